@@ -2,28 +2,38 @@
 
 import { useState, useEffect, useRef, useCallback } from "react"
 import { useInstanceStore } from "@/store/instance-store"
-import type { AuditLogEntry } from "@/types"
+import type { AgentInstance, AuditLogEntry } from "@/types"
 
 const WS_URL = `ws://localhost:${process.env.NEXT_PUBLIC_BACKEND_PORT || "8001"}/ws/monitor`
 const RECONNECT_DELAY = 3000
 const MAX_RECONNECT_DELAY = 30000
 
 interface WebSocketMessage {
-  type: "initial_state" | "instance_update" | "audit_log"
+  type: "initial_state" | "instance_update" | "instance_delta" | "audit_log"
   timestamp: string
+  seq?: number
   data: any
 }
 
+interface InstanceChange {
+  seq: number
+  id: string
+  op: "upsert" | "remove"
+  fields?: Partial<AgentInstance>
+}
+
 export function useWebSocket() {
   const [connectionStatus, setConnectionStatus] = useState<"connected" | "connecting" | "disconnected" | "error">(
     "disconnected",
   )
-  const { instances, stats, setInstances, updateInstance } = useInstanceStore()
+  const { instances, stats, setInstances, addInstance, updateInstance, removeInstance } = useInstanceStore()
   const [auditLogs, setAuditLogs] = useState<AuditLogEntry[]>([])
   const wsRef = useRef<WebSocket | null>(null)
   const reconnectTimeoutRef = useRef<number | null>(null)
   const reconnectDelayRef = useRef(RECONNECT_DELAY)
   const mountedRef = useRef(true)
+  // Sequence number of the last instance change applied
+  const seqRef = useRef(0)
 
   useEffect(() => {
     mountedRef.current = true
@@ -54,6 +64,26 @@ export function useWebSocket() {
               if (message.data.instances) {
                 setInstances(message.data.instances)
               }
+              seqRef.current = message.seq ?? 0
+              break
+
+            case "instance_delta":
+              for (const change of message.data.changes as InstanceChange[]) {
+                if (change.seq <= seqRef.current) continue
+                if (change.seq !== seqRef.current + 1) {
+                  // Missed a change: ask for everything after the last one applied
+                  ws.send(JSON.stringify({ type: "resync", since: seqRef.current }))
+                  break
+                }
+                if (change.op === "remove") {
+                  removeInstance(change.id)
+                } else if (useInstanceStore.getState().instances.some((i) => i.id === change.id)) {
+                  updateInstance(change.id, change.fields ?? {})
+                } else {
+                  addInstance(change.fields as AgentInstance)
+                }
+                seqRef.current = change.seq
+              }
               break
 
             case "instance_update":
@@ -105,7 +135,7 @@ export function useWebSocket() {
         wsRef.current.close()
       }
     }
-  }, [setInstances, updateInstance])
+  }, [setInstances, addInstance, updateInstance, removeInstance])
 
   return {
     connectionStatus,
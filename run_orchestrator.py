@@ -73,11 +73,16 @@ async def start_http_server(config):
     await server.start_server()
 
 
-async def start_stdio_server(config):
-    """Start STDIO server that proxies tool calls to parent HTTP server."""
+async def start_stdio_server():
+    """Start STDIO server that proxies tool calls to parent HTTP server.
+
+    Every Codex/Grok child starts here, so this path imports only the proxy
+    (httpx + fastmcp) — not the config models or the backend.
+    """
     from src.orchestrator.mcp_server import OrchestrationMCPServer
 
-    parent_url = os.getenv("MADROX_PARENT_URL", f"http://localhost:{config.server_port}")
+    server_port = os.getenv("ORCHESTRATOR_PORT", "8001")
+    parent_url = os.getenv("MADROX_PARENT_URL", f"http://localhost:{server_port}")
 
     print(BANNER, file=sys.stderr)
     print(f"  Transport:   STDIO proxy → {parent_url}", file=sys.stderr)
@@ -88,12 +93,22 @@ async def start_stdio_server(config):
 
     # Get FastMCP instance and run with STDIO transport
     mcp_instance = await mcp_server.run()
-    await mcp_instance.run_stdio_async()
+    try:
+        await mcp_instance.run_stdio_async()
+    finally:
+        await mcp_server.aclose()
 
 
 def main():
     """Main entry point with transport auto-detection."""
     try:
+        # Detect transport mode (environment variable checked inside detect_transport_mode)
+        transport = detect_transport_mode()
+
+        if transport == "stdio":
+            asyncio.run(start_stdio_server())
+            return
+
         from src.orchestrator.simple_models import OrchestratorConfig
 
         # Load configuration from environment
@@ -107,15 +122,24 @@ def main():
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             artifacts_dir=os.getenv("ARTIFACTS_DIR", "/tmp/madrox_logs/artifacts"),
             preserve_artifacts=os.getenv("PRESERVE_ARTIFACTS", "true").lower() == "true",
+            tmux_control_mode=os.getenv("MADROX_TMUX_CONTROL_MODE", "true").lower() == "true",
+            tmux_max_workers=int(os.getenv("MADROX_TMUX_MAX_WORKERS", "8")),
+            teardown_concurrency=int(os.getenv("MADROX_TEARDOWN_CONCURRENCY", "8")),
+            mcp_socket=os.getenv("MADROX_MCP_SOCKET", "true").lower() == "true",
+            state_flush_interval_ms=int(os.getenv("MADROX_STATE_FLUSH_INTERVAL_MS", "250")),
+            warm_pool_size=int(os.getenv("MADROX_WARM_POOL_SIZE", "0")),
+            summary_min_new_lines=int(os.getenv("MONITORING_MIN_NEW_LINES", "1")),
+            summary_min_new_chars=int(os.getenv("MONITORING_MIN_NEW_CHARS", "32")),
+            summary_max_age_seconds=float(os.getenv("MONITORING_MAX_SUMMARY_AGE", "300")),
+            summary_max_concurrent=int(os.getenv("MONITORING_MAX_CONCURRENT_SUMMARIES", "4")),
+            summary_requests_per_second=float(os.getenv("MONITORING_SUMMARY_RATE", "4")),
+            summary_batch_size=int(os.getenv("MONITORING_SUMMARY_BATCH_SIZE", "1")),
+            summary_batch_token_budget=int(os.getenv("MONITORING_SUMMARY_BATCH_TOKENS", "8000")),
+            summary_min_poll_interval=float(os.getenv("MONITORING_MIN_POLL_INTERVAL", "3")),
+            summary_max_poll_interval=float(os.getenv("MONITORING_MAX_POLL_INTERVAL", "300")),
         )
 
-        # Detect transport mode (environment variable checked inside detect_transport_mode)
-        transport = detect_transport_mode()
-
-        if transport == "stdio":
-            asyncio.run(start_stdio_server(config))
-        else:
-            asyncio.run(start_http_server(config))
+        asyncio.run(start_http_server(config))
 
     except ImportError as e:
         print(f"Import error: {e}", file=sys.stderr)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark audit log queries: full scan vs. AuditIndex.
+
+Builds audit files of increasing size and times the two queries the
+dashboard issues: "events since T" (the /ws/monitor poll) and "newest events
+for a network" (/logs/audit?root_instance_id=...). The indexed query cost
+should stay flat as the file grows; the full scan grows linearly.
+
+Usage:
+    python scripts/bench_audit_index.py [--sizes 10000,100000,1000000]
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Load the module on its own so the benchmark runs without the server extras
+_spec = importlib.util.spec_from_file_location(
+    "audit_index",
+    Path(__file__).resolve().parent.parent / "src" / "orchestrator" / "audit_index.py",
+)
+_module = sys.modules["audit_index"] = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+AuditIndex = _module.AuditIndex
+
+INSTANCES = [f"inst-{n:03d}" for n in range(200)]
+NETWORK = set(INSTANCES[:5])
+
+
+def write_events(path: Path, start: datetime, count: int, first: int = 0) -> datetime:
+    with path.open("a") as f:
+        for n in range(first, first + count):
+            ts = start + timedelta(milliseconds=n)
+            f.write(
+                json.dumps(
+                    {
+                        "timestamp": ts.isoformat(),
+                        "level": "INFO",
+                        "event": "message_exchange",
+                        "logger": "orchestrator.audit",
+                        "event_type": "message_exchange",
+                        "instance_id": INSTANCES[n % len(INSTANCES)],
+                        "details": {"message_id": f"msg-{n}", "content_length": 120},
+                    }
+                )
+                + "\n"
+            )
+    return start + timedelta(milliseconds=first + count - 1)
+
+
+def full_scan(path: Path, since: str | None, instance_ids: set[str] | None) -> int:
+    """The pre-index reader: parse every line on every call."""
+    matches = 0
+    with path.open() as f:
+        for line in f:
+            entry = json.loads(line)
+            if instance_ids is not None and entry.get("instance_id") not in instance_ids:
+                continue
+            if since and entry["timestamp"] <= since:
+                continue
+            matches += 1
+    return matches
+
+
+def timed(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    args = parser.parse_args()
+
+    print(f"{'lines':>10} {'build ms':>10} {'since ms':>10} {'network ms':>11} {'scan ms':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "audit_20261016.jsonl"
+            start = datetime(2026, 10, 16, 12, 0, 0)
+            last = write_events(path, start, size)
+
+            index = AuditIndex(tmp)
+            build = timed(lambda index=index: index.query(limit=1), repeat=1)
+
+            # Dashboard poll: a few new events since the previous poll
+            since = last.isoformat()
+            write_events(path, start, 10, first=size)
+            since_ms = timed(lambda index=index, since=since: index.query(since=since, limit=100))
+            network_ms = timed(
+                lambda index=index: index.query(instance_ids=NETWORK, limit=100, tail=True)
+            )
+            scan_ms = timed(lambda path=path, since=since: full_scan(path, since, None), repeat=1)
+
+            print(
+                f"{size:>10} {build:>10.1f} {since_ms:>10.3f} {network_ms:>11.3f} {scan_ms:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark hierarchy queries: per-call scans vs. HierarchyIndex.
+
+Builds ``--instances`` records as a tree (``--fanout`` children each) and
+times what the hierarchy tools do with them: list one instance's children,
+draw the whole tree (``get_instance_tree``), collect a network
+(``/network/hierarchy?root_instance_id=``) and walk a cascade termination.
+The scan variants copy and scan every instance per node, as
+``_get_children_internal`` did; the index variants read the adjacency
+lists.
+
+Usage:
+    python scripts/bench_hierarchy.py [--instances 1000] [--fanout 5]
+"""
+
+import argparse
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+# Load the module on its own so the benchmark runs without the server extras
+_spec = importlib.util.spec_from_file_location(
+    "hierarchy_index",
+    Path(__file__).resolve().parent.parent
+    / "src"
+    / "orchestrator"
+    / "tmux_instance_manager"
+    / "hierarchy_index.py",
+)
+_module = sys.modules["hierarchy_index"] = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+HierarchyIndex = _module.HierarchyIndex
+
+
+def build(count: int, fanout: int) -> dict[str, dict]:
+    instances = {}
+    for i in range(count):
+        parent = f"inst-{(i - 1) // fanout:05d}" if i else None
+        instances[f"inst-{i:05d}"] = {
+            "name": f"agent-{i}",
+            "state": "running",
+            "parent_instance_id": parent,
+        }
+    return instances
+
+
+def scan_children(instances: dict[str, dict], parent_id: str) -> list[str]:
+    all_instances = dict(instances)  # the per-call copy
+    return [
+        iid
+        for iid, inst in all_instances.items()
+        if inst.get("parent_instance_id") == parent_id and inst.get("state") != "terminated"
+    ]
+
+
+def index_children(instances: dict[str, dict], index, parent_id: str) -> list[str]:
+    return [
+        iid
+        for iid in index.sync(instances).children(parent_id)
+        if instances[iid].get("state") != "terminated"
+    ]
+
+
+def tree(children_of, root: str) -> int:
+    drawn, stack = 0, [root]
+    while stack:
+        node = stack.pop()
+        drawn += 1
+        stack.extend(children_of(node))
+    return drawn
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instances", type=int, default=1000)
+    parser.add_argument("--fanout", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    instances = build(args.instances, args.fanout)
+    index = HierarchyIndex()
+    root = "inst-00000"
+    mid = f"inst-{args.instances // (2 * args.fanout):05d}"
+
+    def scan(node):
+        return scan_children(instances, node)
+
+    def indexed(node):
+        return index_children(instances, index, node)
+
+    start = time.perf_counter()
+    index.sync(instances)
+    print(f"{args.instances} instances, fanout {args.fanout}")
+    print(f"index build: {(time.perf_counter() - start) * 1000:.2f} ms (once)")
+    assert tree(scan, root) == tree(indexed, root) == args.instances
+
+    cases = [
+        ("get_children", lambda f: f(mid)),
+        # Same walk: every node asks for its children once
+        ("tree / cascade", lambda f: tree(f, root)),
+        ("network of subtree", lambda f: tree(f, mid)),
+    ]
+    print(f"{'query':<20} {'scan ms':>10} {'index ms':>10} {'speedup':>9}")
+    for name, query in cases:
+        before = timed(lambda q=query: q(scan), args.repeat)
+        after = timed(lambda q=query: q(indexed), args.repeat)
+        print(f"{name:<20} {before:>10.3f} {after:>10.3f} {before / after:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
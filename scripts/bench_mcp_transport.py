@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark proxied tool-call latency: TCP loopback vs. the MCP Unix socket.
+
+Serves a stand-in ``/tools/execute`` from a separate process, on both a TCP
+port and a Unix socket bound the way the orchestrator binds them. Then
+``--agents`` concurrent clients, one pooled client each as the STDIO proxy
+keeps, issue ``--calls`` tool calls apiece. Reports p50/p99 per transport,
+plus the old client-per-call TCP path for reference (a tenth of the calls:
+it is that slow).
+
+Usage:
+    python scripts/bench_mcp_transport.py [--agents 50] [--calls 200]
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+# Load the module on its own so the benchmark runs without the server extras
+_spec = importlib.util.spec_from_file_location(
+    "listeners",
+    Path(__file__).resolve().parent.parent / "src" / "orchestrator" / "server" / "listeners.py",
+)
+_module = sys.modules["listeners"] = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+bind_tcp_sockets = _module.bind_tcp_sockets
+bind_unix_socket = _module.bind_unix_socket
+
+# A small tool result, about the size of get_instance_status for one instance
+RESULT = {"instance_id": "inst-000", "state": "idle", "total_tokens_used": 1234, "notes": "x" * 512}
+
+
+def serve(sockets, ready) -> None:
+    import uvicorn
+    from fastapi import FastAPI
+
+    app = FastAPI()
+
+    @app.post("/tools/execute")
+    async def execute_tool(request: dict):
+        return {**RESULT, "tool": request.get("tool")}
+
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="off"))
+
+    async def run():
+        serving = asyncio.create_task(server.serve(sockets=sockets))
+        while not server.started:
+            await asyncio.sleep(0.01)
+        ready.set()
+        await serving
+
+    asyncio.run(run())
+
+
+async def agent(
+    url: str, calls: int, latencies: list[float], uds: str | None, pooled: bool
+) -> None:
+    payload = {"tool": "get_instance_status", "arguments": {"instance_id": "inst-000"}}
+
+    def new_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=30, transport=httpx.AsyncHTTPTransport(uds=uds))
+
+    client = new_client() if pooled else None
+    try:
+        for _ in range(calls):
+            start = time.perf_counter()
+            if client is not None:
+                resp = await client.post(url, json=payload)
+            else:
+                async with new_client() as once:
+                    resp = await once.post(url, json=payload)
+            resp.raise_for_status()
+            latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        if client is not None:
+            await client.aclose()
+
+
+async def run_case(url: str, agents: int, calls: int, uds: str | None, pooled: bool):
+    latencies: list[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(agent(url, calls, latencies, uds, pooled) for _ in range(agents)))
+    elapsed = time.perf_counter() - start
+    cuts = statistics.quantiles(latencies, n=100)
+    return cuts[49], cuts[98], len(latencies) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=50)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="mx-bench-") as tmp:
+        path = os.path.join(tmp, "mcp.sock")
+        sockets = [*bind_tcp_sockets("127.0.0.1", 0), bind_unix_socket(path)]
+        port = sockets[0].getsockname()[1]
+        ready = multiprocessing.Event()
+        server = multiprocessing.Process(target=serve, args=(sockets, ready), daemon=True)
+        server.start()
+        ready.wait(10)
+
+        cases = [
+            ("tcp, client per call", f"http://127.0.0.1:{port}/tools/execute", None, False),
+            ("tcp, pooled", f"http://127.0.0.1:{port}/tools/execute", None, True),
+            ("uds, pooled", "http://localhost/tools/execute", path, True),
+        ]
+        print(f"{args.agents} agents x {args.calls} calls")
+        print(f"{'transport':<22} {'p50 ms':>8} {'p99 ms':>8} {'calls/s':>9}")
+        try:
+            for name, url, uds, pooled in cases:
+                calls = args.calls if pooled else max(1, args.calls // 10)
+                p50, p99, rate = asyncio.run(run_case(url, args.agents, calls, uds, pooled))
+                print(f"{name:<22} {p50:>8.2f} {p99:>8.2f} {rate:>9.0f}")
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,31 @@
-"""Claude Conversational Orchestrator module."""
+"""Claude Conversational Orchestrator module.
 
-from .instance_manager import InstanceManager
-from .log_stream_handler import audit_log, get_log_stream_handler, setup_log_streaming
-from .simple_models import InstanceRole, InstanceState, OrchestratorConfig
+Exports are loaded on first access (PEP 562). Every Codex/Grok child runs
+the STDIO proxy, which imports ``orchestrator.mcp_server``; importing the
+package must not drag in the instance manager, libtmux and FastAPI before
+the proxy has even started.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .instance_manager import InstanceManager
+    from .log_stream_handler import audit_log, get_log_stream_handler, setup_log_streaming
+    from .simple_models import InstanceRole, InstanceState, OrchestratorConfig
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "InstanceManager": ".instance_manager",
+    "InstanceState": ".simple_models",
+    "InstanceRole": ".simple_models",
+    "OrchestratorConfig": ".simple_models",
+    "audit_log": ".log_stream_handler",
+    "get_log_stream_handler": ".log_stream_handler",
+    "setup_log_streaming": ".log_stream_handler",
+}
 
 __all__ = [
     "InstanceManager",
@@ -13,3 +36,16 @@ __all__ = [
     "get_log_stream_handler",
     "setup_log_streaming",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
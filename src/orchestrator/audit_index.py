@@ -0,0 +1,281 @@
+"""Byte-offset index over the JSONL audit trail.
+
+``/logs/audit`` and every ``/ws/monitor`` dashboard (every 2 seconds) asked
+for "events since T" or "events for network X", and each request parsed
+every line of every ``audit_*.jsonl`` file. ``AuditIndex`` parses each line
+once, records its byte offset, timestamp and ``instance_id``, and follows
+the files as they grow, so a query costs a ``stat`` per file, a parse of the
+lines appended since the last query, and a seek-and-read per returned entry.
+
+The index lives in memory and is shared per audit directory
+(``AuditIndex.for_directory``). It detects a truncated or rotated file by
+size and inode and indexes it again.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import json
+import logging
+import threading
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATTERN = "audit_*.jsonl"
+
+#: Bytes read per chunk while indexing newly appended lines.
+_READ_CHUNK = 1024 * 1024
+
+
+def _to_epoch(timestamp: str) -> float:
+    """Epoch seconds for an ISO timestamp; naive values are local time, as written."""
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+
+
+@dataclass
+class _FileIndex:
+    """Line positions of one audit file.
+
+    ``times`` holds the running maximum of the line timestamps so it stays
+    sorted even when concurrent writers land a few microseconds out of order;
+    exact timestamps are checked again when entries are read.
+    """
+
+    inode: int = 0
+    indexed_bytes: int = 0
+    offsets: array = field(default_factory=lambda: array("q"))
+    times: array = field(default_factory=lambda: array("d"))
+    # instance_id ("" for events without one) -> ascending line numbers
+    by_instance: dict[str, array] = field(default_factory=dict)
+
+    def add(self, offset: int, timestamp: float, instance_id: str) -> None:
+        line = len(self.offsets)
+        if self.times and timestamp < self.times[-1]:
+            timestamp = self.times[-1]
+        self.offsets.append(offset)
+        self.times.append(timestamp)
+        lines = self.by_instance.get(instance_id)
+        if lines is None:
+            lines = self.by_instance[instance_id] = array("q")
+        lines.append(line)
+
+
+@dataclass
+class AuditQueryResult:
+    entries: list[dict[str, Any]]
+    total: int
+
+
+class AuditIndex:
+    """Indexed reads of the audit trail by time and instance.
+
+    Usage::
+
+        index = AuditIndex.for_directory(logging_manager.audit_dir)
+        result = index.query(since="2026-10-16T12:00:00", limit=100)
+        result = index.query(instance_ids={"abc", "def"}, limit=50, tail=True)
+    """
+
+    _registry: dict[Path, AuditIndex] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, audit_dir: str | Path):
+        self.audit_dir = Path(audit_dir)
+        self._files: dict[Path, _FileIndex] = {}
+        self._lock = threading.Lock()
+        self.lines_indexed = 0
+        self.rebuilds = 0
+
+    @classmethod
+    def for_directory(cls, audit_dir: str | Path) -> AuditIndex:
+        """The shared index for ``audit_dir``, created on first use."""
+        key = Path(audit_dir).resolve()
+        with cls._registry_lock:
+            index = cls._registry.get(key)
+            if index is None:
+                index = cls._registry[key] = cls(key)
+            return index
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+    def _refresh(self, pattern: str) -> list[tuple[Path, _FileIndex]]:
+        """Catch up on every file matching ``pattern``; oldest file first."""
+        files = []
+        for path in sorted(self.audit_dir.glob(pattern)):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            index = self._files.get(path)
+            if index is None or index.inode != st.st_ino or st.st_size < index.indexed_bytes:
+                if index is not None:
+                    self.rebuilds += 1
+                index = self._files[path] = _FileIndex(inode=st.st_ino)
+            if st.st_size > index.indexed_bytes:
+                self._index_tail(path, index)
+            files.append((path, index))
+        return files
+
+    def _index_tail(self, path: Path, index: _FileIndex) -> None:
+        try:
+            with path.open("rb") as f:
+                f.seek(index.indexed_bytes)
+                offset = index.indexed_bytes
+                pending = b""
+                while chunk := f.read(_READ_CHUNK):
+                    pending += chunk
+                    lines = pending.split(b"\n")
+                    # The last piece is a partial line (or b"") until its newline lands
+                    pending = lines.pop()
+                    for line in lines:
+                        self._index_line(index, offset, line)
+                        offset += len(line) + 1
+                index.indexed_bytes = offset
+        except OSError as e:
+            logger.error(f"Failed to index audit file {path}: {e}")
+
+    def _index_line(self, index: _FileIndex, offset: int, line: bytes) -> None:
+        if not line.strip():
+            return
+        try:
+            entry = json.loads(line)
+            timestamp = _to_epoch(entry["timestamp"])
+        except (ValueError, KeyError, TypeError, AttributeError):
+            # Not an audit record; readers skip it
+            return
+        instance_id = entry.get("instance_id") if isinstance(entry, dict) else None
+        index.add(offset, timestamp, instance_id if isinstance(instance_id, str) else "")
+        self.lines_indexed += 1
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def query(
+        self,
+        since: str | None = None,
+        limit: int = 100,
+        instance_ids: set[str] | None = None,
+        *,
+        include_since: bool = False,
+        tail: bool = False,
+        pattern: str = DEFAULT_PATTERN,
+    ) -> AuditQueryResult:
+        """Audit entries in chronological order.
+
+        Args:
+            since: Only entries after this ISO timestamp (at or after it with
+                ``include_since``)
+            limit: Maximum number of entries to return
+            instance_ids: Only entries for these instances, plus entries that
+                carry no instance_id
+            tail: Return the newest ``limit`` matches instead of the oldest
+            pattern: Glob of the audit files to search
+
+        Returns:
+            The entries and the total number of matches
+        """
+        since_ts = _to_epoch(since) if since else None
+        with self._lock:
+            files = self._refresh(pattern)
+            selections = []
+            total = 0
+            for path, index in files:
+                count, lines = self._select(
+                    index, since_ts, include_since, instance_ids, limit, tail
+                )
+                selections.append((path, index, lines))
+                total += count
+
+        picked = self._pick(selections, limit, tail)
+        entries = []
+        for path, index, lines in picked:
+            entries.extend(self._read(path, index, lines, since_ts, include_since))
+        return AuditQueryResult(entries=entries, total=total)
+
+    @staticmethod
+    def _select(
+        index: _FileIndex,
+        since_ts: float | None,
+        include_since: bool,
+        instance_ids: set[str] | None,
+        limit: int,
+        tail: bool,
+    ) -> tuple[int, list[int] | range]:
+        """Number of matching lines, and the first or last ``limit`` of them."""
+        first = 0
+        if since_ts is not None:
+            search = bisect.bisect_left if include_since else bisect.bisect_right
+            first = search(index.times, since_ts)
+        if instance_ids is None:
+            lines = range(first, len(index.offsets))
+            return len(lines), (lines[-limit:] if tail else lines[:limit]) if limit > 0 else []
+
+        count = 0
+        runs = []
+        for instance_id in (*instance_ids, ""):
+            lines = index.by_instance.get(instance_id)
+            if not lines:
+                continue
+            start = bisect.bisect_left(lines, first)
+            count += len(lines) - start
+            # Only the ends of each run can make the cut, so merge just those
+            runs.append(
+                lines[max(start, len(lines) - limit) :] if tail else lines[start : start + limit]
+            )
+        merged = list(heapq.merge(*runs))
+        return count, (merged[-limit:] if tail else merged[:limit]) if limit > 0 else []
+
+    @staticmethod
+    def _pick(selections: list, limit: int, tail: bool) -> list:
+        """Trim the per-file selections down to ``limit`` lines overall."""
+        picked = []
+        remaining = limit
+        ordered = reversed(selections) if tail else selections
+        for path, index, lines in ordered:
+            if remaining <= 0:
+                break
+            chosen = lines[-remaining:] if tail else lines[:remaining]
+            if chosen:
+                picked.append((path, index, chosen))
+                remaining -= len(chosen)
+        if tail:
+            picked.reverse()
+        return picked
+
+    @staticmethod
+    def _read(
+        path: Path,
+        index: _FileIndex,
+        lines: list[int] | range,
+        since_ts: float | None,
+        include_since: bool,
+    ) -> list[dict[str, Any]]:
+        entries = []
+        try:
+            with path.open("rb") as f:
+                for line in lines:
+                    f.seek(index.offsets[line])
+                    entry = json.loads(f.readline())
+                    if since_ts is not None:
+                        # ``times`` is a running maximum; check the real stamp
+                        ts = _to_epoch(entry["timestamp"])
+                        if ts < since_ts or (ts == since_ts and not include_since):
+                            continue
+                    entries.append(entry)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to read audit file {path}: {e}")
+        return entries
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "files": len(self._files),
+            "lines_indexed": self.lines_indexed,
+            "rebuilds": self.rebuilds,
+        }
@@ -0,0 +1,89 @@
+"""Per-instance caller tokens for MCP tool calls.
+
+Every spawned instance gets a token in its madrox MCP config: the
+``X-Madrox-Caller`` header for HTTP harnesses whose config can set headers, a
+``caller`` query parameter on the URL for the rest, or ``MADROX_CALLER_TOKEN``
+for the STDIO proxy, which sends it as the header. Harnesses whose MCP
+registration is shared by all instances (Codex) set that variable on their
+launch command instead. The server maps a token back to its instance with
+one dict lookup, so spawns are parented to the instance that asked for them
+rather than to whichever instance looks busiest.
+
+A token is ``<instance_id>.<secret>``. The secret is stored on the instance
+record, so tokens survive restarts along with the rest of the record; any
+view of a record handed out of the process goes through ``public_record``,
+and the server's access log masks the query parameter.
+"""
+
+from __future__ import annotations
+
+import hmac
+import logging
+import re
+import secrets
+from collections.abc import Mapping
+from typing import Any
+
+CALLER_HEADER = "X-Madrox-Caller"
+CALLER_QUERY_PARAM = "caller"
+CALLER_TOKEN_ENV = "MADROX_CALLER_TOKEN"
+CALLER_TOKEN_FIELD = "caller_token"
+
+_CALLER_PARAM_RE = re.compile(rf"([?&]{CALLER_QUERY_PARAM}=)[^&\s]+")
+
+
+def new_caller_token(instance_id: str) -> str:
+    return f"{instance_id}.{secrets.token_urlsafe(16)}"
+
+
+def public_record(instance: Mapping[str, Any]) -> dict[str, Any]:
+    """A copy of an instance record without its caller token.
+
+    The token is also masked wherever it was copied into the record, such as
+    the madrox entry of ``mcp_servers``.
+    """
+    token = instance.get(CALLER_TOKEN_FIELD)
+    return {
+        key: redact_caller_token(value, token)
+        for key, value in instance.items()
+        if key != CALLER_TOKEN_FIELD
+    }
+
+
+def redact_caller_token(value: Any, token: str | None) -> Any:
+    """``value`` (a string, or dicts and lists of them) with ``token`` masked."""
+    if not token:
+        return value
+    if isinstance(value, str):
+        return value.replace(token, "***")
+    if isinstance(value, dict):
+        return {key: redact_caller_token(item, token) for key, item in value.items()}
+    if isinstance(value, list):
+        return [redact_caller_token(item, token) for item in value]
+    return value
+
+
+class CallerParamFilter(logging.Filter):
+    """Masks the ``caller`` query parameter in access-log records."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.args, tuple):
+            record.args = tuple(
+                _CALLER_PARAM_RE.sub(r"\1***", arg) if isinstance(arg, str) else arg
+                for arg in record.args
+            )
+        return True
+
+
+def resolve_caller_token(token: str | None, instances: Mapping[str, dict[str, Any]]) -> str | None:
+    """The instance a token was issued to, or None if it is not a live token."""
+    if not isinstance(token, str) or not token:
+        return None
+    instance_id, _, secret = token.rpartition(".")
+    instance = instances.get(instance_id)
+    if not secret or instance is None or instance.get("state") == "terminated":
+        return None
+    expected = instance.get(CALLER_TOKEN_FIELD)
+    if not isinstance(expected, str) or not hmac.compare_digest(expected, token):
+        return None
+    return instance_id
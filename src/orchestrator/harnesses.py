@@ -18,6 +18,7 @@ is used (overridable per harness with ``MADROX_MODEL_<HARNESS>``).
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import shlex
@@ -25,6 +26,7 @@ import shutil
 from pathlib import Path
 from typing import Any, ClassVar
 
+from .caller_identity import CALLER_TOKEN_ENV
 from .config import get_harness_config, resolve_model
 
 logger = logging.getLogger(__name__)
@@ -64,6 +66,15 @@ class Harness:
     #: ``mcp_config_flag``; otherwise they are registered via CLI commands.
     mcp_config_filename: ClassVar[str | None] = None
     mcp_config_flag: ClassVar[str] = "--mcp-config"
+    #: True when ``mcp add`` writes to a config shared by every instance, so
+    #: per-instance values (the caller token) must go on the launch command.
+    mcp_registration_is_global: ClassVar[bool] = False
+    #: True when HTTP MCP servers can be given request headers, so the caller
+    #: token is sent as a header rather than in the URL.
+    mcp_http_headers: ClassVar[bool] = False
+    #: True when the CLI mishandles bracketed paste, so messages must be typed
+    #: line by line with paced keystrokes instead of pasted from a tmux buffer.
+    paste_sensitive: ClassVar[bool] = False
 
     # ------------------------------------------------------------------
     # Binary / model resolution
@@ -163,6 +174,12 @@ class Harness:
             for marker_set in cls.trust_prompt_markers
         )
 
+    @classmethod
+    def is_paste_sensitive(cls) -> bool:
+        """Whether messages must be typed; ``paste_sensitive:`` in YAML overrides."""
+        override = get_harness_config(cls.name).get("paste_sensitive")
+        return cls.paste_sensitive if override is None else bool(override)
+
     @classmethod
     def prepare_workspace(cls, workspace_dir: str) -> None:
         """Hook for pre-launch workspace setup (e.g. pre-trusting a directory)."""
@@ -192,6 +209,7 @@ class ClaudeHarness(Harness):
     prompt_delivery = "cli_arg"
     auto_mcp_transport = "http"
     mcp_config_filename = ".claude_mcp_config.json"
+    mcp_http_headers = True
 
     #: Full-autonomy flags (Claude's equivalent of yolo mode).
     yolo_flags: ClassVar[tuple[str, ...]] = (
@@ -245,6 +263,8 @@ class CodexHarness(Harness):
 
     prompt_delivery = "pane"
     auto_mcp_transport = "stdio"
+    #: `codex mcp add` has no scope flag; it always edits ~/.codex/config.toml.
+    mcp_registration_is_global = True
 
     #: Codex's yolo switch — bypasses both approvals and the sandbox.
     yolo_flags: ClassVar[tuple[str, ...]] = ("--dangerously-bypass-approvals-and-sandbox",)
@@ -266,6 +286,7 @@ class CodexHarness(Harness):
         if profile := instance.get("profile"):
             cmd.extend(["--profile", shlex.quote(str(profile))])
         cmd.extend(cls._model_args(instance))
+        cmd.extend(cls._caller_token_args(instance))
         cmd.extend(cls.extra_args())
         return cmd
 
@@ -275,9 +296,20 @@ class CodexHarness(Harness):
         cmd = [cls.executable(), "resume", "--last"]
         cmd.extend(cls._autonomy_args(instance, resuming=True))
         cmd.extend(cls._model_args(instance))
+        cmd.extend(cls._caller_token_args(instance))
         cmd.extend(cls.extra_args())
         return cmd
 
+    @classmethod
+    def _caller_token_args(cls, instance: dict[str, Any]) -> list[str]:
+        # The shared madrox entry carries no token; each launch overrides it
+        # with its own, so concurrent registrations cannot swap identities.
+        token = instance.get("caller_token")
+        if not token:
+            return []
+        override = f"mcp_servers.madrox.env.{CALLER_TOKEN_ENV}={json.dumps(token)}"
+        return ["-c", shlex.quote(override)]
+
     @classmethod
     def mcp_add_stdio_command(
         cls, name: str, command: str, args: list[str], env: dict[str, str]
@@ -335,6 +367,9 @@ class GrokHarness(Harness):
 
     prompt_delivery = "pane"
     auto_mcp_transport = "http"
+    #: Grok's input box has not been verified with bracketed paste; keep
+    #: typing until it is (flip with ``paste_sensitive: false`` in YAML).
+    paste_sensitive = True
 
     #: Grok documents the short form only (`grok -p "Hello" -m my-model`); the
     #: inherited `--model` was not picked up, so the CLI silently used its own
@@ -7,9 +7,11 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from ..audit_index import AuditIndex
 from ..compat import UTC
 from ..logging_manager import LoggingManager
 from ..tmux_instance_manager import TmuxInstanceManager
+from ..tmux_instance_manager.hierarchy_index import HierarchyIndex
 from ._mcp import mcp
 from .files import FilesMixin
 from .hierarchy import HierarchyMixin
@@ -40,6 +42,7 @@ class InstanceManager(
         self.config = config
         self.mcp = mcp
         self.instances: dict[str, dict[str, Any]] = {}
+        self.hierarchy = HierarchyIndex()
 
         # Job tracking for async messages
         self.jobs: dict[str, dict[str, Any]] = {}
@@ -248,27 +251,7 @@ class InstanceManager(
         if instance_id not in self.instances:
             raise ValueError(f"Instance {instance_id} not found")
 
-        try:
-            session = self.tmux_manager.tmux_sessions.get(instance_id)
-            if not session:
-                raise RuntimeError(f"No tmux session found for instance {instance_id}")
-
-            if not session.windows:
-                raise RuntimeError(f"No tmux window found for instance {instance_id}")
-            window = session.windows[0]
-            if not window.panes:
-                raise RuntimeError(f"No tmux pane found for instance {instance_id}")
-            pane = window.panes[0]
-
-            if lines == -1:
-                output = "\n".join(pane.cmd("capture-pane", "-p").stdout)
-            else:
-                output = "\n".join(pane.cmd("capture-pane", "-p", "-S", f"-{lines}").stdout)
-
-            return output
-        except Exception as e:
-            logger.error(f"Failed to capture tmux pane for instance {instance_id}: {e}")
-            raise
+        return await self.tmux_manager.get_tmux_pane_content(instance_id, lines)
 
     async def ensure_main_instance(self) -> str:
         """Ensure main instance is spawned and return its ID."""
@@ -371,42 +354,11 @@ class InstanceManager(
             logger.warning("Logging manager not initialized")
             return []
 
-        audit_dir = self.logging_manager.audit_dir
-        audit_logs = []
-
-        audit_files = sorted(audit_dir.glob("audit_*.jsonl"), reverse=True)
-
-        since_dt = datetime.fromisoformat(since) if since else None
-
-        for audit_file in audit_files:
-            try:
-                with audit_file.open("r") as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-
-                        try:
-                            log_entry = json.loads(line)
-
-                            if since_dt:
-                                log_timestamp = datetime.fromisoformat(log_entry["timestamp"])
-                                if log_timestamp <= since_dt:
-                                    continue
-
-                            audit_logs.append(log_entry)
-
-                            if len(audit_logs) >= limit:
-                                break
-                        except json.JSONDecodeError:
-                            continue
-
-                if len(audit_logs) >= limit:
-                    break
-            except Exception as e:
-                logger.error(f"Failed to read audit file {audit_file}: {e}")
-                continue
-
-        return audit_logs[:limit]
+        # Indexed: only lines appended since the last query are parsed.
+        # Without ``since`` the newest entries are wanted, not the oldest.
+        index = AuditIndex.for_directory(self.logging_manager.audit_dir)
+        result = await asyncio.to_thread(index.query, since=since, limit=limit, tail=since is None)
+        return result.entries
 
     async def list_logged_instances(self) -> list[dict[str, Any]]:
         """List all instances that have logs."""
@@ -449,6 +401,13 @@ class InstanceManager(
 
         # Save final state — do NOT terminate instances
         self.tmux_manager._save_state()
+        self.tmux_manager._flush_state()
+
+        # Detach the tmux control client; instance sessions keep running
+        try:
+            await self.tmux_manager.shutdown()
+        except Exception as e:
+            logger.error(f"Error shutting down tmux manager: {e}")
 
         active = [i for i in self.instances.values() if i["state"] not in ("terminated", "error")]
         if active:
@@ -2,10 +2,12 @@
 
 import logging
 from datetime import datetime
-from pathlib import Path
 from typing import Any
 
+from ..caller_identity import public_record
 from ..compat import UTC
+from ..terminated_catalog import TerminatedCatalog
+from ..tmux_instance_manager.hierarchy_index import HierarchyIndex
 from ._mcp import mcp
 
 logger = logging.getLogger(__name__)
@@ -20,25 +22,58 @@ class HierarchyMixin:
     total_cost: float
     config: dict[str, Any]
     shared_state_manager: Any
+    tmux_manager: Any
+    hierarchy: HierarchyIndex
+
+    def _shared_only_instances(self) -> dict[str, dict[str, Any]]:
+        """Instances known only through shared metadata (spawned by STDIO children).
+
+        One round trip to the shared-state manager; callers read it once per query.
+        """
+        if not getattr(self, "shared_state_manager", None):
+            return {}
+        try:
+            return {
+                iid: dict(metadata)
+                for iid, metadata in self.shared_state_manager.instance_metadata.items()
+                if iid not in self.instances
+            }
+        except Exception as e:
+            logger.warning(f"Failed to read shared instance metadata: {e}")
+            return {}
+
+    def _child_records(self, parent_id: str) -> list[tuple[str, dict[str, Any]]]:
+        """(id, record) of every child of ``parent_id``, terminated ones included."""
+        index = self.hierarchy.sync(self.instances)
+        children = [(iid, self.instances[iid]) for iid in index.children(parent_id)]
+        children.extend(
+            (iid, instance)
+            for iid, instance in self._shared_only_instances().items()
+            if instance.get("parent_instance_id") == parent_id
+        )
+        return children
+
+    @staticmethod
+    def _relative_view(instance_id: str, instance: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "id": instance_id,
+            "name": instance.get("name"),
+            "role": instance.get("role"),
+            "state": instance.get("state"),
+            "instance_type": instance.get("instance_type"),
+        }
 
     def _get_instance_status_internal(
         self, instance_id: str | None = None, summary_only: bool = False
     ) -> dict[str, Any]:
         """Internal method to get status of instance(s)."""
         all_instances = dict(self.instances)
-
-        if hasattr(self, "shared_state_manager") and self.shared_state_manager:
-            try:
-                for iid, metadata in self.shared_state_manager.instance_metadata.items():
-                    if iid not in all_instances:
-                        all_instances[iid] = dict(metadata)
-            except Exception as e:
-                logger.warning(f"Failed to read shared instance metadata: {e}")
+        all_instances.update(self._shared_only_instances())
 
         if instance_id:
             if instance_id not in all_instances:
                 raise ValueError(f"Instance {instance_id} not found")
-            return all_instances[instance_id].copy()
+            return public_record(all_instances[instance_id])
         else:
             if summary_only:
                 return {
@@ -62,7 +97,7 @@ class HierarchyMixin:
                 }
             else:
                 return {
-                    "instances": {iid: inst.copy() for iid, inst in all_instances.items()},
+                    "instances": {iid: public_record(inst) for iid, inst in all_instances.items()},
                     "total_instances": len(all_instances),
                     "active_instances": len(
                         [
@@ -128,62 +163,23 @@ class HierarchyMixin:
         self, parent_id: str, include_terminated: bool = False
     ) -> list[dict[str, Any]]:
         """Internal method to get all child instances of a parent."""
-        children = []
-
-        all_instances = dict(self.instances)
-        if hasattr(self, "shared_state_manager") and self.shared_state_manager:
-            try:
-                for iid, metadata in self.shared_state_manager.instance_metadata.items():
-                    if iid not in all_instances:
-                        all_instances[iid] = dict(metadata)
-            except Exception as e:
-                logger.warning(f"Failed to read shared instance metadata in get_children: {e}")
-
-        for instance_id, instance in all_instances.items():
-            is_child = instance.get("parent_instance_id") == parent_id
-            include = is_child and (include_terminated or instance.get("state") != "terminated")
-            if include:
-                children.append(
-                    {
-                        "id": instance_id,
-                        "name": instance.get("name"),
-                        "role": instance.get("role"),
-                        "state": instance.get("state"),
-                        "instance_type": instance.get("instance_type"),
-                    }
-                )
+        children = [
+            self._relative_view(iid, instance)
+            for iid, instance in self._child_records(parent_id)
+            if include_terminated or instance.get("state") != "terminated"
+        ]
 
         if include_terminated:
-            artifacts_base = Path(self.config.get("artifacts_dir", "/tmp/madrox_logs/artifacts"))
-            if artifacts_base.exists():
-                import json
-
-                for artifact_dir in artifacts_base.iterdir():
-                    if not artifact_dir.is_dir():
-                        continue
-
-                    instance_id = artifact_dir.name
-                    if any(c["id"] == instance_id for c in children):
-                        continue
-
-                    metadata_path = artifact_dir / "_metadata.json"
-                    if metadata_path.exists():
-                        try:
-                            with open(metadata_path) as f:
-                                metadata = json.load(f)
-
-                            if metadata.get("parent_instance_id") == parent_id:
-                                children.append(
-                                    {
-                                        "id": instance_id,
-                                        "name": metadata.get("instance_name", "unknown"),
-                                        "role": metadata.get("role", "unknown"),
-                                        "state": "terminated",
-                                        "instance_type": metadata.get("instance_type", "claude"),
-                                    }
-                                )
-                        except Exception as e:
-                            logger.warning(f"Failed to load metadata for {instance_id}: {e}")
+            catalog = getattr(self.tmux_manager, "terminated_catalog", None)
+            if isinstance(catalog, TerminatedCatalog):
+                # Terminated children pruned from the state store, or from
+                # earlier sessions
+                seen = {child["id"] for child in children}
+                children.extend(
+                    self._relative_view(entry["id"], {**entry, "state": "terminated"})
+                    for entry in catalog.children(parent_id)
+                    if entry["id"] not in seen
+                )
 
         return children
 
@@ -203,16 +199,9 @@ class HierarchyMixin:
         self, instance_id: str, include_self: bool = False
     ) -> list[dict[str, Any]]:
         """Internal method to get all peer instances (siblings sharing the same parent)."""
-        all_instances = dict(self.instances)
-        if hasattr(self, "shared_state_manager") and self.shared_state_manager:
-            try:
-                for iid, metadata in self.shared_state_manager.instance_metadata.items():
-                    if iid not in all_instances:
-                        all_instances[iid] = dict(metadata)
-            except Exception as e:
-                logger.warning(f"Failed to read shared instance metadata in get_peers: {e}")
-
-        instance = all_instances.get(instance_id)
+        instance = self.instances.get(instance_id)
+        if instance is None:
+            instance = self._shared_only_instances().get(instance_id)
         if not instance:
             return []
 
@@ -220,24 +209,11 @@ class HierarchyMixin:
         if not parent_id:
             return []
 
-        peers = []
-        for iid, inst in all_instances.items():
-            if inst.get("parent_instance_id") != parent_id:
-                continue
-            if inst.get("state") == "terminated":
-                continue
-            if not include_self and iid == instance_id:
-                continue
-            peers.append(
-                {
-                    "id": iid,
-                    "name": inst.get("name"),
-                    "role": inst.get("role"),
-                    "state": inst.get("state"),
-                    "instance_type": inst.get("instance_type"),
-                }
-            )
-        return peers
+        return [
+            self._relative_view(iid, inst)
+            for iid, inst in self._child_records(parent_id)
+            if inst.get("state") != "terminated" and (include_self or iid != instance_id)
+        ]
 
     @mcp.tool
     def get_peers(self, instance_id: str) -> list[dict[str, Any]]:
@@ -300,15 +276,21 @@ class HierarchyMixin:
         line = f"{prefix}{connector}{name} ({short_id}) [{state}] ({instance_type})"
         lines.append(line)
 
-        children = self._get_children_internal(instance_id)
+        # Local children only: instances known just from shared metadata have
+        # no record here to draw
+        children = [
+            child_id
+            for child_id in self.hierarchy.sync(self.instances).children(instance_id)
+            if self.instances[child_id].get("state") != "terminated"
+        ]
         child_count = len(children)
 
-        children.sort(key=lambda x: x.get("name") or "")
+        children.sort(key=lambda child_id: self.instances[child_id].get("name") or "")
 
-        for i, child in enumerate(children):
+        for i, child_id in enumerate(children):
             is_last_child = i == child_count - 1
             if is_root:
                 new_prefix = ""
             else:
                 new_prefix = prefix + ("    " if is_last else "│   ")
-            self._build_tree_recursive(child["id"], new_prefix, is_last_child, lines)
+            self._build_tree_recursive(child_id, new_prefix, is_last_child, lines)
@@ -90,6 +90,42 @@ class LifecycleMixin:
 
         raise ValueError(f"Unsupported instance type: {instance.get('instance_type')}")
 
+    async def _terminate_multiple_instances_internal(
+        self, instance_ids: list[str], force: bool = False
+    ) -> dict[str, list[Any]]:
+        """Internal method to terminate several instances in one teardown."""
+        results: dict[str, list[Any]] = {"terminated": [], "failed": []}
+        valid = []
+        for iid in instance_ids:
+            instance = self.instances.get(iid)
+            if instance is None:
+                results["failed"].append({"instance_id": iid, "error": f"Instance {iid} not found"})
+            elif not is_supported_harness(instance.get("instance_type")):
+                results["failed"].append(
+                    {
+                        "instance_id": iid,
+                        "error": f"Unsupported instance type: {instance.get('instance_type')}",
+                    }
+                )
+            else:
+                valid.append(iid)
+
+        if valid:
+            try:
+                outcomes = await self.tmux_manager.terminate_instances(valid, force=force)
+            except Exception as e:
+                results["failed"].extend({"instance_id": iid, "error": str(e)} for iid in valid)
+                return results
+            for iid in valid:
+                if outcomes.get(iid):
+                    self.instances[iid] = self.tmux_manager.instances[iid]
+                    results["terminated"].append(iid)
+                else:
+                    results["failed"].append(
+                        {"instance_id": iid, "error": "Termination failed (try with force=true)"}
+                    )
+        return results
+
     async def _suspend_instance_internal(self, instance_id: str) -> bool:
         """Internal method to suspend a Claude or Codex instance."""
         if instance_id not in self.instances:
@@ -162,17 +198,7 @@ class LifecycleMixin:
         Returns:
             Dictionary with termination results
         """
-        results: dict[str, list[Any]] = {"terminated": [], "failed": []}
-        for iid in instance_ids:
-            try:
-                success = await self._terminate_instance_internal(iid, force=force)
-                if success:
-                    results["terminated"].append(iid)
-                else:
-                    results["failed"].append(iid)
-            except Exception as e:
-                results["failed"].append({"instance_id": iid, "error": str(e)})
-        return results
+        return await self._terminate_multiple_instances_internal(instance_ids, force=force)
 
     @mcp.tool
     async def coordinate_instances(
@@ -1,9 +1,14 @@
 """Team template MCP tools and helpers."""
 
-import asyncio
 import logging
 from typing import Any
 
+from ..tmux_instance_manager.readiness import (
+    DEFAULT_TEAM_READY_TIMEOUT,
+    ProgressCallback,
+    TeamReadiness,
+    team_status,
+)
 from ._mcp import mcp
 
 logger = logging.getLogger(__name__)
@@ -14,6 +19,7 @@ class TemplateMixin:
 
     # Declared by InstanceManager; present here for type checking only
     instances: dict[str, dict[str, Any]]
+    tmux_manager: Any
     spawn_instance: Any
     _build_tree_recursive: Any
 
@@ -88,7 +94,7 @@ class TemplateMixin:
             f"({len(instruction)} chars, {len(instruction) / 1024:.2f}KB)"
         )
 
-        await asyncio.sleep(10)
+        readiness = await self.wait_for_team(supervisor_id, template_meta["team_size"])
 
         tree_preview = "Initializing network..."
         try:
@@ -114,7 +120,7 @@ class TemplateMixin:
 - Team Size: {template_meta["team_size"]} instances
 - Estimated Duration: {template_meta["duration"]}
 - Estimated Cost: {template_meta["estimated_cost"]}
-- Status: Initializing
+- Status: {team_status(readiness)}
 
 🌳 **Network Topology:**
 {tree_preview}
@@ -128,16 +134,44 @@ Use get_instance_tree() to see the full network hierarchy."""
 
         return result_text
 
+    async def wait_for_team(
+        self,
+        supervisor_id: str,
+        team_size: int,
+        timeout: float = DEFAULT_TEAM_READY_TIMEOUT,
+        on_progress: ProgressCallback | None = None,
+    ) -> TeamReadiness | None:
+        """Wait for a template team to come up: the supervisor plus ``team_size - 1``.
+
+        Returns None if the supervisor is not a tmux-managed instance.
+        """
+
+        def log_progress(readiness: TeamReadiness) -> None:
+            logger.info(f"Team of {supervisor_id}: {readiness.summary()}")
+
+        try:
+            return await self.tmux_manager.wait_for_descendants(
+                supervisor_id,
+                max(0, team_size - 1),
+                timeout,
+                on_progress=on_progress or log_progress,
+            )
+        except ValueError as e:
+            logger.warning(f"Not waiting for team of {supervisor_id}: {e}")
+            return None
+
     def _parse_template_metadata(self, template_content: str) -> dict[str, Any]:
         """Extract metadata from template markdown."""
         lines = template_content.split("\n")
 
+        # The header's size; later "Team Size" lines describe variations
         team_size = 6
         for line in lines:
             if "Team Size" in line and "instances" in line:
                 try:
                     parts = line.split("instances")[0].split()
                     team_size = int(parts[-1])
+                    break
                 except (ValueError, IndexError):
                     pass
 
@@ -7,14 +7,51 @@ Implements robust error handling and never raises exceptions.
 Phase 2: LLM Integration for Activity Summarization
 """
 
+import asyncio
+import json
 import logging
 import os
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
 
 try:
     import aiohttp
 except ImportError:
     aiohttp = None
 
+#: Longest Retry-After honored before giving up on a rate-limited request
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+#: Activity sent per instance is cut to its last this-many characters
+MAX_ACTIVITY_CHARS = 4000
+
+
+class SummaryUnavailable(str):
+    """Fallback text returned in place of a summary that could not be generated.
+
+    It reads like a summary, so it can be shown as-is; callers that must not
+    treat it as one (as context for the next summary, say) check its type.
+    """
+
+    reason: str = ""
+
+
+def summary_unavailable(instance_id: str, reason: str) -> SummaryUnavailable:
+    fallback = SummaryUnavailable(f"Instance {instance_id}: Summary unavailable ({reason})")
+    fallback.reason = reason
+    return fallback
+
+
+@dataclass
+class SummaryRequest:
+    """One instance's activity, to be summarized as part of a batch."""
+
+    instance_id: str
+    activity_text: str
+    previous_summary: str | None = None
+
 
 # SECURITY FIX (CWE-532): Helper function to redact secrets in logs
 def redact_secret(secret: str | None, show_chars: int = 4) -> str:
@@ -34,12 +71,100 @@ def redact_secret(secret: str | None, show_chars: int = 4) -> str:
     return f"***{secret[-show_chars:]}"
 
 
+def retry_after_seconds(value: str | None, default: float = 1.0) -> float:
+    """Parse a Retry-After header (delta-seconds or HTTP date), capped."""
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return default
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token) for sizing batches."""
+    return len(text) // 4 + 1
+
+
+def parse_batch_summaries(content: str, instance_ids: list[str]) -> dict[str, str]:
+    """Per-instance summaries from a batched reply; instances missing or empty are left out.
+
+    The reply should be a JSON object keyed by instance ID. Text around the
+    object (a Markdown code fence, a preamble) is ignored; anything that
+    does not parse yields an empty dict.
+    """
+    start, end = content.find("{"), content.rfind("}")
+    if start == -1 or end < start:
+        return {}
+    try:
+        data = json.loads(content[start : end + 1])
+    except ValueError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        instance_id: data[instance_id].strip()
+        for instance_id in instance_ids
+        if isinstance(data.get(instance_id), str) and data[instance_id].strip()
+    }
+
+
+def _truncate_activity(activity_text: str) -> str:
+    if len(activity_text) > MAX_ACTIVITY_CHARS:
+        return "..." + activity_text[-MAX_ACTIVITY_CHARS:]
+    return activity_text
+
+
+class TokenBucket:
+    """Request rate limiter: ``rate`` tokens per second, up to ``burst`` banked.
+
+    ``pause`` holds every caller back until a deadline, which is how a 429's
+    Retry-After is applied to all in-flight and queued requests at once.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                if self.rate <= 0:
+                    return
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+
 class LLMSummarizer:
     """
     Generates natural language summaries of Claude instance activities using OpenRouter API.
 
     Features:
-    - Async API calls using aiohttp
+    - Async API calls over one pooled, keep-alive aiohttp session (``close()`` it)
+    - At most ``max_concurrent`` requests in flight, ``requests_per_second`` on
+      average; a 429 pauses every request for its Retry-After, then retries
+    - ``summarize_batch`` packs up to ``batch_size`` instances into one request,
+      falling back to one request per instance when the reply does not parse
     - Robust error handling (never raises exceptions)
     - Configurable model and timeout
     - Automatic fallback summaries on errors
@@ -71,6 +196,11 @@ class LLMSummarizer:
     DEFAULT_MODEL = "google/gemini-2.0-flash-exp:free"
     DEFAULT_TIMEOUT = 30  # seconds
     DEFAULT_MAX_TOKENS = 100  # Reduced for more concise summaries
+    DEFAULT_MAX_CONCURRENT = 4
+    DEFAULT_REQUESTS_PER_SECOND = 4.0
+    DEFAULT_MAX_RETRIES = 2  # retries after a 429
+    DEFAULT_BATCH_SIZE = 1  # instances per request; 1 disables batching
+    DEFAULT_BATCH_TOKEN_BUDGET = 8000  # estimated prompt tokens per batched request
 
     # Recommended models for different use cases (2025)
     RECOMMENDED_MODELS = {
@@ -87,7 +217,15 @@ class LLMSummarizer:
     }
 
     def __init__(
-        self, api_key: str | None = None, model: str = DEFAULT_MODEL, timeout: int = DEFAULT_TIMEOUT
+        self,
+        api_key: str | None = None,
+        model: str = DEFAULT_MODEL,
+        timeout: int = DEFAULT_TIMEOUT,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_token_budget: int = DEFAULT_BATCH_TOKEN_BUDGET,
     ):
         """
         Initialize the LLMSummarizer.
@@ -112,6 +250,11 @@ class LLMSummarizer:
                 See RECOMMENDED_MODELS class attribute for full list.
 
             timeout: Request timeout in seconds (default: 30)
+            max_concurrent: Requests in flight at once; also the connection pool size
+            requests_per_second: Average request rate (0 disables rate limiting)
+            max_retries: Retries of a request rejected with 429
+            batch_size: Instances ``summarize_batch`` packs into one request
+            batch_token_budget: Estimated prompt tokens a batched request may carry
 
         Example:
             >>> # Use free Gemini model
@@ -135,6 +278,21 @@ class LLMSummarizer:
         self.timeout = timeout
         self.logger = logging.getLogger(__name__)
 
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_retries = max_retries
+        self.batch_size = max(1, batch_size)
+        self.batch_token_budget = batch_token_budget
+        self._session: Any = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._rate_limiter = TokenBucket(requests_per_second, burst=self.max_concurrent)
+        self.requests_sent = 0
+        self.rate_limited = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.batches_sent = 0
+        self.batched_instances = 0
+        self.batch_fallbacks = 0
+
         # Validate aiohttp is available
         if aiohttp is None:
             self.logger.warning(
@@ -153,7 +311,11 @@ class LLMSummarizer:
             )
 
     async def summarize_activity(
-        self, instance_id: str, activity_text: str, max_tokens: int = DEFAULT_MAX_TOKENS
+        self,
+        instance_id: str,
+        activity_text: str,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        previous_summary: str | None = None,
     ) -> str:
         """
         Generate a natural language summary of instance activity.
@@ -162,10 +324,14 @@ class LLMSummarizer:
             instance_id: ID of the Claude instance
             activity_text: Recent activity/output text to summarize
             max_tokens: Maximum tokens for the summary (default: 200)
+            previous_summary: Summary of the activity before ``activity_text``;
+                when given, only the new activity is sent and the model
+                updates this summary instead of starting over
 
         Returns:
             Natural language summary (2-3 sentences). Never raises exceptions.
-            Returns meaningful fallback string on any error.
+            Returns a meaningful fallback string, as a ``SummaryUnavailable``,
+            on any error.
 
         Error Handling:
             - No API key: Returns "No API key configured" fallback
@@ -185,40 +351,154 @@ class LLMSummarizer:
         # Validate inputs
         if not activity_text or len(activity_text.strip()) == 0:
             self.logger.debug(f"Empty activity text for instance {instance_id}")
-            return f"Instance {instance_id}: No activity to summarize"
+            return SummaryUnavailable(f"Instance {instance_id}: No activity to summarize")
 
         # Check prerequisites
         if not self.api_key:
             self.logger.warning(f"No API key available for instance {instance_id}")
-            return f"Instance {instance_id}: Summary unavailable (no API key configured)"
+            return summary_unavailable(instance_id, "no API key configured")
 
         if aiohttp is None:
             self.logger.warning(f"aiohttp not available for instance {instance_id}")
-            return f"Instance {instance_id}: Summary unavailable (aiohttp not installed)"
+            return summary_unavailable(instance_id, "aiohttp not installed")
 
         # Generate summary via OpenRouter API
         try:
             summary = await self._call_openrouter_api(
-                instance_id=instance_id, activity_text=activity_text, max_tokens=max_tokens
+                instance_id=instance_id,
+                activity_text=activity_text,
+                max_tokens=max_tokens,
+                previous_summary=previous_summary,
             )
             return summary
 
         except TimeoutError:
             self.logger.warning(f"Timeout generating summary for instance {instance_id}")
-            return f"Instance {instance_id}: Summary generation timed out"
+            return SummaryUnavailable(f"Instance {instance_id}: Summary generation timed out")
 
         except aiohttp.ClientError as e:
             self.logger.warning(f"Network error generating summary for instance {instance_id}: {e}")
-            return f"Instance {instance_id}: Summary unavailable (network error)"
+            return summary_unavailable(instance_id, "network error")
 
         except Exception as e:
             self.logger.warning(
                 f"Unexpected error generating summary for instance {instance_id}: {e}"
             )
-            return f"Instance {instance_id}: Summary unavailable (error: {type(e).__name__})"
+            return summary_unavailable(instance_id, f"error: {type(e).__name__}")
+
+    async def summarize_batch(
+        self, requests: list[SummaryRequest], max_tokens: int = DEFAULT_MAX_TOKENS
+    ) -> dict[str, str]:
+        """
+        Summarize several instances with as few requests as possible.
+
+        Requests are packed in order into batches of up to ``batch_size``
+        instances and ``batch_token_budget`` estimated prompt tokens. Each
+        batch is one API call that asks for a JSON object of summaries keyed
+        by instance ID, so the instructions are sent once per batch instead
+        of once per instance. Instances whose summary is missing from the
+        reply (or the whole batch, if the reply does not parse) are
+        summarized one request each, as ``summarize_activity``. If the
+        request itself fails (an HTTP error, or a 429 that outlasts the
+        retries), every instance in the batch gets the fallback instead.
+
+        Args:
+            requests: Activity to summarize, one entry per instance
+            max_tokens: Maximum tokens per instance summary
+
+        Returns:
+            Instance ID -> summary, for every request. Never raises exceptions.
+        """
+        batchable = [r for r in requests if r.activity_text and r.activity_text.strip()]
+        if self.batch_size == 1 or not self.api_key or aiohttp is None:
+            batchable = []
+        batched_ids = {r.instance_id for r in batchable}
+        singles = [r for r in requests if r.instance_id not in batched_ids]
+
+        results = await asyncio.gather(
+            *(self._summarize_chunk(chunk, max_tokens) for chunk in self._plan_batches(batchable)),
+            self._summarize_each(singles, max_tokens),
+        )
+        summaries: dict[str, str] = {}
+        for result in results:
+            summaries.update(result)
+        return summaries
+
+    def _plan_batches(self, requests: list[SummaryRequest]) -> list[list[SummaryRequest]]:
+        """Split ``requests`` into batches within the size and token budget."""
+        batches: list[list[SummaryRequest]] = []
+        batch: list[SummaryRequest] = []
+        tokens = 0
+        for request in requests:
+            cost = estimate_tokens(_truncate_activity(request.activity_text))
+            if request.previous_summary:
+                cost += estimate_tokens(request.previous_summary)
+            if batch and (len(batch) >= self.batch_size or tokens + cost > self.batch_token_budget):
+                batches.append(batch)
+                batch, tokens = [], 0
+            batch.append(request)
+            tokens += cost
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def _summarize_chunk(
+        self, batch: list[SummaryRequest], max_tokens: int
+    ) -> dict[str, str]:
+        """One batched request; instances a reply did not answer go one by one."""
+        if len(batch) == 1:
+            return await self._summarize_each(batch, max_tokens)
+
+        instance_ids = [r.instance_id for r in batch]
+        label = f"batch of {len(batch)}"
+        try:
+            content = await self._complete(
+                label, self._build_batch_prompt(batch), max_tokens * len(batch)
+            )
+        except Exception as e:
+            self.logger.warning(f"Error generating summaries for {label}: {e}")
+            content = summary_unavailable(label, f"error: {type(e).__name__}")
+        self.batches_sent += 1
+
+        # A failed request would fail the same way once per instance
+        if isinstance(content, SummaryUnavailable):
+            return {iid: summary_unavailable(iid, content.reason) for iid in instance_ids}
+
+        summaries = parse_batch_summaries(content, instance_ids)
+        self.batched_instances += len(summaries)
+
+        missing = [r for r in batch if r.instance_id not in summaries]
+        if missing:
+            self.batch_fallbacks += len(missing)
+            self.logger.warning(
+                f"Batched reply covered {len(summaries)}/{len(batch)} instances, "
+                f"summarizing {len(missing)} individually"
+            )
+            summaries.update(await self._summarize_each(missing, max_tokens))
+        return summaries
+
+    async def _summarize_each(
+        self, requests: list[SummaryRequest], max_tokens: int
+    ) -> dict[str, str]:
+        summaries = await asyncio.gather(
+            *(
+                self.summarize_activity(
+                    instance_id=r.instance_id,
+                    activity_text=r.activity_text,
+                    max_tokens=max_tokens,
+                    previous_summary=r.previous_summary,
+                )
+                for r in requests
+            )
+        )
+        return {r.instance_id: summary for r, summary in zip(requests, summaries, strict=True)}
 
     async def _call_openrouter_api(
-        self, instance_id: str, activity_text: str, max_tokens: int
+        self,
+        instance_id: str,
+        activity_text: str,
+        max_tokens: int,
+        previous_summary: str | None = None,
     ) -> str:
         """
         Call OpenRouter API to generate summary.
@@ -227,6 +507,7 @@ class LLMSummarizer:
             instance_id: ID of the instance
             activity_text: Activity text to summarize
             max_tokens: Maximum tokens for response
+            previous_summary: Summary to update with ``activity_text``, if any
 
         Returns:
             Generated summary text
@@ -236,6 +517,66 @@ class LLMSummarizer:
             asyncio.TimeoutError: On timeout
             Exception: On other errors
         """
+        # Truncate activity text if too long (keep last 4000 chars)
+        activity_text = _truncate_activity(activity_text)
+
+        # Build prompt
+        prompt = self._build_prompt(instance_id, activity_text, previous_summary)
+        return await self._complete(instance_id, prompt, max_tokens)
+
+    async def _complete(self, label: str, prompt: str, max_tokens: int) -> str:
+        """Send one chat completion over the shared session, within the limits.
+
+        ``label`` names the instance (or batch) in logs and fallback strings.
+        """
+        api_url = self._api_url()
+
+        # Prepare request
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/anthropics/madrox",
+            "X-Title": "Madrox Instance Monitor",
+        }
+
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": 0.7,
+        }
+
+        session = self._get_session()
+        for attempt in range(self.max_retries + 1):
+            async with self._semaphore:
+                await self._rate_limiter.acquire()
+                self.requests_sent += 1
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                try:
+                    async with session.post(api_url, headers=headers, json=payload) as response:
+                        if response.status != 429:
+                            return await self._parse_response(label, response)
+                        if attempt < self.max_retries:
+                            delay = retry_after_seconds(response.headers.get("Retry-After"))
+                            self.rate_limited += 1
+                            self.logger.warning(
+                                f"OpenRouter rate limited {label}, retrying in {delay:.1f}s"
+                            )
+                            self._rate_limiter.pause(delay)
+                finally:
+                    self.in_flight -= 1
+        self.logger.warning(
+            f"OpenRouter still rate limiting {label} after {self.max_retries} retries"
+        )
+        return summary_unavailable(label, "API error 429")
+
+    def _api_url(self) -> str:
+        """The OpenRouter endpoint, checked against the allowlist.
+
+        Raises:
+            ValueError: If the endpoint is not a trusted OpenRouter HTTPS URL
+        """
         # SECURITY FIX (CWE-918): Validate API URL against allowlist to prevent SSRF
         api_url = self.OPENROUTER_API_URL
         if api_url not in self.TRUSTED_ENDPOINTS:
@@ -260,70 +601,89 @@ class LLMSummarizer:
             self.logger.error(f"Security violation: Invalid domain rejected: {parsed_url.netloc}")
             raise ValueError(f"Only openrouter.ai domains are permitted. Got: {parsed_url.netloc}")
 
-        # Truncate activity text if too long (keep last 4000 chars)
-        if len(activity_text) > 4000:
-            activity_text = "..." + activity_text[-4000:]
+        return api_url
 
-        # Build prompt
-        prompt = self._build_prompt(instance_id, activity_text)
+    async def _parse_response(self, instance_id: str, response: Any) -> str:
+        """Summary text from an OpenRouter response, or a fallback string."""
+        # Check HTTP status
+        if response.status != 200:
+            error_text = await response.text()
+            self.logger.warning(
+                f"OpenRouter API returned status {response.status}: {error_text[:200]}"
+            )
+            return summary_unavailable(instance_id, f"API error {response.status}")
 
-        # Prepare request
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/anthropics/madrox",
-            "X-Title": "Madrox Instance Monitor",
-        }
+        # Parse response
+        data = await response.json()
 
-        payload = {
-            "model": self.model,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": max_tokens,
-            "temperature": 0.7,
+        # Extract summary from response
+        if "choices" in data and len(data["choices"]) > 0:
+            summary = data["choices"][0]["message"]["content"].strip()
+            self.logger.debug(f"Generated summary for instance {instance_id}: {len(summary)} chars")
+            return summary
+        else:
+            self.logger.warning(f"Unexpected API response format for instance {instance_id}")
+            return summary_unavailable(instance_id, "unexpected API response")
+
+    def _get_session(self) -> Any:
+        """The shared session, created on first use (needs a running loop).
+
+        Its connector keeps up to ``max_concurrent`` connections alive between
+        polls, so summaries after the first skip the TCP and TLS handshakes.
+        """
+        if self._session is None or self._session.closed is True:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrent, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared session and its pooled connections."""
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "requests_sent": self.requests_sent,
+            "rate_limited": self.rate_limited,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "max_concurrent": self.max_concurrent,
+            "requests_per_second": self._rate_limiter.rate,
+            "batch_size": self.batch_size,
+            "batches_sent": self.batches_sent,
+            "batched_instances": self.batched_instances,
+            "batch_fallbacks": self.batch_fallbacks,
         }
 
-        # Make request with timeout
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(api_url, headers=headers, json=payload) as response:
-                # Check HTTP status
-                if response.status != 200:
-                    error_text = await response.text()
-                    self.logger.warning(
-                        f"OpenRouter API returned status {response.status}: {error_text[:200]}"
-                    )
-                    return (
-                        f"Instance {instance_id}: Summary unavailable (API error {response.status})"
-                    )
-
-                # Parse response
-                data = await response.json()
-
-                # Extract summary from response
-                if "choices" in data and len(data["choices"]) > 0:
-                    summary = data["choices"][0]["message"]["content"].strip()
-                    self.logger.debug(
-                        f"Generated summary for instance {instance_id}: {len(summary)} chars"
-                    )
-                    return summary
-                else:
-                    self.logger.warning(
-                        f"Unexpected API response format for instance {instance_id}"
-                    )
-                    return f"Instance {instance_id}: Summary unavailable (unexpected API response)"
-
-    def _build_prompt(self, instance_id: str, activity_text: str) -> str:
+    def _build_prompt(
+        self, instance_id: str, activity_text: str, previous_summary: str | None = None
+    ) -> str:
         """
         Build the prompt for summary generation.
 
         Args:
             instance_id: ID of the instance
             activity_text: Activity text to summarize
+            previous_summary: Summary to update, when ``activity_text`` is only
+                the activity since it
 
         Returns:
             Formatted prompt string
         """
+        if previous_summary:
+            return f"""Update this Claude instance's activity summary in 1-2 very brief sentences. Focus only on key actions and current status. Be extremely concise.
+
+Previous summary:
+{previous_summary}
+
+New activity since then:
+{activity_text}
+
+Updated summary:"""
+
         return f"""Summarize this Claude instance's activity in 1-2 very brief sentences. Focus only on key actions and current status. Be extremely concise.
 
 Activity:
@@ -331,6 +691,39 @@ Activity:
 
 Brief summary:"""
 
+    def _build_batch_prompt(self, requests: list[SummaryRequest]) -> str:
+        """
+        Build one prompt summarizing several instances, answered as JSON.
+
+        Args:
+            requests: The instances in the batch, each with its activity and
+                previous summary (if any)
+
+        Returns:
+            Formatted prompt string
+        """
+        sections = []
+        for request in requests:
+            activity_text = _truncate_activity(request.activity_text)
+            if request.previous_summary:
+                body = (
+                    f"Previous summary:\n{request.previous_summary}\n\n"
+                    f"New activity since then:\n{activity_text}"
+                )
+            else:
+                body = f"Activity:\n{activity_text}"
+            sections.append(f"=== Instance {request.instance_id} ===\n{body}")
+        instance_ids = ", ".join(json.dumps(r.instance_id) for r in requests)
+        instances = "\n\n".join(sections)
+
+        return f"""Summarize each Claude instance's activity below in 1-2 very brief sentences. Focus only on key actions and current status. Be extremely concise. Where a previous summary is given, update it with the new activity.
+
+Reply with only a JSON object that has one key per instance ID ({instance_ids}) and that instance's summary as the value.
+
+{instances}
+
+JSON:"""
+
     def __repr__(self) -> str:
         """String representation of the summarizer."""
         # SECURITY FIX (CWE-532): Redact API key in string representation
@@ -0,0 +1,240 @@
+"""Fan-out of serialised log messages to WebSocket clients.
+
+``LogStreamHandler`` used to build a dict per record, spawn a task per
+record, and have that task ``send_json`` to every client in turn: each
+message was serialised once per client, one slow browser held up all the
+others, and a log burst left thousands of tasks queued behind it.
+
+``LogBroadcaster`` takes each message already serialised and appends it to
+a bounded queue per client. Each client has one writer task that drains
+its own queue, so clients no longer wait on one another. When a queue is
+full, the client's overflow policy decides what is lost:
+
+* ``drop_oldest`` (default) discards the oldest queued message, so a
+  lagging dashboard skips ahead to recent logs
+* ``drop_newest`` discards the incoming message
+* ``disconnect`` closes the client, which can reconnect and reload history
+
+Per-client queue depth, lag, sent and dropped counts are in ``stats()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Literal
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["drop_oldest", "drop_newest", "disconnect"]
+
+#: Messages a client may have queued before its overflow policy applies.
+DEFAULT_CLIENT_QUEUE_SIZE = 1000
+DEFAULT_OVERFLOW_POLICY: OverflowPolicy = "drop_oldest"
+
+#: WebSocket close code sent to clients dropped by the ``disconnect`` policy.
+_CLOSE_TRY_AGAIN_LATER = 1013
+
+
+class ClientStream:
+    """One WebSocket client's queue and the writer task that drains it."""
+
+    def __init__(
+        self,
+        websocket: Any,
+        client_id: int,
+        max_queue: int,
+        policy: OverflowPolicy,
+        on_close: Any,
+    ):
+        self.websocket = websocket
+        self.client_id = client_id
+        self.max_queue = max_queue
+        self.policy = policy
+        self._on_close = on_close
+        # (enqueued at, payload)
+        self._queue: deque[tuple[float, str]] = deque()
+        self._ready = asyncio.Event()
+        self.closed = False
+        self.sent = 0
+        self.dropped = 0
+        self.max_queued = 0
+        self._task = asyncio.get_running_loop().create_task(self._drain())
+
+    def put(self, payload: str) -> bool:
+        """Queue ``payload`` for this client. Returns False if it was not queued.
+
+        Must be called on the event loop thread.
+        """
+        if self.closed:
+            return False
+        if len(self._queue) >= self.max_queue:
+            if self.policy == "drop_newest":
+                self.dropped += 1
+                return False
+            if self.policy == "disconnect":
+                self.dropped += len(self._queue) + 1
+                self._queue.clear()
+                self._task.cancel()
+                self._task.get_loop().create_task(self._disconnect())
+                return False
+            self._queue.popleft()
+            self.dropped += 1
+        self._queue.append((time.monotonic(), payload))
+        self.max_queued = max(self.max_queued, len(self._queue))
+        self._ready.set()
+        return True
+
+    async def _drain(self) -> None:
+        try:
+            while True:
+                await self._ready.wait()
+                self._ready.clear()
+                while self._queue:
+                    _, payload = self._queue.popleft()
+                    await self.websocket.send_text(payload)
+                    self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Log stream client {self.client_id} send failed: {e}")
+            self._close()
+
+    async def _disconnect(self) -> None:
+        logger.warning(
+            f"Log stream client {self.client_id} fell {self.max_queue} messages behind; "
+            "disconnecting"
+        )
+        self._close()
+        try:
+            await self.websocket.close(code=_CLOSE_TRY_AGAIN_LATER, reason="Log stream lagging")
+        except Exception:
+            pass
+
+    def _close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._queue.clear()
+            self._on_close(self)
+
+    def cancel(self) -> None:
+        """Stop the writer task and drop anything still queued."""
+        self._task.cancel()
+        self._close()
+
+    @property
+    def lag_seconds(self) -> float:
+        """Age of the oldest message still waiting to be sent."""
+        return time.monotonic() - self._queue[0][0] if self._queue else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "client": self.client_id,
+            "policy": self.policy,
+            "queued": len(self._queue),
+            "max_queued": self.max_queued,
+            "lag_seconds": round(self.lag_seconds, 3),
+            "sent": self.sent,
+            "dropped": self.dropped,
+        }
+
+
+class LogBroadcaster:
+    """Sends each published message to every client through its own queue.
+
+    Usage::
+
+        broadcaster = LogBroadcaster()
+        stream = broadcaster.add_client(websocket)   # on the event loop
+        broadcaster.publish(json.dumps(message))     # from any thread
+        broadcaster.remove_client(websocket)
+    """
+
+    def __init__(
+        self,
+        max_queue: int = DEFAULT_CLIENT_QUEUE_SIZE,
+        policy: OverflowPolicy = DEFAULT_OVERFLOW_POLICY,
+    ):
+        self.max_queue = max_queue
+        self.policy = policy
+        self._clients: dict[Any, ClientStream] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._ids = itertools.count(1)
+        self.published = 0
+
+    @property
+    def clients(self) -> set[Any]:
+        """The connected WebSockets."""
+        return set(self._clients)
+
+    def add_client(
+        self,
+        websocket: Any,
+        max_queue: int | None = None,
+        policy: OverflowPolicy | None = None,
+    ) -> ClientStream:
+        """Register ``websocket`` and start its writer. Idempotent per websocket."""
+        stream = self._clients.get(websocket)
+        if stream is None or stream.closed:
+            self._loop = asyncio.get_running_loop()
+            stream = ClientStream(
+                websocket,
+                next(self._ids),
+                max_queue or self.max_queue,
+                policy or self.policy,
+                self._forget,
+            )
+            self._clients[websocket] = stream
+        return stream
+
+    def remove_client(self, websocket: Any) -> None:
+        stream = self._clients.pop(websocket, None)
+        if stream is not None:
+            stream.cancel()
+
+    def _forget(self, stream: ClientStream) -> None:
+        if self._clients.get(stream.websocket) is stream:
+            del self._clients[stream.websocket]
+
+    def publish(self, payload: str) -> None:
+        """Queue ``payload`` for every client. Safe to call from any thread."""
+        if not self._clients or self._loop is None or self._loop.is_closed():
+            return
+        if self._on_loop_thread():
+            self._fan_out(payload)
+        else:
+            self._loop.call_soon_threadsafe(self._fan_out, payload)
+
+    def _on_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _fan_out(self, payload: str) -> None:
+        self.published += 1
+        for stream in list(self._clients.values()):
+            stream.put(payload)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "published": self.published,
+            "clients": [stream.stats() for stream in self._clients.values()],
+        }
+
+
+_broadcaster: LogBroadcaster | None = None
+_broadcaster_lock = threading.Lock()
+
+
+def get_log_broadcaster() -> LogBroadcaster:
+    """The process-wide broadcaster shared by the system and audit log streams."""
+    global _broadcaster
+    with _broadcaster_lock:
+        if _broadcaster is None:
+            _broadcaster = LogBroadcaster()
+        return _broadcaster
@@ -3,7 +3,6 @@
 Provides per-instance logging, audit trails, and log aggregation capabilities.
 """
 
-import asyncio
 import json
 import logging
 import logging.handlers
@@ -13,171 +12,89 @@ from typing import Any
 
 from fastapi import WebSocket
 
+from .log_broadcaster import LogBroadcaster, get_log_broadcaster
+
+# Attributes every LogRecord has; anything else on a record came from ``extra``
+_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__.keys()
+    | {"message", "asctime", "taskName"}
+)
+
 
 class LogStreamHandler(logging.Handler):
-    """Custom logging handler that broadcasts logs to WebSocket clients."""
+    """Custom logging handler that broadcasts logs to WebSocket clients.
+
+    Each record is serialised once and handed to a ``LogBroadcaster``, which
+    queues it per client; records are not formatted at all while no client
+    is connected.
+    """
 
     _instance = None
     _log_type = "system_log"  # Default log type
 
-    def __init__(self, log_type: str = "system_log"):
+    def __init__(self, log_type: str = "system_log", broadcaster: LogBroadcaster | None = None):
         """Initialize the log stream handler.
 
         Args:
             log_type: Type of logs to broadcast ("system_log" or "audit_log")
+            broadcaster: Client fan-out to publish to (a private one if omitted)
         """
         super().__init__()
-        self.clients: set[WebSocket] = set()
-        self._lock = asyncio.Lock()
+        self.broadcaster = broadcaster or LogBroadcaster()
         self._log_type = log_type
 
     @classmethod
     def get_instance(cls):
         """Get singleton instance for system logs."""
         if cls._instance is None:
-            cls._instance = cls(log_type="system_log")
+            cls._instance = cls(log_type="system_log", broadcaster=get_log_broadcaster())
         return cls._instance
 
+    @property
+    def clients(self) -> set[WebSocket]:
+        return self.broadcaster.clients
+
     def add_client(self, websocket: WebSocket):
-        """Add a WebSocket client to receive log broadcasts."""
-        self.clients.add(websocket)
+        """Add a WebSocket client to receive log broadcasts (on the event loop)."""
+        return self.broadcaster.add_client(websocket)
 
     def remove_client(self, websocket: WebSocket):
         """Remove a WebSocket client."""
-        self.clients.discard(websocket)
+        self.broadcaster.remove_client(websocket)
 
     def emit(self, record: logging.LogRecord):
-        """Emit a log record to all connected WebSocket clients."""
+        """Serialise a log record once and queue it for every connected client."""
+        if not self.broadcaster.clients:
+            return
         try:
-            # Format audit logs differently from system logs
-            if self._log_type == "audit_log":
-                # Audit log format for frontend compatibility
-                log_entry: dict[str, Any] = {
-                    "timestamp": datetime.fromtimestamp(record.created).isoformat(),
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "message": self.format(record),
-                }
-
-                # Add action from event_type if present
-                if hasattr(record, "event_type"):
-                    log_entry["action"] = record.event_type
-
-                # Collect metadata from extra fields
-                metadata: dict[str, Any] = {}
-                for key, value in record.__dict__.items():
-                    if key not in [
-                        "name",
-                        "msg",
-                        "args",
-                        "created",
-                        "filename",
-                        "funcName",
-                        "levelname",
-                        "levelno",
-                        "lineno",
-                        "module",
-                        "msecs",
-                        "message",
-                        "pathname",
-                        "process",
-                        "processName",
-                        "relativeCreated",
-                        "thread",
-                        "threadName",
-                        "exc_info",
-                        "exc_text",
-                        "stack_info",
-                        "asctime",
-                        "taskName",
-                        "event_type",  # Already used for 'action'
-                    ]:
-                        try:
-                            json.dumps(value)  # Ensure serializable
-                            metadata[key] = value
-                        except (TypeError, ValueError):
-                            metadata[key] = str(value)
-
-                if metadata:
-                    log_entry["metadata"] = metadata
-            else:
-                # System log format
-                log_entry = {
-                    "timestamp": datetime.fromtimestamp(record.created).isoformat(),
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "message": self.format(record),
-                    "module": record.module,
-                    "function": record.funcName,
-                    "line": record.lineno,
-                }
-
-                # Add extra fields if present
-                for key, value in record.__dict__.items():
-                    if key not in [
-                        "name",
-                        "msg",
-                        "args",
-                        "created",
-                        "filename",
-                        "funcName",
-                        "levelname",
-                        "levelno",
-                        "lineno",
-                        "module",
-                        "msecs",
-                        "message",
-                        "pathname",
-                        "process",
-                        "processName",
-                        "relativeCreated",
-                        "thread",
-                        "threadName",
-                        "exc_info",
-                        "exc_text",
-                        "stack_info",
-                        "asctime",
-                        "taskName",
-                    ]:
-                        try:
-                            json.dumps(value)  # Ensure serializable
-                            log_entry[key] = value
-                        except (TypeError, ValueError):
-                            log_entry[key] = str(value)
-
-            # Broadcast to all connected clients (non-blocking)
-            if self.clients:
-                try:
-                    # Get the running event loop and schedule the broadcast
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        asyncio.create_task(self._broadcast(log_entry))
-                except RuntimeError:
-                    # No event loop running, skip WebSocket broadcast
-                    pass
-
+            self.broadcaster.publish(self._serialise(record))
         except Exception as e:
             print(f"[ERROR] Exception in LogStreamHandler.emit(): {e}")
             self.handleError(record)
 
-    async def _broadcast(self, log_entry: dict[str, Any]):
-        """Broadcast log entry to all clients.
-
-        Args:
-            log_entry: The log data to broadcast
-        """
-        dead_clients = set()
-
-        for client in self.clients:
-            try:
-                message = {"type": self._log_type, "data": log_entry}
-                await client.send_json(message)
-            except Exception:
-                dead_clients.add(client)
-
-        # Remove dead clients
-        for client in dead_clients:
-            self.clients.discard(client)
+    def _serialise(self, record: logging.LogRecord) -> str:
+        """The WebSocket message for ``record`` as JSON text."""
+        extras = {k: v for k, v in record.__dict__.items() if k not in _RECORD_ATTRS}
+        log_entry: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": self.format(record),
+        }
+        if self._log_type == "audit_log":
+            # Audit log format for frontend compatibility
+            if "event_type" in extras:
+                log_entry["action"] = extras.pop("event_type")
+            if extras:
+                log_entry["metadata"] = extras
+        else:
+            log_entry.update(
+                {"module": record.module, "function": record.funcName, "line": record.lineno}
+            )
+            log_entry.update(extras)
+
+        # default=str stands in for values JSON cannot represent
+        return json.dumps({"type": self._log_type, "data": log_entry}, default=str)
 
 
 # Global singletons for system and audit log handlers
@@ -193,7 +110,9 @@ def get_audit_log_stream_handler() -> LogStreamHandler:
     """Get the global log stream handler instance for audit logs."""
     global _audit_log_stream_handler
     if _audit_log_stream_handler is None:
-        _audit_log_stream_handler = LogStreamHandler(log_type="audit_log")
+        _audit_log_stream_handler = LogStreamHandler(
+            log_type="audit_log", broadcaster=get_log_broadcaster()
+        )
     return _audit_log_stream_handler
 
 
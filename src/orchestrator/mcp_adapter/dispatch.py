@@ -0,0 +1,125 @@
+"""Tool dispatch table for the MCP adapter.
+
+``tools/call`` used to walk a chain of ``if tool_name == ...`` branches,
+importing modules inside some of them and scanning every instance (twice
+for team spawns) to guess the caller before it even knew which tool was
+called. Handlers now register here by name:
+
+    @tools.handler("get_children")
+    async def _get_children(self, call: ToolCall) -> dict[str, Any]:
+        ...
+
+Dispatch is one dict lookup. Only handlers declared ``needs_caller`` pay
+for caller detection, and only when the call does not name its parent.
+``ToolStats`` times every call per tool for ``/health``; ``CallerStats``
+counts how often the caller came from its token rather than a guess.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from ..tmux_instance_manager.async_tmux import LatencyHistogram
+
+
+@dataclass(frozen=True)
+class ToolCall:
+    """One ``tools/call``: the tool name, its arguments and the detected caller.
+
+    ``caller`` is only filled in for handlers declared ``needs_caller``.
+    """
+
+    name: str
+    args: dict[str, Any]
+    caller: str | None = None
+
+
+HandlerFn = Callable[[Any, ToolCall], Awaitable[dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class ToolHandler:
+    name: str
+    fn: HandlerFn  # unbound adapter method: fn(adapter, call)
+    needs_caller: bool = False
+
+
+class ToolRegistry:
+    """Tool name -> handler, filled in by ``@tools.handler`` as mixins load."""
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, ToolHandler] = {}
+
+    def handler(self, *names: str, needs_caller: bool = False) -> Callable[[HandlerFn], HandlerFn]:
+        """Register the decorated method as the handler for each of ``names``."""
+
+        def register(fn: HandlerFn) -> HandlerFn:
+            for name in names:
+                if name in self._handlers:
+                    raise ValueError(f"Duplicate MCP tool handler: {name}")
+                self._handlers[name] = ToolHandler(name, fn, needs_caller)
+            return fn
+
+        return register
+
+    def get(self, name: str | None) -> ToolHandler | None:
+        return self._handlers.get(name) if name else None
+
+    def names(self) -> list[str]:
+        return sorted(self._handlers)
+
+
+#: Registry shared by all mcp_adapter handler mixins
+tools = ToolRegistry()
+
+
+class _ToolTotals:
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.errors = 0
+
+
+class ToolStats:
+    """Per-tool call counts, errors, latency and throughput."""
+
+    def __init__(self) -> None:
+        self._totals: dict[str, _ToolTotals] = {}
+        self._started = time.monotonic()
+
+    def record(self, tool: str, seconds: float, ok: bool) -> None:
+        totals = self._totals.get(tool)
+        if totals is None:
+            totals = self._totals[tool] = _ToolTotals()
+        totals.latency.observe(seconds)
+        if not ok:
+            totals.errors += 1
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Per-tool totals, the tools taking the most server time first."""
+        minutes = max(time.monotonic() - self._started, 1.0) / 60
+        ranked = sorted(
+            self._totals.items(), key=lambda item: item[1].latency.total_seconds, reverse=True
+        )
+        return {
+            tool: {
+                **totals.latency.as_dict(),
+                "errors": totals.errors,
+                "total_seconds": round(totals.latency.total_seconds, 3),
+                "calls_per_minute": round(totals.latency.count / minutes, 2),
+            }
+            for tool, totals in ranked
+        }
+
+
+class CallerStats:
+    """How callers of ``needs_caller`` tools were identified."""
+
+    def __init__(self) -> None:
+        self.token = 0  # resolved from the instance's caller token
+        self.fallback = 0  # guessed by _detect_caller_instance
+
+    def as_dict(self) -> dict[str, int]:
+        return {"token": self.token, "fallback": self.fallback}
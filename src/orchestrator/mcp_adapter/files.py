@@ -0,0 +1,166 @@
+"""File tools: workspace listings and retrieval."""
+
+import asyncio
+import json
+import logging
+from typing import Any
+
+from .dispatch import ToolCall, tools
+
+logger = logging.getLogger(__name__)
+
+
+class FilesToolsMixin:
+    """File tool handlers."""
+
+    # Declared by MCPAdapter; present here for type checking only
+    manager: Any
+
+    @tools.handler("retrieve_instance_file")
+    async def _handle_retrieve_instance_file(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Bypass decorator - use internal method
+        file_path = await self.manager._retrieve_instance_file_internal(
+            instance_id=tool_args["instance_id"],
+            filename=tool_args["filename"],
+            destination_path=tool_args.get("destination_path"),
+        )
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"File retrieved successfully to: {file_path}"
+                    if file_path
+                    else "File not found",
+                }  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    @tools.handler("list_instance_files")
+    async def _handle_list_instance_files(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Bypass decorator - use internal method
+        files = await self.manager._list_instance_files_internal(
+            instance_id=tool_args["instance_id"]
+        )
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": json.dumps(files, indent=2)
+                    if files
+                    else "No files found or instance not found",
+                }  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    @tools.handler("retrieve_multiple_instance_files")
+    async def _handle_retrieve_multiple_instance_files(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        requests = tool_args.get("requests", [])
+
+        # Create tasks for all file retrievals - bypass decorator
+        retrieve_tasks = []
+        for req in requests:
+            retrieve_tasks.append(
+                self.manager._retrieve_instance_file_internal(
+                    instance_id=req["instance_id"],
+                    filename=req["filename"],
+                    destination_path=req.get("destination_path"),
+                )
+            )
+
+        # Execute all in parallel
+        results = await asyncio.gather(*retrieve_tasks, return_exceptions=True)
+
+        # Process results
+        retrieved_files = []
+        errors = []
+
+        for idx, retrieve_result in enumerate(results):
+            req = requests[idx]
+            instance_id = req["instance_id"]
+            filename = req["filename"]
+
+            if isinstance(retrieve_result, Exception):
+                errors.append(
+                    {
+                        "instance_id": instance_id,
+                        "filename": filename,
+                        "error": str(retrieve_result),
+                    }
+                )
+            elif retrieve_result:
+                retrieved_files.append(
+                    {
+                        "instance_id": instance_id,
+                        "filename": filename,
+                        "path": retrieve_result,
+                    }
+                )
+            else:
+                errors.append(
+                    {
+                        "instance_id": instance_id,
+                        "filename": filename,
+                        "error": "File not found",
+                    }
+                )
+
+        # Build response text
+        response_lines = [f"Retrieved {len(retrieved_files)}/{len(requests)} files successfully"]
+
+        if retrieved_files:
+            response_lines.append("\nRetrieved files:")
+            for file_info in retrieved_files:
+                response_lines.append(
+                    f"  - {file_info['instance_id']}/{file_info['filename']}: {file_info['path']}"
+                )
+
+        if errors:
+            response_lines.append("\nErrors:")
+            for error in errors:
+                response_lines.append(
+                    f"  - {error['instance_id']}/{error['filename']}: {error['error']}"
+                )
+
+        result = {"content": [{"type": "text", "text": "\n".join(response_lines)}]}  # type: ignore[list-item]
+        return result
+
+    @tools.handler("list_multiple_instance_files")
+    async def _handle_list_multiple_instance_files(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        instance_ids = tool_args.get("instance_ids", [])
+
+        # Create tasks for all list operations - bypass decorator
+        list_tasks = []
+        for instance_id in instance_ids:
+            list_tasks.append(self.manager._list_instance_files_internal(instance_id=instance_id))
+
+        # Execute all in parallel
+        results = await asyncio.gather(*list_tasks, return_exceptions=True)
+
+        # Process results
+        file_listings = []
+        errors = []
+
+        for idx, list_result in enumerate(results):
+            instance_id = instance_ids[idx]
+
+            if isinstance(list_result, Exception):
+                errors.append({"instance_id": instance_id, "error": str(list_result)})
+            elif list_result:
+                file_listings.append({"instance_id": instance_id, "files": list_result})
+            else:
+                file_listings.append({"instance_id": instance_id, "files": []})
+
+        # Build response
+        response_data = {"listings": file_listings, "errors": errors}
+        result = {
+            "content": [
+                {"type": "text", "text": json.dumps(response_data, indent=2)}  # type: ignore[list-item]
+            ]
+        }
+        return result
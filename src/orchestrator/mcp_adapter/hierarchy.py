@@ -0,0 +1,71 @@
+"""Hierarchy tools: children, peers and the instance tree."""
+
+import json
+import logging
+from typing import Any
+
+from .dispatch import ToolCall, tools
+
+logger = logging.getLogger(__name__)
+
+
+class HierarchyToolsMixin:
+    """Hierarchy tool handlers."""
+
+    # Declared by MCPAdapter; present here for type checking only
+    manager: Any
+
+    @tools.handler("get_children")
+    async def _handle_get_children(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Bypass decorator - use internal method
+        children = self.manager._get_children_internal(parent_id=tool_args["parent_id"])
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"Found {len(children)} children:\n\n" + json.dumps(children, indent=2),
+                }  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    @tools.handler("get_peers")
+    async def _handle_get_peers(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Bypass decorator - use internal method
+        peers = self.manager._get_peers_internal(instance_id=tool_args["instance_id"])
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"Found {len(peers)} peers:\n\n" + json.dumps(peers, indent=2),
+                }  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    @tools.handler("get_instance_tree")
+    async def _handle_get_instance_tree(self, call: ToolCall) -> dict[str, Any]:
+        # Bypass decorator - inline tree building
+        roots = []
+        for instance_id, instance in self.manager.instances.items():
+            if not instance.get("parent_instance_id") and instance.get("state") != "terminated":
+                roots.append((instance_id, instance.get("name", "unknown")))
+
+        if not roots:
+            tree_output = "No instances running"
+        else:
+            roots.sort(key=lambda x: x[1])
+            lines: list[str] = []
+            for i, (root_id, _) in enumerate(roots):
+                is_last_root = i == len(roots) - 1
+                self.manager._build_tree_recursive(root_id, "", is_last_root, lines, is_root=True)
+            tree_output = "\n".join(lines)
+
+        result = {
+            "content": [
+                {"type": "text", "text": f"Instance Hierarchy:\n\n{tree_output}"}  # type: ignore[list-item]
+            ]
+        }
+        return result
@@ -0,0 +1,344 @@
+"""Lifecycle tools: status, output, interrupts, termination and resume."""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Any
+
+from .dispatch import ToolCall, tools
+
+logger = logging.getLogger(__name__)
+
+
+class LifecycleToolsMixin:
+    """Lifecycle tool handlers."""
+
+    # Declared by MCPAdapter; present here for type checking only
+    manager: Any
+
+    @tools.handler("get_instance_status")
+    async def _handle_get_instance_status(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Bypass decorator - use internal method
+        # Use summary_only=True when getting all instances to avoid huge payloads
+        instance_id = tool_args.get("instance_id")
+        status = self.manager._get_instance_status_internal(
+            instance_id=instance_id, summary_only=(instance_id is None)
+        )
+        result = {
+            "content": [{"type": "text", "text": json.dumps(status, indent=2)}]  # type: ignore[list-item]
+        }
+        return result
+
+    @tools.handler("get_live_instance_status")
+    async def _handle_get_live_instance_status(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        instance_id = tool_args["instance_id"]
+
+        # Get basic instance status - bypass decorator
+        instance = self.manager._get_instance_status_internal(instance_id)
+
+        # Get event statistics from tmux_manager
+        event_stats = self.manager.tmux_manager.get_event_statistics(instance_id)
+
+        # Get most recent assistant output from message history
+        last_output = None
+        message_history = self.manager.tmux_manager.message_history.get(instance_id, [])
+        if message_history:
+            # Get the last assistant message as last_output
+            for event in reversed(message_history):
+                if event.get("role") == "assistant":
+                    content = event.get("content", "")
+                    last_output = content[:200] + "..." if len(content) > 200 else content
+                    break
+
+        # Calculate execution time (uptime)
+        created_at = datetime.fromisoformat(instance["created_at"])
+        now = datetime.now(created_at.tzinfo) if created_at.tzinfo else datetime.utcnow()
+        execution_time = (now - created_at).total_seconds()
+
+        live_status = {
+            "instance_id": instance_id,
+            "state": instance["state"],
+            "current_tool": None,  # Not available in interactive mode
+            "execution_time": execution_time,
+            "tools_executed": 0,  # Not available in interactive mode
+            "last_output": last_output,
+            "last_activity": instance["last_activity"],
+            "tools_breakdown": {},  # Not available in interactive mode
+            "event_counts": event_stats.get("event_counts", {}),
+            "note": "Tool tracking not available in interactive mode. Use get_tmux_pane_content for detailed output.",
+        }
+
+        result = {
+            "content": [{"type": "text", "text": json.dumps(live_status, indent=2)}]  # type: ignore[list-item]
+        }
+        return result
+
+    @tools.handler("get_instance_output")
+    async def _handle_get_instance_output(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Bypass decorator - use internal helper
+        messages = await self.manager._get_output_messages(
+            instance_id=tool_args["instance_id"],
+            limit=tool_args.get("limit", 100),
+            since=tool_args.get("since"),
+        )
+        output = {"instance_id": tool_args["instance_id"], "output": messages}
+        result = {
+            "content": [{"type": "text", "text": json.dumps(output, indent=2)}]  # type: ignore[list-item]
+        }
+        return result
+
+    @tools.handler("get_multiple_instance_outputs")
+    async def _handle_get_multiple_instance_outputs(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        requests = tool_args.get("requests", [])
+
+        # Create tasks for all output requests - bypass decorator
+        output_tasks = []
+        for req in requests:
+            output_tasks.append(
+                self.manager._get_output_messages(
+                    instance_id=req["instance_id"],
+                    limit=req.get("limit", 100),
+                    since=req.get("since"),
+                )
+            )
+
+        # Execute all in parallel
+        results = await asyncio.gather(*output_tasks, return_exceptions=True)
+
+        # Process results
+        outputs = []
+        errors = []
+
+        for idx, output_result in enumerate(results):
+            instance_id = requests[idx]["instance_id"]
+
+            if isinstance(output_result, Exception):
+                errors.append({"instance_id": instance_id, "error": str(output_result)})
+            else:
+                outputs.append({"instance_id": instance_id, "output": output_result})
+
+        # Build response
+        response_data = {"outputs": outputs, "errors": errors}
+        result = {
+            "content": [
+                {"type": "text", "text": json.dumps(response_data, indent=2)}  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    @tools.handler("get_tmux_pane_content")
+    async def _handle_get_tmux_pane_content(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Bypass decorator - inline tmux pane capture
+        instance_id = tool_args["instance_id"]
+        lines = tool_args.get("lines", 100)
+
+        if instance_id not in self.manager.instances:
+            raise ValueError(f"Instance {instance_id} not found")
+
+        content = await self.manager.tmux_manager.get_tmux_pane_content(instance_id, lines)
+
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": content,
+                }  # type: ignore[list-item]
+            ]
+        }
+
+        return result
+
+    @tools.handler("interrupt_instance")
+    async def _handle_interrupt_instance(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Bypass decorator - use internal method
+        interrupt_result = await self.manager._interrupt_instance_internal(
+            instance_id=tool_args["instance_id"]
+        )
+        if interrupt_result["success"]:
+            result = {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"⏸️ Interrupt signal sent to instance {tool_args['instance_id']}\n"
+                        f"Current task stopped, instance remains active and ready for new messages.",
+                    }  # type: ignore[list-item]
+                ]
+            }
+        else:
+            result = {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"❌ Failed to interrupt instance {tool_args['instance_id']}: "
+                        f"{interrupt_result.get('error', 'Unknown error')}",
+                    }  # type: ignore[list-item]
+                ],
+                "isError": True,  # type: ignore[dict-item]
+            }
+        return result
+
+    @tools.handler("interrupt_multiple_instances")
+    async def _handle_interrupt_multiple_instances(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        instance_ids = tool_args.get("instance_ids", [])
+
+        # Create interrupt tasks for all instances - bypass decorator
+        interrupt_tasks = []
+        for instance_id in instance_ids:
+            interrupt_tasks.append(
+                self.manager._interrupt_instance_internal(instance_id=instance_id)
+            )
+
+        # Execute all interrupts in parallel
+        results = await asyncio.gather(*interrupt_tasks, return_exceptions=True)
+
+        # Process results
+        interrupted_instances = []
+        errors = []
+
+        for idx, result_item in enumerate(results):
+            instance_id = instance_ids[idx]
+            if isinstance(result_item, Exception):
+                errors.append({"instance_id": instance_id, "error": str(result_item)})
+            elif isinstance(result_item, dict) and result_item.get("success"):
+                interrupted_instances.append(instance_id)
+            else:
+                # result_item is dict but success=False or not a dict
+                error_msg = (
+                    result_item.get("error", "Unknown error")
+                    if isinstance(result_item, dict)
+                    else f"Unexpected result: {result_item}"
+                )
+                errors.append(
+                    {
+                        "instance_id": instance_id,
+                        "error": error_msg,
+                    }
+                )
+
+        # Build response message
+        message_parts = []
+        if interrupted_instances:
+            message_parts.append(
+                f"⏸️ Interrupted {len(interrupted_instances)}/{len(instance_ids)} instances successfully:\n"
+                + "\n".join(f"  - {iid}" for iid in interrupted_instances)
+            )
+        if errors:
+            message_parts.append(
+                f"\n❌ Errors ({len(errors)}):\n"
+                + "\n".join(f"  - {e['instance_id']}: {e['error']}" for e in errors)
+            )
+
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": "\n".join(message_parts)
+                    if message_parts
+                    else "No instances interrupted",
+                }  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    @tools.handler("terminate_instance")
+    async def _handle_terminate_instance(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Bypass decorator - use internal method
+        success = await self.manager._terminate_instance_internal(
+            instance_id=tool_args["instance_id"],
+            force=tool_args.get("force", False),
+        )
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"Instance {tool_args['instance_id']} terminated"
+                    if success
+                    else f"Failed to terminate {tool_args['instance_id']}",
+                }  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    @tools.handler("terminate_multiple_instances")
+    async def _handle_terminate_multiple_instances(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        instance_ids = tool_args.get("instance_ids", [])
+        force = tool_args.get("force", False)
+
+        # One teardown for every instance and subtree - bypass decorator
+        results = await self.manager._terminate_multiple_instances_internal(
+            instance_ids, force=force
+        )
+        terminated_instances = results["terminated"]
+        errors = results["failed"]
+
+        # Build response text
+        response_lines = [
+            f"Terminated {len(terminated_instances)}/{len(instance_ids)} instances successfully"
+        ]
+
+        if terminated_instances:
+            response_lines.append("\nSuccessfully terminated:")
+            for instance_id in terminated_instances:
+                response_lines.append(f"  - {instance_id}")
+
+        if errors:
+            response_lines.append("\nErrors:")
+            for error in errors:
+                response_lines.append(f"  - {error['instance_id']}: {error['error']}")
+
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": "\n".join(response_lines),
+                }  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    @tools.handler("list_persisted_instances")
+    async def _handle_list_persisted_instances(self, call: ToolCall) -> dict[str, Any]:
+        try:
+            persisted = self.manager.list_persisted_instances()
+            result = {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": json.dumps(persisted, indent=2),
+                    }
+                ]
+            }
+        except Exception as e:
+            result = {"error": {"code": -32603, "message": str(e)}}
+        return result
+
+    @tools.handler("resume_instance")
+    async def _handle_resume_instance(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        try:
+            resume_result = await self.manager.resume_instance(
+                instance_id=tool_args.get("instance_id", ""),
+                name=tool_args.get("name"),
+                model=tool_args.get("model"),
+            )
+            result = {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": json.dumps(resume_result, indent=2),
+                    }
+                ]
+            }
+        except Exception as e:
+            result = {"error": {"code": -32603, "message": str(e)}}
+        return result
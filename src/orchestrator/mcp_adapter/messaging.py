@@ -0,0 +1,425 @@
+"""Messaging tools: sends, broadcasts, coordination, replies and jobs."""
+
+import asyncio
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import Any
+
+from ..compat import UTC
+from ..harnesses import is_supported_harness
+from .dispatch import ToolCall, tools
+
+logger = logging.getLogger(__name__)
+
+
+class MessagingToolsMixin:
+    """Messaging tool handlers."""
+
+    # Declared by MCPAdapter; present here for type checking only
+    manager: Any
+
+    @tools.handler("send_to_instance")
+    async def _handle_send_to_instance(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Bypass decorator - call tmux_manager directly
+        instance_id = tool_args["instance_id"]
+        if instance_id not in self.manager.instances:
+            raise ValueError(f"Instance {instance_id} not found")
+
+        instance = self.manager.instances[instance_id]
+
+        # Delegate to TmuxInstanceManager
+        if is_supported_harness(instance.get("instance_type")):
+            response = await self.manager.tmux_manager.send_message(
+                instance_id=instance_id,
+                message=tool_args["message"],
+                wait_for_response=tool_args.get("wait_for_response", False),
+                timeout_seconds=tool_args.get("timeout_seconds", 180),
+            )
+            if response is None:
+                response = {"status": "message_sent"}
+        else:
+            raise ValueError(f"Unsupported instance type: {instance.get('instance_type')}")
+
+        # Handle response based on whether we waited or not
+        if isinstance(response, dict) and "status" in response:
+            if response["status"] == "timeout":
+                # Timeout with job tracking
+                text = (
+                    f"Request timed out but is still processing.\n"
+                    f"Job ID: {response['job_id']}\n"
+                    f"Estimated wait: {response.get('estimated_wait_seconds', 30)} seconds\n"
+                    f"Use get_job_status with job_id to check progress"
+                )
+            elif response["status"] == "pending":
+                # Non-blocking job created
+                text = f"Message sent (job_id: {response['job_id']}, status: {response['status']})"
+            else:
+                # Other status response
+                text = f"Response: {response}"
+
+            result = {"content": [{"type": "text", "text": text}]}  # type: ignore[list-item]
+        elif response:
+            # Blocking: return actual response
+            result = {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": response.get("response", str(response)),
+                    }  # type: ignore[list-item]
+                ]
+            }
+        else:
+            # No response
+            result = {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": "Message sent but no response received",
+                    }  # type: ignore[list-item]
+                ]
+            }
+        return result
+
+    @tools.handler("send_to_multiple_instances")
+    async def _handle_send_to_multiple_instances(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        instance_ids = tool_args.get("instance_ids", [])
+        message = tool_args.get("message", "")
+        wait_for_responses = tool_args.get("wait_for_responses", False)
+        timeout_seconds = tool_args.get("timeout_seconds", 180)
+
+        # Create send tasks for all instances - bypass decorator
+        async def send_message_bypass(inst_id):
+            if inst_id not in self.manager.instances:
+                raise ValueError(f"Instance {inst_id} not found")
+
+            instance = self.manager.instances[inst_id]
+            if is_supported_harness(instance.get("instance_type")):
+                result = await self.manager.tmux_manager.send_message(
+                    instance_id=inst_id,
+                    message=message,
+                    wait_for_response=wait_for_responses,
+                    timeout_seconds=timeout_seconds,
+                )
+                return result or {"status": "message_sent"}
+            else:
+                raise ValueError(f"Unsupported instance type: {instance.get('instance_type')}")
+
+        send_tasks = [send_message_bypass(iid) for iid in instance_ids]
+
+        # Execute all sends in parallel
+        results = await asyncio.gather(*send_tasks, return_exceptions=True)
+
+        # Process results
+        successful_sends = []
+        errors = []
+
+        for idx, send_result in enumerate(results):
+            iid = instance_ids[idx]
+
+            if isinstance(send_result, Exception):
+                errors.append(
+                    {
+                        "instance_id": iid,
+                        "error": str(send_result),
+                    }
+                )
+            elif isinstance(send_result, dict):
+                # Successful send
+                successful_sends.append(
+                    {
+                        "instance_id": iid,
+                        "response": send_result.get("response", "Sent"),
+                    }
+                )
+            else:
+                # Unexpected result type
+                successful_sends.append(
+                    {
+                        "instance_id": iid,
+                        "response": str(send_result),
+                    }
+                )
+
+        # Build response text
+        response_lines = [
+            f"Sent to {len(successful_sends)}/{len(instance_ids)} instances successfully"
+        ]
+
+        if successful_sends:
+            response_lines.append("\nResponses:")
+            for send_info in successful_sends:
+                response_lines.append(
+                    f"\n--- {send_info['instance_id']} ---\n{send_info['response']}"
+                )
+
+        if errors:
+            response_lines.append("\nErrors:")
+            for error in errors:
+                response_lines.append(f"  - {error['instance_id']}: {error['error']}")
+
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": "\n".join(response_lines),
+                }  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    @tools.handler("broadcast_to_children")
+    async def _handle_broadcast_to_children(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Bypass decorator - inline implementation
+        parent_id = tool_args["parent_id"]
+        message = tool_args["message"]
+        wait_for_responses = tool_args.get("wait_for_responses", False)
+
+        children = self.manager._get_children_internal(parent_id)
+
+        if not children:
+            broadcast_result = {"children_count": 0, "results": []}
+        else:
+            # Send to all children in parallel - bypass decorator
+            async def send_to_child(child):
+                instance_id = child["id"]
+                if instance_id not in self.manager.instances:
+                    raise ValueError(f"Instance {instance_id} not found")
+
+                instance = self.manager.instances[instance_id]
+                if is_supported_harness(instance.get("instance_type")):
+                    result = await self.manager.tmux_manager.send_message(
+                        instance_id=instance_id,
+                        message=message,
+                        wait_for_response=wait_for_responses,
+                    )
+                    return result or {"status": "message_sent"}
+                else:
+                    raise ValueError(f"Unsupported instance type: {instance.get('instance_type')}")
+
+            tasks = [send_to_child(child) for child in children]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            # Format results
+            formatted_results = []
+            for i, child in enumerate(children):
+                result = results[i]  # type: ignore[assignment]
+                if isinstance(result, Exception):  # type: ignore[unreachable]
+                    formatted_results.append(  # type: ignore[unreachable]
+                        {
+                            "child_id": child["id"],
+                            "child_name": child["name"],
+                            "status": "error",
+                            "error": str(result),
+                        }
+                    )
+                else:
+                    formatted_results.append(
+                        {
+                            "child_id": child["id"],
+                            "child_name": child["name"],
+                            "status": "sent" if not wait_for_responses else "completed",
+                            "response": result if wait_for_responses else None,
+                        }
+                    )
+
+            broadcast_result = {
+                "children_count": len(children),
+                "results": formatted_results,
+            }
+
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"Broadcasted to {broadcast_result['children_count']} children\n\n"
+                    + json.dumps(broadcast_result["results"], indent=2),
+                }  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    @tools.handler("coordinate_instances")
+    async def _handle_coordinate_instances(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Bypass decorator - inline coordination logic
+        task_id = str(uuid.uuid4())
+        coordinator_id = tool_args["coordinator_id"]
+        participant_ids = tool_args["participant_ids"]
+        task_description = tool_args["task_description"]
+        coordination_type = tool_args.get("coordination_type", "sequential")
+
+        # Validate all instances exist
+        all_ids = [coordinator_id] + participant_ids
+        for iid in all_ids:
+            if iid not in self.manager.instances:
+                raise ValueError(f"Instance {iid} not found")
+            if self.manager.instances[iid]["state"] not in ["running", "idle"]:
+                raise RuntimeError(f"Instance {iid} is not available")
+
+        # Start coordination in background
+        coordination_task = {
+            "task_id": task_id,
+            "description": task_description,
+            "coordinator_id": coordinator_id,
+            "participant_ids": participant_ids,
+            "coordination_type": coordination_type,
+            "status": "running",
+            "started_at": datetime.now(UTC).isoformat(),
+            "steps": [],
+            "results": {},
+        }
+        asyncio.create_task(self.manager._execute_coordination(coordination_task))
+
+        coordination_result = {"task_id": task_id, "status": "started"}
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"Coordination completed: {coordination_result}",
+                }  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    @tools.handler("reply_to_caller")
+    async def _handle_reply_to_caller(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Handle reply from instance to its caller
+        reply_result = await self.manager.handle_reply_to_caller(
+            instance_id=tool_args["instance_id"],
+            reply_message=tool_args["reply_message"],
+            correlation_id=tool_args.get("correlation_id"),
+        )
+
+        if reply_result["success"]:
+            # Format delivered_to: show first 8 chars of instance ID for readability
+            delivered_to = reply_result.get("delivered_to", "caller")
+            if delivered_to and len(delivered_to) > 8 and delivered_to != "coordinator":
+                delivered_to_display = f"{delivered_to[:8]}..."
+            else:
+                delivered_to_display = delivered_to
+
+            result = {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"✅ Reply delivered to {delivered_to_display}"
+                        + (
+                            f" (correlated with message {reply_result.get('correlation_id')})"
+                            if reply_result.get("correlation_id")
+                            else ""
+                        ),
+                    }  # type: ignore[list-item]
+                ]
+            }
+        else:
+            result = {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"❌ Failed to deliver reply: {reply_result.get('error', 'Unknown error')}",
+                    }  # type: ignore[list-item]
+                ],
+                "isError": True,  # type: ignore[dict-item]
+            }
+        return result
+
+    @tools.handler("get_pending_replies")
+    async def _handle_get_pending_replies(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Poll response queue for pending replies from children
+        replies = await self.manager._get_pending_replies_internal(
+            instance_id=tool_args["instance_id"],
+            wait_timeout=tool_args.get("wait_timeout", 0),
+        )
+
+        if replies:
+            reply_text = f"📬 Received {len(replies)} pending replies:\n\n"
+            for idx, reply in enumerate(replies, 1):
+                sender = reply.get("sender_id", "unknown")
+                sender_display = f"{sender[:8]}..." if len(sender) > 8 else sender
+                message = reply.get("reply_message", "")
+                correlation = reply.get("correlation_id", "none")
+                reply_text += f"Reply #{idx} from {sender_display}:\n"
+                reply_text += f"  Message: {message}\n"
+                reply_text += f"  Correlation: {correlation}\n\n"
+
+            result = {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": reply_text.strip(),
+                    }  # type: ignore[list-item]
+                ]
+            }
+        else:
+            result = {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": "📭 No pending replies in queue",
+                    }  # type: ignore[list-item]
+                ]
+            }
+        return result
+
+    @tools.handler("get_job_status")
+    async def _handle_get_job_status(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        # Bypass decorator - inline job status logic
+        job_id = tool_args["job_id"]
+        wait_for_completion = tool_args.get("wait_for_completion", True)
+        max_wait = tool_args.get("max_wait", 120)
+
+        if job_id not in self.manager.jobs:
+            job_status = None
+        else:
+            job = self.manager.jobs[job_id]
+            if not wait_for_completion or job["status"] in [
+                "completed",
+                "failed",
+                "timeout",
+            ]:
+                job_status = job
+            else:
+                # Wait for completion
+                start_time = asyncio.get_event_loop().time()
+                while asyncio.get_event_loop().time() - start_time < max_wait:
+                    job = self.manager.jobs[job_id]
+                    if job["status"] in ["completed", "failed", "timeout"]:
+                        break
+                    await asyncio.sleep(1)
+                job_status = self.manager.jobs[job_id]
+
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": json.dumps(job_status, indent=2) if job_status else "Job not found",
+                }  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    # DEPRECATED: get_main_instance_id tool removed
+    # Child instances should use their own instance_id in reply_to_caller, not main instance ID
+    # This tool was causing unwanted auto-spawning of main orchestrator instances
+    @tools.handler("get_main_instance_id")
+    async def _handle_get_main_instance_id(self, call: ToolCall) -> dict[str, Any]:
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": "⚠️ DEPRECATED: This tool has been removed.\n\n"
+                    "Use your own instance_id in reply_to_caller, not the main instance ID.\n"
+                    "Your instance_id is already provided in your system prompt.",
+                }  # type: ignore[list-item]
+            ],
+            "isError": True,  # type: ignore[dict-item]
+        }
+        return result
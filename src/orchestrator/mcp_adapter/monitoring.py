@@ -0,0 +1,108 @@
+"""Monitoring tools: AI-generated agent summaries."""
+
+import json
+import logging
+from typing import Any
+
+from .dispatch import ToolCall, tools
+
+logger = logging.getLogger(__name__)
+
+
+class MonitoringToolsMixin:
+    """Monitoring tool handlers."""
+
+    # Declared by MCPAdapter; present here for type checking only
+    manager: Any
+
+    @tools.handler("get_agent_summary")
+    async def _handle_get_agent_summary(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        instance_id = tool_args["instance_id"]
+        monitoring_service = getattr(self.manager, "monitoring_service", None) or getattr(
+            getattr(self.manager, "tmux_manager", None), "monitoring_service", None
+        )
+        if not monitoring_service:
+            result = {
+                "error": {
+                    "code": -32603,
+                    "message": "MonitoringService not available",
+                }
+            }
+        elif not monitoring_service.is_running():
+            result = {
+                "error": {
+                    "code": -32603,
+                    "message": "MonitoringService not running",
+                }
+            }
+        else:
+            try:
+                summary = await monitoring_service.get_summary(instance_id)
+                if not summary:
+                    result = {
+                        "error": {
+                            "code": -32603,
+                            "message": f"No summary found for instance {instance_id}",
+                        }
+                    }
+                else:
+                    result = {
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": json.dumps(summary, indent=2),
+                            }  # type: ignore[list-item]
+                        ]
+                    }
+            except Exception as e:
+                result = {"error": {"code": -32603, "message": str(e)}}
+        return result
+
+    @tools.handler("get_all_agent_summaries")
+    async def _handle_get_all_agent_summaries(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        status_filter = tool_args.get("status_filter")
+        monitoring_service = getattr(self.manager, "monitoring_service", None) or getattr(
+            getattr(self.manager, "tmux_manager", None), "monitoring_service", None
+        )
+        if not monitoring_service:
+            result = {
+                "error": {
+                    "code": -32603,
+                    "message": "MonitoringService not available",
+                }
+            }
+        elif not monitoring_service.is_running():
+            result = {
+                "error": {
+                    "code": -32603,
+                    "message": "MonitoringService not running",
+                }
+            }
+        else:
+            try:
+                summaries = await monitoring_service.get_all_summaries()
+
+                # Apply status filter if provided
+                if status_filter:
+                    summaries = {
+                        iid: summary
+                        for iid, summary in summaries.items()
+                        if summary.get("status") in status_filter
+                    }
+
+                result = {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": json.dumps(
+                                {"summaries": summaries, "count": len(summaries)},
+                                indent=2,
+                            ),
+                        }  # type: ignore[list-item]
+                    ]
+                }
+            except Exception as e:
+                result = {"error": {"code": -32603, "message": str(e)}}
+        return result
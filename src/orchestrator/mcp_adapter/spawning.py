@@ -0,0 +1,404 @@
+"""Spawn tools: single harness spawns, batches and team templates."""
+
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from ..harnesses import get_harness, harness_names
+from ..tmux_instance_manager.readiness import team_status
+from .dispatch import ToolCall, tools
+
+logger = logging.getLogger(__name__)
+
+#: Tool name -> harness, so a new harness gets its spawn tool for free.
+SPAWN_TOOLS = {f"spawn_{name}": name for name in harness_names()}
+
+
+class SpawningToolsMixin:
+    """Spawn tool handlers and the team template helpers they use."""
+
+    # Declared by MCPAdapter; present here for type checking only
+    manager: Any
+
+    @tools.handler(*SPAWN_TOOLS, needs_caller=True)
+    async def _handle_spawn_harness(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        harness = get_harness(SPAWN_TOOLS[call.name])
+
+        # AUTO-INJECT parent_instance_id if not provided and caller detected
+        parent_id = tool_args.get("parent_instance_id")
+        if not parent_id and call.caller:
+            parent_id = call.caller
+            logger.info(
+                f"Auto-injected parent_instance_id={call.caller} "
+                f"for {call.name} call from managed instance"
+            )
+
+        spawn_kwargs = {
+            "role": tool_args.get("role", "general"),
+            "system_prompt": tool_args.get("system_prompt"),
+            "bypass_isolation": tool_args.get("bypass_isolation", True),
+            "wait_for_ready": tool_args.get("wait_for_ready", True),
+            "parent_instance_id": parent_id,
+            "mcp_servers": tool_args.get("mcp_servers", {}),
+        }
+        # Codex-only knobs, passed through when present.
+        for optional in ("sandbox_mode", "profile"):
+            if optional in tool_args:
+                spawn_kwargs[optional] = tool_args[optional]
+
+        # Go through the same helper as the MCP tools so this
+        # transport gets identical model resolution, reply
+        # waiting and failure reporting. Calling spawn_instance
+        # directly silently dropped all of it.
+        spawn_result = await self.manager._spawn_harness_instance(
+            instance_type=harness.name,
+            name=tool_args.get("name", "unnamed"),
+            # None resolves to the harness default
+            model=tool_args.get("model"),
+            initial_prompt=tool_args.get("initial_prompt"),
+            wait_for_response=tool_args.get("wait_for_response", False),
+            timeout_seconds=tool_args.get("timeout_seconds", 180),
+            **spawn_kwargs,
+        )
+
+        instance_id = spawn_result.get("instance_id")
+        if spawn_result.get("status") == "failed":
+            summary = (
+                f"Failed to spawn {harness.label} instance "
+                f"'{tool_args.get('name')}' (ID: {instance_id}): "
+                f"{spawn_result.get('error_message')}"
+            )
+        else:
+            summary = (
+                f"Spawned {harness.label} instance '{tool_args.get('name')}' with ID: {instance_id}"
+            )
+
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"{summary}\n{json.dumps(spawn_result, default=str)}",
+                }  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    @tools.handler("spawn_multiple_instances", needs_caller=True)
+    async def _handle_spawn_multiple_instances(self, call: ToolCall) -> dict[str, Any]:
+        tool_args = call.args
+        instances_config = tool_args.get("instances", [])
+
+        # Create spawn tasks for all instances
+        spawn_tasks = []
+        for instance_config in instances_config:
+            # AUTO-INJECT parent_instance_id if not provided and caller detected
+            parent_id = instance_config.get("parent_instance_id")
+            if not parent_id and call.caller:
+                parent_id = call.caller
+                logger.info(
+                    f"Auto-injected parent_instance_id={call.caller} for '{instance_config.get('name')}' in spawn_multiple_instances"
+                )
+
+            spawn_tasks.append(
+                self.manager.spawn_instance(
+                    name=instance_config.get("name", "unnamed"),
+                    role=instance_config.get("role", "general"),
+                    system_prompt=instance_config.get("system_prompt"),
+                    model=instance_config.get("model"),
+                    bypass_isolation=instance_config.get("bypass_isolation", True),
+                    wait_for_ready=instance_config.get("wait_for_ready", True),
+                    parent_instance_id=parent_id,
+                    mcp_servers=instance_config.get("mcp_servers", {}),
+                    instance_type=instance_config.get(
+                        "instance_type", instance_config.get("type", "claude")
+                    ),
+                    initial_prompt=instance_config.get("initial_prompt"),
+                )
+            )
+
+        # Execute all spawns in parallel
+        results = await asyncio.gather(*spawn_tasks, return_exceptions=True)
+
+        # Process results
+        spawned_instances = []
+        errors = []
+
+        for idx, spawn_result in enumerate(results):
+            if isinstance(spawn_result, Exception):
+                errors.append(
+                    {
+                        "index": idx,
+                        "name": instances_config[idx].get("name", "unknown"),
+                        "error": str(spawn_result),
+                    }
+                )
+            else:
+                # spawn_result is the instance_id
+                spawned_instances.append(
+                    {
+                        "name": instances_config[idx].get("name"),
+                        "instance_id": spawn_result,
+                    }
+                )
+
+        # Build response text
+        response_lines = [
+            f"Spawned {len(spawned_instances)}/{len(instances_config)} instances successfully"
+        ]
+
+        if spawned_instances:
+            response_lines.append("\nSuccessfully spawned:")
+            for instance in spawned_instances:
+                response_lines.append(f"  - {instance['name']}: {instance['instance_id']}")
+
+        if errors:
+            response_lines.append("\nErrors:")
+            for error in errors:
+                response_lines.append(f"  - {error['name']}: {error['error']}")
+
+        result = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": "\n".join(response_lines),
+                }  # type: ignore[list-item]
+            ]
+        }
+        return result
+
+    @tools.handler("spawn_team_from_template", needs_caller=True)
+    async def _handle_spawn_team_from_template(self, call: ToolCall) -> dict[str, Any]:
+        # Spawn a complete team from a predefined template
+        tool_args = call.args
+        template_name = tool_args["template_name"]
+        task_description = tool_args.get("task_description", "Standby - awaiting task assignment")
+        supervisor_role = tool_args.get("supervisor_role")
+        parent_id = tool_args.get("parent_instance_id")
+
+        # Auto-detect caller if parent not provided
+        if not parent_id:
+            parent_id = call.caller
+            if parent_id:
+                logger.info(f"Auto-injected parent_instance_id={parent_id} for team supervisor")
+
+        # Load template file
+        template_path = Path("templates") / f"{template_name}.md"
+        if not template_path.exists():
+            raise ValueError(
+                f"Template not found: {template_name}\n"
+                f"Available templates: software_engineering_team, research_analysis_team, "
+                f"security_audit_team, data_pipeline_team"
+            )
+
+        template_content = template_path.read_text()
+
+        # Parse template metadata
+        template_meta = self._parse_template_metadata(template_content)
+
+        # Use provided supervisor role or template default
+        role = supervisor_role or template_meta["supervisor_role"]
+
+        # Build instruction message FIRST (before spawning)
+        instruction = self._build_template_instruction(
+            template_content=template_content, task_description=task_description
+        )
+
+        # Spawn supervisor WITH instruction as initial_prompt (bypasses paste detection)
+        supervisor_id = await self.manager.spawn_instance(
+            name=f"{template_name}-lead",
+            role=role,
+            wait_for_ready=True,
+            initial_prompt=instruction,
+            parent_instance_id=parent_id,
+        )
+
+        # No need to send_message - instruction already received via CLI argument
+        logger.info(
+            f"Spawned supervisor {supervisor_id} with initial instruction "
+            f"({len(instruction)} chars, {len(instruction) / 1024:.2f}KB)"
+        )
+
+        # Wait for the supervisor's team to come up (or time out)
+        readiness = await self.manager.wait_for_team(supervisor_id, template_meta["team_size"])
+
+        # Get network tree preview
+        tree_preview = "Initializing network..."
+        try:
+            roots = []
+            for instance_id, instance in self.manager.instances.items():
+                if not instance.get("parent_instance_id") and instance.get("state") != "terminated":
+                    roots.append((instance_id, instance.get("name", "unknown")))
+
+            if roots:
+                roots.sort(key=lambda x: x[1])
+                lines: list[str] = []
+                for i, (root_id, _) in enumerate(roots):
+                    is_last_root = i == len(roots) - 1
+                    self.manager._build_tree_recursive(
+                        root_id, "", is_last_root, lines, is_root=True
+                    )
+                tree_preview = "\n".join(lines)
+        except Exception as e:
+            logger.warning(f"Failed to build tree preview: {e}")
+
+        # Build result
+        result_text = f"""✅ Team spawned from template: {template_name}
+
+📋 **Template Details:**
+- Supervisor ID: {supervisor_id}
+- Team Size: {template_meta["team_size"]} instances
+- Estimated Duration: {template_meta["duration"]}
+- Estimated Cost: {template_meta["estimated_cost"]}
+- Status: {team_status(readiness)}
+
+🌳 **Network Topology:**
+{tree_preview}
+
+📝 **Task:**
+{task_description[:200]}{"..." if len(task_description) > 200 else ""}
+
+⏳ The supervisor is now spawning the team and executing the workflow.
+Use get_pending_replies({supervisor_id}) to monitor progress.
+Use get_instance_tree() to see the full network hierarchy."""
+
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": result_text,
+                }  # type: ignore[list-item]
+            ]
+        }
+
+    def _parse_template_metadata(self, template_content: str) -> dict:
+        """Extract metadata from template markdown.
+
+        Args:
+            template_content: Template markdown content
+
+        Returns:
+            Dictionary with team_size, duration, estimated_cost, supervisor_role
+        """
+        lines = template_content.split("\n")
+
+        # Parse Team Size from the first "Team Size: X instances" (the header;
+        # later ones describe variations of the team)
+        team_size = 6  # default
+        for line in lines:
+            if "Team Size" in line and "instances" in line:
+                try:
+                    # Extract number before "instances"
+                    parts = line.split("instances")[0].split()
+                    team_size = int(parts[-1])
+                    break
+                except (ValueError, IndexError):
+                    pass
+
+        # Parse Duration from "Estimated Duration: X hours"
+        duration = "2-4 hours"
+        for line in lines:
+            if "Estimated Duration" in line or "Duration:" in line:
+                # Extract everything after the colon
+                if ":" in line:
+                    duration = line.split(":", 1)[-1].strip()
+
+        # Parse Supervisor Role from markdown
+        supervisor_role = "general"
+        in_supervisor_section = False
+        for line in lines:
+            # Look for supervisor section headers
+            if any(
+                header in line
+                for header in [
+                    "### Technical Lead",
+                    "### Research Lead",
+                    "### Security Lead",
+                    "### Data Engineering Lead",
+                ]
+            ):
+                in_supervisor_section = True
+            elif line.startswith("###"):
+                in_supervisor_section = False
+
+            # Extract role from **Role**: `role_name`
+            if in_supervisor_section and "**Role**:" in line:
+                if "`" in line:
+                    supervisor_role = line.split("`")[1]
+                    break
+
+        return {
+            "team_size": team_size,
+            "duration": duration,
+            "estimated_cost": f"${team_size * 5}",
+            "supervisor_role": supervisor_role,
+        }
+
+    def _extract_section(self, content: str, header: str) -> str:
+        """Extract markdown section by header.
+
+        Args:
+            content: Markdown content
+            header: Section header (e.g., "## Workflow Phases")
+
+        Returns:
+            Section content
+        """
+        lines = content.split("\n")
+        section_lines = []
+        in_section = False
+
+        for line in lines:
+            if line.strip().startswith(header):
+                in_section = True
+                continue
+            if in_section and line.startswith("## ") and line.strip() != header:
+                break
+            if in_section:
+                section_lines.append(line)
+
+        return "\n".join(section_lines).strip()
+
+    def _build_template_instruction(self, template_content: str, task_description: str) -> str:
+        """Build instruction message for supervisor from template.
+
+        Args:
+            template_content: Template markdown content
+            task_description: User's specific task description
+
+        Returns:
+            Instruction message for supervisor
+        """
+        # Extract key sections
+        team_structure = self._extract_section(template_content, "## Team Structure")
+        workflow_phases = self._extract_section(template_content, "## Workflow Phases")
+        communication = self._extract_section(template_content, "## Communication Protocols")
+
+        instruction = f"""Execute the team workflow from this template:
+
+TASK DESCRIPTION:
+{task_description}
+
+TEAM STRUCTURE TO SPAWN:
+{team_structure[:500]}... [See full template for details]
+
+WORKFLOW PHASES TO EXECUTE:
+{workflow_phases[:800]}... [See full template for details]
+
+COMMUNICATION PROTOCOLS TO USE:
+{communication[:400]}... [See full template for details]
+
+CRITICAL EXECUTION INSTRUCTIONS:
+1. Spawn your team members with parent_instance_id set to YOUR instance_id
+2. Use broadcast_to_children for team-wide announcements
+3. Use send_to_instance for 1-on-1 coordination
+4. Workers MUST use reply_to_caller to report back to you
+5. Poll get_pending_replies every 5-15 minutes to collect worker responses
+6. Follow the workflow phases sequentially as outlined in the template
+7. Report final deliverables and status when complete
+
+Begin execution now. Spawn your team and start the workflow."""
+
+        return instruction
@@ -3,10 +3,16 @@
 Instead of importing the backend's tool definitions (which triggers heavy
 imports), this STDIO server fetches tool schemas from the parent HTTP
 server's /tools endpoint and generates lightweight proxy functions.
+
+Every proxy keeps one pooled HTTP client for its lifetime, and caches the
+tool schemas on disk under the parent's schema hash so a restart costs a
+bodyless 304 rather than the full schema list.
 """
 
 import asyncio
+import hashlib
 import inspect
+import json
 import logging
 import os
 from pathlib import Path
@@ -15,8 +21,21 @@ from typing import Any
 import httpx
 from fastmcp import FastMCP
 
+from .caller_identity import CALLER_HEADER, CALLER_TOKEN_ENV
+
 logger = logging.getLogger(__name__)
 
+#: Where proxies keep tool schemas between starts (override: MADROX_SCHEMA_CACHE_DIR).
+DEFAULT_SCHEMA_CACHE_DIR = Path.home() / ".cache" / "madrox" / "tool-schemas"
+
+#: Seconds allowed for a proxied tool call, and for opening the connection.
+CALL_TIMEOUT = 300.0
+CONNECT_TIMEOUT = 10.0
+
+#: One proxy serves one agent, so a handful of connections covers its
+#: concurrent tool calls.
+POOL_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=4)
+
 _JSON_TYPE_MAP: dict[str, type] = {
     "string": str,
     "integer": int,
@@ -87,6 +106,46 @@ def _make_proxy_from_schema(
     return proxy_fn
 
 
+class ToolSchemaCache:
+    """The parent's tool schemas as last fetched, stored on disk per parent URL.
+
+    An entry holds the parent's ``schema_hash`` with the tools. A starting
+    proxy sends the hash as ``If-None-Match`` and reuses the entry on a 304.
+    """
+
+    def __init__(self, parent_url: str, cache_dir: str | Path | None = None):
+        cache_dir = Path(
+            cache_dir or os.getenv("MADROX_SCHEMA_CACHE_DIR") or DEFAULT_SCHEMA_CACHE_DIR
+        )
+        key = hashlib.sha256(parent_url.encode()).hexdigest()[:16]
+        self.path = cache_dir / f"{key}.json"
+
+    def load(self) -> dict[str, Any] | None:
+        """The cached ``{"schema_hash", "tools"}`` entry, or None if absent or unreadable."""
+        try:
+            entry = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(entry, dict)
+            or not entry.get("schema_hash")
+            or not isinstance(entry.get("tools"), list)
+        ):
+            return None
+        return entry
+
+    def store(self, schema_hash: str, tools: list[dict[str, Any]]) -> None:
+        """Replace the entry atomically; concurrent proxies may start together."""
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps({"schema_hash": schema_hash, "tools": tools}))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.debug(f"Could not write tool schema cache {self.path}: {e}")
+            tmp.unlink(missing_ok=True)
+
+
 class OrchestrationMCPServer:
     """STDIO MCP proxy server that forwards all tool calls to the parent HTTP server.
 
@@ -95,17 +154,30 @@ class OrchestrationMCPServer:
     heavy dependency chain.
     """
 
-    def __init__(self, parent_url: str | None = None):
+    def __init__(
+        self,
+        parent_url: str | None = None,
+        parent_socket: str | None = None,
+        schema_cache_dir: str | Path | None = None,
+    ):
         """Initialize proxy MCP server.
 
         Args:
             parent_url: URL of the parent HTTP server (e.g. http://localhost:8001).
                        Auto-detected from MADROX_PARENT_URL env var if not provided.
+            parent_socket: Unix socket the parent also listens on. Auto-detected
+                       from MADROX_PARENT_SOCKET; used instead of TCP when it exists.
+            schema_cache_dir: Directory for the on-disk tool schema cache.
         """
         default_port = os.getenv("ORCHESTRATOR_PORT", "8001")
         self.parent_url = parent_url or os.getenv(
             "MADROX_PARENT_URL", f"http://localhost:{default_port}"
         )
+        self.parent_socket = parent_socket or os.getenv("MADROX_PARENT_SOCKET")
+        # Tells the parent which instance this proxy serves
+        self.caller_token = os.getenv(CALLER_TOKEN_ENV)
+        self.schema_cache = ToolSchemaCache(self.parent_url, schema_cache_dir)
+        self._client: httpx.AsyncClient | None = None
         self.mcp = FastMCP("claude-orchestrator-stdio-proxy")
         self._dashboard_started = False
 
@@ -203,32 +275,77 @@ class OrchestrationMCPServer:
         finally:
             log_file.close()
 
-    async def _register_proxy_tools(self):
-        """Fetch tool schemas from the parent HTTP server and register proxies.
+    def _get_client(self) -> httpx.AsyncClient:
+        """The proxy's pooled client, created on first use.
+
+        Tool calls reuse its keep-alive connections instead of opening a new
+        TCP connection per call.
+        """
+        if self._client is None or self._client.is_closed:
+            uds = self.parent_socket
+            if uds and not os.path.exists(uds):
+                logger.warning(f"Parent socket {uds} not found; using {self.parent_url}")
+                uds = None
+            headers = {CALLER_HEADER: self.caller_token} if self.caller_token else None
+            self._client = httpx.AsyncClient(
+                headers=headers,
+                timeout=httpx.Timeout(CALL_TIMEOUT, connect=CONNECT_TIMEOUT),
+                transport=httpx.AsyncHTTPTransport(uds=uds, limits=POOL_LIMITS),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _fetch_tool_schemas(self) -> list[dict[str, Any]] | None:
+        """Tool schemas from the cache if the parent confirms them, else from /tools.
 
-        Retries up to 3 times with 1s delay on failure. Each tool schema is
-        used to generate a proxy function with matching signature.
+        With a cached entry, one conditional request is made and the cache is
+        used if the parent is unreachable. Without one, retries up to 3 times
+        with 1s delay.
         """
         url = f"{self.parent_url}/tools"
+        cached = self.schema_cache.load()
+        headers = {"If-None-Match": f'"{cached["schema_hash"]}"'} if cached else {}
+        attempts = 1 if cached else 3
         last_error = None
 
-        for attempt in range(3):
+        for attempt in range(attempts):
             try:
-                async with httpx.AsyncClient(timeout=10) as client:
-                    resp = await client.get(url)
-                    resp.raise_for_status()
-                    data = resp.json()
-                    break
+                resp = await self._get_client().get(url, headers=headers, timeout=10)
+                if cached and resp.status_code == 304:
+                    logger.debug(f"Tool schemas unchanged ({cached['schema_hash']})")
+                    return cached["tools"]
+                resp.raise_for_status()
+                data = resp.json()
+                break
             except Exception as e:
                 last_error = e
-                logger.warning(f"Failed to fetch tools (attempt {attempt + 1}/3): {e}")
-                if attempt < 2:
+                logger.warning(f"Failed to fetch tools (attempt {attempt + 1}/{attempts}): {e}")
+                if attempt < attempts - 1:
                     await asyncio.sleep(1)
         else:
+            if cached:
+                logger.warning(f"Using cached tool schemas; {url} unreachable: {last_error}")
+                return cached["tools"]
             logger.error(f"Could not fetch tool schemas from {url}: {last_error}")
-            return
+            return None
 
         tools = data.get("tools", [])
+        schema_hash = data.get("schema_hash")
+        if schema_hash:
+            self.schema_cache.store(schema_hash, tools)
+        return tools
+
+    async def _register_proxy_tools(self):
+        """Fetch tool schemas and register a proxy function for each."""
+        tools = await self._fetch_tool_schemas()
+        if tools is None:
+            return
+
         for tool_def in tools:
             tool_name = tool_def["name"]
             description = tool_def.get("description", "")
@@ -251,20 +368,17 @@ class OrchestrationMCPServer:
         url = f"{self.parent_url}/tools/execute"
 
         try:
-            async with httpx.AsyncClient(timeout=300) as client:
-                resp = await client.post(
-                    url,
-                    json={"tool": tool_name, "arguments": arguments},
-                )
+            resp = await self._get_client().post(
+                url,
+                json={"tool": tool_name, "arguments": arguments},
+            )
 
-                if resp.status_code >= 400:
-                    error_text = resp.text
-                    logger.error(
-                        f"Parent returned {resp.status_code} for {tool_name}: {error_text}"
-                    )
-                    return {"error": error_text, "status_code": resp.status_code}
+            if resp.status_code >= 400:
+                error_text = resp.text
+                logger.error(f"Parent returned {resp.status_code} for {tool_name}: {error_text}")
+                return {"error": error_text, "status_code": resp.status_code}
 
-                return resp.json()
+            return resp.json()
 
         except httpx.ConnectError:
             msg = f"Cannot connect to parent server at {self.parent_url}"
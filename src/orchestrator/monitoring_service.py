@@ -8,15 +8,21 @@ Phase 3: Background Monitoring Service
 """
 
 import asyncio
+import hashlib
+import heapq
+import inspect
 import json
 import logging
 import os
 import time
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
 from .compat import UTC
+from .llm_summarizer import SummaryRequest, SummaryUnavailable
 
 try:
     import aiofiles
@@ -25,12 +31,126 @@ except ImportError:
     aiofiles = None
 
 
+#: Defaults for the change gate: a summary is only generated once this much
+#: new output has accumulated since the last one, or the last one is older
+#: than ``max_summary_age`` and anything at all has changed.
+DEFAULT_MIN_NEW_LINES = 1
+DEFAULT_MIN_NEW_CHARS = 32
+DEFAULT_MAX_SUMMARY_AGE = 300.0
+
+#: Defaults for the adaptive poll schedule: a busy instance is polled down to
+#: every ``min_poll_interval`` seconds, a quiet one backs off up to every
+#: ``max_poll_interval``. Output faster than ``busy_output_rate`` characters
+#: per second counts as busy.
+DEFAULT_MIN_POLL_INTERVAL = 3.0
+DEFAULT_MAX_POLL_INTERVAL = 300.0
+DEFAULT_BUSY_OUTPUT_RATE = 20.0
+
+
+@dataclass
+class ActivityFingerprint:
+    """What an instance's output looked like when it was last summarized."""
+
+    digest: str
+    #: hash(line) -> occurrences, to count lines that are new since
+    line_counts: Counter[int] = field(default_factory=Counter)
+    summarized_at: float = field(default_factory=time.monotonic)
+    #: a change below the thresholds is waiting for more output
+    deferred: bool = False
+    #: pane position at the summarized capture; the next delta starts here
+    cursor: Any = None
+    #: the summary itself, sent as rolling context with the next delta
+    summary: str | None = None
+
+
+@dataclass
+class InstanceCadence:
+    """How often an instance is polled, adapted to how much it is doing."""
+
+    interval: float
+    next_due: float = 0.0
+    #: consecutive polls that produced no summary
+    quiet_polls: int = 0
+    #: instance state at the last poll; a change brings the next poll forward
+    state: str | None = None
+    #: new output characters per second, as of the last summary
+    output_rate: float = 0.0
+    last_polled: float = 0.0
+
+    def to_dict(self, now: float) -> dict[str, Any]:
+        return {
+            "interval": round(self.interval, 1),
+            "next_poll_in": round(max(0.0, self.next_due - now), 1),
+            "quiet_polls": self.quiet_polls,
+            "output_rate": round(self.output_rate, 1),
+        }
+
+
+class PollScheduler:
+    """Instances in a heap keyed by next-due time.
+
+    Rescheduling pushes a new entry and leaves the old one in the heap;
+    entries whose time no longer matches the instance's ``next_due`` are
+    dropped when they reach the top.
+    """
+
+    def __init__(self) -> None:
+        self.cadences: dict[str, InstanceCadence] = {}
+        self._heap: list[tuple[float, str]] = []
+
+    def schedule(self, instance_id: str, cadence: InstanceCadence, due: float) -> None:
+        self.cadences[instance_id] = cadence
+        cadence.next_due = due
+        heapq.heappush(self._heap, (due, instance_id))
+
+    def pop_due(self, now: float) -> list[str]:
+        """Instances due by ``now``, earliest first; they stay tracked until rescheduled."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due_at, instance_id = heapq.heappop(self._heap)
+            if self._current(due_at, instance_id):
+                due.append(instance_id)
+        return due
+
+    def next_due(self) -> float | None:
+        while self._heap and not self._current(*self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def forget(self, instance_id: str) -> None:
+        self.cadences.pop(instance_id, None)
+
+    def _current(self, due_at: float, instance_id: str) -> bool:
+        cadence = self.cadences.get(instance_id)
+        return cadence is not None and cadence.next_due == due_at
+
+
+@dataclass
+class PendingSummary:
+    """An instance whose new output passed the change gate, awaiting its summary."""
+
+    instance_id: str
+    status: str
+    activity: str
+    #: the lines new since the last summary, sent to the summarizer
+    delta: str
+    cursor: Any
+    fingerprint: ActivityFingerprint
+    previous_summary: str | None
+    started: float = field(default_factory=time.time)
+
+
+def _fingerprint_lines(activity: str) -> list[str]:
+    return [stripped for line in activity.splitlines() if (stripped := line.rstrip())]
+
+
 class MonitoringService:
     """
     Background service for monitoring Claude instances and generating summaries.
 
-    This service runs an asyncio task that polls InstanceManager at regular intervals,
-    generates activity summaries using LLMSummarizer, and persists them to disk.
+    This service runs an asyncio task that polls InstanceManager, generates activity
+    summaries using LLMSummarizer, and persists them to disk. Each instance is polled
+    on its own interval: shorter while it is busy, longer while it is quiet.
     """
 
     # Class Attributes (Singleton pattern)
@@ -44,6 +164,12 @@ class MonitoringService:
         poll_interval: int = 12,
         storage_path: str = "/tmp/madrox_logs/summaries",
         max_tokens: int = 100,
+        min_new_lines: int = DEFAULT_MIN_NEW_LINES,
+        min_new_chars: int = DEFAULT_MIN_NEW_CHARS,
+        max_summary_age: float = DEFAULT_MAX_SUMMARY_AGE,
+        min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        busy_output_rate: float = DEFAULT_BUSY_OUTPUT_RATE,
     ):
         """
         Initialize the monitoring service.
@@ -51,9 +177,16 @@ class MonitoringService:
         Args:
             instance_manager: Reference to the InstanceManager
             llm_summarizer: Reference to the LLMSummarizer
-            poll_interval: Polling interval in seconds (default: 12)
+            poll_interval: Polling interval in seconds for an instance with
+                ordinary activity (default: 12)
             storage_path: Base path for storing summaries (session subdirectory auto-created)
             max_tokens: Maximum tokens for LLM summary generation (default: 100)
+            min_new_lines: New output lines needed before an instance is summarized again
+            min_new_chars: New output characters needed before it is summarized again
+            max_summary_age: Seconds after which any change is summarized, whatever its size
+            min_poll_interval: Shortest interval, for busy or just-changed instances
+            max_poll_interval: Longest interval a quiet instance backs off to
+            busy_output_rate: New output characters per second that count as busy
         """
         self.instance_manager = instance_manager
         self.llm_summarizer = llm_summarizer
@@ -75,6 +208,22 @@ class MonitoringService:
         self._error_counts: dict[str, int] = {}
         self._last_error_time: dict[str, float] = {}
 
+        # Change gate: skip instances whose output has not changed enough
+        self.min_new_lines = min_new_lines
+        self.min_new_chars = min_new_chars
+        self.max_summary_age = max_summary_age
+        self._fingerprints: dict[str, ActivityFingerprint] = {}
+        self._checked_cursors: dict[str, Any] = {}
+        self.summaries_generated = 0
+        self.skipped_unchanged = 0
+        self.skipped_below_threshold = 0
+
+        # Adaptive schedule: each instance is polled on its own interval
+        self.min_poll_interval = min(min_poll_interval, poll_interval)
+        self.max_poll_interval = max(max_poll_interval, poll_interval)
+        self.busy_output_rate = busy_output_rate
+        self._scheduler = PollScheduler()
+
     # ============================================================================
     # Lifecycle Methods
     # ============================================================================
@@ -135,6 +284,16 @@ class MonitoringService:
             except asyncio.CancelledError:
                 self._logger.info("Monitoring task cancelled successfully")
 
+        # Release the summarizer's pooled connections
+        close = getattr(self.llm_summarizer, "close", None)
+        if close is not None:
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                self._logger.warning(f"Failed to close LLM summarizer: {e}")
+
         self._logger.info("MonitoringService stopped")
 
     def is_running(self) -> bool:
@@ -149,8 +308,9 @@ class MonitoringService:
         """
         Main monitoring loop (runs in background task).
 
-        Continuously polls InstanceManager, processes instances,
-        and persists summaries at the configured interval.
+        Continuously polls InstanceManager, processes the instances that
+        are due, and persists summaries. After each poll, the instance is
+        rescheduled by ``_reschedule``.
 
         Handles all exceptions to prevent task crashes.
         Implements graceful shutdown on cancellation.
@@ -170,19 +330,50 @@ class MonitoringService:
                 }
 
                 self._logger.debug(f"Found {len(active_instances)} active instances")
-
-                # Process each instance in parallel
+                self._forget_inactive(active_instances)
+                self._sync_schedule(active_instances)
+
+                # Collect the new output of each instance that is due, in parallel
+                now = time.monotonic()
+                due = [
+                    instance_id
+                    for instance_id in self._scheduler.pop_due(now)
+                    if instance_id in active_instances
+                ]
                 tasks = []
-                for instance_id, instance_data in active_instances.items():
+                for instance_id in due:
                     if not self._should_skip_instance(instance_id):
-                        tasks.append(self._process_instance(instance_id, instance_data))
+                        tasks.append(
+                            self._prepare_summary(instance_id, active_instances[instance_id])
+                        )
 
-                # Process all instances concurrently
+                # Summarize all instances that changed, batched if the summarizer can
+                summarized: dict[str, int] = {}
                 if tasks:
-                    await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Wait for next poll interval
-                await asyncio.sleep(self.poll_interval)
+                    prepared = await asyncio.gather(*tasks, return_exceptions=True)
+                    pending = [p for p in prepared if isinstance(p, PendingSummary)]
+                    if pending:
+                        await self._summarize_pending(pending)
+                    summarized = {
+                        p.instance_id: len(p.delta)
+                        for p in pending
+                        if self._fingerprints.get(p.instance_id) is p.fingerprint
+                    }
+
+                for instance_id in due:
+                    self._reschedule(
+                        instance_id,
+                        active_instances[instance_id].get("state"),
+                        summarized.get(instance_id),
+                    )
+
+                # Sleep until the next instance is due; new instances and state
+                # changes are picked up at least every poll interval
+                next_due = self._scheduler.next_due()
+                delay = self.poll_interval
+                if next_due is not None:
+                    delay = min(delay, max(0.0, next_due - time.monotonic()))
+                await asyncio.sleep(delay)
 
             except asyncio.CancelledError:
                 self._logger.info("Monitoring loop cancelled")
@@ -203,46 +394,139 @@ class MonitoringService:
             instance_data: Instance metadata and status
 
         Steps:
-            1. Get recent output from instance
-            2. Call LLMSummarizer to generate summary
+            1. Get output written since the last summary
+            2. Call LLMSummarizer with the new lines and the previous summary
             3. Persist summary to disk
             4. Update error tracking
 
         Implements error isolation - failures don't crash the loop.
         """
+        pending = await self._prepare_summary(instance_id, instance_data)
+        if pending is not None:
+            await self._summarize_pending([pending])
+
+    async def _prepare_summary(
+        self, instance_id: str, instance_data: dict
+    ) -> PendingSummary | None:
+        """Get an instance's new output; None if it needs no summary this round."""
         try:
-            start_time = time.time()
+            started = time.time()
 
-            # Get recent activity
-            activity = await self._get_instance_activity(instance_id)
+            if await self._output_unmoved(instance_id):
+                self.skipped_unchanged += 1
+                return None
+
+            # Get output written since the last summary
+            activity, cursor = await self._get_instance_delta(instance_id)
 
             if not activity or len(activity.strip()) == 0:
                 self._logger.debug(f"No activity for instance {instance_id}, skipping")
-                return
+                return None
+
+            changed = self._changed_enough(instance_id, activity)
+            if changed is None:
+                return None
+            fingerprint, delta = changed
+            previous = self._fingerprints.get(instance_id)
+            return PendingSummary(
+                instance_id=instance_id,
+                status=instance_data.get("state", "unknown"),
+                activity=activity,
+                delta=delta,
+                cursor=cursor,
+                fingerprint=fingerprint,
+                previous_summary=previous.summary if previous else None,
+                started=started,
+            )
+
+        except Exception as e:
+            self._logger.error(f"Error processing instance {instance_id}: {e}")
+            self._record_error(instance_id)
+            return None
+
+    async def _summarize_pending(self, pending: list[PendingSummary]) -> None:
+        """Summarize the new lines of each instance and persist the results.
+
+        The previous summary stands in for everything before the new lines.
+        Several instances go to the summarizer's ``summarize_batch`` in one
+        call when it has one; otherwise each gets its own request.
+        """
+        summarize_batch = getattr(self.llm_summarizer, "summarize_batch", None)
+        if summarize_batch is None or len(pending) == 1:
+            await asyncio.gather(*(self._summarize_one(p) for p in pending), return_exceptions=True)
+            return
+
+        try:
+            self._logger.debug(f"Generating summaries for {len(pending)} instances")
+            summaries = await summarize_batch(
+                [SummaryRequest(p.instance_id, p.delta, p.previous_summary) for p in pending],
+                max_tokens=self.max_tokens,
+            )
+        except Exception as e:
+            self._logger.error(f"Error summarizing {len(pending)} instances: {e}")
+            for p in pending:
+                self._record_error(p.instance_id)
+            return
+
+        await asyncio.gather(
+            *(self._finish_summary(p, summaries.get(p.instance_id)) for p in pending),
+            return_exceptions=True,
+        )
 
+    async def _summarize_one(self, pending: PendingSummary) -> None:
+        try:
             # Generate summary using LLMSummarizer
-            self._logger.debug(f"Generating summary for instance {instance_id}")
+            self._logger.debug(f"Generating summary for instance {pending.instance_id}")
             summary = await self.llm_summarizer.summarize_activity(
-                instance_id=instance_id, activity_text=activity, max_tokens=self.max_tokens
+                instance_id=pending.instance_id,
+                activity_text=pending.delta,
+                max_tokens=self.max_tokens,
+                previous_summary=pending.previous_summary,
             )
+        except Exception as e:
+            self._logger.error(f"Error processing instance {pending.instance_id}: {e}")
+            self._record_error(pending.instance_id)
+            return
+        await self._finish_summary(pending, summary)
+
+    async def _finish_summary(self, pending: PendingSummary, summary: str | None) -> None:
+        """Persist an instance's summary and record it against the change gate."""
+        instance_id = pending.instance_id
+        try:
+            if summary is None:
+                raise ValueError("summarizer returned no summary")
 
             # Calculate generation time
-            generation_time_ms = int((time.time() - start_time) * 1000)
+            generation_time_ms = int((time.time() - pending.started) * 1000)
 
             # Persist summary
             await self._persist_summary(
                 instance_id=instance_id,
                 summary=summary,
-                status=instance_data.get("state", "unknown"),
+                status=pending.status,
                 metadata={
-                    "output_length": len(activity),
+                    "output_length": len(pending.activity),
+                    "delta_length": len(pending.delta),
+                    "rolling_context": pending.previous_summary is not None,
                     "error_count": self._error_counts.get(instance_id, 0),
                     "generation_time_ms": generation_time_ms,
                     "poll_interval": self.poll_interval,
                 },
             )
 
+            # A fallback is shown, but the new lines stay unsummarized for the
+            # next poll and the instance backs off as after any other error
+            if isinstance(summary, SummaryUnavailable):
+                self._logger.warning(f"No summary for instance {instance_id}: {summary}")
+                self._record_error(instance_id)
+                return
+
             # Record success
+            fingerprint = pending.fingerprint
+            fingerprint.cursor = pending.cursor
+            fingerprint.summary = summary
+            self._fingerprints[instance_id] = fingerprint
+            self.summaries_generated += 1
             self._record_success(instance_id)
             self._logger.info(
                 f"Successfully processed instance {instance_id} ({generation_time_ms}ms)"
@@ -252,6 +536,205 @@ class MonitoringService:
             self._logger.error(f"Error processing instance {instance_id}: {e}")
             self._record_error(instance_id)
 
+    async def _output_unmoved(self, instance_id: str) -> bool:
+        """True if the pane's output end has not moved since the last check.
+
+        Asks the manager for the pane's history size and cursor, which costs
+        far less than capturing 1,000 lines. Managers without
+        ``get_output_cursor`` (or a pane that cannot report one) always get
+        a capture, as does a pane whose history is full: tmux then drops old
+        lines in chunks, so the same cursor can come back after new output.
+        A change deferred by the thresholds is re-checked once the last
+        summary has aged out, even if nothing moved since.
+        """
+        get_cursor = getattr(self.instance_manager, "get_output_cursor", None)
+        if get_cursor is None:
+            return False
+        try:
+            cursor = await get_cursor(instance_id)
+        except Exception:
+            return False
+        if cursor is None or getattr(cursor, "history_full", False):
+            return False
+        previous = self._checked_cursors.get(instance_id)
+        self._checked_cursors[instance_id] = cursor
+        fingerprint = self._fingerprints.get(instance_id)
+        if fingerprint is None or cursor != previous:
+            return False
+        return not (fingerprint.deferred and self._summary_expired(fingerprint))
+
+    def _changed_enough(
+        self, instance_id: str, activity: str
+    ) -> tuple[ActivityFingerprint, str] | None:
+        """Fingerprint ``activity`` and decide whether it is worth a summary.
+
+        Returns the new fingerprint to record once the summary is written
+        and the lines new since the last summary, in order. Returns None
+        (counting the skip) when nothing is new or the new lines are below
+        ``min_new_lines`` / ``min_new_chars`` and the last summary is recent.
+        """
+        digest = hashlib.sha256(activity.encode()).hexdigest()
+        previous = self._fingerprints.get(instance_id)
+        if previous is not None and digest == previous.digest:
+            previous.deferred = False
+            self.skipped_unchanged += 1
+            return None
+
+        line_counts: Counter[int] = Counter()
+        delta: list[str] = []
+        new_chars = 0
+        for line in _fingerprint_lines(activity):
+            key = hash(line)
+            line_counts[key] += 1
+            if previous is None or line_counts[key] > previous.line_counts[key]:
+                delta.append(line)
+                new_chars += len(line)
+        new_lines = len(delta)
+
+        if previous is not None and new_lines == 0:
+            # Only redraws of lines already summarized
+            previous.deferred = False
+            self.skipped_unchanged += 1
+            return None
+        if (
+            previous is not None
+            and (new_lines < self.min_new_lines or new_chars < self.min_new_chars)
+            and not self._summary_expired(previous)
+        ):
+            previous.deferred = True
+            self.skipped_below_threshold += 1
+            self._logger.debug(
+                f"Deferring summary for {instance_id}: {new_lines} new lines, {new_chars} chars"
+            )
+            return None
+        return ActivityFingerprint(digest, line_counts), "\n".join(delta)
+
+    def _sync_schedule(self, active_instances: dict[str, Any]) -> None:
+        """Schedule new instances now, and bring forward any whose state changed."""
+        now = time.monotonic()
+        for instance_id, instance_data in active_instances.items():
+            cadence = self._scheduler.cadences.get(instance_id)
+            if cadence is None:
+                cadence = InstanceCadence(self.poll_interval, state=instance_data.get("state"))
+                self._scheduler.schedule(instance_id, cadence, now)
+            elif instance_data.get("state") != cadence.state and cadence.next_due > now:
+                self._scheduler.schedule(instance_id, cadence, now)
+
+    def _reschedule(self, instance_id: str, state: str | None, new_chars: int | None) -> None:
+        """Set an instance's next poll from what its last poll found.
+
+        Args:
+            instance_id: The instance just polled
+            state: Its state at this poll
+            new_chars: Length of the new output summarized, or None if the
+                poll produced no summary
+
+        A state change polls again at ``min_poll_interval``. New output
+        faster than ``busy_output_rate`` halves the interval, down to
+        ``min_poll_interval``; slower output resets it to ``poll_interval``.
+        Each poll without a summary doubles it from ``poll_interval`` up to
+        ``max_poll_interval``, as ``_get_backoff_seconds`` does for errors.
+        An instance in error backoff is not polled before the backoff ends.
+        """
+        cadence = self._scheduler.cadences.get(instance_id)
+        if cadence is None:
+            return
+        now = time.monotonic()
+        elapsed = now - cadence.last_polled if cadence.last_polled else self.poll_interval
+        cadence.last_polled = now
+        state_changed = state != cadence.state
+        cadence.state = state
+
+        if new_chars is not None:
+            cadence.quiet_polls = 0
+            cadence.output_rate = new_chars / max(elapsed, 1e-3)
+            if cadence.output_rate >= self.busy_output_rate:
+                cadence.interval = max(self.min_poll_interval, cadence.interval / 2)
+            else:
+                cadence.interval = self.poll_interval
+        else:
+            cadence.quiet_polls += 1
+            cadence.output_rate = 0.0
+            cadence.interval = self._get_backoff_seconds(
+                cadence.quiet_polls, base=self.poll_interval, cap=self.max_poll_interval
+            )
+        if state_changed:
+            cadence.quiet_polls = 0
+            cadence.interval = self.min_poll_interval
+
+        due = now + cadence.interval
+        error_count = self._error_counts.get(instance_id, 0)
+        if error_count:
+            backoff_left = self._get_backoff_seconds(error_count) - (
+                time.time() - self._last_error_time.get(instance_id, 0)
+            )
+            due = max(due, now + backoff_left)
+        self._scheduler.schedule(instance_id, cadence, due)
+
+    def _forget_inactive(self, active_instances: dict[str, Any]) -> None:
+        """Drop change-gate and schedule state for instances that are no longer active."""
+        for tracked in (self._fingerprints, self._checked_cursors, self._scheduler.cadences):
+            for instance_id in [iid for iid in tracked if iid not in active_instances]:
+                del tracked[instance_id]
+
+    def _summary_expired(self, fingerprint: ActivityFingerprint) -> bool:
+        return time.monotonic() - fingerprint.summarized_at >= self.max_summary_age
+
+    def stats(self) -> dict[str, Any]:
+        """Summaries generated vs skipped by the change gate."""
+        considered = (
+            self.summaries_generated + self.skipped_unchanged + self.skipped_below_threshold
+        )
+        skipped = considered - self.summaries_generated
+        stats = {
+            "running": self.is_running(),
+            "poll_interval": self.poll_interval,
+            "summaries_generated": self.summaries_generated,
+            "skipped_unchanged": self.skipped_unchanged,
+            "skipped_below_threshold": self.skipped_below_threshold,
+            "skip_rate": round(skipped / considered, 3) if considered else 0.0,
+            "thresholds": {
+                "min_new_lines": self.min_new_lines,
+                "min_new_chars": self.min_new_chars,
+                "max_summary_age": self.max_summary_age,
+            },
+            "schedule": {
+                "instances": len(self._scheduler.cadences),
+                "min_poll_interval": self.min_poll_interval,
+                "max_poll_interval": self.max_poll_interval,
+            },
+        }
+        summarizer_stats = getattr(self.llm_summarizer, "stats", None)
+        if callable(summarizer_stats):
+            summarizer_stats = summarizer_stats()
+            if isinstance(summarizer_stats, dict):
+                stats["summarizer"] = summarizer_stats
+        return stats
+
+    async def _get_instance_delta(self, instance_id: str) -> tuple[str, Any]:
+        """Output written since the instance was last summarized.
+
+        Uses the manager's ``get_output_since`` with the pane cursor saved at
+        the last summary, so a long-running agent costs a capture of its
+        new output plus one screen instead of its last 1,000 lines.
+        Managers without it get the full capture from
+        ``_get_instance_activity``.
+
+        Returns:
+            (output, cursor to store with the summary, or None)
+        """
+        get_since = getattr(self.instance_manager, "get_output_since", None)
+        if get_since is not None:
+            fingerprint = self._fingerprints.get(instance_id)
+            try:
+                data = await get_since(
+                    instance_id, fingerprint.cursor if fingerprint else None, limit=1000
+                )
+                return data.get("output", ""), data.get("cursor")
+            except Exception as e:
+                self._logger.debug(f"Delta capture failed for {instance_id}, capturing all: {e}")
+        return await self._get_instance_activity(instance_id), None
+
     async def _get_instance_activity(self, instance_id: str) -> str:
         """
         Retrieve recent activity for an instance.
@@ -445,6 +928,8 @@ class MonitoringService:
         """
         self._error_counts[instance_id] = self._error_counts.get(instance_id, 0) + 1
         self._last_error_time[instance_id] = time.time()
+        # Capture again on the next poll even if the pane has not moved since
+        self._checked_cursors.pop(instance_id, None)
 
         error_count = self._error_counts[instance_id]
         backoff = self._get_backoff_seconds(error_count)
@@ -465,20 +950,22 @@ class MonitoringService:
         if instance_id in self._last_error_time:
             del self._last_error_time[instance_id]
 
-    def _get_backoff_seconds(self, error_count: int) -> float:
+    def _get_backoff_seconds(self, error_count: int, base: float = 1, cap: float = 300) -> float:
         """
         Calculate backoff time based on error count.
 
         Args:
-            error_count: Number of consecutive errors
+            error_count: Number of consecutive errors (or quiet polls)
+            base: Backoff after zero errors, doubled per error
+            cap: Longest backoff
 
         Returns:
             Backoff time in seconds
 
-        Formula: min(2^error_count, 300) seconds
-        Max backoff: 5 minutes
+        Formula: min(base * 2^error_count, cap) seconds
+        Max backoff: 5 minutes by default
         """
-        return min(2**error_count, 300)
+        return min(base * 2**error_count, cap)
 
     # ============================================================================
     # Utility Methods
@@ -553,9 +1040,11 @@ class MonitoringService:
         Retrieve the latest summaries for all monitored instances.
 
         Returns:
-            Dict mapping instance_id to summary data
+            Dict mapping instance_id to summary data. Instances still being
+            monitored carry their poll schedule under ``"cadence"``.
         """
         summaries: dict[str, dict] = {}
+        now = time.monotonic()
 
         try:
             # Iterate through all instance directories
@@ -567,6 +1056,9 @@ class MonitoringService:
                     instance_id = instance_dir.name
                     summary = await self.get_summary(instance_id, latest=True)
                     if summary:
+                        cadence = self._scheduler.cadences.get(instance_id)
+                        if cadence is not None:
+                            summary["cadence"] = cadence.to_dict(now)
                         summaries[instance_id] = summary
 
         except Exception as e:
@@ -0,0 +1,441 @@
+"""Reply bus: per-instance reply queues shared over a Unix domain socket.
+
+Replies flow from a child instance back to whoever is waiting on it. The
+waiting side used to block a fresh worker thread on a
+``multiprocessing.Manager`` queue proxy for every wait, and each put paid a
+Manager lock round-trip plus a queue round-trip through the daemon process.
+
+The bus keeps the queues in the orchestrator process itself:
+
+* ``ReplyQueue`` — a bounded, thread-safe queue with a synchronous ``put`` and
+  an awaitable ``get``; waiting costs a future, not a thread.
+* ``ReplyBusServer`` — owns the queues and serves them to other processes on a
+  private Unix socket. It runs its own event loop on a daemon thread so it is
+  reachable as soon as it is constructed, independent of which loop (if any)
+  the caller runs.
+* ``ReplyBusClient`` — used by STDIO child processes. Each request is one
+  length-prefixed JSON frame on a pooled connection.
+
+Wire format: a 4-byte big-endian length followed by a UTF-8 JSON object.
+Every connection opens with ``{"op": "hello", "authkey": <base64>}``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hmac
+import json
+import logging
+import os
+import shutil
+import struct
+import tempfile
+import threading
+from collections import deque
+from queue import Empty, Full
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+#: Default number of undelivered replies held per instance.
+DEFAULT_QUEUE_SIZE = 100
+
+#: Largest frame either side will accept; replies are text, not artifacts.
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+
+_HEADER = struct.Struct("!I")
+
+#: Slack added on top of a remote ``get`` timeout before the client gives up
+#: on the server's answer.
+_REQUEST_SLACK_SECONDS = 5.0
+
+
+class ReplyBusError(Exception):
+    """The reply bus is unreachable or refused a request."""
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class ReplyQueue:
+    """Bounded FIFO with a thread-safe ``put`` and an awaitable ``get``.
+
+    ``put`` never blocks: a full queue raises ``queue.Full`` straight away.
+    ``get`` parks the calling coroutine on a future that the next ``put``
+    resolves, from whichever thread or loop that ``put`` runs on.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_QUEUE_SIZE):
+        self.maxsize = maxsize
+        self._items: deque[Any] = deque()
+        self._waiters: deque[asyncio.Future] = deque()
+        self._lock = threading.Lock()
+
+    def put(self, item: Any) -> None:
+        """Append ``item``; raises ``queue.Full`` when the queue is at capacity."""
+        with self._lock:
+            if self.maxsize > 0 and len(self._items) >= self.maxsize:
+                raise Full
+            self._items.append(item)
+            self._wake_one()
+
+    put_nowait = put
+
+    def put_front(self, item: Any) -> None:
+        """Return an item that was taken but could not be delivered."""
+        with self._lock:
+            self._items.appendleft(item)
+            self._wake_one()
+
+    def get_nowait(self) -> Any:
+        with self._lock:
+            if not self._items:
+                raise Empty
+            return self._items.popleft()
+
+    async def get(self, timeout: float | None = None) -> Any:
+        """Wait up to ``timeout`` seconds for an item (``None`` waits forever).
+
+        Raises:
+            TimeoutError: If nothing arrived in time
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._lock:
+                if self._items:
+                    return self._items.popleft()
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No reply within {timeout}s")
+                waiter = loop.create_future()
+                self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except TimeoutError:
+                self._forget(waiter)
+                raise TimeoutError(f"No reply within {timeout}s") from None
+            except BaseException:
+                self._forget(waiter)
+                raise
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def drain(self) -> int:
+        """Discard every pending item; returns how many were dropped."""
+        with self._lock:
+            dropped = len(self._items)
+            self._items.clear()
+            return dropped
+
+    def _wake_one(self) -> None:
+        # Caller holds the lock
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            try:
+                waiter.get_loop().call_soon_threadsafe(_resolve, waiter)
+            except RuntimeError:
+                # The waiter's loop has been closed
+                continue
+            return
+
+    def _forget(self, waiter: asyncio.Future) -> None:
+        with self._lock:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                # Already woken; hand its item on to the next waiter
+                if self._items:
+                    self._wake_one()
+
+
+def encode_frame(payload: dict[str, Any]) -> bytes:
+    body = json.dumps(payload, default=str).encode("utf-8")
+    if len(body) > MAX_FRAME_BYTES:
+        raise ReplyBusError(f"Frame of {len(body)} bytes exceeds {MAX_FRAME_BYTES}")
+    return _HEADER.pack(len(body)) + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> dict[str, Any]:
+    """Read one frame; raises ``asyncio.IncompleteReadError`` on EOF."""
+    (length,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if length > MAX_FRAME_BYTES:
+        raise ReplyBusError(f"Frame of {length} bytes exceeds {MAX_FRAME_BYTES}")
+    payload = json.loads(await reader.readexactly(length))
+    if not isinstance(payload, dict):
+        raise ReplyBusError("Frame is not a JSON object")
+    return payload
+
+
+class ReplyBusServer:
+    """Owns the reply queues and serves them on a private Unix socket.
+
+    Usage::
+
+        bus = ReplyBusServer(authkey)
+        bus.start()
+        bus.queue("abc").put({"reply_message": "done"})
+        reply = await bus.queue("abc").get(timeout=30)
+        bus.close()
+    """
+
+    def __init__(self, authkey: bytes, socket_path: str | None = None):
+        self._authkey = bytes(authkey)
+        self._owned_dir: str | None = None
+        if socket_path is None:
+            # mkdtemp creates the directory 0700, so only this user can connect
+            self._owned_dir = tempfile.mkdtemp(prefix="madrox-bus-")
+            socket_path = os.path.join(self._owned_dir, "reply.sock")
+        self.socket_path = socket_path
+        self.queues: dict[str, ReplyQueue] = {}
+        self._queues_lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self.connections = 0
+        self.remote_puts = 0
+        self.remote_gets = 0
+        self.rejected = 0
+
+    # ------------------------------------------------------------------
+    # Queues
+    # ------------------------------------------------------------------
+    def queue(self, queue_id: str, maxsize: int = DEFAULT_QUEUE_SIZE) -> ReplyQueue:
+        """The queue for ``queue_id``, created on first use."""
+        with self._queues_lock:
+            queue = self.queues.get(queue_id)
+            if queue is None:
+                queue = self.queues[queue_id] = ReplyQueue(maxsize)
+            return queue
+
+    def remove(self, queue_id: str) -> ReplyQueue | None:
+        with self._queues_lock:
+            return self.queues.pop(queue_id, None)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, timeout: float = 5.0) -> None:
+        """Start serving on a daemon thread; returns once the socket is bound."""
+        if self.is_running:
+            return
+        ready = threading.Event()
+        failure: list[BaseException] = []
+
+        def run() -> None:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            self._loop = loop
+            try:
+                self._server = loop.run_until_complete(
+                    asyncio.start_unix_server(
+                        self._handle, path=self.socket_path, limit=MAX_FRAME_BYTES
+                    )
+                )
+                os.chmod(self.socket_path, 0o600)
+            except BaseException as e:
+                failure.append(e)
+                ready.set()
+                loop.close()
+                return
+            ready.set()
+            try:
+                loop.run_forever()
+            finally:
+                self._server.close()
+                # Connection handlers may be parked on a get; end them first
+                pending = asyncio.all_tasks(loop)
+                for task in pending:
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                loop.run_until_complete(self._server.wait_closed())
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name="madrox-reply-bus", daemon=True)
+        self._thread.start()
+        if not ready.wait(timeout):
+            raise ReplyBusError(f"Reply bus did not start within {timeout}s")
+        if failure:
+            self._thread = None
+            raise ReplyBusError(f"Reply bus failed to start: {failure[0]}") from failure[0]
+        logger.info(f"Reply bus listening on {self.socket_path}")
+
+    def close(self) -> None:
+        """Stop serving and remove the socket."""
+        loop, thread = self._loop, self._thread
+        if loop is not None and thread is not None and thread.is_alive():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+        self._thread = None
+        if self._owned_dir:
+            shutil.rmtree(self._owned_dir, ignore_errors=True)
+        else:
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "socket": self.socket_path,
+            "running": self.is_running,
+            "connections": self.connections,
+            "remote_puts": self.remote_puts,
+            "remote_gets": self.remote_gets,
+            "rejected": self.rejected,
+        }
+
+    # ------------------------------------------------------------------
+    # Protocol
+    # ------------------------------------------------------------------
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            hello = await read_frame(reader)
+            offered = base64.b64decode(hello.get("authkey", ""))
+            if hello.get("op") != "hello" or not hmac.compare_digest(offered, self._authkey):
+                self.rejected += 1
+                writer.write(encode_frame({"ok": False, "error": "unauthorized"}))
+                await writer.drain()
+                return
+            self.connections += 1
+            writer.write(encode_frame({"ok": True}))
+            await writer.drain()
+
+            while True:
+                request = await read_frame(reader)
+                await self._serve(request, writer)
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            # EOF from the client, or the server is closing
+            pass
+        except Exception as e:
+            logger.warning(f"Reply bus connection dropped: {e}")
+        finally:
+            writer.close()
+
+    async def _serve(self, request: dict[str, Any], writer: asyncio.StreamWriter) -> None:
+        op = request.get("op")
+        queue_id = str(request.get("queue", ""))
+        if op == "put":
+            self.remote_puts += 1
+            try:
+                self.queue(queue_id).put(request.get("message"))
+                response: dict[str, Any] = {"ok": True}
+            except Full:
+                response = {"ok": False, "error": "full"}
+        elif op == "get":
+            self.remote_gets += 1
+            queue = self.queue(queue_id)
+            try:
+                message = await queue.get(request.get("timeout"))
+            except TimeoutError:
+                response = {"ok": False, "error": "timeout"}
+            else:
+                try:
+                    writer.write(encode_frame({"ok": True, "message": message}))
+                    await writer.drain()
+                except Exception:
+                    # The asker went away; keep the reply for the next one
+                    queue.put_front(message)
+                    raise
+                return
+        else:
+            response = {"ok": False, "error": f"unknown op {op!r}"}
+        writer.write(encode_frame(response))
+        await writer.drain()
+
+
+class ReplyBusClient:
+    """Reaches a ``ReplyBusServer`` from another process.
+
+    Connections are pooled per event loop and each carries one request at a
+    time, so a long ``get`` never delays a ``put``.
+    """
+
+    def __init__(self, socket_path: str, authkey: bytes):
+        self.socket_path = socket_path
+        self._authkey = bytes(authkey)
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._pool_loop: asyncio.AbstractEventLoop | None = None
+
+    async def put(self, queue_id: str, message: Any, timeout: float = 5.0) -> None:
+        """Deliver ``message``; raises ``queue.Full`` if the queue is at capacity."""
+        response = await self._request(
+            {"op": "put", "queue": queue_id, "message": message}, timeout
+        )
+        if not response.get("ok"):
+            if response.get("error") == "full":
+                raise Full
+            raise ReplyBusError(f"put to {queue_id} failed: {response.get('error')}")
+
+    async def get(self, queue_id: str, timeout: float) -> Any:
+        """Wait up to ``timeout`` seconds for the next message on ``queue_id``.
+
+        Raises:
+            TimeoutError: If nothing arrived in time
+        """
+        response = await self._request(
+            {"op": "get", "queue": queue_id, "timeout": timeout},
+            timeout + _REQUEST_SLACK_SECONDS,
+        )
+        if response.get("ok"):
+            return response.get("message")
+        if response.get("error") == "timeout":
+            raise TimeoutError(f"No reply from {queue_id} within {timeout}s")
+        raise ReplyBusError(f"get from {queue_id} failed: {response.get('error')}")
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+
+    async def _request(self, payload: dict[str, Any], timeout: float) -> dict[str, Any]:
+        reader, writer = await self._acquire()
+        try:
+            writer.write(encode_frame(payload))
+            await writer.drain()
+            response = await asyncio.wait_for(read_frame(reader), timeout)
+        except BaseException:
+            # A half-finished exchange leaves the stream unusable
+            writer.close()
+            raise
+        self._idle.append((reader, writer))
+        return response
+
+    async def _acquire(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        loop = asyncio.get_running_loop()
+        if self._pool_loop is not loop:
+            # Streams are bound to the loop that opened them
+            self._idle = []
+            self._pool_loop = loop
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+        try:
+            reader, writer = await asyncio.open_unix_connection(
+                self.socket_path, limit=MAX_FRAME_BYTES
+            )
+        except OSError as e:
+            raise ReplyBusError(f"Reply bus at {self.socket_path} unreachable: {e}") from e
+        writer.write(
+            encode_frame({"op": "hello", "authkey": base64.b64encode(self._authkey).decode()})
+        )
+        await writer.drain()
+        ack = await asyncio.wait_for(read_frame(reader), _REQUEST_SLACK_SECONDS)
+        if not ack.get("ok"):
+            writer.close()
+            raise ReplyBusError(f"Reply bus refused connection: {ack.get('error')}")
+        return reader, writer
@@ -1,6 +1,7 @@
 """Claude Orchestrator MCP Server."""
 
 import asyncio
+import json
 import logging
 import os
 from collections.abc import AsyncGenerator
@@ -11,22 +12,43 @@ from typing import Any
 from fastapi import (
     FastAPI,
     HTTPException,
+    Request,
+    Response,
     WebSocket,
     WebSocketDisconnect,
 )
 from fastapi.middleware.cors import CORSMiddleware
 
+from ..audit_index import AuditIndex
+from ..caller_identity import CALLER_HEADER, CallerParamFilter, resolve_caller_token
 from ..instance_manager import InstanceManager
-from ..logging_manager import LoggingManager, get_audit_log_stream_handler, get_log_stream_handler
+from ..log_broadcaster import get_log_broadcaster
+from ..logging_manager import LoggingManager
 from ..mcp_adapter import MCPAdapter
+from ..mcp_adapter.dispatch import CallerStats, ToolStats
+from ..monitoring_service import MonitoringService
 from ..simple_models import (
     InstanceRole,
     OrchestratorConfig,
 )
 from ..state_store import StateStore
+from ..tmux_instance_manager.async_tmux import AsyncTmux
+from ..tmux_instance_manager.change_feed import (
+    ChangeSubscription,
+    InstanceChangeFeed,
+    ResyncRequired,
+)
+from ..tmux_instance_manager.delivery import DeliveryStats
+from ..tmux_instance_manager.hierarchy_index import HierarchyIndex
+from ..tmux_instance_manager.persistence import StatePersister
+from ..tmux_instance_manager.warm_pool import WarmPool
+from .listeners import bind_tcp_sockets, bind_unix_socket, mcp_socket_path, remove_unix_socket
 
 logger = logging.getLogger(__name__)
 
+#: Seconds between audit log checks on an otherwise idle /ws/monitor connection.
+MONITOR_AUDIT_INTERVAL = 2.0
+
 
 class ClaudeOrchestratorServer:
     """MCP Server for Claude Orchestrator."""
@@ -90,6 +112,10 @@ class ClaudeOrchestratorServer:
         # Test the reconfigured module-level logger
         server_logger.info("Module-level logger reconfigured successfully")
 
+        # STDIO children on this host can reach us over a Unix socket in the
+        # log directory instead of TCP loopback (bound in start_server)
+        self.mcp_socket_path = mcp_socket_path(log_dir) if config.mcp_socket else None
+
         # Initialize state store for persistent instance state
         state_dir = os.path.join(log_dir, "state")
         self.state_store = StateStore(state_dir=state_dir)
@@ -129,6 +155,8 @@ class ClaudeOrchestratorServer:
         self.max_ws_connections = int(os.getenv("MAX_WS_CONNECTIONS", "100"))
         self.active_ws_connections = 0
         self._ws_connection_lock = asyncio.Lock()
+        # Parent -> children over instance_manager.instances, for /network/hierarchy
+        self._hierarchy = HierarchyIndex()
 
         # Initialize FastAPI app with lifespan for clean shutdown
         @asynccontextmanager
@@ -228,6 +256,47 @@ class ClaudeOrchestratorServer:
                         ]
                     ),
                 },
+                "delivery": self._delivery_metrics(),
+                "tmux_latency": self._tmux_latency_metrics(),
+                "persistence": self._persistence_metrics(),
+                "change_feed": self._change_feed_metrics(),
+                "log_streaming": self._log_stream_metrics(),
+                "mcp_tools": self._mcp_tool_metrics(),
+                "mcp_callers": self._mcp_caller_metrics(),
+                "warm_pool": self._warm_pool_metrics(),
+                "monitoring": self._monitoring_metrics(),
+            }
+
+        def monitor_audit_message(log: dict[str, Any]) -> dict[str, Any]:
+            """Audit entry as a /ws/monitor message with a human-readable summary."""
+            event_type = log.get("event_type", "")
+            details = log.get("details", {})
+            instance_name = details.get("instance_name", log.get("instance_id", ""))
+
+            if event_type == "instance_spawn":
+                message = f"Spawned instance '{instance_name}' ({details.get('role', 'general')})"
+            elif event_type == "message_exchange":
+                message = f"Message sent to '{instance_name}'"
+            elif event_type == "instance_terminate":
+                message = f"Terminated instance '{instance_name}'"
+            else:
+                message = event_type.replace("_", " ").title()
+
+            # Use timestamp + instance_id + event_type for unique ID
+            log_id = f"{log.get('timestamp', '')}_{log.get('instance_id', '')}_{log.get('event_type', '')}"
+
+            return {
+                "type": "audit_log",
+                "timestamp": datetime.utcnow().isoformat(),
+                "data": {
+                    "log": {
+                        "id": log_id,
+                        "timestamp": log.get("timestamp", ""),
+                        "type": log.get("event_type", ""),
+                        "message": message,
+                        "instanceId": log.get("instance_id"),
+                    }
+                },
             }
 
         @self.app.websocket("/ws/monitor")
@@ -249,38 +318,18 @@ class ClaudeOrchestratorServer:
                 f"(active: {self.active_ws_connections}/{self.max_ws_connections})"
             )
 
+            feed = self._sync_change_feed()
+            subscription = feed.subscribe()
+            receiver: asyncio.Task | None = None
             try:
-                # Send initial state with instances (exclude terminated)
-                # Use _get_instance_status_internal to include tmux-discovered instances
-                status_data = self.instance_manager._get_instance_status_internal()
-                instances_data = []
-                for instance_id, instance in status_data.get("instances", {}).items():
-                    # Skip terminated instances
-                    if instance.get("state") == "terminated":
-                        continue
-
-                    instances_data.append(
-                        {
-                            "id": instance_id,
-                            "name": instance.get("name", instance_id),
-                            "type": instance.get("instance_type", "claude"),
-                            "status": instance.get("state", "unknown"),
-                            "role": instance.get("role", "general"),
-                            "parentId": instance.get("parent_instance_id"),
-                            "createdAt": instance.get("created_at", datetime.utcnow().isoformat()),
-                            "lastActivity": instance.get(
-                                "last_activity", datetime.utcnow().isoformat()
-                            ),
-                            "totalTokens": instance.get("total_tokens_used", 0),
-                            "totalCost": instance.get("total_cost", 0.0),
-                        }
-                    )
-
+                # Snapshot of live instances; deltas numbered after its seq follow
+                _, seq, views = subscription.resync()
                 await websocket.send_json(
                     {
                         "type": "initial_state",
                         "timestamp": datetime.utcnow().isoformat(),
-                        "data": {"instances": instances_data},
+                        "seq": seq,
+                        "data": {"instances": views},
                     }
                 )
 
@@ -289,131 +338,63 @@ class ClaudeOrchestratorServer:
                     since=self.server_start_time, limit=100
                 )
                 for log in audit_logs:
-                    # Generate human-readable message from event
-                    event_type = log.get("event_type", "")
-                    details = log.get("details", {})
-                    instance_name = details.get("instance_name", log.get("instance_id", ""))
-
-                    if event_type == "instance_spawn":
-                        message = (
-                            f"Spawned instance '{instance_name}' ({details.get('role', 'general')})"
-                        )
-                    elif event_type == "message_exchange":
-                        message = f"Message sent to '{instance_name}'"
-                    elif event_type == "instance_terminate":
-                        message = f"Terminated instance '{instance_name}'"
-                    else:
-                        message = event_type.replace("_", " ").title()
-
-                    # Use timestamp + instance_id + event_type for unique ID
-                    log_id = f"{log.get('timestamp', '')}_{log.get('instance_id', '')}_{log.get('event_type', '')}"
-
-                    await websocket.send_json(
-                        {
-                            "type": "audit_log",
-                            "timestamp": datetime.utcnow().isoformat(),
-                            "data": {
-                                "log": {
-                                    "id": log_id,
-                                    "timestamp": log.get("timestamp", ""),
-                                    "type": log.get("event_type", ""),
-                                    "message": message,
-                                    "instanceId": log.get("instance_id"),
-                                }
-                            },
-                        }
-                    )
+                    await websocket.send_json(monitor_audit_message(log))
 
                 # Track last known audit log timestamp (use local time to match audit logs)
                 last_audit_check = datetime.now().isoformat()
 
-                # Keep connection alive and send updates
-                while True:
-                    # Wait for ping from client (heartbeat)
+                # Client messages: pings, and {"type": "resync", "since": <seq>} after a gap
+                receiver = asyncio.create_task(
+                    self._receive_monitor_requests(websocket, subscription)
+                )
+
+                while not receiver.done():
                     try:
-                        message = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
-                    except TimeoutError:
-                        # Send periodic updates even without client ping
-                        pass
-
-                    # Send current instance state (exclude terminated)
-                    # Use _get_instance_status_internal to include tmux-discovered instances
-                    status_data = self.instance_manager._get_instance_status_internal()
-                    instances_data = []
-                    for instance_id, instance in status_data.get("instances", {}).items():
-                        # Skip terminated instances
-                        if instance.get("state") == "terminated":
+                        changes = await subscription.next_batch(timeout=MONITOR_AUDIT_INTERVAL)
+                    except ResyncRequired as resync:
+                        if resync.since is None:
+                            self._sync_change_feed()
+                        kind, seq, data = subscription.resync(resync.since)
+                        if kind == "snapshot":
+                            await websocket.send_json(
+                                {
+                                    "type": "initial_state",
+                                    "timestamp": datetime.utcnow().isoformat(),
+                                    "seq": seq,
+                                    "data": {"instances": data},
+                                }
+                            )
                             continue
+                        changes = data
 
-                        instances_data.append(
+                    if changes:
+                        await websocket.send_json(
                             {
-                                "id": instance_id,
-                                "name": instance.get("name", instance_id),
-                                "type": instance.get("instance_type", "claude"),
-                                "status": instance.get("state", "unknown"),
-                                "role": instance.get("role", "general"),
-                                "parentId": instance.get("parent_instance_id"),
-                                "createdAt": instance.get(
-                                    "created_at", datetime.utcnow().isoformat()
-                                ),
-                                "lastActivity": instance.get(
-                                    "last_activity", datetime.utcnow().isoformat()
-                                ),
-                                "totalTokens": instance.get("total_tokens_used", 0),
-                                "totalCost": instance.get("total_cost", 0.0),
+                                "type": "instance_delta",
+                                "timestamp": datetime.utcnow().isoformat(),
+                                "seq": changes[-1].seq,
+                                "data": {"changes": [change.as_dict() for change in changes]},
                             }
                         )
 
-                    await websocket.send_json(
-                        {
-                            "type": "instance_update",
-                            "timestamp": datetime.utcnow().isoformat(),
-                            "data": {"instances": instances_data},
-                        }
-                    )
-
-                    # Send new audit logs since last check
+                    # New audit events; the index makes an idle poll a stat per file
                     new_audit_logs = await self.instance_manager.get_audit_logs(
                         since=last_audit_check, limit=100
                     )
                     if new_audit_logs:
                         for log in new_audit_logs:
-                            # Generate human-readable message from event
-                            event_type = log.get("event_type", "")
-                            details = log.get("details", {})
-                            instance_name = details.get("instance_name", log.get("instance_id", ""))
-
-                            if event_type == "instance_spawn":
-                                message = f"Spawned instance '{instance_name}' ({details.get('role', 'general')})"
-                            elif event_type == "message_exchange":
-                                message = f"Message sent to '{instance_name}'"
-                            elif event_type == "instance_terminate":
-                                message = f"Terminated instance '{instance_name}'"
-                            else:
-                                message = event_type.replace("_", " ").title()
-
-                            # Use timestamp + instance_id + event_type for unique ID
-                            log_id = f"{log.get('timestamp', '')}_{log.get('instance_id', '')}_{log.get('event_type', '')}"
-
-                            await websocket.send_json(
-                                {
-                                    "type": "audit_log",
-                                    "timestamp": datetime.utcnow().isoformat(),
-                                    "data": {
-                                        "log": {
-                                            "id": log_id,
-                                            "timestamp": log.get("timestamp", ""),
-                                            "type": log.get("event_type", ""),
-                                            "message": message,
-                                            "instanceId": log.get("instance_id"),
-                                        }
-                                    },
-                                }
-                            )
+                            await websocket.send_json(monitor_audit_message(log))
                         # Update last check timestamp to the newest log
                         last_audit_check = new_audit_logs[-1].get("timestamp", last_audit_check)
+                        if any(
+                            log.get("event_type") in ("instance_spawn", "instance_terminate")
+                            for log in new_audit_logs
+                        ):
+                            # Picks up instances spawned by STDIO children in other processes
+                            self._sync_change_feed()
 
-                    await asyncio.sleep(2)  # Update every 2 seconds
+                # Surface the receiver's WebSocketDisconnect (or error)
+                await receiver
 
             except WebSocketDisconnect:
                 logger.info("WebSocket client disconnected from /ws/monitor")
@@ -424,6 +405,9 @@ class ClaudeOrchestratorServer:
                 except Exception:
                     pass
             finally:
+                subscription.close()
+                if receiver is not None:
+                    receiver.cancel()
                 # Decrement connection count on disconnect
                 async with self._ws_connection_lock:
                     self.active_ws_connections -= 1
@@ -462,12 +446,10 @@ class ClaudeOrchestratorServer:
                 f"(active: {self.active_ws_connections}/{self.max_ws_connections})"
             )
 
-            # Register this client with both system and audit log stream handlers
-            log_handler = get_log_stream_handler()
-            log_handler.add_client(websocket)
-
-            audit_log_handler = get_audit_log_stream_handler()
-            audit_log_handler.add_client(websocket)
+            # One queue and writer per client, shared by the system and audit
+            # log streams; everything this handler sends goes through it too
+            broadcaster = get_log_broadcaster()
+            stream = broadcaster.add_client(websocket)
 
             try:
                 # Send recent system logs on initial connection
@@ -478,15 +460,13 @@ class ClaudeOrchestratorServer:
                             lines = f.readlines()
                             # Send last 100 system log lines
                             for line in lines[-100:]:
+                                line = line.strip()
                                 try:
-                                    import json
-
-                                    log_entry = json.loads(line.strip())
-                                    await websocket.send_json(
-                                        {"type": "system_log", "data": log_entry}
-                                    )
+                                    json.loads(line)
                                 except json.JSONDecodeError:
                                     continue
+                                # Already JSON: wrap it without re-serialising
+                                stream.put(f'{{"type": "system_log", "data": {line}}}')
                     except Exception as e:
                         logger.error(f"Failed to load historical system logs: {e}")
 
@@ -494,12 +474,12 @@ class ClaudeOrchestratorServer:
                 audit_logs = await self.instance_manager.get_audit_logs(limit=100)
                 for audit_entry in audit_logs:
                     transformed_audit = transform_audit_log(audit_entry)
-                    await websocket.send_json({"type": "audit_log", "data": transformed_audit})
+                    stream.put(json.dumps({"type": "audit_log", "data": transformed_audit}))
 
                 # Keep connection alive and handle client pings
                 last_audit_check = datetime.now().isoformat()
 
-                while True:
+                while not stream.closed:
                     # Check for new audit logs periodically
                     new_audit_logs = await self.instance_manager.get_audit_logs(
                         since=last_audit_check, limit=50
@@ -508,17 +488,13 @@ class ClaudeOrchestratorServer:
                     if new_audit_logs:
                         for audit_entry in new_audit_logs:
                             transformed_audit = transform_audit_log(audit_entry)
-                            await websocket.send_json(
-                                {"type": "audit_log", "data": transformed_audit}
-                            )
+                            stream.put(json.dumps({"type": "audit_log", "data": transformed_audit}))
                         # Update timestamp to the newest audit log
                         last_audit_check = new_audit_logs[-1].get("timestamp", last_audit_check)
 
-                    # Send ping to keep connection alive
-                    try:
-                        await websocket.send_json({"type": "ping"})
-                    except Exception:
-                        break
+                    # Send ping to keep connection alive; the writer notices a
+                    # dead connection and closes the stream
+                    stream.put('{"type": "ping"}')
 
                     await asyncio.sleep(2)  # Check every 2 seconds
 
@@ -531,8 +507,7 @@ class ClaudeOrchestratorServer:
                 except Exception:
                     pass
             finally:
-                log_handler.remove_client(websocket)
-                audit_log_handler.remove_client(websocket)
+                broadcaster.remove_client(websocket)
                 # Decrement connection count on disconnect
                 async with self._ws_connection_lock:
                     self.active_ws_connections -= 1
@@ -543,17 +518,37 @@ class ClaudeOrchestratorServer:
 
         # MCP Protocol endpoints
         @self.app.get("/tools")
-        async def list_tools():
-            """List available MCP tools with full schemas."""
+        async def list_tools(request: Request, response: Response):
+            """List available MCP tools with full schemas.
+
+            The schema hash doubles as an ETag so STDIO proxies holding a
+            cached copy get a bodyless 304 instead of the full schema list.
+            """
             tools = await self.mcp_adapter.get_available_tools()
-            return {"tools": tools}
+            schema_hash = await self.mcp_adapter.get_tools_schema_hash()
+            etag = f'"{schema_hash}"'
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+            return {"tools": tools, "schema_hash": schema_hash}
 
         @self.app.post("/tools/execute")
-        async def execute_tool(request: dict[str, Any]):
+        async def execute_tool(request: dict[str, Any], http_request: Request):
             """Execute an MCP tool."""
             tool_name = request.get("tool")
             arguments = request.get("arguments", {})
 
+            # A STDIO proxy names the instance it serves; parent its spawns there
+            caller = resolve_caller_token(
+                http_request.headers.get(CALLER_HEADER), self.instance_manager.instances
+            )
+            if (
+                caller
+                and not arguments.get("parent_instance_id")
+                and self._tool_takes_parent(tool_name)
+            ):
+                arguments = {**arguments, "parent_instance_id": caller}
+
             try:
                 if tool_name == "spawn_claude":
                     return await self._spawn_claude(**arguments)
@@ -858,6 +853,17 @@ class ClaudeOrchestratorServer:
             result = await result
         return result
 
+    def _tool_takes_parent(self, tool_name: str | None) -> bool:
+        """True if the tool accepts a top-level ``parent_instance_id``."""
+        from fastmcp.tools.tool import FunctionTool
+
+        if tool_name == "spawn_claude":
+            return True
+        attr = getattr(type(self.instance_manager), tool_name or "", None)
+        return isinstance(attr, FunctionTool) and "parent_instance_id" in attr.parameters.get(
+            "properties", {}
+        )
+
     async def _spawn_claude(
         self,
         name: str | None = None,
@@ -1127,7 +1133,7 @@ class ClaudeOrchestratorServer:
                 def __init__(self, *args: Any, **kwargs: Any) -> None:
                     pass
 
-                async def serve(self) -> None:
+                async def serve(self, sockets: Any = None) -> None:
                     pass
 
             class _UvicornModule:
@@ -1150,7 +1156,10 @@ class ClaudeOrchestratorServer:
             port=self.config.server_port,
             log_level=self.config.log_level.lower(),
         )
+        # HTTP harnesses that cannot send headers pass their caller token in the URL
+        logging.getLogger("uvicorn.access").addFilter(CallerParamFilter())
         server = uvicorn.Server(config)
+        sockets = self._bind_listeners()
 
         # Parent-death watchdog (issue #30): if our launching shell dies and we
         # reparent to PID 1, trigger a graceful uvicorn shutdown so the lifespan
@@ -1158,9 +1167,35 @@ class ClaudeOrchestratorServer:
         # we don't linger as an orphan leaking subprocesses.
         watchdog_task = asyncio.create_task(self._parent_death_watchdog(server))
         try:
-            await server.serve()
+            await server.serve(sockets=sockets)
         finally:
             watchdog_task.cancel()
+            if sockets is not None and self.mcp_socket_path:
+                remove_unix_socket(self.mcp_socket_path)
+
+    def _bind_listeners(self) -> list[Any] | None:
+        """TCP plus MCP Unix socket for uvicorn, or None to let it bind TCP alone.
+
+        Once the Unix socket is bound, STDIO children are pointed at it.
+        """
+        if not self.mcp_socket_path:
+            return None
+        try:
+            unix_socket = bind_unix_socket(self.mcp_socket_path)
+        except OSError as e:
+            logger.warning(f"MCP socket unavailable, children will use TCP: {e}")
+            self.mcp_socket_path = None
+            return None
+        try:
+            tcp_sockets = bind_tcp_sockets(self.config.server_host, self.config.server_port)
+        except OSError:
+            unix_socket.close()
+            remove_unix_socket(self.mcp_socket_path)
+            raise
+
+        self.instance_manager.tmux_manager.mcp_socket_path = self.mcp_socket_path
+        logger.info(f"MCP also listening on unix socket {self.mcp_socket_path}")
+        return [*tcp_sockets, unix_socket]
 
     async def _parent_death_watchdog(self, server: Any) -> None:
         """Trigger graceful shutdown if our parent process dies (we reparent to PID 1).
@@ -1195,7 +1230,6 @@ class ClaudeOrchestratorServer:
             since: Filter logs after this timestamp
             root_instance_id: Optional root instance ID to filter logs by specific network
         """
-        import json
         from pathlib import Path
 
         log_dir = Path(self.config.log_dir) / "audit"
@@ -1212,29 +1246,20 @@ class ClaudeOrchestratorServer:
             }
             network_instance_ids = self._get_network_instances(active_instances, root_instance_id)
 
-        logs = []
-        if audit_file.exists():
-            with open(audit_file) as f:
-                for line in f:
-                    if line.strip():
-                        log_entry = json.loads(line)
-
-                        # Filter by network if specified
-                        if network_instance_ids is not None:
-                            log_instance_id = log_entry.get("instance_id")
-                            if log_instance_id and log_instance_id not in network_instance_ids:
-                                continue
-
-                        # Filter by timestamp
-                        if since:
-                            if log_entry["timestamp"] >= since:
-                                logs.append(log_entry)
-                        else:
-                            logs.append(log_entry)
+        index = AuditIndex.for_directory(log_dir)
+        result = await asyncio.to_thread(
+            index.query,
+            since=since,
+            limit=limit,
+            instance_ids=network_instance_ids,
+            include_since=True,
+            tail=True,
+            pattern=audit_file.name,
+        )
 
         return {
-            "logs": logs[-limit:] if logs else [],
-            "total": len(logs),
+            "logs": result.entries,
+            "total": result.total,
             "file": str(audit_file),
             "filtered_by_network": root_instance_id is not None,
         }
@@ -1305,20 +1330,20 @@ class ClaudeOrchestratorServer:
         """
         instances = self.instance_manager.instances
 
-        # Filter out terminated instances
-        active_instances = {
-            instance_id: instance_data
-            for instance_id, instance_data in instances.items()
-            if instance_data.get("state") != "terminated"
-        }
-
         # If root_instance_id specified, filter to only that network
         if root_instance_id:
-            network_instances = self._get_network_instances(active_instances, root_instance_id)
+            network = self._get_network_instances(instances, root_instance_id)
+            active_instances = {
+                instance_id: instance_data
+                for instance_id, instance_data in instances.items()
+                if instance_id in network
+            }
+        else:
+            # Filter out terminated instances
             active_instances = {
                 instance_id: instance_data
-                for instance_id, instance_data in active_instances.items()
-                if instance_id in network_instances
+                for instance_id, instance_data in instances.items()
+                if instance_data.get("state") != "terminated"
             }
 
         # Create instance info map
@@ -1356,6 +1381,9 @@ class ClaudeOrchestratorServer:
     def _get_network_instances(self, instances: dict[str, dict], root_id: str) -> set[str]:
         """Get all instance IDs in a network (root + all descendants).
 
+        Terminated instances, and anything reachable only through them, are
+        left out. Children come from the hierarchy index, not a scan per level.
+
         Args:
             instances: Dictionary of instance_id -> instance_data
             root_id: Root instance ID to start from
@@ -1363,23 +1391,104 @@ class ClaudeOrchestratorServer:
         Returns:
             Set of instance IDs in the network
         """
-        if root_id not in instances:
+        root = instances.get(root_id)
+        if root is None or root.get("state") == "terminated":
             return set()
 
+        index = self._hierarchy.sync(instances)
         network = {root_id}
         to_process = [root_id]
 
         while to_process:
             current_id = to_process.pop()
-            # Find all children of current instance
-            for instance_id, instance_data in instances.items():
-                if instance_data.get("parent_instance_id") == current_id:
-                    if instance_id not in network:
-                        network.add(instance_id)
-                        to_process.append(instance_id)
+            for child_id in index.children(current_id):
+                if child_id not in network and instances[child_id].get("state") != "terminated":
+                    network.add(child_id)
+                    to_process.append(child_id)
 
         return network
 
+    def _delivery_metrics(self) -> dict[str, Any]:
+        """Per-harness message delivery throughput for /health ({} if unavailable)."""
+        stats = getattr(self.instance_manager.tmux_manager, "delivery_stats", None)
+        return stats.snapshot() if isinstance(stats, DeliveryStats) else {}
+
+    def _tmux_latency_metrics(self) -> dict[str, Any]:
+        """Latency histogram per tmux verb for /health ({} if unavailable)."""
+        tmux = getattr(self.instance_manager.tmux_manager, "tmux", None)
+        return tmux.stats() if isinstance(tmux, AsyncTmux) else {}
+
+    def _persistence_metrics(self) -> dict[str, Any]:
+        """Write-behind flush counters and latency for /health ({} if unavailable)."""
+        persister = getattr(self.instance_manager.tmux_manager, "state_persister", None)
+        if not isinstance(persister, StatePersister):
+            return {}
+        metrics = persister.stats()
+        if isinstance(self.state_store, StateStore):
+            metrics["journal"] = self.state_store.stats()
+        return metrics
+
+    def _change_feed_metrics(self) -> dict[str, Any]:
+        """Instance change feed counters for /health ({} if unavailable)."""
+        feed = getattr(self.instance_manager.tmux_manager, "change_feed", None)
+        return feed.stats() if isinstance(feed, InstanceChangeFeed) else {}
+
+    def _log_stream_metrics(self) -> dict[str, Any]:
+        """Per-client log stream queue depth, lag and drops for /health."""
+        return get_log_broadcaster().stats()
+
+    def _mcp_tool_metrics(self) -> dict[str, Any]:
+        """Per-tool MCP call counts, errors and latency for /health."""
+        stats = getattr(self.mcp_adapter, "tool_stats", None)
+        return stats.snapshot() if isinstance(stats, ToolStats) else {}
+
+    def _mcp_caller_metrics(self) -> dict[str, Any]:
+        """How spawn callers were identified: by token or by the fallback guess."""
+        stats = getattr(self.mcp_adapter, "caller_stats", None)
+        return stats.as_dict() if isinstance(stats, CallerStats) else {}
+
+    def _warm_pool_metrics(self) -> dict[str, Any]:
+        """Warm session pool size, hit rate and claim latency for /health."""
+        pool = getattr(self.instance_manager.tmux_manager, "warm_pool", None)
+        return pool.stats() if isinstance(pool, WarmPool) else {}
+
+    def _monitoring_metrics(self) -> dict[str, Any]:
+        """Activity summaries generated vs skipped by the change gate ({} if disabled)."""
+        service = getattr(self.instance_manager.tmux_manager, "monitoring_service", None)
+        return service.stats() if isinstance(service, MonitoringService) else {}
+
+    def _sync_change_feed(self) -> InstanceChangeFeed:
+        """Publish every known instance to the change feed and return the feed.
+
+        Changes made by this process are published as they happen; this
+        catches instances the feed cannot see, such as ones spawned by STDIO
+        children and known only through shared metadata. Unchanged instances
+        publish nothing.
+        """
+        feed = self.instance_manager.tmux_manager.change_feed
+        status_data = self.instance_manager._get_instance_status_internal()
+        for instance_id, instance in status_data.get("instances", {}).items():
+            feed.publish(instance_id, instance)
+        return feed
+
+    async def _receive_monitor_requests(
+        self, websocket: WebSocket, subscription: ChangeSubscription
+    ) -> None:
+        """Read /ws/monitor client messages until the client disconnects.
+
+        Plain-text messages are heartbeats. ``{"type": "resync", "since": n}``
+        asks for every change after ``n`` (or a snapshot if they are gone).
+        """
+        while True:
+            text = await websocket.receive_text()
+            try:
+                message = json.loads(text)
+            except ValueError:
+                continue
+            if isinstance(message, dict) and message.get("type") == "resync":
+                since = message.get("since")
+                subscription.request_resync(since if isinstance(since, int) else None)
+
     async def _health_check_loop(self):
         """Background health check loop."""
         while True:
@@ -1507,6 +1616,21 @@ async def main():
         workspace_base_dir=os.getenv("WORKSPACE_DIR", "/tmp/claude_orchestrator"),
         log_dir=os.getenv("LOG_DIR", "/tmp/madrox_logs"),
         log_level=os.getenv("LOG_LEVEL", "INFO"),
+        tmux_control_mode=os.getenv("MADROX_TMUX_CONTROL_MODE", "true").lower() == "true",
+        tmux_max_workers=int(os.getenv("MADROX_TMUX_MAX_WORKERS", "8")),
+        teardown_concurrency=int(os.getenv("MADROX_TEARDOWN_CONCURRENCY", "8")),
+        mcp_socket=os.getenv("MADROX_MCP_SOCKET", "true").lower() == "true",
+        state_flush_interval_ms=int(os.getenv("MADROX_STATE_FLUSH_INTERVAL_MS", "250")),
+        warm_pool_size=int(os.getenv("MADROX_WARM_POOL_SIZE", "0")),
+        summary_min_new_lines=int(os.getenv("MONITORING_MIN_NEW_LINES", "1")),
+        summary_min_new_chars=int(os.getenv("MONITORING_MIN_NEW_CHARS", "32")),
+        summary_max_age_seconds=float(os.getenv("MONITORING_MAX_SUMMARY_AGE", "300")),
+        summary_max_concurrent=int(os.getenv("MONITORING_MAX_CONCURRENT_SUMMARIES", "4")),
+        summary_requests_per_second=float(os.getenv("MONITORING_SUMMARY_RATE", "4")),
+        summary_batch_size=int(os.getenv("MONITORING_SUMMARY_BATCH_SIZE", "1")),
+        summary_batch_token_budget=int(os.getenv("MONITORING_SUMMARY_BATCH_TOKENS", "8000")),
+        summary_min_poll_interval=float(os.getenv("MONITORING_MIN_POLL_INTERVAL", "3")),
+        summary_max_poll_interval=float(os.getenv("MONITORING_MAX_POLL_INTERVAL", "300")),
     )
 
     # Setup logging
@@ -0,0 +1,83 @@
+"""Listening sockets for the orchestrator's HTTP server.
+
+Besides its TCP port, the server can listen on a Unix socket in its log
+directory. STDIO proxies on the same host send their tool calls over it
+instead of TCP loopback. Both kinds of socket are bound here and handed to
+one uvicorn server, so the app and its lifespan still run once.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import socket
+
+logger = logging.getLogger(__name__)
+
+MCP_SOCKET_NAME = "mcp.sock"
+
+# sun_path is 108 bytes on Linux and 104 on macOS, including the NUL
+_MAX_UNIX_PATH = 103
+
+
+def mcp_socket_path(log_dir: str) -> str | None:
+    """The MCP socket path for a backend, or None if it is too long to bind."""
+    path = os.path.join(os.path.abspath(log_dir), MCP_SOCKET_NAME)
+    if len(os.fsencode(path)) > _MAX_UNIX_PATH:
+        logger.warning(f"MCP socket path {path} is too long; children will use TCP")
+        return None
+    return path
+
+
+def bind_tcp_sockets(host: str, port: int) -> list[socket.socket]:
+    """Bind ``host:port`` on every address it resolves to.
+
+    Matches ``loop.create_server(host=..., port=...)``, so ``localhost``
+    still listens on both 127.0.0.1 and ::1.
+    """
+    sockets: list[socket.socket] = []
+    infos = socket.getaddrinfo(host or None, port, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE)
+    try:
+        for family, type_, proto, _, address in dict.fromkeys(infos):
+            sock = socket.socket(family, type_, proto)
+            sockets.append(sock)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if family == socket.AF_INET6:
+                sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 1)
+            sock.bind(address)
+    except OSError:
+        for sock in sockets:
+            sock.close()
+        raise
+    return sockets
+
+
+def bind_unix_socket(path: str) -> socket.socket:
+    """Bind a Unix socket at ``path`` that only this user can connect to.
+
+    A socket file left by a crashed backend is replaced. One that still
+    accepts connections belongs to a live backend, and raises OSError.
+    """
+    if os.path.exists(path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(path)
+            except OSError:
+                os.unlink(path)
+            else:
+                raise OSError(f"Another server is listening on {path}")
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.bind(path)
+        os.chmod(path, 0o600)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def remove_unix_socket(path: str) -> None:
+    with contextlib.suppress(OSError):
+        os.unlink(path)
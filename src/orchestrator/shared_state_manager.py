@@ -1,22 +1,25 @@
-"""Shared state manager for cross-process IPC using multiprocessing.Manager.
+"""Shared state manager for cross-process IPC.
 
 This module provides the SharedStateManager class that enables communication
 between isolated Claude instances running in separate processes via STDIO transport.
 
-The implementation uses multiprocessing.Manager to create proxy objects (queues,
-dicts, locks) that can be safely shared across process boundaries, solving the
-limitation of asyncio.Queue which is local to a single process.
+Message envelopes and instance metadata live in multiprocessing.Manager dict
+proxies. Reply queues live on the reply bus (see ``reply_bus``): the parent
+owns them in-process and STDIO children reach them over a private Unix socket,
+so a reply costs one socket round-trip instead of several Manager proxy calls.
 """
 
 import logging
 import os
 from collections import deque
 from datetime import UTC, datetime, timedelta
-from multiprocessing import Manager, Queue
+from multiprocessing import Manager
 from multiprocessing.managers import DictProxy
 from pathlib import Path
 from typing import Any
 
+from .reply_bus import ReplyBusClient, ReplyBusServer, ReplyQueue
+
 logger = logging.getLogger(__name__)
 
 # SECURITY FIX (CWE-770): Message retention policy to prevent unbounded memory growth
@@ -75,24 +78,25 @@ def redact_authkey(authkey: bytes | None) -> str:
 
 
 class SharedStateManager:
-    """Manages shared state using multiprocessing.Manager for IPC.
+    """Manages shared state for cross-process IPC.
 
     This class provides a centralized interface for managing cross-process
     communication state, including:
-    - Response queues for bidirectional messaging
+    - Response queues for bidirectional messaging (reply bus)
     - Message registry for tracking message lifecycle
     - Instance metadata for coordination
-    - Locks for thread-safe operations
 
-    The Manager daemon runs in a separate process and provides proxy objects
-    that can be safely accessed from multiple processes.
+    The Manager daemon runs in a separate process and provides the dict
+    proxies. Reply queues are owned by the parent's ReplyBusServer; child
+    connections reach them through a ReplyBusClient.
 
     Attributes:
         manager: The multiprocessing.Manager instance (daemon process)
-        response_queues: Dict mapping instance_id to response Queue
+        reply_bus: The ReplyBusServer (parent only, None in children)
+        reply_socket: Path of the reply bus socket, or None if unavailable
+        response_queues: Dict mapping instance_id to response ReplyQueue
         message_registry: Shared dict for storing message envelopes
         instance_metadata: Shared dict for storing instance information
-        queue_locks: Dict mapping instance_id to Lock for synchronization
     """
 
     def __init__(self) -> None:
@@ -102,7 +106,8 @@ class SharedStateManager:
         The Manager daemon will run until shutdown() is called.
 
         If running as a child process with MADROX_MANAGER_* environment variables set,
-        connects to the parent's existing Manager daemon instead of creating a new one.
+        connects to the parent's existing Manager daemon instead of creating a new one,
+        and to the parent's reply bus when MADROX_REPLY_SOCKET is set.
         """
         import base64
         import os
@@ -181,23 +186,37 @@ class SharedStateManager:
                 f"authkey={redact_authkey(self.manager_authkey)}"
             )
 
-            # Shared queues for message passing (instance_id -> Queue)
-            self.response_queues: dict[str, Queue] = {}
+            # Reply queues (instance_id -> ReplyQueue). The parent serves its
+            # queues on the reply bus; the authkey is shared with the Manager
+            # so children need no extra credential.
+            self.reply_bus: ReplyBusServer | None = None
+            self._reply_client: ReplyBusClient | None = None
+            if self.is_child_connection:
+                self.reply_socket = os.getenv("MADROX_REPLY_SOCKET")
+                if self.reply_socket:
+                    self._reply_client = ReplyBusClient(self.reply_socket, self.manager_authkey)
+                else:
+                    logger.warning(
+                        "MADROX_REPLY_SOCKET not set; replies stay local to this process"
+                    )
+                self.response_queues: dict[str, ReplyQueue] = {}
+            else:
+                self.reply_bus = ReplyBusServer(self.manager_authkey)
+                self.reply_bus.start()
+                self.reply_socket = self.reply_bus.socket_path
+                self.response_queues = self.reply_bus.queues
 
             # Shared dicts for state synchronization
             # Manager.dict() is valid but not in type stubs for all Manager variants
             self.message_registry: DictProxy = self.manager.dict()  # type: ignore[attr-defined]
             self.instance_metadata: DictProxy = self.manager.dict()  # type: ignore[attr-defined]
 
-            # Locks for thread-safe operations (instance_id -> manager Lock proxy)
-            self.queue_locks: dict[str, Any] = {}
-
             logger.info("SharedStateManager initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize SharedStateManager: {e}")
             raise
 
-    def create_response_queue(self, instance_id: str, maxsize: int = 100) -> Queue:
+    def create_response_queue(self, instance_id: str, maxsize: int = 100) -> ReplyQueue:
         """Create a new response queue for an instance.
 
         This method should be called when spawning a new instance to ensure
@@ -208,7 +227,7 @@ class SharedStateManager:
             maxsize: Maximum number of messages in the queue (default: 100)
 
         Returns:
-            The newly created Queue object
+            The newly created ReplyQueue
 
         Raises:
             ValueError: If a queue already exists for this instance_id
@@ -221,12 +240,10 @@ class SharedStateManager:
                 )
                 return self.response_queues[instance_id]
 
-            # Create queue and lock (manager methods are dynamic, not in type stubs)
-            queue: Queue[Any] = self.manager.Queue(maxsize=maxsize)  # type: ignore[attr-defined]
-            lock = self.manager.Lock()  # type: ignore[attr-defined]
-
-            self.response_queues[instance_id] = queue
-            self.queue_locks[instance_id] = lock
+            if self.reply_bus is not None:
+                queue = self.reply_bus.queue(instance_id, maxsize)
+            else:
+                queue = self.response_queues[instance_id] = ReplyQueue(maxsize)
 
             logger.info(f"Created response queue for instance {instance_id} (maxsize={maxsize})")
             return queue
@@ -234,7 +251,7 @@ class SharedStateManager:
             logger.error(f"Failed to create response queue for {instance_id}: {e}")
             raise
 
-    def get_response_queue(self, instance_id: str) -> Queue:
+    def get_response_queue(self, instance_id: str) -> ReplyQueue:
         """Get response queue for an instance (creates if doesn't exist).
 
         This is a convenience method that ensures a queue exists for the given
@@ -244,7 +261,7 @@ class SharedStateManager:
             instance_id: Unique identifier for the instance
 
         Returns:
-            The Queue object for this instance
+            The ReplyQueue for this instance
 
         Raises:
             Exception: If queue creation or retrieval fails
@@ -258,6 +275,46 @@ class SharedStateManager:
             logger.error(f"Failed to get response queue for {instance_id}: {e}")
             raise
 
+    async def put_reply(self, instance_id: str, message: dict[str, Any]) -> None:
+        """Deliver a reply to an instance's response queue.
+
+        In the parent this is an in-process append; in a child it is one
+        request to the parent's reply bus.
+
+        Args:
+            instance_id: Instance whose queue receives the reply
+            message: Reply payload (must be JSON-serializable)
+
+        Raises:
+            queue.Full: If the target queue is at capacity
+            ReplyBusError: If the parent's reply bus cannot be reached
+        """
+        if self._reply_client is not None:
+            await self._reply_client.put(instance_id, message)
+        else:
+            self.get_response_queue(instance_id).put(message)
+
+    async def get_reply(self, instance_id: str, timeout: float) -> Any:
+        """Wait up to ``timeout`` seconds for the next reply for an instance.
+
+        A timeout of 0 takes a reply only if one is already queued. The wait
+        parks the coroutine rather than a thread and can be cancelled.
+
+        Args:
+            instance_id: Instance whose queue to read from
+            timeout: Timeout in seconds
+
+        Returns:
+            The reply payload
+
+        Raises:
+            TimeoutError: If no reply arrived in time
+            ReplyBusError: If the parent's reply bus cannot be reached
+        """
+        if self._reply_client is not None:
+            return await self._reply_client.get(instance_id, timeout)
+        return await self.get_response_queue(instance_id).get(timeout)
+
     def register_message(self, message_id: str, envelope_dict: dict[str, Any]) -> None:
         """Register a message envelope in shared state.
 
@@ -370,31 +427,15 @@ class SharedStateManager:
 
             # Clean up response queue
             if instance_id in self.response_queues:
-                queue = self.response_queues[instance_id]
-
-                # Drain the queue
-                drained_count = 0
-                while not queue.empty():
-                    try:
-                        queue.get_nowait()
-                        drained_count += 1
-                    except Exception:
-                        # Queue might be empty or have race condition
-                        break
+                drained_count = self.response_queues.pop(instance_id).drain()
 
                 if drained_count > 0:
                     logger.warning(
                         f"Drained {drained_count} unprocessed messages from {instance_id} queue"
                     )
 
-                del self.response_queues[instance_id]
                 logger.debug(f"Removed response queue for {instance_id}")
 
-            # Clean up lock
-            if instance_id in self.queue_locks:
-                del self.queue_locks[instance_id]
-                logger.debug(f"Removed lock for {instance_id}")
-
             # Clean up instance metadata
             if instance_id in self.instance_metadata:
                 del self.instance_metadata[instance_id]
@@ -563,6 +604,9 @@ class SharedStateManager:
                 except Exception as e:
                     logger.error(f"Error cleaning up {instance_id} during shutdown: {e}")
 
+            if getattr(self, "reply_bus", None) is not None:
+                self.reply_bus.close()  # type: ignore[union-attr]
+
             # Only shutdown the Manager daemon if we created it (not a child connection)
             if hasattr(self, "is_child_connection") and self.is_child_connection:
                 logger.info("Child connection - not shutting down parent's Manager daemon")
@@ -587,7 +631,6 @@ class SharedStateManager:
         try:
             stats = {
                 "active_queues": len(self.response_queues),
-                "active_locks": len(self.queue_locks),
                 "registered_messages": len(self.message_registry),
                 "instance_metadata_count": len(self.instance_metadata),
                 "queue_depths": {},
@@ -599,6 +642,9 @@ class SharedStateManager:
                 if depth is not None:
                     stats["queue_depths"][instance_id] = depth  # type: ignore[index]
 
+            if self.reply_bus is not None:
+                stats["reply_bus"] = self.reply_bus.stats()
+
             return stats
         except Exception as e:
             logger.error(f"Failed to get SharedStateManager stats: {e}")
@@ -243,6 +243,21 @@ class OrchestratorConfig:
         metrics_port: int = 9090,
         artifacts_dir: str = "/tmp/madrox_logs/artifacts",
         preserve_artifacts: bool = True,
+        tmux_control_mode: bool = True,
+        tmux_max_workers: int = 8,
+        teardown_concurrency: int = 8,
+        mcp_socket: bool = True,
+        state_flush_interval_ms: int = 250,
+        warm_pool_size: int = 0,
+        summary_min_new_lines: int = 1,
+        summary_min_new_chars: int = 32,
+        summary_max_age_seconds: float = 300.0,
+        summary_max_concurrent: int = 4,
+        summary_requests_per_second: float = 4.0,
+        summary_batch_size: int = 1,
+        summary_batch_token_budget: int = 8000,
+        summary_min_poll_interval: float = 3.0,
+        summary_max_poll_interval: float = 300.0,
     ):
         self.server_host = server_host
         self.server_port = server_port
@@ -260,6 +275,21 @@ class OrchestratorConfig:
         self.metrics_port = metrics_port
         self.artifacts_dir = artifacts_dir
         self.preserve_artifacts = preserve_artifacts
+        self.tmux_control_mode = tmux_control_mode
+        self.tmux_max_workers = tmux_max_workers
+        self.teardown_concurrency = teardown_concurrency
+        self.mcp_socket = mcp_socket
+        self.state_flush_interval_ms = state_flush_interval_ms
+        self.warm_pool_size = warm_pool_size
+        self.summary_min_new_lines = summary_min_new_lines
+        self.summary_min_new_chars = summary_min_new_chars
+        self.summary_max_age_seconds = summary_max_age_seconds
+        self.summary_max_concurrent = summary_max_concurrent
+        self.summary_requests_per_second = summary_requests_per_second
+        self.summary_batch_size = summary_batch_size
+        self.summary_batch_token_budget = summary_batch_token_budget
+        self.summary_min_poll_interval = summary_min_poll_interval
+        self.summary_max_poll_interval = summary_max_poll_interval
 
     def to_dict(self) -> dict[str, Any]:
         """Return a plain dict representation suitable for consumers.
@@ -282,4 +312,19 @@ class OrchestratorConfig:
             "metrics_port": self.metrics_port,
             "artifacts_dir": self.artifacts_dir,
             "preserve_artifacts": self.preserve_artifacts,
+            "tmux_control_mode": self.tmux_control_mode,
+            "tmux_max_workers": self.tmux_max_workers,
+            "teardown_concurrency": self.teardown_concurrency,
+            "mcp_socket": self.mcp_socket,
+            "state_flush_interval_ms": self.state_flush_interval_ms,
+            "warm_pool_size": self.warm_pool_size,
+            "summary_min_new_lines": self.summary_min_new_lines,
+            "summary_min_new_chars": self.summary_min_new_chars,
+            "summary_max_age_seconds": self.summary_max_age_seconds,
+            "summary_max_concurrent": self.summary_max_concurrent,
+            "summary_requests_per_second": self.summary_requests_per_second,
+            "summary_batch_size": self.summary_batch_size,
+            "summary_batch_token_budget": self.summary_batch_token_budget,
+            "summary_min_poll_interval": self.summary_min_poll_interval,
+            "summary_max_poll_interval": self.summary_max_poll_interval,
         }
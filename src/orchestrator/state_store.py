@@ -2,10 +2,24 @@
 
 Follows the PositionTracker pattern: JSON file with atomic writes
 (temp file + os.replace) and fcntl locking.
+
+Instance records are journaled: ``instances.json`` is a snapshot and
+``instances.journal.jsonl`` holds the changes made since, one JSON object
+per line. A state transition appends only the fields that changed, so its
+cost follows the size of the change rather than the size of the fleet.
+Loading replays the journal over the snapshot; compaction folds the journal
+back into the snapshot once it grows past ``COMPACT_AFTER_ENTRIES`` lines.
+
+Journal entries are idempotent, so a crash between writing a new snapshot
+and truncating the journal only replays changes that are already applied:
+
+    {"op": "set", "id": "<instance id>", "fields": {...}, "unset": [...]}
+    {"op": "del", "id": "<instance id>"}
 """
 
 from __future__ import annotations
 
+import copy
 import fcntl
 import json
 import logging
@@ -18,22 +32,52 @@ logger = logging.getLogger(__name__)
 TRANSIENT_PREFIXES = ("_",)
 PRUNE_AFTER_HOURS = 24
 PRUNE_SUSPENDED_AFTER_HOURS = 168  # 7 days
+COMPACT_AFTER_ENTRIES = 500
+
+_MISSING = object()
+
+
+def _same(a: Any, b: Any) -> bool:
+    # Identity first: unchanged prompts and dicts are usually the same object
+    return a is b or a == b
+
+
+def _frozen(value: Any) -> Any:
+    """Copy a field value so later in-place mutation is detected as a change."""
+    try:
+        return copy.deepcopy(value)
+    except Exception:
+        return value
 
 
 class StateStore:
     """Persists instance and server state to JSON files.
 
     Files:
-        {state_dir}/instances.json  — all instance records
-        {state_dir}/server.json     — server-level state (session_id, etc.)
+        {state_dir}/instances.json          — instance snapshot
+        {state_dir}/instances.journal.jsonl — instance changes since the snapshot
+        {state_dir}/server.json             — server-level state (session_id, etc.)
     """
 
-    def __init__(self, state_dir: str | Path = "/tmp/madrox_logs/state"):
+    def __init__(
+        self,
+        state_dir: str | Path = "/tmp/madrox_logs/state",
+        compact_after: int = COMPACT_AFTER_ENTRIES,
+    ):
         self.state_dir = Path(state_dir)
         self.state_dir.mkdir(parents=True, exist_ok=True)
         self.instances_file = self.state_dir / "instances.json"
+        self.journal_file = self.state_dir / "instances.journal.jsonl"
         self.server_file = self.state_dir / "server.json"
         self._lock_file = self.state_dir / ".lock"
+        self.compact_after = compact_after
+
+        # Last record written per instance, used to work out deltas. Filled
+        # lazily from disk on the first write.
+        self._persisted: dict[str, dict[str, Any]] | None = None
+        self._journal_entries = self._count_journal_entries()
+        self.appends = 0
+        self.compactions = 0
 
     def _acquire_lock(self):
         """Acquire exclusive lock file for read-modify-write operations."""
@@ -45,15 +89,17 @@ class StateStore:
         fcntl.flock(f.fileno(), fcntl.LOCK_UN)
         f.close()
 
-    def _write_json(self, path: Path, data: Any) -> None:
+    def _write_json(self, path: Path, data: Any) -> bool:
         try:
             temp = path.with_suffix(".tmp")
             with temp.open("w") as f:
                 json.dump(data, f, indent=2, default=str)
                 f.flush()
             temp.replace(path)
+            return True
         except Exception as e:
             logger.error(f"Failed to write {path}: {e}")
+            return False
 
     def _read_json(self, path: Path) -> Any:
         if not path.exists():
@@ -73,36 +119,149 @@ class StateStore:
             if not any(k.startswith(p) for p in TRANSIENT_PREFIXES)
         }
 
+    # ------------------------------------------------------------------
+    # Journal
+    # ------------------------------------------------------------------
+    def _count_journal_entries(self) -> int:
+        try:
+            with self.journal_file.open("rb") as f:
+                return sum(1 for _ in f)
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            logger.error(f"Failed to read {self.journal_file}: {e}")
+            return 0
+
+    def _append(self, entries: list[dict[str, Any]]) -> None:
+        """Append entries to the journal in a single write. Caller holds the lock."""
+        if not entries:
+            return
+        payload = "".join(
+            json.dumps(entry, default=str, separators=(",", ":")) + "\n" for entry in entries
+        )
+        with self.journal_file.open("a") as f:
+            f.write(payload)
+            f.flush()
+        self._journal_entries += len(entries)
+        self.appends += len(entries)
+        if self._journal_entries >= self.compact_after:
+            self._compact()
+
+    def _replay(self, data: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Apply journal entries on top of a snapshot, in place."""
+        try:
+            f = self.journal_file.open("r")
+        except FileNotFoundError:
+            return data
+        with f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    op, iid = entry["op"], entry["id"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    # A torn final line from a crash mid-append
+                    logger.warning(f"Skipping unreadable journal entry at line {line_no}")
+                    continue
+                if op == "del":
+                    data.pop(iid, None)
+                elif op == "set":
+                    record = data.setdefault(iid, {})
+                    record.update(entry.get("fields", {}))
+                    for key in entry.get("unset", ()):
+                        record.pop(key, None)
+        return data
+
+    def _compact(self) -> None:
+        """Fold the journal into a fresh snapshot. Caller holds the lock."""
+        data = self.load_all()
+        if not self._write_json(self.instances_file, data):
+            return
+        try:
+            self.journal_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.error(f"Failed to truncate {self.journal_file}: {e}")
+            return
+        self._journal_entries = 0
+        self.compactions += 1
+        logger.debug(f"Compacted state journal into snapshot ({len(data)} instances)")
+
+    def compact(self) -> None:
+        """Rewrite the snapshot from snapshot + journal and empty the journal."""
+        lock = self._acquire_lock()
+        try:
+            self._compact()
+        finally:
+            self._release_lock(lock)
+
+    def _delta(self, instance_id: str, record: dict[str, Any]) -> dict[str, Any] | None:
+        """Journal entry for the fields of ``record`` that changed since last written."""
+        assert self._persisted is not None
+        previous = self._persisted.get(instance_id, {})
+        fields = {k: v for k, v in record.items() if not _same(v, previous.get(k, _MISSING))}
+        unset = [k for k in previous if k not in record]
+        if not fields and not unset:
+            return None
+
+        stored = self._persisted.setdefault(instance_id, {})
+        for k, v in fields.items():
+            stored[k] = _frozen(v)
+        for k in unset:
+            del stored[k]
+
+        entry: dict[str, Any] = {"op": "set", "id": instance_id, "fields": fields}
+        if unset:
+            entry["unset"] = unset
+        return entry
+
+    def _ensure_persisted(self) -> dict[str, dict[str, Any]]:
+        if self._persisted is None:
+            self._persisted = self.load_all()
+        return self._persisted
+
+    # ------------------------------------------------------------------
+    # Instances
+    # ------------------------------------------------------------------
     def save_instance(self, instance: dict[str, Any]) -> None:
         lock = self._acquire_lock()
         try:
-            all_instances = self.load_all()
-            all_instances[instance["id"]] = self._strip_transient(instance)
-            self._write_json(self.instances_file, all_instances)
+            self._ensure_persisted()
+            entry = self._delta(instance["id"], self._strip_transient(instance))
+            if entry:
+                self._append([entry])
         finally:
             self._release_lock(lock)
 
     def save_all(self, instances: dict[str, dict[str, Any]]) -> None:
         lock = self._acquire_lock()
         try:
-            data = {iid: self._strip_transient(inst) for iid, inst in instances.items()}
-            self._write_json(self.instances_file, data)
+            persisted = self._ensure_persisted()
+            entries = []
+            for iid, inst in instances.items():
+                entry = self._delta(iid, self._strip_transient(inst))
+                if entry:
+                    entries.append(entry)
+            for iid in [iid for iid in persisted if iid not in instances]:
+                del persisted[iid]
+                entries.append({"op": "del", "id": iid})
+            self._append(entries)
         finally:
             self._release_lock(lock)
 
     def load_all(self) -> dict[str, dict[str, Any]]:
         data = self._read_json(self.instances_file)
         if not isinstance(data, dict):
-            return {}
-        return data
+            data = {}
+        return self._replay(data)
 
     def remove_instance(self, instance_id: str) -> None:
         lock = self._acquire_lock()
         try:
-            all_instances = self.load_all()
-            if instance_id in all_instances:
-                del all_instances[instance_id]
-                self._write_json(self.instances_file, all_instances)
+            persisted = self._ensure_persisted()
+            if instance_id in persisted:
+                del persisted[instance_id]
+                self._append([{"op": "del", "id": instance_id}])
         finally:
             self._release_lock(lock)
 
@@ -115,6 +274,13 @@ class StateStore:
             return None
         return data
 
+    def stats(self) -> dict[str, Any]:
+        return {
+            "journal_entries": self._journal_entries,
+            "appends": self.appends,
+            "compactions": self.compactions,
+        }
+
     def prune_terminated(self, max_age_hours: float = PRUNE_AFTER_HOURS) -> int:
         """Remove terminated/error/suspended instances older than their max age. Returns count removed."""
         lock = self._acquire_lock()
@@ -145,8 +311,13 @@ class StateStore:
             for iid in to_remove:
                 del all_instances[iid]
 
+            if to_remove or self._journal_entries:
+                # Runs at startup: a good moment to start from a clean snapshot
+                if self._write_json(self.instances_file, all_instances):
+                    self.journal_file.unlink(missing_ok=True)
+                    self._journal_entries = 0
+                self._persisted = None
             if to_remove:
-                self._write_json(self.instances_file, all_instances)
                 logger.info(f"Pruned {len(to_remove)} stale instances from state store")
 
             return len(to_remove)
@@ -0,0 +1,127 @@
+"""Append-only catalog of terminated instances, keyed by parent.
+
+``get_children(include_terminated=True)`` used to find terminated children
+by listing every directory under the artifacts dir and opening its
+``_metadata.json``, so each call cost a read per historical instance across
+every session kept on disk. ``StateStore`` cannot answer it either: it
+prunes terminated records after ``PRUNE_AFTER_HOURS``.
+
+``TerminatedCatalog`` keeps one line per termination in
+``{state_dir}/terminated.jsonl``:
+
+    {"id": ..., "parent_instance_id": ..., "name": ..., "role": ...,
+     "instance_type": ..., "terminated_at": ...}
+
+and an in-memory ``parent -> {id: entry}`` map over it. The map is built by
+reading the file once and then follows it as it grows (a ``stat`` per query
+and a parse of the lines appended since), so STDIO child processes that
+share the state dir can append too. A lookup is a dict access whatever the
+size of the history. An instance terminated again after a resume keeps its
+latest entry.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = "terminated.jsonl"
+
+#: Instance fields copied into each catalog entry.
+ENTRY_FIELDS = ("id", "parent_instance_id", "name", "role", "instance_type", "terminated_at")
+
+
+class TerminatedCatalog:
+    """Terminated instances by parent, backed by an append-only JSONL file."""
+
+    def __init__(self, state_dir: str | Path):
+        self.path = Path(state_dir) / CATALOG_FILENAME
+        self._lock = threading.Lock()
+        self._inode = 0
+        self._indexed_bytes = 0
+        self._by_parent: dict[str, dict[str, dict[str, Any]]] = {}
+        self._entries = 0
+
+    def record(self, instance: dict[str, Any]) -> None:
+        """Append a terminated instance. Best effort: a failed write is logged.
+
+        Instances without a parent are skipped; nothing looks them up.
+        """
+        if not instance.get("parent_instance_id"):
+            return
+        entry = {field: instance.get(field) for field in ENTRY_FIELDS}
+        line = (json.dumps(entry, default=str) + "\n").encode()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as f:
+                # One write per line under an exclusive lock, so concurrent
+                # writers never interleave partial lines
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.write(line)
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+        except OSError as e:
+            logger.warning(f"Failed to record terminated instance {entry['id']}: {e}")
+
+    def children(self, parent_id: str) -> list[dict[str, Any]]:
+        """Catalog entries of the terminated children of ``parent_id``."""
+        with self._lock:
+            self._refresh()
+            return [dict(entry) for entry in self._by_parent.get(parent_id, {}).values()]
+
+    def _refresh(self) -> None:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset(0)
+            return
+        if st.st_ino != self._inode or st.st_size < self._indexed_bytes:
+            self._reset(st.st_ino)
+        if st.st_size == self._indexed_bytes:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self._indexed_bytes)
+            data = f.read(st.st_size - self._indexed_bytes)
+        # A line still being written has no newline yet; pick it up next time
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].splitlines():
+            self._index_line(line)
+        self._indexed_bytes += complete
+
+    def _index_line(self, line: bytes) -> None:
+        try:
+            entry = json.loads(line)
+            instance_id = entry["id"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Skipping malformed line in {self.path}")
+            return
+        parent_id = entry.get("parent_instance_id")
+        if not parent_id:
+            return
+        siblings = self._by_parent.setdefault(parent_id, {})
+        siblings.pop(instance_id, None)  # latest termination last
+        siblings[instance_id] = entry
+        self._entries += 1
+
+    def _reset(self, inode: int) -> None:
+        self._inode = inode
+        self._indexed_bytes = 0
+        self._by_parent.clear()
+        self._entries = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            self._refresh()
+            return {
+                "entries": self._entries,
+                "parents": len(self._by_parent),
+                "bytes": self._indexed_bytes,
+            }
@@ -1,6 +1,12 @@
 """Tmux-based Instance Manager package."""
 
+from .control_mode import TmuxControlClient
 from .core import TmuxInstanceManager
 from .helpers import MAX_MESSAGE_HISTORY_PER_INSTANCE, redact_authkey
 
-__all__ = ["TmuxInstanceManager", "MAX_MESSAGE_HISTORY_PER_INSTANCE", "redact_authkey"]
+__all__ = [
+    "TmuxInstanceManager",
+    "TmuxControlClient",
+    "MAX_MESSAGE_HISTORY_PER_INSTANCE",
+    "redact_authkey",
+]
@@ -0,0 +1,143 @@
+"""Asynchronous front-end for libtmux calls.
+
+libtmux runs a ``tmux`` subprocess for every call — ``pane.cmd``,
+``send_keys``, ``new_session``, even ``session.windows`` — and blocks until it
+exits. Made directly on the event loop, one slow invocation stalls every MCP
+request, WebSocket push and the queue poller. ``AsyncTmux`` runs those calls
+on a small dedicated thread pool and keeps a latency histogram per tmux verb,
+so slow tmux shows up on ``/health`` instead of as unexplained loop stalls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+#: Upper bounds (milliseconds) of the latency histogram buckets.
+LATENCY_BUCKETS_MS: tuple[int, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+#: tmux calls are short subprocess waits; a handful of threads covers dozens
+#: of instances while bounding how many tmux clients can run at once.
+DEFAULT_MAX_WORKERS = 8
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; each observation lands in exactly one bucket."""
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS]
+        labels.append(f">{LATENCY_BUCKETS_MS[-1]}ms")
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_seconds * 1000 / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 2),
+            "buckets": {label: n for label, n in zip(labels, self.buckets, strict=True) if n},
+        }
+
+
+class AsyncTmux:
+    """Runs blocking libtmux calls off the event loop and times them per verb.
+
+    Usage::
+
+        tmux = AsyncTmux(libtmux.Server())
+        session = await tmux.new_session(session_name="madrox-abc", x=160, y=50)
+        pane = await tmux.first_pane(session)
+        lines = (await tmux.pane_cmd(pane, "capture-pane", "-p")).stdout
+    """
+
+    def __init__(self, server: Any, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.server = server
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="madrox-tmux"
+        )
+        self._histograms: dict[str, LatencyHistogram] = {}
+
+    def observe(self, verb: str, seconds: float) -> None:
+        """Record one call's latency under ``verb``."""
+        histogram = self._histograms.get(verb)
+        if histogram is None:
+            histogram = self._histograms[verb] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    async def run(self, verb: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn`` on the tmux thread pool and record its latency."""
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            return await loop.run_in_executor(
+                self._executor, functools.partial(fn, *args, **kwargs)
+            )
+        finally:
+            self.observe(verb, time.perf_counter() - start)
+
+    def call(self, verb: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn`` inline, for the few synchronous code paths; still timed."""
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.observe(verb, time.perf_counter() - start)
+
+    # ------------------------------------------------------------------
+    # libtmux verbs
+    # ------------------------------------------------------------------
+    async def pane_cmd(self, pane: Any, *args: str) -> Any:
+        """``pane.cmd(*args)``; the first argument is the tmux verb."""
+        return await self.run(args[0], pane.cmd, *args)
+
+    async def server_cmd(self, *args: str) -> Any:
+        """``server.cmd(*args)`` for commands that do not target a pane."""
+        return await self.run(args[0], self.server.cmd, *args)
+
+    async def send_keys(self, pane: Any, keys: str, **kwargs: Any) -> None:
+        await self.run("send-keys", pane.send_keys, keys, **kwargs)
+
+    async def new_session(self, **kwargs: Any) -> Any:
+        return await self.run("new-session", self.server.new_session, **kwargs)
+
+    async def kill_session(self, session: Any) -> None:
+        await self.run("kill-session", session.kill_session)
+
+    async def find_session(self, session_name: str) -> Any:
+        return await self.run(
+            "list-sessions", self.server.find_where, {"session_name": session_name}
+        )
+
+    async def first_pane(self, session: Any) -> Any:
+        """First pane of the first window (``session.windows`` lists via tmux)."""
+        return await self.run("list-panes", lambda: session.windows[0].panes[0])
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Latency histogram per tmux verb, JSON-ready."""
+        return {verb: hist.as_dict() for verb, hist in sorted(self._histograms.items())}
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,255 @@
+"""In-process feed of instance changes for the monitor dashboard.
+
+``/ws/monitor`` used to rebuild and resend the whole instance list to every
+client every 2 seconds, changed or not. The manager now publishes each
+instance to an ``InstanceChangeFeed`` whenever it marks it for persistence;
+the feed keeps the dashboard view of every live instance, works out which
+fields changed, and fans the delta out to subscribers under a sequence
+number. Nothing is sent while nothing changes.
+
+Protocol, as seen by a dashboard:
+
+* the server sends a snapshot (every live instance) with the current ``seq``
+* every later message carries changes numbered ``seq + 1``, ``seq + 2``, ...
+* a client that sees a gap asks to resync from the last ``seq`` it applied;
+  it gets the missed changes from the feed's backlog if they are still
+  there, otherwise a fresh snapshot
+* a subscriber that falls more than ``max_pending`` changes behind is cut
+  over to a snapshot instead of queueing without bound
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+#: Changes kept for clients that resync after a gap.
+DEFAULT_BACKLOG = 1024
+
+#: Changes a subscriber may have queued before it is sent a snapshot instead.
+DEFAULT_MAX_PENDING = 256
+
+_MISSING = object()
+
+
+def _iso(value: Any) -> Any:
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def instance_view(instance_id: str, instance: dict[str, Any]) -> dict[str, Any]:
+    """The fields of an instance record the monitor dashboard shows."""
+    created_at = _iso(instance.get("created_at"))
+    return {
+        "id": instance_id,
+        "name": instance.get("name", instance_id),
+        "type": instance.get("instance_type", "claude"),
+        "status": instance.get("state", "unknown"),
+        "role": instance.get("role", "general"),
+        "parentId": instance.get("parent_instance_id"),
+        "createdAt": created_at,
+        "lastActivity": _iso(instance.get("last_activity")) or created_at,
+        "totalTokens": instance.get("total_tokens_used", 0),
+        "totalCost": instance.get("total_cost", 0.0),
+    }
+
+
+@dataclass
+class InstanceChange:
+    seq: int
+    instance_id: str
+    op: str  # "upsert" | "remove"
+    fields: dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        change: dict[str, Any] = {"seq": self.seq, "id": self.instance_id, "op": self.op}
+        if self.op == "upsert":
+            change["fields"] = self.fields
+        return change
+
+
+class ResyncRequired(Exception):
+    """The subscriber must restart its stream with ``resync(since)``.
+
+    ``since`` is the sequence number the client asked to resume after, or
+    ``None`` when the subscriber overflowed and needs a snapshot.
+    """
+
+    def __init__(self, since: int | None = None):
+        super().__init__(since)
+        self.since = since
+
+
+class ChangeSubscription:
+    """One consumer's queue of changes, filled by ``InstanceChangeFeed.publish``."""
+
+    def __init__(self, feed: InstanceChangeFeed, max_pending: int):
+        self._feed = feed
+        self.max_pending = max_pending
+        self._pending: deque[InstanceChange] = deque()
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self.overflowed = False
+        self._resync_requested = False
+        self._resync_since: int | None = None
+
+    def _offer(self, change: InstanceChange) -> None:
+        # Called with the feed lock held, possibly off the loop thread
+        if self.overflowed:
+            return
+        if len(self._pending) >= self.max_pending:
+            self.overflowed = True
+            self._pending.clear()
+        else:
+            self._pending.append(change)
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._wakeup.set()
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def next_batch(self, timeout: float | None = None) -> list[InstanceChange]:
+        """Every change queued so far, waiting up to ``timeout`` for the first.
+
+        Returns an empty list on timeout. Raises ``ResyncRequired`` if the
+        subscriber overflowed or a resync was requested; call ``resync``
+        before reading again.
+        """
+        # Clear before checking so a publish in between still wakes us
+        self._wakeup.clear()
+        if not self._pending and not self.overflowed and not self._resync_requested:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except TimeoutError:
+                return []
+        with self._feed._lock:
+            if self._resync_requested:
+                self._resync_requested = False
+                raise ResyncRequired(None if self.overflowed else self._resync_since)
+            if self.overflowed:
+                raise ResyncRequired
+            batch = list(self._pending)
+            self._pending.clear()
+        return batch
+
+    def request_resync(self, since: int | None = None) -> None:
+        """Ask the reader of ``next_batch`` to restart after ``since`` (from the client)."""
+        self._resync_since = since
+        self._resync_requested = True
+        self._wakeup.set()
+
+    def resync(self, since: int | None = None) -> tuple[str, int, list[Any]]:
+        """Restart the stream after a gap or overflow.
+
+        Returns ``("changes", seq, changes)`` when everything after ``since``
+        is still in the backlog, else ``("snapshot", seq, views)``. Changes
+        published after the returned ``seq`` follow through ``next_batch``.
+        """
+        with self._feed._lock:
+            self._pending.clear()
+            self.overflowed = False
+            if since is not None:
+                missed = self._feed._changes_since(since)
+                if missed is not None:
+                    return "changes", self._feed.seq, missed
+            return "snapshot", self._feed.seq, self._feed._views_snapshot()
+
+    def close(self) -> None:
+        with self._feed._lock:
+            self._feed._subscribers.discard(self)
+
+
+class InstanceChangeFeed:
+    """Diffs published instance records and fans the changes out.
+
+    Usage::
+
+        feed = InstanceChangeFeed()
+        feed.publish("abc", instance)        # after any change to ``instance``
+        feed.publish("abc", None)            # instance gone
+
+        sub = feed.subscribe()
+        kind, seq, data = sub.resync()       # initial snapshot
+        changes = await sub.next_batch(timeout=30)
+    """
+
+    def __init__(
+        self, backlog: int = DEFAULT_BACKLOG, max_pending: int = DEFAULT_MAX_PENDING
+    ) -> None:
+        self.seq = 0
+        self.max_pending = max_pending
+        self._views: dict[str, dict[str, Any]] = {}
+        self._backlog: deque[InstanceChange] = deque(maxlen=backlog)
+        self._subscribers: set[ChangeSubscription] = set()
+        self._lock = threading.Lock()
+        self.published = 0
+        self.unchanged = 0
+        self.overflows = 0
+
+    def publish(self, instance_id: str, instance: dict[str, Any] | None) -> InstanceChange | None:
+        """Record the current state of an instance; ``None`` or terminated removes it.
+
+        Returns the change sent to subscribers, or ``None`` if the dashboard
+        view of the instance did not change.
+        """
+        gone = instance is None or instance.get("state") == "terminated"
+        view = None if gone else instance_view(instance_id, instance)
+        with self._lock:
+            previous = self._views.get(instance_id)
+            if view is None:
+                if previous is None:
+                    return None
+                del self._views[instance_id]
+                change = InstanceChange(self.seq + 1, instance_id, "remove")
+            else:
+                if previous is None:
+                    fields = view
+                else:
+                    fields = {k: v for k, v in view.items() if previous.get(k, _MISSING) != v}
+                if not fields:
+                    self.unchanged += 1
+                    return None
+                self._views[instance_id] = view
+                change = InstanceChange(self.seq + 1, instance_id, "upsert", fields)
+
+            self.seq = change.seq
+            self.published += 1
+            self._backlog.append(change)
+            for subscriber in self._subscribers:
+                was_overflowed = subscriber.overflowed
+                subscriber._offer(change)
+                if subscriber.overflowed and not was_overflowed:
+                    self.overflows += 1
+        return change
+
+    def subscribe(self, max_pending: int | None = None) -> ChangeSubscription:
+        """A new subscription; call ``resync()`` on it for the starting snapshot."""
+        subscription = ChangeSubscription(self, max_pending or self.max_pending)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def _changes_since(self, seq: int) -> list[InstanceChange] | None:
+        if seq == self.seq:
+            return []
+        if seq > self.seq or not self._backlog or self._backlog[0].seq > seq + 1:
+            return None
+        return [change for change in self._backlog if change.seq > seq]
+
+    def _views_snapshot(self) -> list[dict[str, Any]]:
+        return [dict(view) for view in self._views.values()]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "seq": self.seq,
+            "instances": len(self._views),
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "unchanged": self.unchanged,
+            "overflows": self.overflows,
+        }
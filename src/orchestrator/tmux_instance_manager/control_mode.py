@@ -0,0 +1,394 @@
+"""Persistent tmux control-mode connection for event-driven pane output.
+
+Polling ``capture-pane`` forks one tmux client per poll per waiting instance,
+which adds up to hundreds of forks per second with a few dozen busy agents.
+A single ``tmux -C`` client instead receives ``%output`` notifications for
+every watched pane, keeps a bounded ring buffer of recent output per pane and
+wakes waiters the moment new output arrives. Commands (``capture-pane``,
+``display-message`` ...) travel over the same connection, so neither readiness
+nor response detection needs to fork at all.
+
+tmux only reports output for windows that belong to the control client's own
+session, so each watched instance window is linked into a hidden hub session.
+The hub name deliberately does not start with ``madrox-``: the server treats
+every ``madrox-*`` session without a persisted record as an orphan to kill.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import shlex
+from collections import deque
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+#: Hidden session the watched instance windows are linked into.
+HUB_SESSION = "madrox_control"
+
+#: Bytes of recent output kept per pane.
+DEFAULT_PANE_BUFFER_BYTES = 64 * 1024
+
+#: %output lines carry whole terminal redraws; the default 64 KiB StreamReader
+#: limit would abort the reader on the first large one.
+_READ_LIMIT = 16 * 1024 * 1024
+
+#: tmux escapes control characters and backslashes in %output as \ooo.
+_OCTAL_ESCAPE = re.compile(rb"\\([0-7]{3})")
+
+
+class TmuxControlError(RuntimeError):
+    """A command sent over the control connection failed or could not be sent."""
+
+
+def decode_output(data: bytes) -> bytes:
+    """Undo tmux's octal escaping of a ``%output`` payload."""
+    return _OCTAL_ESCAPE.sub(lambda m: bytes([int(m.group(1), 8)]), data)
+
+
+@dataclass
+class _PaneStream:
+    """Ring buffer and wake-up signal for one watched pane."""
+
+    window_id: str
+    buffer: bytearray = field(default_factory=bytearray)
+    seq: int = 0
+    event: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class TmuxControlClient:
+    """One ``tmux -C`` connection shared by every instance of a manager.
+
+    Usage::
+
+        client = TmuxControlClient()
+        await client.start()
+        await client.watch("%3", "@2")
+        seq = client.output_seq("%3")
+        seq = await client.wait_for_output("%3", seq, timeout=1.0)
+        lines = await client.capture_pane("%3")
+    """
+
+    def __init__(
+        self,
+        socket_name: str | None = None,
+        socket_path: str | None = None,
+        buffer_bytes: int = DEFAULT_PANE_BUFFER_BYTES,
+        command_timeout: float = 5.0,
+    ):
+        self.socket_name = socket_name
+        self.socket_path = socket_path
+        self.buffer_bytes = buffer_bytes
+        self.command_timeout = command_timeout
+
+        self._process: asyncio.subprocess.Process | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._write_lock = asyncio.Lock()
+        self._pending: deque[asyncio.Future[list[str]]] = deque()
+        self._panes: dict[str, _PaneStream] = {}
+        self._attached = asyncio.Event()
+        self._closed = False
+
+        # Counters surfaced through stats()
+        self.output_events = 0
+        self.output_bytes = 0
+        self.commands_sent = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def _tmux_argv(self, *args: str) -> list[str]:
+        argv = ["tmux"]
+        if self.socket_path:
+            argv.extend(["-S", self.socket_path])
+        elif self.socket_name:
+            argv.extend(["-L", self.socket_name])
+        argv.extend(args)
+        return argv
+
+    @property
+    def is_alive(self) -> bool:
+        return (
+            not self._closed
+            and self._process is not None
+            and self._process.returncode is None
+            and self._reader_task is not None
+            and not self._reader_task.done()
+        )
+
+    async def start(self, width: int = 160, height: int = 50) -> None:
+        """Attach a control client to a fresh hub session.
+
+        A hub left behind by a previous server run is killed first. That only
+        closes windows linked to nothing else — CLIs whose own session is
+        already gone — so live instances are unaffected.
+
+        Args:
+            width: Client width; tmux sizes linked windows to the latest
+                client, so this must match the instance session size.
+            height: Client height.
+        """
+        stale = await asyncio.create_subprocess_exec(
+            *self._tmux_argv("kill-session", "-t", HUB_SESSION),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        await stale.wait()
+
+        self._process = await asyncio.create_subprocess_exec(
+            *self._tmux_argv(
+                "-C",
+                "new-session",
+                "-s",
+                HUB_SESSION,
+                "-x",
+                str(width),
+                "-y",
+                str(height),
+            ),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=_READ_LIMIT,
+        )
+        self._reader_task = asyncio.create_task(self._read_loop())
+        # Commands written before the client is attached are rejected with
+        # "no current client" when the tmux server was already running.
+        try:
+            await asyncio.wait_for(self._attached.wait(), timeout=self.command_timeout)
+        except TimeoutError as e:
+            raise TmuxControlError("tmux control client did not attach") from e
+        if not self.is_alive:
+            raise TmuxControlError("tmux control client exited during startup")
+        await self.command("refresh-client", "-C", f"{width}x{height}")
+        logger.info(f"tmux control-mode client attached to {HUB_SESSION}")
+
+    async def close(self) -> None:
+        """Detach the control client and kill the hub session."""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._process and self._process.returncode is None:
+            try:
+                # Killing the hub only unlinks watched windows from it.
+                await self._send_line(shlex.join(["kill-session", "-t", HUB_SESSION]))
+            except Exception as e:
+                logger.debug(f"Could not kill control hub session: {e}")
+            if self._process.stdin:
+                self._process.stdin.close()
+            try:
+                await asyncio.wait_for(self._process.wait(), timeout=2.0)
+            except TimeoutError:
+                self._process.kill()
+
+        if self._reader_task and not self._reader_task.done():
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+
+        self._fail_pending(TmuxControlError("tmux control client closed"))
+        logger.info("tmux control-mode client closed")
+
+    # ------------------------------------------------------------------
+    # Protocol
+    # ------------------------------------------------------------------
+    async def _read_loop(self) -> None:
+        assert self._process is not None and self._process.stdout is not None
+        stdout = self._process.stdout
+        block: list[str] | None = None
+        block_from_client = False
+
+        try:
+            while True:
+                raw = await stdout.readline()
+                if not raw:
+                    break
+                line = raw.rstrip(b"\n")
+
+                if block is not None:
+                    if line.startswith((b"%end ", b"%error ")):
+                        if block_from_client:
+                            self._resolve(block, error=line.startswith(b"%error"))
+                        block = None
+                    else:
+                        block.append(line.decode("utf-8", errors="replace"))
+                    continue
+
+                if line.startswith(b"%output "):
+                    self._handle_output(line)
+                elif line.startswith(b"%begin "):
+                    block = []
+                    # Flags bit 0 marks replies to commands this client sent;
+                    # the attach itself produces an unsolicited block.
+                    parts = line.split()
+                    block_from_client = len(parts) >= 4 and int(parts[3]) & 1 == 1
+                elif line.startswith(b"%session-changed"):
+                    self._attached.set()
+                elif line.startswith(b"%exit"):
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"tmux control-mode reader failed: {e}", exc_info=True)
+        finally:
+            self._fail_pending(TmuxControlError("tmux control connection lost"))
+            self._attached.set()
+            for stream in self._panes.values():
+                stream.event.set()
+            if not self._closed:
+                logger.warning("tmux control-mode connection ended")
+
+    def _handle_output(self, line: bytes) -> None:
+        # %output %<pane-id> <escaped data>
+        _, _, rest = line.partition(b" ")
+        pane_id, _, payload = rest.partition(b" ")
+        stream = self._panes.get(pane_id.decode("ascii", errors="replace"))
+        if stream is None:
+            return
+
+        data = decode_output(payload)
+        stream.buffer.extend(data)
+        overflow = len(stream.buffer) - self.buffer_bytes
+        if overflow > 0:
+            del stream.buffer[:overflow]
+
+        stream.seq += 1
+        self.output_events += 1
+        self.output_bytes += len(data)
+
+        # Waiters hold the old event; a fresh one arms the next wake-up.
+        stream.event.set()
+        stream.event = asyncio.Event()
+
+    def _resolve(self, block: list[str], error: bool) -> None:
+        if not self._pending:
+            return
+        future = self._pending.popleft()
+        if future.done():
+            return
+        if error:
+            future.set_exception(TmuxControlError("\n".join(block) or "tmux command failed"))
+        else:
+            future.set_result(block)
+
+    def _fail_pending(self, exc: Exception) -> None:
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _send_line(self, command_line: str) -> asyncio.Future[list[str]]:
+        if self._process is None or self._process.stdin is None:
+            raise TmuxControlError("tmux control client is not started")
+        future: asyncio.Future[list[str]] = asyncio.get_running_loop().create_future()
+        # The lock keeps the write order identical to the reply order.
+        async with self._write_lock:
+            self._pending.append(future)
+            self._process.stdin.write(command_line.encode() + b"\n")
+            try:
+                await self._process.stdin.drain()
+            except (ConnectionError, BrokenPipeError) as e:
+                raise TmuxControlError(f"tmux control connection lost: {e}") from e
+        self.commands_sent += 1
+        return future
+
+    async def command(self, *args: str, timeout: float | None = None) -> list[str]:
+        """Run a tmux command over the control connection and return its output lines.
+
+        Raises:
+            TmuxControlError: If the command fails or the connection is down.
+            TimeoutError: If tmux does not answer within the timeout.
+        """
+        if not self.is_alive:
+            raise TmuxControlError("tmux control client is not running")
+        future = await self._send_line(shlex.join(args))
+        # Shield so a timed-out caller does not cancel the future that the
+        # reader will still pop when tmux eventually answers.
+        return await asyncio.wait_for(
+            asyncio.shield(future), timeout=timeout or self.command_timeout
+        )
+
+    # ------------------------------------------------------------------
+    # Panes
+    # ------------------------------------------------------------------
+    def is_watching(self, pane_id: str) -> bool:
+        return pane_id in self._panes
+
+    async def watch(self, pane_id: str, window_id: str) -> None:
+        """Start receiving output for a pane by linking its window into the hub."""
+        if pane_id in self._panes:
+            return
+        self._panes[pane_id] = _PaneStream(window_id=window_id)
+        try:
+            await self.command("link-window", "-d", "-s", window_id, "-t", f"{HUB_SESSION}:")
+        except Exception:
+            self._panes.pop(pane_id, None)
+            raise
+        logger.debug(f"Watching pane {pane_id} (window {window_id}) via control mode")
+
+    async def unwatch(self, pane_id: str) -> None:
+        """Stop watching a pane and unlink its window from the hub.
+
+        Must run before the instance session is killed: ``kill-session`` leaves
+        alone any window that is still linked into another session, so the CLI
+        would otherwise live on inside the hub.
+        """
+        stream = self._panes.pop(pane_id, None)
+        if stream is None:
+            return
+        stream.event.set()
+        if not self.is_alive:
+            return
+        try:
+            await self.command("unlink-window", "-t", f"{HUB_SESSION}:{stream.window_id}")
+        except Exception as e:
+            # Already gone (pane exited) — nothing left to unlink.
+            logger.debug(f"Could not unlink window {stream.window_id}: {e}")
+
+    def output_seq(self, pane_id: str) -> int:
+        """Number of output notifications seen for a pane so far."""
+        stream = self._panes.get(pane_id)
+        return stream.seq if stream else 0
+
+    async def wait_for_output(self, pane_id: str, after_seq: int, timeout: float) -> int:
+        """Wait until the pane produces output past ``after_seq``.
+
+        Returns:
+            The pane's current sequence number — equal to ``after_seq`` when the
+            timeout elapsed without new output.
+        """
+        stream = self._panes.get(pane_id)
+        if stream is None:
+            return after_seq
+        if stream.seq != after_seq:
+            return stream.seq
+        try:
+            await asyncio.wait_for(stream.event.wait(), timeout=max(timeout, 0))
+        except TimeoutError:
+            pass
+        return stream.seq
+
+    def recent_output(self, pane_id: str) -> str:
+        """Raw recent output of a pane (escape sequences included)."""
+        stream = self._panes.get(pane_id)
+        if stream is None:
+            return ""
+        return stream.buffer.decode("utf-8", errors="replace")
+
+    async def capture_pane(self, pane_id: str, *args: str) -> list[str]:
+        """``capture-pane -p`` for a pane, without forking a tmux client."""
+        return await self.command("capture-pane", "-p", "-t", pane_id, *args)
+
+    def stats(self) -> dict[str, int | bool]:
+        return {
+            "alive": self.is_alive,
+            "watched_panes": len(self._panes),
+            "output_events": self.output_events,
+            "output_bytes": self.output_bytes,
+            "commands_sent": self.commands_sent,
+        }
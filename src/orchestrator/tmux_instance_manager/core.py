@@ -5,11 +5,15 @@ Manages Claude CLI instances via tmux sessions for persistent interactive commun
 
 import asyncio
 import base64
+import copy
 import json
 import logging
+import os
 import re
 import shlex
+import shutil
 import sys
+import tempfile
 import time
 import uuid
 from datetime import datetime, timedelta
@@ -18,15 +22,47 @@ from typing import Any, ClassVar
 
 import libtmux
 
+from ..audit_index import AuditIndex
+from ..caller_identity import (
+    CALLER_HEADER,
+    CALLER_QUERY_PARAM,
+    CALLER_TOKEN_ENV,
+    new_caller_token,
+    public_record,
+    redact_caller_token,
+)
 from ..compat import UTC
 from ..config import resolve_model
 from ..harnesses import Harness, get_harness
 from ..llm_summarizer import LLMSummarizer
-from ..monitoring_service import MonitoringService
+from ..monitoring_service import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MAX_SUMMARY_AGE,
+    DEFAULT_MIN_NEW_CHARS,
+    DEFAULT_MIN_NEW_LINES,
+    DEFAULT_MIN_POLL_INTERVAL,
+    MonitoringService,
+)
 from ..name_generator import get_instance_name
 from ..simple_models import MessageEnvelope
+from ..state_store import StateStore
+from ..terminated_catalog import TerminatedCatalog
 from ..toml_config import update_toml_config
-from .helpers import MAX_MESSAGE_HISTORY_PER_INSTANCE, redact_authkey
+from .async_tmux import DEFAULT_MAX_WORKERS, AsyncTmux
+from .change_feed import InstanceChangeFeed
+from .control_mode import TmuxControlClient
+from .delivery import DeliveryStats
+from .helpers import MAX_MESSAGE_HISTORY_PER_INSTANCE, PaneCursor, redact_authkey
+from .hierarchy_index import HierarchyIndex
+from .persistence import DEFAULT_FLUSH_INTERVAL_MS, StatePersister
+from .readiness import (
+    DEFAULT_TEAM_READY_TIMEOUT,
+    READY_STATES,
+    ProgressCallback,
+    TeamReadiness,
+    wait_for_team,
+)
+from .warm_pool import PoolKey, WarmPool, WarmSession, pool_key
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +74,29 @@ _ENV_VAR_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 #: only keeps the pane readable while they scroll past.
 _PANE_COMMAND_PACING_SECONDS = 0.05
 
+#: Pause between the end of a bracketed paste and the submitting Enter, so
+#: the CLI has closed the paste before the keystroke arrives.
+_PASTE_SUBMIT_DELAY_SECONDS = 0.1
+
+#: Tries at the submitting Enter after a paste; the text itself is never resent.
+_PASTE_SUBMIT_ATTEMPTS = 2
+
+#: After a control-mode wake-up, wait this long so one capture covers the
+#: whole burst of redraws instead of one capture per %output line.
+_CONTROL_SETTLE_SECONDS = 0.05
+
+#: Instances torn down at once by ``terminate_instances``. Killing a session
+#: runs on the AsyncTmux pool; worktree removal runs git subprocesses.
+DEFAULT_TEARDOWN_CONCURRENCY = 8
+
+#: Scrollback kept per instance pane. Incremental captures need tmux's line
+#: numbering, which shifts once history is full; the default 2000 lines fill
+#: early in a long-running session.
+PANE_HISTORY_LIMIT = 50_000
+
+#: Most lines captured when there is no usable cursor to start from.
+_UNTRACKED_CAPTURE_LINES = 2000
+
 
 class TmuxInstanceManager:
     """Manages Claude instances via tmux sessions."""
@@ -68,9 +127,29 @@ class TmuxInstanceManager:
         self.tmux_sessions: dict[str, libtmux.Session] = {}
         self.message_history: dict[str, list[dict]] = {}
         self.logging_manager = logging_manager
+        # Parent -> children over self.instances, for cascade termination
+        self.hierarchy = HierarchyIndex()
 
-        # Persistent state store (injected by server)
+        # Persistent state store (injected by server), written behind
         self.state_store = config.get("_state_store")
+        self.state_persister = StatePersister(
+            self.state_store,
+            lambda: self.instances,
+            flush_interval_ms=float(
+                config.get("state_flush_interval_ms", DEFAULT_FLUSH_INTERVAL_MS)
+            ),
+        )
+
+        # Terminated instances by parent, kept next to the state store; it
+        # outlives the store's pruning for get_children(include_terminated)
+        self.terminated_catalog = (
+            TerminatedCatalog(self.state_store.state_dir)
+            if isinstance(self.state_store, StateStore)
+            else None
+        )
+
+        # Instance deltas pushed to /ws/monitor dashboards
+        self.change_feed = InstanceChangeFeed()
 
         # NEW: Use shared state manager for IPC
         self.shared_state = shared_state_manager
@@ -87,6 +166,25 @@ class TmuxInstanceManager:
         # Resource tracking
         self.total_tokens_used = 0
 
+        # tmux control mode: one persistent `tmux -C` client replaces
+        # capture-pane polling for watched panes (started lazily, needs a loop)
+        self._tmux_control_mode = bool(config.get("tmux_control_mode", False))
+        self.control_client: TmuxControlClient | None = None
+        self._control_client_lock = asyncio.Lock()
+        self._watched_panes: dict[str, str] = {}  # instance_id -> pane_id
+
+        # Sessions killed / worktrees removed at once by terminate_instances
+        self._teardown_concurrency = max(
+            1, int(config.get("teardown_concurrency", DEFAULT_TEARDOWN_CONCURRENCY))
+        )
+
+        # Opt-in pool of pre-booted CLI sessions that spawns claim (warm_pool.py)
+        self.warm_pool = WarmPool(int(config.get("warm_pool_size", 0)))
+        self._warm_boot_tasks: set[asyncio.Task] = set()
+
+        # Per-harness message delivery throughput (reported on /health)
+        self.delivery_stats = DeliveryStats()
+
         # Create workspace base directory
         self.workspace_base = Path(
             config.get("workspace_base_dir", "/tmp/claude_orchestrator")  # noqa: S108
@@ -97,18 +195,56 @@ class TmuxInstanceManager:
         self.tmux_server = libtmux.Server()
         logger.info("Connected to tmux server")
 
+        # Every libtmux call forks tmux and blocks; route them off the loop
+        self.tmux = AsyncTmux(
+            self.tmux_server,
+            max_workers=int(config.get("tmux_max_workers", DEFAULT_MAX_WORKERS)),
+        )
+
         # Store server port for MCP config generation
         import os
 
         self.server_port = int(os.getenv("ORCHESTRATOR_PORT", "8001"))
+        # Unix socket the server also listens on; set by the server once bound
+        self.mcp_socket_path: str | None = None
 
         # Initialize monitoring service if OPENROUTER_API_KEY is available
         self.monitoring_service = None
         if os.getenv("OPENROUTER_API_KEY"):
             try:
-                llm_summarizer = LLMSummarizer()
+                llm_summarizer = LLMSummarizer(
+                    max_concurrent=int(
+                        config.get("summary_max_concurrent", LLMSummarizer.DEFAULT_MAX_CONCURRENT)
+                    ),
+                    requests_per_second=float(
+                        config.get(
+                            "summary_requests_per_second", LLMSummarizer.DEFAULT_REQUESTS_PER_SECOND
+                        )
+                    ),
+                    batch_size=int(
+                        config.get("summary_batch_size", LLMSummarizer.DEFAULT_BATCH_SIZE)
+                    ),
+                    batch_token_budget=int(
+                        config.get(
+                            "summary_batch_token_budget", LLMSummarizer.DEFAULT_BATCH_TOKEN_BUDGET
+                        )
+                    ),
+                )
                 self.monitoring_service = MonitoringService(
-                    instance_manager=self, llm_summarizer=llm_summarizer, poll_interval=12
+                    instance_manager=self,
+                    llm_summarizer=llm_summarizer,
+                    poll_interval=12,
+                    min_new_lines=int(config.get("summary_min_new_lines", DEFAULT_MIN_NEW_LINES)),
+                    min_new_chars=int(config.get("summary_min_new_chars", DEFAULT_MIN_NEW_CHARS)),
+                    max_summary_age=float(
+                        config.get("summary_max_age_seconds", DEFAULT_MAX_SUMMARY_AGE)
+                    ),
+                    min_poll_interval=float(
+                        config.get("summary_min_poll_interval", DEFAULT_MIN_POLL_INTERVAL)
+                    ),
+                    max_poll_interval=float(
+                        config.get("summary_max_poll_interval", DEFAULT_MAX_POLL_INTERVAL)
+                    ),
                 )
 
                 # Configure loggers for MonitoringService and LLMSummarizer
@@ -161,33 +297,41 @@ class TmuxInstanceManager:
                     f"(keeping last {MAX_MESSAGE_HISTORY_PER_INSTANCE})"
                 )
 
-    def _save_state(self) -> None:
-        """Persist current instance state to disk (if state_store configured).
+    def _save_state(self, instance_id: str | None = None) -> None:
+        """Mark instance state for persistence and publish it to the change feed.
 
-        Safe to call from both sync and async contexts. File I/O is fast
-        (<1ms for typical state) but callers in hot async paths should
-        prefer _save_state_async() to avoid blocking the event loop.
+        The write happens on the persister's next flush, so a burst of
+        transitions costs one write. Pass ``instance_id`` when only that
+        instance changed; ``None`` persists every instance.
         """
-        if self.state_store:
-            try:
-                self.state_store.save_all(self.instances)
-            except Exception as e:
-                logger.error(f"Failed to persist instance state: {e}")
+        self.state_persister.mark_dirty(instance_id)
+        self._publish_change(instance_id)
+
+    async def _save_state_async(self, instance_id: str | None = None) -> None:
+        """Async spelling of _save_state, kept for existing callers."""
+        self._save_state(instance_id)
+
+    def _publish_change(self, instance_id: str | None = None) -> None:
+        """Send the dashboard view of changed instances to the change feed."""
+        if instance_id is None:
+            for iid, instance in list(self.instances.items()):
+                self.change_feed.publish(iid, instance)
+        else:
+            self.change_feed.publish(instance_id, self.instances.get(instance_id))
 
-    async def _save_state_async(self) -> None:
-        """Async version of _save_state — runs file I/O in executor."""
-        if self.state_store:
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, self._save_state)
+    def _flush_state(self) -> None:
+        """Write pending instance state now (terminate, suspend, shutdown)."""
+        self.state_persister.flush()
 
-    async def _get_from_shared_queue(self, instance_id: str, timeout: int) -> dict:
-        """Get message from shared queue with async wrapper.
+    async def _get_from_shared_queue(self, instance_id: str, timeout: float) -> dict:
+        """Get a reply from the instance's shared response queue.
 
-        Wraps blocking multiprocessing.Queue.get() in executor to avoid blocking event loop.
+        The wait parks this coroutine on the reply bus; no thread is held
+        while it waits, and cancelling the task ends the wait.
 
         Args:
             instance_id: Instance ID whose queue to read from
-            timeout: Timeout in seconds
+            timeout: Timeout in seconds (0 takes only an already-queued reply)
 
         Returns:
             Message dict from queue
@@ -195,55 +339,30 @@ class TmuxInstanceManager:
         Raises:
             TimeoutError: If no message received within timeout
         """
-        import concurrent.futures
-
         if not self.shared_state:
             raise RuntimeError("Shared state not available (HTTP mode)")
 
-        queue = self.shared_state.get_response_queue(instance_id)
-        loop = asyncio.get_event_loop()
-
-        # Run blocking queue.get() in thread executor
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = loop.run_in_executor(
-                executor,
-                queue.get,  # Blocking call
-                True,  # block=True
-                timeout,  # timeout in seconds
-            )
-            try:
-                return await future
-            except Exception as e:
-                # Convert queue.Empty to TimeoutError for consistency
-                if "Empty" in str(type(e).__name__):
-                    raise TimeoutError(
-                        f"No message received from instance {instance_id} within {timeout}s"
-                    ) from None
-                raise
+        try:
+            return await self.shared_state.get_reply(instance_id, timeout)
+        except TimeoutError:
+            raise TimeoutError(
+                f"No message received from instance {instance_id} within {timeout}s"
+            ) from None
 
     async def _put_to_shared_queue(self, instance_id: str, message: dict):
-        """Put message to shared queue with async wrapper.
+        """Put a reply on the instance's shared response queue.
 
         Args:
             instance_id: Target instance ID whose queue to write to
             message: Message dict to send
-        """
-        import concurrent.futures
 
+        Raises:
+            queue.Full: If the target queue is at capacity
+        """
         if not self.shared_state:
             raise RuntimeError("Shared state not available (HTTP mode)")
 
-        queue = self.shared_state.get_response_queue(instance_id)
-        lock = self.shared_state.queue_locks[instance_id]
-        loop = asyncio.get_event_loop()
-
-        def put_with_lock():
-            with lock:
-                queue.put(message, block=True, timeout=5)
-
-        # Run blocking queue.put() in thread executor
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            await loop.run_in_executor(executor, put_with_lock)
+        await self.shared_state.put_reply(instance_id, message)
 
     @staticmethod
     def _normalize_mcp_servers(instance: dict[str, Any]) -> dict[str, Any]:
@@ -269,34 +388,50 @@ class TmuxInstanceManager:
         return mcp_servers
 
     def _add_madrox_mcp_server(
-        self, mcp_servers: dict[str, Any], harness: type[Harness], instance_id: str
+        self,
+        mcp_servers: dict[str, Any],
+        harness: type[Harness],
+        instance_id: str,
+        caller_token: str | None = None,
     ) -> None:
         """Wire the instance back to this orchestrator over the harness's transport."""
         if "madrox" in mcp_servers:
             return
 
+        caller_token = caller_token or self.instances.get(instance_id, {}).get("caller_token")
         if harness.auto_mcp_transport == "stdio":
             # A STDIO subprocess proxies every tool call to the parent HTTP server.
             orchestrator_script = str(
                 Path(__file__).parent.parent.parent.parent / "run_orchestrator.py"
             )
             parent_url = f"http://localhost:{self.server_port}"
+            env = {"MADROX_TRANSPORT": "stdio", "MADROX_PARENT_URL": parent_url}
+            if self.mcp_socket_path:
+                # Same host: the proxy skips TCP loopback (falls back if it vanishes)
+                env["MADROX_PARENT_SOCKET"] = self.mcp_socket_path
+            if caller_token and not harness.mcp_registration_is_global:
+                # Otherwise the harness passes the token on its launch command
+                env[CALLER_TOKEN_ENV] = caller_token
             mcp_servers["madrox"] = {
                 "transport": "stdio",
                 "command": sys.executable,
                 "args": [orchestrator_script],
-                "env": {"MADROX_TRANSPORT": "stdio", "MADROX_PARENT_URL": parent_url},
+                "env": env,
             }
             logger.debug(
                 f"Configured STDIO madrox proxy for {instance_id}: "
-                f"{sys.executable} {orchestrator_script} -> {parent_url}"
+                f"{sys.executable} {orchestrator_script} -> "
+                f"{self.mcp_socket_path or parent_url}"
             )
         else:
             # HTTP transport keeps every spawn visible to the parent server.
-            mcp_servers["madrox"] = {
-                "transport": "http",
-                "url": f"http://localhost:{self.server_port}/mcp",
-            }
+            url = f"http://localhost:{self.server_port}/mcp"
+            madrox: dict[str, Any] = {"transport": "http", "url": url}
+            if caller_token and harness.mcp_http_headers:
+                madrox["headers"] = {CALLER_HEADER: caller_token}
+            elif caller_token:
+                madrox["url"] = f"{url}?{CALLER_QUERY_PARAM}={caller_token}"
+            mcp_servers["madrox"] = madrox
             logger.debug(
                 f"Configured HTTP madrox for {instance_id}: http://localhost:{self.server_port}/mcp"
             )
@@ -337,7 +472,9 @@ class TmuxInstanceManager:
         """
         harness = get_harness(instance.get("instance_type"))
         mcp_servers = self._normalize_mcp_servers(instance)
-        self._add_madrox_mcp_server(mcp_servers, harness, instance["id"])
+        self._add_madrox_mcp_server(
+            mcp_servers, harness, instance["id"], caller_token=instance.get("caller_token")
+        )
 
         if harness.mcp_config_filename:
             self._write_mcp_config_file(instance, harness, mcp_servers)
@@ -424,8 +561,11 @@ class TmuxInstanceManager:
                     continue
 
                 cli_command = " ".join(cmd_parts)
-                logger.info(f"Adding {harness.name} MCP server: {cli_command}")
-                pane.send_keys(cli_command, enter=True)
+                logger.info(
+                    f"Adding {harness.name} MCP server: "
+                    f"{redact_caller_token(cli_command, instance.get('caller_token'))}"
+                )
+                await self.tmux.send_keys(pane, cli_command, enter=True)
                 await asyncio.sleep(_PANE_COMMAND_PACING_SECONDS)
 
             except Exception as e:
@@ -485,6 +625,8 @@ class TmuxInstanceManager:
                     continue
                 # Claude Code uses "type", not "transport".
                 servers[server_name] = {"type": "http", "url": url}
+                if headers := server_config.get("headers"):
+                    servers[server_name]["headers"] = headers
 
             elif transport == "stdio":
                 command = server_config.get("command")
@@ -569,7 +711,11 @@ class TmuxInstanceManager:
         if active_count >= self.config.get("max_concurrent_instances", 10):
             raise RuntimeError("Maximum concurrent instances reached")
 
-        instance_id = str(uuid.uuid4())
+        # A matching pre-booted session skips tmux and CLI startup entirely
+        warm = await self._claim_warm_session(
+            instance_type, model, bypass_isolation, sandbox_mode, profile, kwargs
+        )
+        instance_id = warm.instance_id if warm else str(uuid.uuid4())
 
         # Generate a funny name if not provided
         if not name or name == "unnamed" or name == "":
@@ -668,16 +814,21 @@ class TmuxInstanceManager:
             "environment_vars": kwargs.get("environment_vars", {}),
             "resource_limits": kwargs.get("resource_limits", {}),
             "parent_instance_id": kwargs.get("parent_instance_id"),
-            "mcp_servers": kwargs.get("mcp_servers", {}),
+            "mcp_servers": warm.mcp_servers if warm else kwargs.get("mcp_servers", {}),
             "statusline": "",
             "error_message": None,
             "retry_count": 0,
             "use_worktree": use_worktree,
             "git_repo": git_repo if use_worktree else None,
             "git_worktree_branch": git_worktree_branch,
+            # Identifies this instance's own MCP calls (see caller_identity)
+            "caller_token": warm.caller_token if warm else new_caller_token(instance_id),
         }
+        if warm and warm.mcp_config_path:
+            instance["_mcp_config_path"] = warm.mcp_config_path
 
         self.instances[instance_id] = instance
+        self._publish_change(instance_id)
         self.message_history[instance_id] = []
 
         # Initialize response queue for this instance immediately at spawn
@@ -728,7 +879,7 @@ class TmuxInstanceManager:
         if wait_for_ready:
             # Blocking: wait for full initialization
             try:
-                await self._initialize_tmux_session(instance_id)
+                await self._start_instance_session(instance_id, warm)
                 instance["state"] = "idle"
                 await self._process_queued_messages(instance_id)
                 logger.info(
@@ -741,7 +892,7 @@ class TmuxInstanceManager:
                     },
                 )
 
-                self._save_state()
+                self._save_state(instance_id)
 
                 if self.logging_manager:
                     instance_logger = self.logging_manager.get_instance_logger(
@@ -752,7 +903,7 @@ class TmuxInstanceManager:
             except Exception as e:
                 instance["state"] = "error"
                 instance["error_message"] = str(e)
-                self._save_state()
+                self._save_state(instance_id)
                 logger.error(
                     f"Failed to initialize tmux instance {instance_id}: {e}",
                     extra={"instance_id": instance_id, "error": str(e)},
@@ -772,15 +923,18 @@ class TmuxInstanceManager:
                 f"Spawning {instance_type} instance {instance_id} ({instance_name}) in background",
                 extra={"instance_id": instance_id, "instance_type": instance_type},
             )
-            asyncio.create_task(self._initialize_instance_background(instance_id))
+            asyncio.create_task(self._initialize_instance_background(instance_id, warm))
 
         return instance_id
 
-    async def _initialize_instance_background(self, instance_id: str):
+    async def _initialize_instance_background(
+        self, instance_id: str, warm: WarmSession | None = None
+    ):
         """Initialize an instance in the background (non-blocking spawn).
 
         Args:
             instance_id: Instance ID to initialize
+            warm: Pre-booted session claimed for the instance, if any
         """
         instance = self.instances.get(instance_id)
         if not instance:
@@ -788,9 +942,9 @@ class TmuxInstanceManager:
             return
 
         try:
-            await self._initialize_tmux_session(instance_id)
+            await self._start_instance_session(instance_id, warm)
             instance["state"] = "idle"
-            self._save_state()
+            self._save_state(instance_id)
             await self._process_queued_messages(instance_id)
             logger.info(
                 f"Background initialization completed for instance {instance_id} ({instance['name']})",
@@ -799,7 +953,7 @@ class TmuxInstanceManager:
         except Exception as e:
             instance["state"] = "error"
             instance["error_message"] = str(e)
-            self._save_state()
+            self._save_state(instance_id)
             logger.error(
                 f"Background initialization failed for instance {instance_id}: {e}",
                 extra={"instance_id": instance_id, "error": str(e)},
@@ -808,19 +962,155 @@ class TmuxInstanceManager:
     async def _wait_for_queue_response(self, instance_id: str, timeout: int) -> dict:
         """Wait for a bidirectional reply via response queue."""
         if self.shared_state:
-            # Chunk into 1s waits so the task is cancellable
-            deadline = time.time() + timeout
-            while time.time() < deadline:
-                remaining = max(1, int(deadline - time.time()))
-                chunk = min(remaining, 1)
-                try:
-                    return await self._get_from_shared_queue(instance_id, timeout=chunk)
-                except TimeoutError:
-                    continue
-            raise TimeoutError(f"No queue response from {instance_id} within {timeout}s")
+            return await self._get_from_shared_queue(instance_id, timeout=timeout)
         else:
             return await asyncio.wait_for(self.response_queues[instance_id].get(), timeout=timeout)
 
+    # ------------------------------------------------------------------
+    # tmux control mode
+    # ------------------------------------------------------------------
+    async def _get_control_client(self) -> TmuxControlClient | None:
+        """Return the running control client, starting it on first use.
+
+        A client that fails to start disables control mode for the rest of the
+        manager's life; every caller falls back to ``capture-pane`` polling.
+        """
+        if not self._tmux_control_mode:
+            return None
+        async with self._control_client_lock:
+            if self.control_client is not None and self.control_client.is_alive:
+                return self.control_client
+
+            socket_name = getattr(self.tmux_server, "socket_name", None)
+            socket_path = getattr(self.tmux_server, "socket_path", None)
+            client = TmuxControlClient(
+                socket_name=socket_name if isinstance(socket_name, str) else None,
+                socket_path=str(socket_path) if isinstance(socket_path, (str, Path)) else None,
+            )
+            try:
+                await client.start()
+            except Exception as e:
+                logger.warning(f"tmux control mode unavailable, falling back to polling: {e}")
+                await client.close()
+                self._tmux_control_mode = False
+                return None
+
+            # A restarted client has lost every link into the hub.
+            self._watched_panes.clear()
+            self.control_client = client
+            return client
+
+    async def _watch_pane(self, instance_id: str, pane) -> None:
+        """Subscribe to a pane's output over the control connection."""
+        pane_id = getattr(pane, "pane_id", None)
+        window_id = getattr(pane, "window_id", None)
+        if not isinstance(pane_id, str) or not isinstance(window_id, str):
+            return
+        if self._watched_panes.get(instance_id) == pane_id:
+            if self.control_client is not None and self.control_client.is_alive:
+                return
+
+        client = await self._get_control_client()
+        if client is None:
+            return
+        try:
+            await client.watch(pane_id, window_id)
+            self._watched_panes[instance_id] = pane_id
+        except Exception as e:
+            logger.warning(f"Could not watch pane {pane_id} of {instance_id}: {e}")
+
+    async def _unwatch_pane(self, instance_id: str) -> None:
+        """Unlink an instance's window from the hub before its session is killed."""
+        pane_id = self._watched_panes.pop(instance_id, None)
+        if pane_id and self.control_client is not None:
+            await self.control_client.unwatch(pane_id)
+
+    def _control_for(self, pane) -> TmuxControlClient | None:
+        """Control client watching this pane, or None when polling is required."""
+        client = self.control_client
+        pane_id = getattr(pane, "pane_id", None)
+        if client is None or not isinstance(pane_id, str):
+            return None
+        if not client.is_alive or not client.is_watching(pane_id):
+            return None
+        return client
+
+    async def _capture_pane(self, pane, *args: str) -> str:
+        """``capture-pane -p`` through the control connection when the pane is watched."""
+        client = self._control_for(pane)
+        if client is not None:
+            try:
+                return "\n".join(await client.capture_pane(pane.pane_id, *args))
+            except Exception as e:
+                logger.debug(f"Control-mode capture failed, forking tmux instead: {e}")
+        return "\n".join((await self.tmux.pane_cmd(pane, "capture-pane", "-p", *args)).stdout)
+
+    async def _pane_cursor(self, pane) -> PaneCursor | None:
+        """Read the pane's history size and cursor row (None if unavailable)."""
+        fmt = "#{history_size} #{cursor_y} #{history_limit}"
+        try:
+            client = self._control_for(pane)
+            if client is not None:
+                lines = await client.command("display-message", "-p", "-t", pane.pane_id, fmt)
+            else:
+                lines = (await self.tmux.pane_cmd(pane, "display-message", "-p", fmt)).stdout
+            history_size, cursor_y, history_limit = (int(v) for v in lines[0].split())
+        except Exception:
+            return None
+        return PaneCursor(history_size, cursor_y, history_limit)
+
+    async def _capture_since(self, pane, cursor: PaneCursor | None) -> str:
+        """Capture the screen visible at ``cursor`` time plus everything after it.
+
+        Keeps per-message capture cost proportional to the reply instead of the
+        session's lifetime scrollback. Falls back to the last
+        ``_UNTRACKED_CAPTURE_LINES`` lines when the cursor is missing or tmux's
+        line numbering has shifted since.
+        """
+        start = None
+        if cursor is not None:
+            now = await self._pane_cursor(pane)
+            start = cursor.capture_start(now) if now is not None else None
+        if start is None:
+            start = -_UNTRACKED_CAPTURE_LINES
+        return await self._capture_pane(pane, "-S", str(start))
+
+    async def _next_pane_output(
+        self, pane, interval: float, previous: str | None, seq: int
+    ) -> tuple[str, int]:
+        """Wait up to one poll interval and return the pane's visible content.
+
+        Polled panes sleep the full interval and are captured every time.
+        Watched panes wake as soon as output arrives, and a pane that produced
+        no output since ``seq`` is not captured at all.
+
+        Returns:
+            ``(output, seq)`` to feed into the next call.
+        """
+        client = self._control_for(pane)
+        if client is None:
+            await asyncio.sleep(interval)
+            return "\n".join((await self.tmux.pane_cmd(pane, "capture-pane", "-p")).stdout), seq
+
+        new_seq = await client.wait_for_output(pane.pane_id, seq, interval)
+        if new_seq == seq and previous is not None:
+            return previous, seq
+        await asyncio.sleep(_CONTROL_SETTLE_SECONDS)
+        return await self._capture_pane(pane), client.output_seq(pane.pane_id)
+
+    async def shutdown(self) -> None:
+        """Release resources that outlive individual instances."""
+        await self._drain_warm_pool()
+        self.state_persister.close()
+        if self.control_client is not None:
+            try:
+                await self.control_client.close()
+            except Exception as e:
+                logger.error(f"Error closing tmux control client: {e}")
+            self.control_client = None
+            self._watched_panes.clear()
+        self.tmux.shutdown()
+
     @staticmethod
     def _last_content_line(output: str) -> str:
         """Last line of pane output that is neither status bar nor separator.
@@ -841,9 +1131,16 @@ class TmuxInstanceManager:
         return ""
 
     async def _wait_for_pane_response(
-        self, pane, initial_output: str, timeout: int, instance_type: str = "claude"
+        self,
+        pane,
+        initial_output: str,
+        timeout: int,
+        instance_type: str = "claude",
+        cursor: PaneCursor | None = None,
     ) -> str:
-        """Poll tmux pane for response completion. Returns full scrollback output.
+        """Poll tmux pane for response completion.
+
+        Returns the output since ``cursor`` (the full scrollback without one).
 
         Two-phase detection:
         1. Wait for output to start growing (response started)
@@ -854,32 +1151,34 @@ class TmuxInstanceManager:
         harness = get_harness(instance_type)
         start_time = time.time()
         last_size = len(initial_output)
-        stable_count = 0
+        last_growth_at = start_time
         poll_count = 0
         response_started = False
         stability_reached_at: float | None = None
         last_line = ""
+        # With control mode the loop wakes on output rather than every 0.3s,
+        # so stability is measured in time (three quiet polls' worth).
+        control = self._control_for(pane)
+        seq = control.output_seq(pane.pane_id) if control else 0
+        current_output: str | None = None
 
         while time.time() - start_time < timeout:
-            await asyncio.sleep(0.3)
+            current_output, seq = await self._next_pane_output(pane, 0.3, current_output, seq)
             poll_count += 1
-
-            current_output = "\n".join(pane.cmd("capture-pane", "-p").stdout)
             current_size = len(current_output)
 
             if current_size > last_size:
                 response_started = True
-                stable_count = 0
+                last_growth_at = time.time()
                 stability_reached_at = None
                 last_size = current_size
                 continue
 
             if response_started:
-                stable_count += 1
                 # The idle prompt is only meaningful once output has settled, so
                 # scan for it here rather than on every poll.
                 last_line = self._last_content_line(current_output)
-                if stable_count >= 3 and stability_reached_at is None:
+                if time.time() - last_growth_at >= 0.9 and stability_reached_at is None:
                     stability_reached_at = time.time()
                     logger.info(
                         f"Pane poll: output stable after {time.time() - start_time:.1f}s "
@@ -921,7 +1220,7 @@ class TmuxInstanceManager:
             )
 
         logger.debug(f"Polling completed after {poll_count} polls, {time.time() - start_time:.1f}s")
-        return "\n".join(pane.cmd("capture-pane", "-p", "-S", "-").stdout)
+        return await self._capture_since(pane, cursor)
 
     async def send_message(
         self,
@@ -976,7 +1275,7 @@ class TmuxInstanceManager:
         # Update instance state
         instance["state"] = "busy"
         instance["last_activity"] = datetime.now(UTC).isoformat()
-        await self._save_state_async()
+        await self._save_state_async(instance_id)
 
         # Generate message ID for tracking
         message_id = str(uuid.uuid4())
@@ -1047,11 +1346,14 @@ class TmuxInstanceManager:
 
             # Send message via tmux (SINGLE SEND)
             session = self.tmux_sessions[instance_id]
-            window = session.windows[0]
-            pane = window.panes[0]
+            pane = await self.tmux.first_pane(session)
+            # Covers reconnected instances whose session predates this manager.
+            await self._watch_pane(instance_id, pane)
 
             # Use new multiline-safe method
-            await self._send_multiline_message_to_pane(pane, formatted_message)
+            await self._send_multiline_message_to_pane(
+                pane, formatted_message, get_harness(instance.get("instance_type"))
+            )
             envelope.mark_delivered()
 
             logger.debug(f"Sent message {message_id} to instance {instance_id}")
@@ -1065,6 +1367,7 @@ class TmuxInstanceManager:
                 instance["request_count"] += 1
 
                 self.total_tokens_used += estimated_tokens
+                self._save_state(instance_id)
 
                 return {
                     "instance_id": instance_id,
@@ -1091,14 +1394,19 @@ class TmuxInstanceManager:
                     logger.info(f"Drained {drained} stale queue item(s) for {instance_id}")
 
             await asyncio.sleep(0.3)
-            initial_output = "\n".join(pane.cmd("capture-pane", "-p").stdout)
+            # Cursor first: the screen captured right after starts at or below
+            # it, so the anchor search always finds the baseline in the delta.
+            cursor = await self._pane_cursor(pane)
+            initial_output = await self._capture_pane(pane)
 
             instance_type = instance.get("instance_type", "claude")
             queue_task = asyncio.create_task(
                 self._wait_for_queue_response(instance_id, timeout_seconds)
             )
             poll_task = asyncio.create_task(
-                self._wait_for_pane_response(pane, initial_output, timeout_seconds, instance_type)
+                self._wait_for_pane_response(
+                    pane, initial_output, timeout_seconds, instance_type, cursor
+                )
             )
 
             done, pending = await asyncio.wait(
@@ -1145,7 +1453,7 @@ class TmuxInstanceManager:
                         f"Ignoring stale queue reply (correlation {queue_response['correlation_id'][:8]}… "
                         f"!= {message_id[:8]}…) — falling back to pane"
                     )
-                    full_output = "\n".join(pane.cmd("capture-pane", "-p", "-S", "-").stdout)
+                    full_output = await self._capture_since(pane, cursor)
                     response_text = self._extract_response(full_output, initial_output, instance_id)
                     protocol = "fallback"
                 else:
@@ -1174,7 +1482,7 @@ class TmuxInstanceManager:
                 exc = winner.exception()
                 logger.warning(f"Both response detection paths failed for {instance_id}: {exc}")
                 envelope.mark_timeout()
-                full_output = "\n".join(pane.cmd("capture-pane", "-p", "-S", "-").stdout)
+                full_output = await self._capture_since(pane, cursor)
                 response_text = self._extract_response(full_output, initial_output, instance_id)
                 protocol = "fallback"
 
@@ -1187,7 +1495,7 @@ class TmuxInstanceManager:
             if protocol != "bidirectional":
                 scan_output = full_output
                 if scan_output is None:
-                    scan_output = "\n".join(pane.cmd("capture-pane", "-p", "-S", "-").stdout)
+                    scan_output = await self._capture_since(pane, cursor)
                 backend_error = self._detect_backend_error(scan_output, initial_output)
                 # Empty output with no detected error is still a failure to
                 # surface — the instance produced nothing.
@@ -1227,6 +1535,7 @@ class TmuxInstanceManager:
             instance["request_count"] += 1
 
             self.total_tokens_used += estimated_tokens
+            self._save_state(instance_id)
 
             # Log response with structured data
             if self.logging_manager:
@@ -1245,10 +1554,10 @@ class TmuxInstanceManager:
                     },
                 )
 
-                # Log tmux output for debugging (only available from polling path)
-                if protocol != "bidirectional":
-                    pane_output = "\n".join(pane.cmd("capture-pane", "-p", "-S", "-").stdout)
-                    self.logging_manager.log_tmux_output(instance_id, pane_output)
+                # Log tmux output for debugging (only available from polling path).
+                # Reuses the delta captured above instead of the whole scrollback.
+                if protocol != "bidirectional" and full_output is not None:
+                    self.logging_manager.log_tmux_output(instance_id, full_output)
 
                 # Log audit event
                 self.logging_manager.log_audit_event(
@@ -1298,7 +1607,7 @@ class TmuxInstanceManager:
             # Update state back to idle
             if instance["state"] == "busy":
                 instance["state"] = "idle"
-                await self._save_state_async()
+                await self._save_state_async(instance_id)
                 # Process any queued messages
                 await self._process_queued_messages(instance_id)
 
@@ -1325,6 +1634,7 @@ class TmuxInstanceManager:
         # Mark busy while draining queue to prevent new messages interleaving
         instance["state"] = "busy"
         instance["last_activity"] = datetime.now(UTC).isoformat()
+        self._save_state(instance_id)
 
         try:
             session = self.tmux_sessions.get(instance_id)
@@ -1334,12 +1644,12 @@ class TmuxInstanceManager:
                 )
                 return
 
-            window = session.windows[0]
-            pane = window.panes[0]
+            pane = await self.tmux.first_pane(session)
+            harness = get_harness(instance.get("instance_type"))
 
             for msg in queued:
                 formatted = f"[MSG:{msg['message_id']}] {msg['message']}"
-                await self._send_multiline_message_to_pane(pane, formatted)
+                await self._send_multiline_message_to_pane(pane, formatted, harness)
                 logger.info(
                     f"Delivered queued message {msg['message_id']} to {instance_id} "
                     f"(queued at {msg['queued_at']})"
@@ -1349,6 +1659,7 @@ class TmuxInstanceManager:
         finally:
             instance["state"] = "idle"
             instance["last_activity"] = datetime.now(UTC).isoformat()
+            self._save_state(instance_id)
 
     async def interrupt_instance(self, instance_id: str) -> dict[str, Any]:
         """Send interrupt signal (Ctrl+C) to a running instance.
@@ -1381,18 +1692,17 @@ class TmuxInstanceManager:
             if not session:
                 raise RuntimeError(f"No tmux session found for instance {instance_id}")
 
-            window = session.windows[0]
-            pane = window.panes[0]
+            pane = await self.tmux.first_pane(session)
 
             # Send Ctrl+C to interrupt the current operation
             # This works in both Claude and Codex CLI modes
-            pane.send_keys("C-c", literal=False)  # Send Ctrl+C
+            await self.tmux.send_keys(pane, "C-c", literal=False)  # Send Ctrl+C
 
             # Wait briefly for interrupt to take effect
             await asyncio.sleep(0.5)
 
             # Verify the interrupt was processed by checking output
-            output = "\n".join(pane.cmd("capture-pane", "-p").stdout)
+            output = await self._capture_pane(pane)
             interrupted = any(
                 indicator in output.lower()
                 for indicator in ["interrupt", "cancel", "stopped", "^c"]
@@ -1412,6 +1722,7 @@ class TmuxInstanceManager:
             # Update state
             instance["state"] = "idle"
             instance["last_activity"] = datetime.now(UTC).isoformat()
+            self._save_state(instance_id)
 
             return {
                 "success": True,
@@ -1436,6 +1747,8 @@ class TmuxInstanceManager:
     async def terminate_instance(self, instance_id: str, force: bool = False) -> bool:
         """Terminate a Claude instance and kill its tmux session.
 
+        Every live instance below it is terminated too (cascade).
+
         Args:
             instance_id: Instance ID to terminate
             force: Force termination even if busy
@@ -1443,79 +1756,122 @@ class TmuxInstanceManager:
         Returns:
             True if terminated successfully
         """
-        if instance_id not in self.instances:
-            raise ValueError(f"Instance {instance_id} not found")
+        results = await self.terminate_instances([instance_id], force=force)
+        return results[instance_id]
 
-        instance = self.instances[instance_id]
+    async def terminate_instances(
+        self, instance_ids: list[str], force: bool = False
+    ) -> dict[str, bool]:
+        """Terminate instances and their subtrees in one teardown.
 
-        if not force and instance["state"] == "busy":
-            logger.warning(
-                f"Cannot terminate busy instance {instance_id} without force=True",
-                extra={"instance_id": instance_id},
-            )
-            return False
+        The subtrees are computed once. tmux sessions are killed and git
+        worktrees removed in parallel, at most ``teardown_concurrency`` at a
+        time, and instance state is written once at the end.
 
-        # First, terminate all child instances (cascade)
-        children_to_terminate = [
-            child_id
-            for child_id, child_instance in self.instances.items()
-            if child_instance.get("parent_instance_id") == instance_id
-            and child_instance.get("state") != "terminated"
+        Args:
+            instance_ids: Instance IDs to terminate
+            force: Force termination even if busy
+
+        Returns:
+            instance_id -> True if terminated successfully, for each requested ID
+        """
+        unknown = [iid for iid in instance_ids if iid not in self.instances]
+        if unknown:
+            raise ValueError(f"Instance {', '.join(unknown)} not found")
+
+        results: dict[str, bool] = {}
+        index = self.hierarchy.sync(self.instances)
+        # Descendants before the instance itself, each instance once
+        teardown: dict[str, None] = {}
+        for instance_id in instance_ids:
+            if not force and self.instances[instance_id]["state"] == "busy":
+                logger.warning(
+                    f"Cannot terminate busy instance {instance_id} without force=True",
+                    extra={"instance_id": instance_id},
+                )
+                results[instance_id] = False
+                continue
+            descendants = [
+                iid
+                for iid in index.descendants(instance_id)
+                if self.instances[iid].get("state") != "terminated"
+            ]
+            if descendants:
+                logger.info(
+                    f"Cascade terminating {len(descendants)} descendants of {instance_id}",
+                    extra={"instance_id": instance_id, "children": descendants},
+                )
+            teardown.update(dict.fromkeys(reversed(descendants)))
+            teardown[instance_id] = None
+
+        limit = asyncio.Semaphore(self._teardown_concurrency)
+
+        async def bounded(coro):
+            async with limit:
+                return await coro
+
+        ids = list(teardown)
+        await asyncio.gather(*(bounded(self._kill_instance_session(iid)) for iid in ids))
+
+        now = datetime.now(UTC).isoformat()
+        for instance_id in ids:
+            # Cascaded descendants are always force-terminated
+            cascaded = instance_id not in instance_ids
+            results[instance_id] = self._finalize_termination(instance_id, now, force or cascaded)
+        self._flush_state()
+
+        if (
+            self.monitoring_service
+            and self.monitoring_service.is_running()
+            and all(i["state"] in ("terminated", "error") for i in self.instances.values())
+        ):
+            await self.monitoring_service.stop()
+            logger.info("MonitoringService stopped (no active instances)")
+
+        # No artifact preservation needed - workspace IS the artifacts directory
+        worktrees = [
+            self.instances[iid]
+            for iid in ids
+            if results[iid]
+            and self.instances[iid].get("use_worktree")
+            and self.instances[iid].get("git_repo")
         ]
+        removed = await asyncio.gather(
+            *(bounded(self._remove_worktree(instance)) for instance in worktrees),
+            return_exceptions=True,
+        )
+        for instance, outcome in zip(worktrees, removed, strict=True):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Failed to remove worktree for {instance.get('id')}: {outcome}")
 
-        if children_to_terminate:
-            logger.info(
-                f"Cascade terminating {len(children_to_terminate)} child instances of {instance_id}",
-                extra={"instance_id": instance_id, "children": children_to_terminate},
-            )
-            for child_id in children_to_terminate:
-                try:
-                    await self.terminate_instance(child_id, force=True)
-                except Exception as e:
-                    logger.error(
-                        f"Failed to terminate child instance {child_id}: {e}",
-                        extra={"parent_id": instance_id, "child_id": child_id},
-                    )
+        return {iid: results[iid] for iid in instance_ids}
 
+    async def _kill_instance_session(self, instance_id: str) -> None:
+        """Stop watching and kill an instance's tmux session, if it has one."""
+        session = self.tmux_sessions.get(instance_id)
+        if session is None:
+            return
+        session_name = f"madrox-{instance_id}"
         try:
-            # Kill tmux session
-            if instance_id in self.tmux_sessions:
-                session = self.tmux_sessions[instance_id]
-                session_name = f"madrox-{instance_id}"
-                try:
-                    session.kill_session()
-                    logger.info(f"Killed tmux session: {session_name}")
-                except Exception as e:
-                    logger.warning(f"Failed to kill tmux session {session_name}: {e}")
-                del self.tmux_sessions[instance_id]
-
-            # Stop monitoring service if this is the last active instance
-            active_count = len(
-                [
-                    i
-                    for i in self.instances.values()
-                    if i["state"] not in ["terminated", "error"] and i["id"] != instance_id
-                ]
-            )
-            if (
-                active_count == 0
-                and self.monitoring_service
-                and self.monitoring_service.is_running()
-            ):
-                await self.monitoring_service.stop()
-                logger.info("MonitoringService stopped (no active instances)")
-
-            # Update instance state
-            instance["state"] = "terminated"
-            instance["terminated_at"] = datetime.now(UTC).isoformat()
-            self._save_state()
+            await self._unwatch_pane(instance_id)
+            await self.tmux.kill_session(session)
+            logger.info(f"Killed tmux session: {session_name}")
+        except Exception as e:
+            logger.warning(f"Failed to kill tmux session {session_name}: {e}")
+        self.tmux_sessions.pop(instance_id, None)
 
-            # Clean up git worktree if applicable
-            if instance.get("use_worktree") and instance.get("git_repo"):
-                await self._remove_worktree(instance)
+    def _finalize_termination(self, instance_id: str, terminated_at: str, force: bool) -> bool:
+        """Mark a killed instance terminated and release its resources.
 
-            # No artifact preservation needed - workspace IS the artifacts directory
-            # All files remain in place, no copying or cleanup required
+        State is only marked dirty; the caller flushes once for the batch.
+        """
+        instance = self.instances[instance_id]
+        try:
+            instance["state"] = "terminated"
+            instance["terminated_at"] = terminated_at
+            self._save_state(instance_id)
+            if self.terminated_catalog:
+                self.terminated_catalog.record(instance)
 
             # Remove message history
             if instance_id in self.message_history:
@@ -1584,8 +1940,9 @@ class TmuxInstanceManager:
             # Kill tmux session
             session = self.tmux_sessions.get(instance_id)
             if session:
+                await self._unwatch_pane(instance_id)
                 try:
-                    session.kill_session()
+                    await self.tmux.kill_session(session)
                 except Exception as e:
                     logger.warning(f"Error killing tmux session for {instance_id}: {e}")
                 self.tmux_sessions.pop(instance_id, None)
@@ -1593,7 +1950,8 @@ class TmuxInstanceManager:
             # Update state
             instance["state"] = "suspended"
             instance["suspended_at"] = datetime.now(UTC).isoformat()
-            self._save_state()
+            self._save_state(instance_id)
+            self._flush_state()
 
             # Log audit event
             if self.logging_manager:
@@ -1659,7 +2017,7 @@ class TmuxInstanceManager:
             elif instance_id not in self.response_queues:
                 self.response_queues[instance_id] = asyncio.Queue()
 
-            self._save_state()
+            self._save_state(instance_id)
 
             # Recover: create tmux session with --continue
             await self._recover_instance_async(instance_id)
@@ -1667,7 +2025,7 @@ class TmuxInstanceManager:
             # Check result
             if instance["state"] == "idle":
                 instance.pop("suspended_at", None)
-                self._save_state()
+                self._save_state(instance_id)
 
                 if self.logging_manager:
                     self.logging_manager.log_audit_event(
@@ -1694,7 +2052,9 @@ class TmuxInstanceManager:
         session_name = f"madrox-{instance_id}"
 
         try:
-            session = self.tmux_server.find_where({"session_name": session_name})
+            session = self.tmux.call(
+                "list-sessions", self.tmux_server.find_where, {"session_name": session_name}
+            )
         except Exception:
             session = None
 
@@ -1721,11 +2081,13 @@ class TmuxInstanceManager:
             if mcp_config_path.exists():
                 persisted_record["_mcp_config_path"] = str(mcp_config_path)
 
-        # Detect current CLI state from pane content
+        # Detect current CLI state from pane content. Runs synchronously during
+        # server startup, before the event loop serves requests.
         try:
-            window = session.windows[0]
-            pane = window.panes[0]
-            output = "\n".join(pane.cmd("capture-pane", "-p").stdout)
+            pane = self.tmux.call("list-panes", lambda: session.windows[0].panes[0])
+            output = "\n".join(
+                self.tmux.call("capture-pane", pane.cmd, "capture-pane", "-p").stdout
+            )
 
             busy_indicators = ["Thinking", "Running", "⏳"]
 
@@ -1754,7 +2116,7 @@ class TmuxInstanceManager:
         logger.info(
             f"Reconnected instance {instance_id} in state '{persisted_record.get('state')}'"
         )
-        self._save_state()
+        self._save_state(instance_id)
         return instance_id
 
     def recover_instance(self, persisted_record: dict[str, Any]) -> str:
@@ -1786,7 +2148,7 @@ class TmuxInstanceManager:
         # Schedule async recovery (tmux session creation needs to happen in background)
         asyncio.create_task(self._recover_instance_async(instance_id))
 
-        self._save_state()
+        self._save_state(instance_id)
         return instance_id
 
     async def _recover_instance_async(self, instance_id: str) -> None:
@@ -1798,7 +2160,7 @@ class TmuxInstanceManager:
         try:
             await self._initialize_tmux_session_for_recovery(instance_id)
             instance["state"] = "idle"
-            self._save_state()
+            self._save_state(instance_id)
             logger.info(f"Successfully recovered instance {instance_id} ({instance.get('name')})")
 
             if self.logging_manager:
@@ -1813,7 +2175,7 @@ class TmuxInstanceManager:
         except Exception as e:
             instance["state"] = "error"
             instance["error_message"] = f"Recovery failed: {e}"
-            self._save_state()
+            self._save_state(instance_id)
             logger.error(f"Failed to recover instance {instance_id}: {e}", exc_info=True)
 
     def get_instance_status(self, instance_id: str | None = None) -> dict[str, Any]:
@@ -1828,10 +2190,10 @@ class TmuxInstanceManager:
         if instance_id:
             if instance_id not in self.instances:
                 raise ValueError(f"Instance {instance_id} not found")
-            return self.instances[instance_id].copy()
+            return public_record(self.instances[instance_id])
         else:
             return {
-                "instances": {iid: inst.copy() for iid, inst in self.instances.items()},
+                "instances": {iid: public_record(inst) for iid, inst in self.instances.items()},
                 "total_instances": len(self.instances),
                 "active_instances": len(
                     [
@@ -1843,6 +2205,39 @@ class TmuxInstanceManager:
                 "total_tokens_used": self.total_tokens_used,
             }
 
+    async def wait_for_descendants(
+        self,
+        root_id: str,
+        count: int,
+        timeout: float = DEFAULT_TEAM_READY_TIMEOUT,
+        *,
+        ready_states: tuple[str, ...] = READY_STATES,
+        on_progress: ProgressCallback | None = None,
+    ) -> TeamReadiness:
+        """Wait until ``count`` descendants of ``root_id`` are up, or ``timeout``.
+
+        Wakes on instance state changes, so it returns as soon as the team is
+        assembled. ``on_progress`` is called each time another member is up.
+        """
+        if root_id not in self.instances:
+            raise ValueError(f"Instance {root_id} not found")
+
+        def descendants() -> list[tuple[str, str]]:
+            index = self.hierarchy.sync(self.instances)
+            return [
+                (iid, self.instances[iid].get("state", "")) for iid in index.descendants(root_id)
+            ]
+
+        return await wait_for_team(
+            self.change_feed,
+            root_id,
+            descendants,
+            count,
+            timeout,
+            ready_states=ready_states,
+            on_progress=on_progress,
+        )
+
     def get_all_instances(self) -> dict[str, dict[str, Any]]:
         """
         Get all instances (required by MonitoringService).
@@ -1874,6 +2269,47 @@ class TmuxInstanceManager:
             logger.warning(f"Failed to get output for instance {instance_id}: {e}")
             return {"output": ""}
 
+    async def get_output_cursor(self, instance_id: str) -> PaneCursor | None:
+        """Where an instance's pane output ends now (used by MonitoringService).
+
+        A cheap ``display-message`` instead of a capture, so the monitor can
+        tell that nothing was written since its last check.
+        """
+        session = self.tmux_sessions.get(instance_id)
+        if instance_id not in self.instances or session is None:
+            return None
+        try:
+            pane = await self.tmux.first_pane(session)
+        except Exception:
+            return None
+        return await self._pane_cursor(pane)
+
+    async def get_output_since(
+        self, instance_id: str, cursor: PaneCursor | None, limit: int = 1000
+    ) -> dict[str, Any]:
+        """Output written since ``cursor`` (used by MonitoringService).
+
+        Captures the screen as it was at ``cursor`` plus everything after it,
+        at most ``limit`` lines. Without a usable cursor (first call, history
+        cleared or full) this is the last ``limit`` lines.
+
+        Returns:
+            Dict with 'output', and 'cursor' to pass to the next call
+        """
+        session = self.tmux_sessions.get(instance_id)
+        if instance_id not in self.instances or session is None:
+            return {"output": "", "cursor": None}
+        try:
+            pane = await self.tmux.first_pane(session)
+            now = await self._pane_cursor(pane)
+            start = cursor.capture_start(now) if cursor is not None and now is not None else None
+            start = -limit if start is None else max(start, -limit)
+            output = await self._capture_pane(pane, "-S", str(start))
+        except Exception as e:
+            logger.warning(f"Failed to get output for instance {instance_id}: {e}")
+            return {"output": "", "cursor": None}
+        return {"output": output, "cursor": now}
+
     # ------------------------------------------------------------------
     # Tmux session startup
     # ------------------------------------------------------------------
@@ -1898,6 +2334,10 @@ class TmuxInstanceManager:
             self.shared_state.manager_authkey
         ).decode("ascii")
 
+        # Replies travel over the reply bus, authenticated with the same key
+        if self.shared_state.reply_socket:
+            session_env["MADROX_REPLY_SOCKET"] = self.shared_state.reply_socket
+
         # SECURITY FIX (CWE-532): never log the authkey itself.
         logger.debug(
             f"Manager IPC credentials for tmux session ({location}), "
@@ -1905,18 +2345,17 @@ class TmuxInstanceManager:
         )
         return session_env
 
-    def _kill_existing_session(self, session_name: str) -> None:
+    async def _kill_existing_session(self, session_name: str) -> None:
         """Remove a stale tmux session with the same name, if any."""
         try:
-            existing = self.tmux_server.find_where({"session_name": session_name})
+            existing = await self.tmux.find_session(session_name)
             if existing:
-                existing.kill_session()
+                await self.tmux.kill_session(existing)
                 logger.debug(f"Killed existing session: {session_name}")
         except Exception as e:
             logger.debug(f"No existing session to clean up: {e}")
 
-    @staticmethod
-    def _export_session_env(session, pane, session_env: dict[str, str]) -> None:
+    async def _export_session_env(self, session, pane, session_env: dict[str, str]) -> None:
         """Make the IPC credentials visible to the shell and its children.
 
         tmux session variables are not exported into the shell automatically, so
@@ -1927,12 +2366,12 @@ class TmuxInstanceManager:
 
         for key, value in session_env.items():
             try:
-                session.set_environment(key, value)
+                await self.tmux.run("set-environment", session.set_environment, key, value)
             except Exception as e:
                 logger.warning(f"Failed to set environment variable {key}: {e}")
 
         for key, value in session_env.items():
-            pane.send_keys(f"export {key}={shlex.quote(value)}", enter=True)
+            await self.tmux.send_keys(pane, f"export {key}={shlex.quote(value)}", enter=True)
 
         logger.debug(f"Exported {len(session_env)} environment variables to shell")
 
@@ -1948,15 +2387,18 @@ class TmuxInstanceManager:
             True when a ready marker was seen before ``max_wait`` elapsed.
         """
         start = time.time()
+        control = self._control_for(pane)
+        seq = control.output_seq(pane.pane_id) if control else 0
+        output: str | None = None
 
         while time.time() - start < max_wait:
-            await asyncio.sleep(0.15)
-            output = "\n".join(pane.cmd("capture-pane", "-p").stdout)
+            output, seq = await self._next_pane_output(pane, 0.15, output, seq)
 
             if harness.is_trust_prompt(output):
-                pane.send_keys("1", enter=True)
+                await self.tmux.send_keys(pane, "1", enter=True)
                 logger.debug("Auto-accepted workspace trust prompt")
                 await asyncio.sleep(0.5)
+                output = None  # the answered dialog must not be matched again
                 continue
 
             if harness.is_ready_output(output):
@@ -1986,15 +2428,40 @@ class TmuxInstanceManager:
         """
         instance = self.instances[instance_id]
         harness = get_harness(instance.get("instance_type"))
+        pane, cli_ready = await self._launch_cli(instance, resume=resume)
+
+        if resume:
+            # Conversation context comes back with the resume flags — sending the
+            # bootstrap again would duplicate it.
+            logger.info(
+                f"Recovery: tmux session initialized for {harness.name} instance {instance_id}"
+            )
+            return
+
+        await self._bootstrap_instance(pane, instance, harness, cli_ready)
+        logger.info(f"Tmux session initialized for {harness.name} instance {instance_id}")
+
+    async def _launch_cli(self, instance: dict[str, Any], *, resume: bool) -> tuple[Any, bool]:
+        """Create the instance's tmux session and start the CLI in it.
+
+        The session is registered in ``tmux_sessions`` as soon as it exists.
+        Warm pool boots pass a record that is not (yet) in ``self.instances``.
+
+        Returns:
+            (pane, whether the CLI reported ready in time)
+        """
+        instance_id = instance["id"]
+        harness = get_harness(instance.get("instance_type"))
         session_name = f"madrox-{instance_id}"
         prefix = "Recovery: " if resume else ""
 
         logger.debug(f"{prefix}Creating tmux session: {session_name}")
-        self._kill_existing_session(session_name)
+        await self._unwatch_pane(instance_id)
+        await self._kill_existing_session(session_name)
 
         session_env = self._build_session_env()
         try:
-            session = self.tmux_server.new_session(
+            session = await self.tmux.new_session(
                 session_name=session_name,
                 window_name=harness.name,
                 start_directory=instance["workspace_dir"],
@@ -2002,14 +2469,33 @@ class TmuxInstanceManager:
                 y=50,
                 environment=session_env or None,
             )
+            # history-limit only applies to windows created after it is set,
+            # so the first window is swapped for one that keeps more scrollback
+            await self.tmux.server_cmd(
+                "set-option",
+                "-t",
+                session_name,
+                "history-limit",
+                str(PANE_HISTORY_LIMIT),
+                ";",
+                "new-window",
+                "-k",
+                "-t",
+                f"{session_name}:^",
+                "-n",
+                harness.name,
+                "-c",
+                instance["workspace_dir"],
+            )
         except Exception as e:
             logger.error(f"Failed to create tmux session: {e}")
             raise
 
         self.tmux_sessions[instance_id] = session
-        pane = session.windows[0].panes[0]
+        pane = await self.tmux.first_pane(session)
+        await self._watch_pane(instance_id, pane)
 
-        self._export_session_env(session, pane, session_env)
+        await self._export_session_env(session, pane, session_env)
 
         # MCP servers must be registered before the CLI starts; for Claude this
         # also records the config path consumed by the launch command.
@@ -2024,21 +2510,195 @@ class TmuxInstanceManager:
             else harness.build_launch_command(instance)
         )
         cmd = " ".join(cmd_parts)
-        pane.send_keys(cmd, enter=True)
-        logger.debug(f"{prefix}Started {harness.name} CLI in tmux session: {cmd}")
+        await self.tmux.send_keys(pane, cmd, enter=True)
+        logger.debug(
+            f"{prefix}Started {harness.name} CLI in tmux session: "
+            f"{redact_caller_token(cmd, instance.get('caller_token'))}"
+        )
 
-        cli_ready = await self._wait_for_cli_ready(pane, harness)
+        return pane, await self._wait_for_cli_ready(pane, harness)
 
-        if resume:
-            # Conversation context comes back with the resume flags — sending the
-            # bootstrap again would duplicate it.
-            logger.info(
-                f"Recovery: tmux session initialized for {harness.name} instance {instance_id}"
+    async def _start_instance_session(self, instance_id: str, warm: WarmSession | None) -> None:
+        """Bring a new instance up, in a claimed warm session when there is one."""
+        if warm is None:
+            await self._initialize_tmux_session(instance_id)
+        else:
+            await self._bind_warm_session(instance_id, warm)
+
+    # ------------------------------------------------------------------
+    # Warm pool
+    # ------------------------------------------------------------------
+    def _warm_launch(
+        self,
+        instance_type: str,
+        model: str | None,
+        bypass_isolation: bool,
+        sandbox_mode: str | None,
+        profile: str | None,
+        mcp_servers: Any,
+    ) -> tuple[PoolKey, dict[str, Any]]:
+        """Pool key and launch inputs for a spawn configuration."""
+        launch = {
+            "bypass_isolation": bypass_isolation,
+            "sandbox_mode": sandbox_mode,
+            "profile": profile,
+            "mcp_servers": self._normalize_mcp_servers(
+                {"mcp_servers": copy.deepcopy(mcp_servers or {})}
+            ),
+        }
+        return pool_key(instance_type, model, **launch), launch
+
+    async def _claim_warm_session(
+        self,
+        instance_type: str,
+        model: str | None,
+        bypass_isolation: bool,
+        sandbox_mode: str | None,
+        profile: str | None,
+        options: dict[str, Any],
+    ) -> WarmSession | None:
+        """Claim a live pooled session for this spawn and top the pool back up."""
+        if not self.warm_pool.enabled or options.get("use_worktree"):
+            return None
+
+        key, launch = self._warm_launch(
+            instance_type,
+            model,
+            bypass_isolation,
+            sandbox_mode,
+            profile,
+            options.get("mcp_servers"),
+        )
+        harness = get_harness(instance_type)
+        warm = None
+        while (candidate := self.warm_pool.claim(key)) is not None:
+            if await self._warm_session_alive(candidate, harness):
+                warm = candidate
+                break
+            logger.info(f"Discarding dead warm session {candidate.instance_id}")
+            await self._discard_warm_session(candidate)
+
+        self.warm_pool.record_claim(warm is not None)
+        self._refill_warm_pool(key, instance_type, model, launch)
+        return warm
+
+    async def prewarm(
+        self,
+        instance_type: str = "claude",
+        model: str | None = None,
+        *,
+        bypass_isolation: bool = True,
+        sandbox_mode: str | None = None,
+        profile: str | None = None,
+        mcp_servers: dict[str, Any] | None = None,
+    ) -> int:
+        """Start booting warm sessions for a spawn configuration, up to the pool size.
+
+        Call ahead of a burst of spawns (e.g. before building a team) so the
+        first spawns hit too. Returns without waiting for the boots.
+
+        Returns:
+            Number of sessions started booting
+        """
+        if not self.warm_pool.enabled:
+            return 0
+        harness = get_harness(instance_type)
+        model = resolve_model(harness.name, model)
+        key, launch = self._warm_launch(
+            harness.name, model, bypass_isolation, sandbox_mode, profile, mcp_servers
+        )
+        return self._refill_warm_pool(key, harness.name, model, launch)
+
+    def _refill_warm_pool(
+        self, key: PoolKey, instance_type: str, model: str | None, launch: dict[str, Any]
+    ) -> int:
+        """Boot sessions in the background until ``key`` reaches the pool size."""
+        started = 0
+        for _ in range(self.warm_pool.deficit(key)):
+            self.warm_pool.begin_boot(key)
+            task = asyncio.create_task(self._boot_warm_session(key, instance_type, model, launch))
+            self._warm_boot_tasks.add(task)
+            task.add_done_callback(self._warm_boot_tasks.discard)
+            started += 1
+        return started
+
+    async def _boot_warm_session(
+        self, key: PoolKey, instance_type: str, model: str | None, launch: dict[str, Any]
+    ) -> None:
+        """Launch an idle CLI under a reserved instance ID and add it to the pool."""
+        instance_id = str(uuid.uuid4())
+        workspace_dir = self.workspace_base / instance_id
+        record = {
+            "id": instance_id,
+            "instance_type": instance_type,
+            "model": model,
+            "workspace_dir": str(workspace_dir),
+            "caller_token": new_caller_token(instance_id),
+            **copy.deepcopy(launch),
+        }
+        try:
+            workspace_dir.mkdir(parents=True, exist_ok=True)
+            (workspace_dir / ".madrox_instance_id").write_text(instance_id)
+            pane, cli_ready = await self._launch_cli(record, resume=False)
+            if not cli_ready:
+                raise RuntimeError("CLI did not become ready")
+            self.warm_pool.put(
+                key,
+                WarmSession(
+                    instance_id=instance_id,
+                    workspace_dir=str(workspace_dir),
+                    caller_token=record["caller_token"],
+                    session=self.tmux_sessions[instance_id],
+                    pane=pane,
+                    mcp_servers=record["mcp_servers"],
+                    mcp_config_path=record.get("_mcp_config_path"),
+                ),
             )
-            return
+            logger.debug(f"Warm {instance_type} session {instance_id} ready")
+        except (Exception, asyncio.CancelledError) as e:
+            if not isinstance(e, asyncio.CancelledError):
+                logger.warning(f"Failed to boot warm {instance_type} session: {e}")
+            await self._kill_instance_session(instance_id)
+            shutil.rmtree(workspace_dir, ignore_errors=True)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        finally:
+            self.warm_pool.end_boot(key)
 
-        await self._bootstrap_instance(pane, instance, harness, cli_ready)
-        logger.info(f"Tmux session initialized for {harness.name} instance {instance_id}")
+    async def _warm_session_alive(self, warm: WarmSession, harness: type[Harness]) -> bool:
+        """Whether the pooled CLI is still up and showing its input prompt."""
+        try:
+            return harness.is_ready_output(await self._capture_pane(warm.pane))
+        except Exception:
+            return False
+
+    async def _discard_warm_session(self, warm: WarmSession) -> None:
+        """Kill a pooled session that will never be claimed and remove its workspace."""
+        self.warm_pool.discarded += 1
+        await self._kill_instance_session(warm.instance_id)
+        shutil.rmtree(warm.workspace_dir, ignore_errors=True)
+
+    async def _bind_warm_session(self, instance_id: str, warm: WarmSession) -> None:
+        """Turn a claimed warm session into the instance: identity, role, first prompt."""
+        instance = self.instances[instance_id]
+        harness = get_harness(instance.get("instance_type"))
+
+        await self._bootstrap_instance(warm.pane, instance, harness, cli_ready=True)
+        if harness.prompt_delivery == "cli_arg" and (prompt := instance.get("initial_prompt")):
+            # The CLI was launched before the prompt was known, so it cannot
+            # ride along as an argument; deliver it like a message
+            await self._send_multiline_message_to_pane(warm.pane, prompt, harness)
+
+        self.warm_pool.claim_latency.observe(time.monotonic() - warm.claimed_at)
+        logger.info(f"Bound warm {harness.name} session to instance {instance_id}")
+
+    async def _drain_warm_pool(self) -> None:
+        """Stop pending boots and kill every idle pooled session."""
+        for task in list(self._warm_boot_tasks):
+            task.cancel()
+        await asyncio.gather(*self._warm_boot_tasks, return_exceptions=True)
+        for warm in self.warm_pool.drain():
+            await self._discard_warm_session(warm)
 
     # ------------------------------------------------------------------
     # First-contact bootstrap
@@ -2084,13 +2744,13 @@ class TmuxInstanceManager:
         if role_instructions := self._pane_role_instructions(instance):
             bootstrap += f"\nYOUR ROLE AND INSTRUCTIONS:\n{role_instructions}\n"
 
-        await self._send_multiline_message_to_pane(pane, bootstrap)
+        await self._send_multiline_message_to_pane(pane, bootstrap, harness)
         logger.debug(f"Sent instance_id information to {harness.label} instance")
         await asyncio.sleep(2)  # Let the CLI process the briefing
 
         if initial_prompt := instance.get("initial_prompt"):
-            baseline = "\n".join(pane.cmd("capture-pane", "-p", "-S", "-").stdout)
-            pane.send_keys(initial_prompt, enter=True)
+            baseline = await self._capture_pane(pane, "-S", "-")
+            await self.tmux.send_keys(pane, initial_prompt, enter=True)
             logger.debug(f"Sent initial prompt to {harness.label} instance")
             await asyncio.sleep(2)
             # The backend can reject the request outright (unknown model, auth
@@ -2132,7 +2792,7 @@ class TmuxInstanceManager:
         deadline = time.monotonic() + max_wait
         while True:
             try:
-                output = "\n".join(pane.cmd("capture-pane", "-p", "-S", "-").stdout)
+                output = await self._capture_pane(pane, "-S", "-")
             except Exception as e:  # pragma: no cover - pane vanished mid-spawn
                 logger.debug(f"Could not capture pane for bootstrap error scan: {e}")
                 return
@@ -2293,29 +2953,115 @@ class TmuxInstanceManager:
             f"{bidirectional_instructions}"
         )
 
-    async def _send_multiline_message_to_pane(self, pane, message: str) -> None:
-        """Send multiline message to tmux pane without triggering paste detection.
+    async def _send_multiline_message_to_pane(
+        self, pane, message: str, harness: type[Harness] | None = None
+    ) -> None:
+        """Deliver a (possibly multiline) message to the CLI in a pane and submit it.
 
-        Uses line-by-line send_keys with C-j (newline without submit) and adaptive timing.
-        CRITICAL: Adds delay AFTER each send_keys call to prevent instant keystroke bursts.
-        The pacing yields to the event loop, so a long message to one instance
-        does not stall every other instance.
+        Harnesses that handle bracketed paste get the whole payload pasted from
+        a tmux buffer in two commands. Paste-sensitive harnesses — and callers
+        that do not name a harness — get the paced keystroke path, which is
+        also the fallback when the buffer cannot be loaded. Once the paste has
+        been issued, failures are raised instead: typing the message as well
+        could deliver it twice.
 
         Args:
             pane: libtmux pane object
             message: Message content (may contain newlines)
+            harness: Harness running in the pane
         """
         # Health check: verify Claude CLI is running (not at shell prompt)
         # Only check visible screen (not scroll buffer which contains export commands)
-        pane_lines = pane.cmd("capture-pane", "-p").stdout
-        visible_lines = pane_lines[-10:] if isinstance(pane_lines, list) else pane_lines
-        pane_content = (
-            "\n".join(visible_lines) if isinstance(visible_lines, list) else visible_lines
-        )
+        pane_content = "\n".join((await self._capture_pane(pane)).split("\n")[-10:])
         shell_indicators = ["zsh: ", "bash: "]
         if any(indicator in pane_content for indicator in shell_indicators):
             raise RuntimeError("Claude CLI has exited. Instance at shell prompt. Restart needed.")
 
+        harness_name = harness.name if harness else "unknown"
+        total_lines = message.count("\n") + 1
+        start = time.perf_counter()
+
+        if harness is not None and not harness.is_paste_sensitive():
+            try:
+                buffer_name = await self._load_paste_buffer(pane, message)
+            except Exception as e:
+                logger.warning(f"Loading paste buffer failed, typing message instead: {e}")
+                start = time.perf_counter()
+            else:
+                await self._paste_buffer_to_pane(pane, buffer_name)
+                elapsed = time.perf_counter() - start
+                self.delivery_stats.record(
+                    harness_name, "paste", len(message), total_lines, elapsed
+                )
+                logger.info(
+                    f"Sent message via bracketed paste: {len(message)} chars, "
+                    f"{total_lines} lines, {elapsed:.2f}s total"
+                )
+                return
+
+        await self._type_message_to_pane(pane, message)
+        self.delivery_stats.record(
+            harness_name, "keystrokes", len(message), total_lines, time.perf_counter() - start
+        )
+
+    async def _load_paste_buffer(self, pane, message: str) -> str:
+        """Stage the message in a new tmux buffer and return the buffer's name.
+
+        ``load-buffer`` reads from a file because a control-mode command must
+        fit on one line; the file is private to the user and removed at once.
+        Nothing has reached the pane if this raises.
+        """
+        buffer_name = f"madrox-{uuid.uuid4().hex[:12]}"
+        fd, path = tempfile.mkstemp(prefix="madrox-paste-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(message)
+
+            client = self._control_for(pane)
+            if client is not None:
+                await client.command("load-buffer", "-b", buffer_name, path)
+            else:
+                result = await self.tmux.server_cmd("load-buffer", "-b", buffer_name, path)
+                if result.stderr:
+                    raise RuntimeError("; ".join(result.stderr))
+        finally:
+            os.unlink(path)
+        return buffer_name
+
+    async def _paste_buffer_to_pane(self, pane, buffer_name: str) -> None:
+        """Bracketed-paste a staged buffer into the pane, then press Enter.
+
+        The text may be in the pane even when ``paste-buffer`` reports a
+        failure, so errors are raised rather than answered by resending it.
+        Only the Enter is retried.
+        """
+        client = self._control_for(pane)
+        if client is not None:
+            # -p wraps the text in bracketed-paste markers; -d frees the buffer
+            await client.command("paste-buffer", "-p", "-d", "-b", buffer_name, "-t", pane.pane_id)
+        else:
+            result = await self.tmux.pane_cmd(pane, "paste-buffer", "-p", "-d", "-b", buffer_name)
+            if result.stderr:
+                raise RuntimeError("; ".join(result.stderr))
+
+        for attempt in range(1, _PASTE_SUBMIT_ATTEMPTS + 1):
+            await asyncio.sleep(_PASTE_SUBMIT_DELAY_SECONDS)
+            try:
+                await self.tmux.send_keys(pane, "Enter", literal=False)
+                return
+            except Exception as e:
+                if attempt == _PASTE_SUBMIT_ATTEMPTS:
+                    raise
+                logger.warning(f"Submitting pasted message failed, pressing Enter again: {e}")
+
+    async def _type_message_to_pane(self, pane, message: str) -> None:
+        """Type a message line by line without triggering paste detection.
+
+        Uses line-by-line send_keys with C-j (newline without submit) and adaptive timing.
+        CRITICAL: Adds delay AFTER each send_keys call to prevent instant keystroke bursts.
+        The pacing yields to the event loop, so a long message to one instance
+        does not stall every other instance.
+        """
         message_size_kb = len(message) / 1024
         lines = message.split("\n")
         total_lines = len(lines)
@@ -2334,13 +3080,13 @@ class TmuxInstanceManager:
         for i, line in enumerate(lines):
             # Send the line content
             if line:  # Only send non-empty lines
-                pane.send_keys(line, enter=False, literal=True)
+                await self.tmux.send_keys(pane, line, enter=False, literal=True)
                 await asyncio.sleep(delay_per_keystroke)  # CRITICAL: Delay after line
                 keystroke_count += 1
 
             # Add newline between lines (not after last line)
             if i < total_lines - 1:
-                pane.send_keys("C-j", enter=False, literal=False)
+                await self.tmux.send_keys(pane, "C-j", enter=False, literal=False)
                 await asyncio.sleep(delay_per_keystroke)  # CRITICAL: Delay after C-j
                 keystroke_count += 1
 
@@ -2348,7 +3094,7 @@ class TmuxInstanceManager:
         await asyncio.sleep(0.05)
 
         # Send Enter keystroke
-        pane.send_keys("Enter", literal=False)
+        await self.tmux.send_keys(pane, "Enter", literal=False)
 
         total_time = keystroke_count * delay_per_keystroke
         logger.info(
@@ -2527,6 +3273,25 @@ class TmuxInstanceManager:
     # Interactive sessions use rich terminal UI which cannot be parsed as structured JSON.
     # For detailed output inspection, use get_tmux_pane_content() to capture raw terminal output.
 
+    @staticmethod
+    def _lines_after_baseline(output: str, initial_output: str | None) -> list[str]:
+        """Lines of ``output`` that follow the last three lines of ``initial_output``.
+
+        The tail of the baseline is matched in ``output`` to find where new
+        content starts, which also handles scrollback growth. Without a match
+        (or a baseline) every line is returned.
+        """
+        lines = output.split("\n")
+        if not initial_output:
+            return lines
+        initial_lines = initial_output.split("\n")
+        if len(initial_lines) >= 3:
+            anchor = initial_lines[-3:]
+            for i in range(len(lines) - 2):
+                if lines[i : i + 3] == anchor:
+                    return lines[i + 3 :]
+        return lines
+
     def _extract_response(
         self, full_output: str, initial_output: str, instance_id: str | None = None
     ) -> str:
@@ -2536,7 +3301,7 @@ class TmuxInstanceManager:
         terminal chrome to get the actual response text.
 
         Args:
-            full_output: Full scrollback after response
+            full_output: Pane output after the response (scrollback since the send)
             initial_output: Baseline captured before message was sent
             instance_id: Target instance ID for message history lookup
 
@@ -2544,18 +3309,7 @@ class TmuxInstanceManager:
             Cleaned response text
         """
         # Diff-based: only process lines added after the baseline
-        initial_lines = initial_output.split("\n")
-        full_lines = full_output.split("\n")
-
-        # Find where new content starts — match the tail of initial output
-        # in the full output to handle scrollback growth
-        new_lines = full_lines
-        if len(initial_lines) >= 3:
-            anchor = initial_lines[-3:]
-            for i in range(len(full_lines) - 2):
-                if full_lines[i : i + 3] == anchor:
-                    new_lines = full_lines[i + 3 :]
-                    break
+        new_lines = self._lines_after_baseline(full_output, initial_output)
 
         # Strip terminal chrome from new content only
         content_lines = []
@@ -2671,7 +3425,7 @@ class TmuxInstanceManager:
         false positives on legitimate model responses.
 
         Args:
-            output: Raw tmux pane content to scan (full scrollback capture).
+            output: Raw tmux pane content to scan (scrollback since the send).
             initial_output: Baseline captured before the message was sent; only
                 lines after this baseline are scanned. None scans everything.
 
@@ -2682,17 +3436,8 @@ class TmuxInstanceManager:
         if not output:
             return None
 
-        raw_lines = output.split("\n")
-
         # Restrict to lines added after the baseline, mirroring _extract_response.
-        if initial_output:
-            initial_lines = initial_output.split("\n")
-            if len(initial_lines) >= 3:
-                anchor = initial_lines[-3:]
-                for i in range(len(raw_lines) - 2):
-                    if raw_lines[i : i + 3] == anchor:
-                        raw_lines = raw_lines[i + 3 :]
-                        break
+        raw_lines = self._lines_after_baseline(output, initial_output)
 
         for idx, raw_line in enumerate(raw_lines):
             line = raw_line.strip()
@@ -2801,11 +3546,10 @@ class TmuxInstanceManager:
 
         try:
             session = self.tmux_sessions[instance_id]
-            window = session.windows[0]
-            pane = window.panes[0]
+            pane = await self.tmux.first_pane(session)
 
             # Check if pane is still active
-            pane_info = pane.cmd("display-message", "-p", "#{pane_active}")
+            pane_info = await self.tmux.pane_cmd(pane, "display-message", "-p", "#{pane_active}")
             is_active = pane_info.stdout[0].strip() == "1"
 
             if not is_active:
@@ -2817,7 +3561,7 @@ class TmuxInstanceManager:
                 }
 
             # Check if underlying process is alive
-            pane_pid_result = pane.cmd("display-message", "-p", "#{pane_pid}")
+            pane_pid_result = await self.tmux.pane_cmd(pane, "display-message", "-p", "#{pane_pid}")
             if not pane_pid_result.stdout:
                 return {
                     "healthy": False,
@@ -2896,50 +3640,12 @@ class TmuxInstanceManager:
             logger.warning("Logging manager not initialized")
             return []
 
-        import json
-        from datetime import datetime
-
-        audit_dir = self.logging_manager.audit_dir
-        audit_logs = []
-
-        # Read audit files (newest first)
-        audit_files = sorted(audit_dir.glob("audit_*.jsonl"), reverse=True)
-
-        since_dt = datetime.fromisoformat(since) if since else None
-
-        for audit_file in audit_files:
-            try:
-                # Read all lines from the file in order (oldest first in file)
-                with audit_file.open("r") as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-
-                        try:
-                            log_entry = json.loads(line)
-
-                            # Filter by timestamp if specified (exclude logs at or before since timestamp)
-                            if since_dt:
-                                log_timestamp = datetime.fromisoformat(log_entry["timestamp"])
-                                if log_timestamp <= since_dt:
-                                    continue
-
-                            audit_logs.append(log_entry)
-
-                            if len(audit_logs) >= limit:
-                                break
-                        except json.JSONDecodeError:
-                            continue
-
-                if len(audit_logs) >= limit:
-                    break
-            except Exception as e:
-                logger.error(f"Failed to read audit file {audit_file}: {e}")
-                continue
-
-        # Return in chronological order (oldest first)
-        # Frontend will reverse when displaying
-        return audit_logs[-limit:] if audit_logs else []
+        # Indexed: only lines appended since the last query are parsed.
+        # Chronological order (oldest first); the frontend reverses it.
+        # Without ``since`` the newest ``limit`` entries are returned.
+        index = AuditIndex.for_directory(self.logging_manager.audit_dir)
+        result = await asyncio.to_thread(index.query, since=since, limit=limit, tail=since is None)
+        return result.entries
 
     async def health_check(self):
         """Perform health check on all instances."""
@@ -3001,16 +3707,15 @@ class TmuxInstanceManager:
             if not session:
                 raise RuntimeError(f"No tmux session found for instance {instance_id}")
 
-            window = session.windows[0]
-            pane = window.panes[0]
+            pane = await self.tmux.first_pane(session)
 
             # Capture pane content with specified number of lines
             if lines == -1:
                 # Capture all visible content
-                output = "\n".join(pane.cmd("capture-pane", "-p").stdout)
+                output = await self._capture_pane(pane)
             else:
                 # Capture specified number of lines from the end
-                output = "\n".join(pane.cmd("capture-pane", "-p", "-S", f"-{lines}").stdout)
+                output = await self._capture_pane(pane, "-S", f"-{lines}")
 
             return output
         except Exception as e:
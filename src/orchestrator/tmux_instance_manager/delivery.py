@@ -0,0 +1,62 @@
+"""Throughput accounting for message delivery into tmux panes.
+
+Messages reach a CLI in one of two ways:
+
+* ``paste`` — the payload is staged in a tmux buffer (``load-buffer``) and
+  pasted with bracketed paste (``paste-buffer -p``). Two tmux commands no
+  matter how long the message is.
+* ``keystrokes`` — every line is typed with ``send_keys`` and paced so the CLI
+  does not mistake it for a paste. Only used for harnesses flagged
+  ``paste_sensitive`` and as the fallback when pasting fails.
+
+``DeliveryStats`` keeps per-harness, per-mode totals so the cost of each path
+is visible on ``/health``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+DeliveryMode = Literal["paste", "keystrokes"]
+
+
+@dataclass
+class _ModeTotals:
+    messages: int = 0
+    bytes: int = 0
+    lines: int = 0
+    seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "messages": self.messages,
+            "bytes": self.bytes,
+            "lines": self.lines,
+            "seconds": round(self.seconds, 3),
+            "avg_ms": round(self.seconds * 1000 / self.messages, 1) if self.messages else 0.0,
+            "bytes_per_second": round(self.bytes / self.seconds) if self.seconds else 0,
+        }
+
+
+class DeliveryStats:
+    """Per-harness delivery throughput, split by delivery mode."""
+
+    def __init__(self) -> None:
+        self._totals: dict[str, dict[str, _ModeTotals]] = {}
+
+    def record(
+        self, harness: str, mode: DeliveryMode, size: int, lines: int, seconds: float
+    ) -> None:
+        totals = self._totals.setdefault(harness, {}).setdefault(mode, _ModeTotals())
+        totals.messages += 1
+        totals.bytes += size
+        totals.lines += lines
+        totals.seconds += seconds
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, float | int]]]:
+        """``{harness: {mode: totals}}`` with derived averages, JSON-ready."""
+        return {
+            harness: {mode: totals.as_dict() for mode, totals in modes.items()}
+            for harness, modes in self._totals.items()
+        }
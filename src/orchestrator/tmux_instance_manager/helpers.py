@@ -1,5 +1,9 @@
 """Shared helpers and constants for TmuxInstanceManager."""
 
+from __future__ import annotations
+
+from dataclasses import dataclass
+
 # SECURITY FIX (CWE-770): Message history limits to prevent unbounded memory growth
 MAX_MESSAGE_HISTORY_PER_INSTANCE = 500  # Keep last 500 messages per instance
 
@@ -19,3 +23,34 @@ def redact_authkey(authkey: bytes | None) -> str:
     # Show last 4 bytes as hex
     last_bytes = authkey[-4:] if len(authkey) >= 4 else authkey
     return f"***{last_bytes.hex()}"
+
+
+@dataclass(frozen=True)
+class PaneCursor:
+    """Where a pane's output ended at one point in time.
+
+    tmux numbers the lines of a pane's history + screen from the oldest
+    history line, so ``history_size`` is the absolute index of the top screen
+    line. Comparing it with a later reading tells how far that line has since
+    scrolled into history — the offset to hand to ``capture-pane -S`` to
+    capture only what came after.
+    """
+
+    history_size: int
+    cursor_y: int
+    history_limit: int
+
+    @property
+    def history_full(self) -> bool:
+        """True once tmux drops old lines, which breaks absolute numbering."""
+        return self.history_size >= self.history_limit
+
+    def capture_start(self, later: PaneCursor) -> int | None:
+        """``capture-pane -S`` offset of this reading's top screen line in ``later``.
+
+        Returns None when the numbering cannot be trusted: history was cleared
+        (it shrank) or hit its limit and started discarding lines.
+        """
+        if later.history_full or later.history_size < self.history_size:
+            return None
+        return self.history_size - later.history_size
@@ -0,0 +1,102 @@
+"""Parent -> children index over an instances mapping.
+
+Hierarchy queries used to find children by scanning every instance, and
+the tree view did that once per node: O(N²) for ``get_instance_tree``,
+and a full scan per level for cascade termination and ``/network/hierarchy``.
+
+``HierarchyIndex`` keeps the adjacency lists, plus each instance's depth
+and root, for one instances dict. Instance records are never deleted, only
+added, so new records are always the last keys in the dict. ``sync``
+therefore catches up by indexing only the keys added since it last ran. A
+replaced or shrunken mapping is reindexed from scratch. Termination does
+not change the index: callers filter on state, which they read from the
+record anyway.
+
+Each reader owns an index for the dict it reads (the tmux manager, the
+instance manager and the server each hold one) and calls ``sync`` before
+querying it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from itertools import islice
+from typing import Any
+
+
+class HierarchyIndex:
+    def __init__(self) -> None:
+        self._source: Mapping[str, dict[str, Any]] | None = None
+        self._size = 0
+        self._last_key: str | None = None
+        self._parent: dict[str, str | None] = {}
+        self._children: dict[str, list[str]] = {}
+        self._depth: dict[str, int] = {}
+        self._root: dict[str, str] = {}
+
+    def sync(self, instances: Mapping[str, dict[str, Any]]) -> HierarchyIndex:
+        """Bring the index up to date with ``instances`` and return it."""
+        size = len(instances)
+        if (
+            instances is not self._source
+            or size < self._size
+            or (self._last_key is not None and self._last_key not in instances)
+        ):
+            self._reset(instances)
+        if size > self._size:
+            added = list(islice(reversed(instances.keys()), size - self._size))
+            for instance_id in reversed(added):
+                self._add(instance_id, instances[instance_id].get("parent_instance_id"))
+            self._size = size
+            self._last_key = added[0]
+        return self
+
+    def children(self, parent_id: str) -> list[str]:
+        """Direct children of ``parent_id``, in spawn order."""
+        return list(self._children.get(parent_id, ()))
+
+    def parent(self, instance_id: str) -> str | None:
+        return self._parent.get(instance_id)
+
+    def depth(self, instance_id: str) -> int:
+        """0 for an instance with no (known) parent."""
+        return self._depth.get(instance_id, 0)
+
+    def root(self, instance_id: str) -> str:
+        return self._root.get(instance_id, instance_id)
+
+    def descendants(self, instance_id: str) -> Iterator[str]:
+        """Every instance below ``instance_id``, breadth first."""
+        seen = {instance_id}  # a corrupt record could make a parent cycle
+        level = self._children.get(instance_id, [])
+        while level:
+            level = [child for child in level if child not in seen]
+            seen.update(level)
+            yield from level
+            level = [child for parent in level for child in self._children.get(parent, ())]
+
+    def _reset(self, instances: Mapping[str, dict[str, Any]]) -> None:
+        self._source = instances
+        self._size = 0
+        self._last_key = None
+        self._parent.clear()
+        self._children.clear()
+        self._depth.clear()
+        self._root.clear()
+
+    def _add(self, instance_id: str, parent_id: str | None) -> None:
+        self._parent[instance_id] = parent_id
+        if parent_id:
+            self._children.setdefault(parent_id, []).append(instance_id)
+        if parent_id in self._parent:
+            self._depth[instance_id] = self._depth[parent_id] + 1
+            self._root[instance_id] = self._root[parent_id]
+        else:
+            # No parent, or one not indexed yet: a root until it shows up
+            self._depth[instance_id] = 0
+            self._root[instance_id] = instance_id
+        # Children indexed before this instance now hang below it
+        for descendant in self.descendants(instance_id):
+            parent = self._parent[descendant]
+            self._depth[descendant] = self._depth[parent] + 1  # type: ignore[index]
+            self._root[descendant] = self._root[instance_id]
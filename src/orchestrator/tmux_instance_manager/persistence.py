@@ -0,0 +1,144 @@
+"""Write-behind persistence of instance state.
+
+State transitions come in bursts: a single ``send_message`` marks the
+instance busy, then idle, then drains queued messages, and spawn/terminate
+storms touch many instances at once. Writing each transition straight to
+the ``StateStore`` serialises the same records over and over.
+
+``StatePersister`` records which instances changed and writes them at most
+once per flush interval. Marks that arrive while a flush is pending are
+folded into it. Callers that must not lose a transition (terminate,
+shutdown) call ``flush`` to write synchronously.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .async_tmux import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+#: Default upper bound on how long a change waits before it is written.
+DEFAULT_FLUSH_INTERVAL_MS = 250
+
+
+class StatePersister:
+    """Coalesces instance state writes and flushes them on a timer.
+
+    Usage::
+
+        persister = StatePersister(store, lambda: manager.instances, flush_interval_ms=250)
+        persister.mark_dirty("abc")   # schedules a flush within 250 ms
+        persister.mark_dirty()        # every instance
+        persister.flush()             # write now (terminate / shutdown)
+    """
+
+    def __init__(
+        self,
+        store: Any,
+        instances: Callable[[], dict[str, dict[str, Any]]],
+        flush_interval_ms: float = DEFAULT_FLUSH_INTERVAL_MS,
+    ):
+        self.store = store
+        self.instances = instances
+        self.flush_interval = max(0.0, flush_interval_ms / 1000)
+        self._dirty: set[str] = set()
+        self._all_dirty = False
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+        self.marks = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.records_written = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+    @property
+    def pending(self) -> bool:
+        return self._all_dirty or bool(self._dirty)
+
+    def mark_dirty(self, instance_id: str | None = None) -> None:
+        """Note that ``instance_id`` (or, with ``None``, every instance) changed.
+
+        Inside a running event loop the write is deferred to the next flush;
+        outside one (startup reconnection, tests) it happens immediately.
+        """
+        if self.store is None:
+            return
+        with self._lock:
+            self.marks += 1
+            if self.pending:
+                self.coalesced += 1
+            if instance_id is None:
+                self._all_dirty = True
+            else:
+                self._dirty.add(instance_id)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        if self._timer is None or self._timer_loop is not loop:
+            # A timer left on another (closed) loop would never fire
+            self._timer = loop.call_later(self.flush_interval, self._on_timer)
+            self._timer_loop = loop
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self.flush()
+
+    def flush(self) -> None:
+        """Write every pending change now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        with self._lock:
+            if not self.pending:
+                return
+            all_dirty, dirty = self._all_dirty, self._dirty
+            self._all_dirty, self._dirty = False, set()
+
+            start = time.perf_counter()
+            try:
+                instances = self.instances()
+                if all_dirty:
+                    self.store.save_all(instances)
+                    self.records_written += len(instances)
+                else:
+                    for instance_id in dirty:
+                        instance = instances.get(instance_id)
+                        if instance is None:
+                            self.store.remove_instance(instance_id)
+                        else:
+                            self.store.save_instance(instance)
+                    self.records_written += len(dirty)
+                self.flushes += 1
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Failed to persist instance state: {e}")
+            finally:
+                self.latency.observe(time.perf_counter() - start)
+
+    def close(self) -> None:
+        """Flush what is pending and stop scheduling."""
+        self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "flush_interval_ms": round(self.flush_interval * 1000),
+            "marks": self.marks,
+            "coalesced": self.coalesced,
+            "flushes": self.flushes,
+            "records_written": self.records_written,
+            "errors": self.errors,
+            "pending": self.pending,
+            "flush_latency": self.latency.as_dict(),
+        }
@@ -0,0 +1,145 @@
+"""Wait for a supervisor's team to come up.
+
+A template spawn starts the supervisor and returns while the supervisor is
+still spawning its team. Callers used to sleep a fixed 10-15 s before
+rendering the tree, which was too long for a team up in 3 s and too short
+for one still booting after a minute.
+
+``wait_for_team`` instead blocks until ``expected`` descendants of the
+supervisor are up, or a timeout passes. It re-checks on every batch from the
+instance change feed, so it returns as soon as the last member's state
+change is published. A slow periodic re-check covers state changes that
+never reach the feed. An instance counts as up once it has been seen idle or
+busy (a member that took its first task before we looked is up too), and
+stays counted unless it is terminated.
+"""
+
+from __future__ import annotations
+
+import inspect
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .change_feed import InstanceChangeFeed, ResyncRequired
+
+#: Instance states that mean a team member finished booting.
+READY_STATES = ("idle", "busy")
+
+#: How long a template spawn waits for the supervisor's team to come up.
+DEFAULT_TEAM_READY_TIMEOUT = 60.0
+
+#: Re-check interval for state changes that do not go through the feed.
+RECHECK_INTERVAL_SECONDS = 2.0
+
+ProgressCallback = Callable[["TeamReadiness"], Awaitable[None] | None]
+
+
+@dataclass
+class TeamReadiness:
+    """Where a team stands: who is up, who is still booting."""
+
+    root_id: str
+    expected: int
+    ready: list[str] = field(default_factory=list)
+    #: descendant ID -> state, for members not up yet
+    pending: dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def complete(self) -> bool:
+        return len(self.ready) >= self.expected
+
+    def summary(self) -> str:
+        text = f"{len(self.ready)}/{self.expected} ready after {self.elapsed:.1f}s"
+        if self.timed_out:
+            text += " (timed out)"
+        return text
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "root_id": self.root_id,
+            "expected": self.expected,
+            "ready": list(self.ready),
+            "pending": dict(self.pending),
+            "elapsed": round(self.elapsed, 3),
+            "timed_out": self.timed_out,
+            "complete": self.complete,
+        }
+
+
+def team_status(readiness: TeamReadiness | None) -> str:
+    """Status line for a template spawn result; None if nothing was waited on."""
+    if readiness is None:
+        return "Initializing"
+    members = f"{len(readiness.ready)}/{readiness.expected} team members up"
+    if readiness.complete:
+        return f"Ready ({members} in {readiness.elapsed:.1f}s)"
+    return f"Initializing ({members} after {readiness.elapsed:.0f}s)"
+
+
+async def wait_for_team(
+    feed: InstanceChangeFeed,
+    root_id: str,
+    descendants: Callable[[], Iterable[tuple[str, str]]],
+    expected: int,
+    timeout: float,
+    *,
+    ready_states: Iterable[str] = READY_STATES,
+    on_progress: ProgressCallback | None = None,
+    recheck_interval: float = RECHECK_INTERVAL_SECONDS,
+) -> TeamReadiness:
+    """Block until ``expected`` descendants of ``root_id`` are up, or ``timeout``.
+
+    Args:
+        feed: Change feed the manager publishes instance transitions to
+        root_id: The supervisor whose subtree is waited on
+        descendants: Returns ``(instance_id, state)`` for the current subtree
+        expected: Members that make the team complete
+        timeout: Seconds to wait at most
+        ready_states: States that count as up
+        on_progress: Called (or awaited) whenever the ready count changes
+
+    Returns:
+        The final ``TeamReadiness``; ``timed_out`` is set if the team was
+        still incomplete at the deadline.
+    """
+    ready_states = frozenset(ready_states)
+    start = time.monotonic()
+    deadline = start + timeout
+    seen_ready: dict[str, None] = {}
+    reported = -1
+    subscription = feed.subscribe()
+    try:
+        while True:
+            readiness = TeamReadiness(root_id, expected)
+            live = set()
+            for instance_id, state in descendants():
+                if state == "terminated":
+                    continue
+                live.add(instance_id)
+                if state in ready_states:
+                    seen_ready[instance_id] = None
+                elif instance_id not in seen_ready:
+                    readiness.pending[instance_id] = state
+            readiness.ready = [iid for iid in seen_ready if iid in live]
+            now = time.monotonic()
+            readiness.elapsed = now - start
+            readiness.timed_out = not readiness.complete and now >= deadline
+
+            if on_progress and (len(readiness.ready) != reported or readiness.timed_out):
+                reported = len(readiness.ready)
+                result = on_progress(readiness)
+                if inspect.isawaitable(result):
+                    await result
+            if readiness.complete or readiness.timed_out:
+                return readiness
+
+            try:
+                await subscription.next_batch(timeout=min(deadline - now, recheck_interval))
+            except ResyncRequired:
+                subscription.resync()
+    finally:
+        subscription.close()
@@ -0,0 +1,125 @@
+"""Pre-booted CLI sessions that ``spawn_instance`` can claim.
+
+A cold spawn creates a tmux session, writes the MCP config, launches the CLI
+and waits for it to come up: seconds per instance, paid one after another
+when a supervisor builds a team. With ``warm_pool_size`` set, the manager
+keeps that many sessions per launch configuration booted and idle. A spawn
+that matches one claims it, and only the per-instance part is left to do:
+the identity briefing, the role prompt and the initial prompt.
+
+Sessions are keyed by harness, model and a fingerprint of everything else
+the launch command and MCP config depend on (user MCP servers, autonomy
+flags, Codex sandbox and profile). Each pooled session reserves its instance
+ID when it boots, so its workspace, MCP config and caller token are already
+the ones the claimed instance uses. Spawns that need a git worktree cannot
+be served from the pool, because the worktree has to exist before the CLI
+starts in it.
+
+Pooled sessions are not instances: they are not listed, persisted or
+counted towards ``max_concurrent_instances``. A restart treats them as
+orphans and kills them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .async_tmux import LatencyHistogram
+
+#: (harness, model, launch fingerprint)
+PoolKey = tuple[str, str | None, str]
+
+
+def pool_key(instance_type: str, model: str | None, **launch: Any) -> PoolKey:
+    """Key for a launch configuration; ``launch`` holds every other launch input."""
+    encoded = json.dumps(launch, sort_keys=True, default=str).encode()
+    return (instance_type, model, hashlib.sha256(encoded).hexdigest()[:16])
+
+
+@dataclass
+class WarmSession:
+    """A booted, idle CLI session waiting to become an instance."""
+
+    instance_id: str
+    workspace_dir: str
+    caller_token: str
+    session: Any
+    pane: Any
+    #: MCP servers as configured, the madrox entry included
+    mcp_servers: dict[str, Any]
+    mcp_config_path: str | None = None
+    booted_at: float = field(default_factory=time.monotonic)
+    claimed_at: float = 0.0
+
+
+class WarmPool:
+    """Idle warm sessions per key, plus hit/miss and claim-latency counters."""
+
+    def __init__(self, size: int = 0):
+        self.size = max(0, size)
+        self._idle: dict[PoolKey, deque[WarmSession]] = {}
+        self._booting: dict[PoolKey, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+        self.claim_latency = LatencyHistogram()
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def claim(self, key: PoolKey) -> WarmSession | None:
+        """Take the oldest idle session for ``key``; None on a miss."""
+        idle = self._idle.get(key)
+        if not idle:
+            return None
+        warm = idle.popleft()
+        warm.claimed_at = time.monotonic()
+        return warm
+
+    def record_claim(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def put(self, key: PoolKey, warm: WarmSession) -> None:
+        self._idle.setdefault(key, deque()).append(warm)
+
+    def deficit(self, key: PoolKey) -> int:
+        """Sessions to boot for ``key`` to reach the pool size."""
+        return self.size - len(self._idle.get(key, ())) - self._booting.get(key, 0)
+
+    def begin_boot(self, key: PoolKey) -> None:
+        self._booting[key] = self._booting.get(key, 0) + 1
+
+    def end_boot(self, key: PoolKey) -> None:
+        self._booting[key] = max(0, self._booting.get(key, 0) - 1)
+
+    def drain(self) -> list[WarmSession]:
+        """Remove and return every idle session."""
+        drained = [warm for idle in self._idle.values() for warm in idle]
+        self._idle.clear()
+        return drained
+
+    def stats(self) -> dict[str, Any]:
+        claims = self.hits + self.misses
+        return {
+            "size": self.size,
+            "idle": sum(len(idle) for idle in self._idle.values()),
+            "booting": sum(self._booting.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / claims, 3) if claims else 0.0,
+            "discarded": self.discarded,
+            "claim_latency": self.claim_latency.as_dict(),
+            "keys": {
+                f"{harness}/{model or 'default'}/{fingerprint}": len(idle)
+                for (harness, model, fingerprint), idle in self._idle.items()
+            },
+        }
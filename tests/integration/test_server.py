@@ -8,6 +8,7 @@ from fastapi.testclient import TestClient
 
 from orchestrator.server import ClaudeOrchestratorServer
 from orchestrator.simple_models import OrchestratorConfig
+from orchestrator.tmux_instance_manager.change_feed import InstanceChangeFeed
 
 
 @pytest.fixture
@@ -41,6 +42,7 @@ def server(orchestrator_config, mock_env_vars):
                 mock_instance_manager = MagicMock()
                 mock_instance_manager.instances = {}
                 mock_instance_manager.mcp = MagicMock()
+                mock_instance_manager.tmux_manager.change_feed = InstanceChangeFeed()
                 mock_instance_manager._get_instance_status_internal = MagicMock(
                     return_value={"instances": {}, "total_instances": 0}
                 )
@@ -12,6 +12,8 @@ Tests cover:
 Phase 2: LLM Summarizer - Testing
 """
 
+import asyncio
+import json
 import os
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -128,7 +130,7 @@ async def test_summarize_with_valid_api_key(
         mock_session = AsyncMock()
         # Use regular Mock for post() since it returns a context manager, not a coroutine
         mock_session.post = Mock(return_value=mock_post)
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         # Call summarize_activity
         result = await summarizer.summarize_activity(
@@ -187,7 +189,7 @@ async def test_request_format_matches_openrouter_spec(
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.return_value = mock_post
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         await summarizer.summarize_activity(
             instance_id="test-instance", activity_text=sample_activity_text, max_tokens=150
@@ -292,7 +294,7 @@ async def test_api_timeout_returns_fallback(summarizer_with_api_key, sample_acti
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.side_effect = TimeoutError("API request timeout")
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         result = await summarizer.summarize_activity(
             instance_id="test-timeout", activity_text=sample_activity_text, max_tokens=200
@@ -322,7 +324,7 @@ async def test_connection_timeout_graceful_fallback(summarizer_with_api_key):
         mock_session.post.side_effect = aiohttp.ClientConnectorError(
             connection_key=None, os_error=TimeoutError("Connection timeout")
         )
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         result = await summarizer.summarize_activity(
             instance_id="test-conn-timeout", activity_text="Some text", max_tokens=100
@@ -360,7 +362,7 @@ async def test_api_401_unauthorized(summarizer_with_api_key, sample_activity_tex
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.return_value = mock_post
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         result = await summarizer.summarize_activity(
             instance_id="test-401", activity_text=sample_activity_text, max_tokens=200
@@ -393,7 +395,7 @@ async def test_api_403_forbidden(summarizer_with_api_key, sample_activity_text):
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.return_value = mock_post
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         result = await summarizer.summarize_activity(
             instance_id="test-403", activity_text=sample_activity_text, max_tokens=200
@@ -426,7 +428,7 @@ async def test_api_500_server_error(summarizer_with_api_key, sample_activity_tex
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.return_value = mock_post
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         result = await summarizer.summarize_activity(
             instance_id="test-500", activity_text=sample_activity_text, max_tokens=200
@@ -459,7 +461,7 @@ async def test_api_rate_limit_429(summarizer_with_api_key, sample_activity_text)
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.return_value = mock_post
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         result = await summarizer.summarize_activity(
             instance_id="test-429", activity_text=sample_activity_text, max_tokens=200
@@ -496,7 +498,7 @@ async def test_summarize_running_instance(summarizer_with_api_key):
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.return_value = mock_post
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         result = await summarizer.summarize_activity(
             instance_id="running-instance", activity_text=activity, max_tokens=150
@@ -528,7 +530,7 @@ async def test_summarize_idle_instance(summarizer_with_api_key):
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.return_value = mock_post
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         result = await summarizer.summarize_activity(
             instance_id="idle-instance", activity_text=activity, max_tokens=100
@@ -564,7 +566,7 @@ async def test_summarize_busy_instance_long_output(summarizer_with_api_key, long
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.return_value = mock_post
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         result = await summarizer.summarize_activity(
             instance_id="busy-instance", activity_text=long_activity_text, max_tokens=250
@@ -609,7 +611,7 @@ async def test_no_exceptions_on_network_error(summarizer_with_api_key):
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.side_effect = aiohttp.ClientError("Network error")
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         try:
             result = await summarizer.summarize_activity(
@@ -643,7 +645,7 @@ async def test_no_exceptions_on_json_decode_error(summarizer_with_api_key):
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.return_value = mock_post
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         try:
             result = await summarizer.summarize_activity(
@@ -678,7 +680,7 @@ async def test_no_exceptions_on_unexpected_response_format(summarizer_with_api_k
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.return_value = mock_post
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         try:
             result = await summarizer.summarize_activity(
@@ -709,7 +711,7 @@ async def test_all_error_paths_return_strings(summarizer_with_api_key):
         with patch("aiohttp.ClientSession") as mock_session_class:
             mock_session = AsyncMock()
             mock_session.post.side_effect = error
-            mock_session_class.return_value.__aenter__.return_value = mock_session
+            mock_session_class.return_value = mock_session
 
             try:
                 result = await summarizer.summarize_activity(
@@ -753,7 +755,7 @@ async def test_multiple_calls_with_different_instances(summarizer_with_api_key):
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.return_value = mock_post
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         results = []
         for i in range(3):
@@ -794,7 +796,7 @@ async def test_max_tokens_parameter_passed_correctly(summarizer_with_api_key):
     with patch("aiohttp.ClientSession") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.post.return_value = mock_post
-        mock_session_class.return_value.__aenter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
         test_max_tokens = 300
         await summarizer.summarize_activity(
@@ -805,3 +807,279 @@ async def test_max_tokens_parameter_passed_correctly(summarizer_with_api_key):
         call_args = mock_session.post.call_args
         json_data = call_args[1]["json"]
         assert json_data["max_tokens"] == test_max_tokens
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(LLMSummarizer is None, reason="LLMSummarizer not yet implemented")
+async def test_prompt_with_previous_summary_asks_for_update(summarizer_with_api_key):
+    """With a previous summary, the prompt carries it plus only the new activity."""
+    prompt = summarizer_with_api_key._build_prompt(
+        "abc", "Ran the test suite", previous_summary="Writing the parser."
+    )
+
+    assert "Previous summary:\nWriting the parser." in prompt
+    assert "New activity since then:\nRan the test suite" in prompt
+    assert "Previous summary" not in summarizer_with_api_key._build_prompt("abc", "x")
+
+
+# ============================================================================
+# Test: Pooled Session and Limits (local stub server)
+# ============================================================================
+
+
+class StubOpenRouter:
+    """Local chat-completions endpoint recording connections and concurrency."""
+
+    def __init__(self, delay: float = 0.05, rate_limit_first: int = 0):
+        self.delay = delay
+        self.rate_limit_first = rate_limit_first
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.peers: set = set()
+        self.prompts: list[str] = []
+        self.reply = lambda prompt: "stub summary"
+        self.fail_status: int | None = None
+
+    async def handle(self, request):
+        from aiohttp import web
+
+        self.requests += 1
+        self.prompts.append((await request.json())["messages"][0]["content"])
+        self.peers.add(request.transport.get_extra_info("peername"))
+        if self.requests <= self.rate_limit_first:
+            return web.Response(status=429, headers={"Retry-After": "0.2"}, text="slow down")
+        if self.fail_status is not None:
+            return web.Response(status=self.fail_status, text="upstream error")
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        content = self.reply(self.prompts[-1])
+        return web.json_response({"choices": [{"message": {"content": content}}]})
+
+
+@pytest.fixture
+async def stub_openrouter():
+    from aiohttp import web
+
+    stub = StubOpenRouter()
+    app = web.Application()
+    app.router.add_post("/api/v1/chat/completions", lambda request: stub.handle(request))
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    stub.url = f"http://127.0.0.1:{port}/api/v1/chat/completions"
+    yield stub
+    await runner.cleanup()
+
+
+def _stub_summarizer(stub, monkeypatch, **kwargs):
+    summarizer = LLMSummarizer(api_key="test-key", **kwargs)
+    # The endpoint allowlist only admits openrouter.ai over HTTPS
+    monkeypatch.setattr(summarizer, "_api_url", lambda: stub.url)
+    return summarizer
+
+
+@pytest.mark.asyncio
+async def test_session_reuses_connections_and_bounds_concurrency(stub_openrouter, monkeypatch):
+    summarizer = _stub_summarizer(
+        stub_openrouter, monkeypatch, max_concurrent=2, requests_per_second=0
+    )
+    try:
+        results = await asyncio.gather(
+            *(summarizer.summarize_activity(f"i{n}", "Working") for n in range(6))
+        )
+        await summarizer.summarize_activity("later", "Still working")
+    finally:
+        await summarizer.close()
+
+    assert results == ["stub summary"] * 6
+    assert stub_openrouter.requests == 7
+    assert stub_openrouter.peak_in_flight == 2
+    assert summarizer.peak_in_flight == 2
+    # Seven requests over at most two kept-alive connections
+    assert len(stub_openrouter.peers) <= 2
+
+
+@pytest.mark.asyncio
+async def test_429_waits_for_retry_after_then_retries(stub_openrouter, monkeypatch):
+    stub_openrouter.rate_limit_first = 1
+    summarizer = _stub_summarizer(stub_openrouter, monkeypatch)
+    loop = asyncio.get_running_loop()
+    try:
+        started = loop.time()
+        result = await summarizer.summarize_activity("i1", "Working")
+        elapsed = loop.time() - started
+    finally:
+        await summarizer.close()
+
+    assert result == "stub summary"
+    assert summarizer.stats()["rate_limited"] == 1
+    assert elapsed >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_429_gives_up_after_max_retries(stub_openrouter, monkeypatch):
+    from orchestrator.llm_summarizer import SummaryUnavailable
+
+    stub_openrouter.rate_limit_first = 99
+    summarizer = _stub_summarizer(stub_openrouter, monkeypatch, max_retries=1)
+    try:
+        result = await summarizer.summarize_activity("i1", "Working")
+    finally:
+        await summarizer.close()
+
+    assert stub_openrouter.requests == 2
+    assert summarizer.stats()["rate_limited"] == 1
+    assert isinstance(result, SummaryUnavailable)
+    assert result == "Instance i1: Summary unavailable (API error 429)"
+
+
+@pytest.mark.asyncio
+async def test_fallbacks_are_marked_unavailable(stub_openrouter, monkeypatch):
+    from orchestrator.llm_summarizer import SummaryUnavailable
+
+    summarizer = _stub_summarizer(stub_openrouter, monkeypatch)
+    try:
+        summary = await summarizer.summarize_activity("i1", "Working")
+        stub_openrouter.fail_status = 500
+        fallback = await summarizer.summarize_activity("i1", "Working")
+    finally:
+        await summarizer.close()
+    monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+    without_key = await LLMSummarizer().summarize_activity("i1", "Working")
+
+    assert not isinstance(summary, SummaryUnavailable)
+    assert isinstance(fallback, SummaryUnavailable)
+    assert fallback == "Instance i1: Summary unavailable (API error 500)"
+    assert isinstance(without_key, SummaryUnavailable)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests():
+    from orchestrator.llm_summarizer import TokenBucket, retry_after_seconds
+
+    bucket = TokenBucket(rate=20, burst=1)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for _ in range(5):
+        await bucket.acquire()
+    assert loop.time() - started >= 0.19  # first token banked, then 1/20 s each
+
+    assert retry_after_seconds("3") == 3.0
+    assert retry_after_seconds("3600") == 60.0
+    assert retry_after_seconds("garbage", default=2.0) == 2.0
+
+
+# ============================================================================
+# Test: Batch Mode
+# ============================================================================
+
+
+def _batch_reply(prompt: str) -> str:
+    """Answer a batched prompt for every instance in it, inside a code fence."""
+    import re
+
+    if "JSON object" not in prompt:
+        return "single summary"
+    ids = re.findall(r"=== Instance (\S+) ===", prompt)
+    return "```json\n" + json.dumps({iid: f"{iid} is busy" for iid in ids}) + "\n```"
+
+
+def _requests(n: int, **kwargs) -> list:
+    from orchestrator.llm_summarizer import SummaryRequest
+
+    return [SummaryRequest(f"i{k}", f"Running step {k}", **kwargs) for k in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_batch_packs_instances_into_one_request(stub_openrouter, monkeypatch):
+    stub_openrouter.reply = _batch_reply
+    summarizer = _stub_summarizer(stub_openrouter, monkeypatch, batch_size=8)
+    try:
+        summaries = await summarizer.summarize_batch(
+            _requests(3, previous_summary="Was reading the spec")
+        )
+    finally:
+        await summarizer.close()
+
+    assert summaries == {f"i{k}": f"i{k} is busy" for k in range(3)}
+    assert stub_openrouter.requests == 1
+    prompt = stub_openrouter.prompts[0]
+    assert prompt.count("Summarize each Claude instance") == 1
+    assert prompt.count("Previous summary:\nWas reading the spec") == 3
+    assert summarizer.stats()["batched_instances"] == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_falls_back_to_single_requests(stub_openrouter, monkeypatch):
+    stub_openrouter.reply = lambda prompt: (
+        '{"i0": "i0 is busy"}' if "JSON object" in prompt else "single summary"
+    )
+    summarizer = _stub_summarizer(stub_openrouter, monkeypatch, batch_size=8)
+    try:
+        summaries = await summarizer.summarize_batch(_requests(3))
+    finally:
+        await summarizer.close()
+
+    # i1 and i2 were missing from the reply and got a request each
+    assert summaries == {"i0": "i0 is busy", "i1": "single summary", "i2": "single summary"}
+    assert stub_openrouter.requests == 3
+    assert summarizer.stats()["batch_fallbacks"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [500, 429])
+async def test_failed_batch_request_is_not_resent_per_instance(
+    stub_openrouter, monkeypatch, status
+):
+    from orchestrator.llm_summarizer import SummaryUnavailable
+
+    if status == 429:
+        stub_openrouter.rate_limit_first = 99
+    else:
+        stub_openrouter.fail_status = status
+    summarizer = _stub_summarizer(stub_openrouter, monkeypatch, batch_size=8, max_retries=0)
+    try:
+        summaries = await summarizer.summarize_batch(_requests(3))
+    finally:
+        await summarizer.close()
+
+    assert stub_openrouter.requests == 1
+    assert summaries == {
+        f"i{k}": f"Instance i{k}: Summary unavailable (API error {status})" for k in range(3)
+    }
+    assert all(isinstance(summary, SummaryUnavailable) for summary in summaries.values())
+    assert summarizer.stats()["batch_fallbacks"] == 0
+
+
+def test_batches_respect_size_and_token_budget():
+    from orchestrator.llm_summarizer import SummaryRequest
+
+    summarizer = LLMSummarizer(api_key="test-key", batch_size=3, batch_token_budget=100)
+    small = [SummaryRequest(f"s{k}", "x" * 40) for k in range(4)]  # 11 tokens each
+    large = SummaryRequest("large", "x" * 360)  # 91 tokens
+
+    batches = summarizer._plan_batches([*small, large, *small[:1]])
+
+    assert [[r.instance_id for r in b] for b in batches] == [
+        ["s0", "s1", "s2"],
+        ["s3"],
+        ["large"],
+        ["s0"],
+    ]
+
+
+def test_parse_batch_summaries():
+    from orchestrator.llm_summarizer import parse_batch_summaries
+
+    assert parse_batch_summaries('Sure:\n{"a": " A ", "b": "", "c": 3}', ["a", "b", "c"]) == {
+        "a": "A"
+    }
+    assert parse_batch_summaries("not json {", ["a"]) == {}
+    assert parse_batch_summaries('["a"]', ["a"]) == {}
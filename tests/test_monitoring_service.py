@@ -8,6 +8,7 @@ import asyncio
 import json
 import shutil
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
@@ -37,7 +38,11 @@ class MockLLMSummarizer:
     """Mock LLMSummarizer for testing."""
 
     async def summarize_activity(
-        self, instance_id: str, activity_text: str, max_tokens: int = 200
+        self,
+        instance_id: str,
+        activity_text: str,
+        max_tokens: int = 200,
+        previous_summary: str | None = None,
     ) -> str:
         """Generate a mock summary."""
         return f"Summary for {instance_id}: Agent is working on tasks..."
@@ -107,6 +112,21 @@ async def test_monitoring_service_start_stop(monitoring_service):
     assert not monitoring_service.is_running()
 
 
+@pytest.mark.asyncio
+async def test_stop_closes_summarizer_session(monitoring_service, mock_llm_summarizer):
+    """Stopping the service releases the summarizer's pooled connections."""
+    closed = []
+
+    async def close():
+        closed.append(True)
+
+    mock_llm_summarizer.close = close
+    await monitoring_service.start()
+    await monitoring_service.stop()
+
+    assert closed == [True]
+
+
 @pytest.mark.asyncio
 async def test_monitoring_service_cannot_start_twice(monitoring_service):
     """Test that MonitoringService raises error if started twice."""
@@ -320,6 +340,375 @@ async def test_get_all_summaries(monitoring_service, temp_storage):
         assert "summary" in summary
 
 
+# ============================================================================
+# Change Gate Tests
+# ============================================================================
+
+
+class ChangingInstanceManager(MockInstanceManager):
+    """Instance manager whose output and pane cursor the test controls."""
+
+    def __init__(self, with_cursor: bool = True):
+        super().__init__()
+        self.output = "Booting\nReading files"
+        self.cursor: tuple[int, int] | None = (0, 2)
+        self.captures = 0
+        if not with_cursor:
+            self.get_output_cursor = None
+
+    async def get_instance_output(self, instance_id: str, limit: int = 1000):
+        self.captures += 1
+        return {"output": self.output}
+
+    async def get_output_cursor(self, instance_id: str):
+        return self.cursor
+
+
+class PaneInstanceManager(MockInstanceManager):
+    """Instance manager with a scrolling pane: a two-line screen over history."""
+
+    SCREEN = 2
+
+    def __init__(self):
+        super().__init__()
+        self.lines = ["Booting", "Reading files"]
+        self.captured: list[str] = []
+
+    async def get_output_since(self, instance_id, cursor, limit=1000):
+        start = 0 if cursor is None else max(0, cursor - self.SCREEN)
+        output = "\n".join(self.lines[start:])
+        self.captured.append(output)
+        return {"output": output, "cursor": len(self.lines)}
+
+
+class CountingSummarizer(MockLLMSummarizer):
+    def __init__(self):
+        self.calls: list[str] = []
+        self.contexts: list[str | None] = []
+
+    async def summarize_activity(
+        self, instance_id, activity_text, max_tokens=200, previous_summary=None
+    ):
+        self.calls.append(activity_text)
+        self.contexts.append(previous_summary)
+        return f"summary {len(self.calls)}"
+
+
+def _gated_service(temp_storage, manager, **kwargs):
+    from orchestrator.monitoring_service import MonitoringService
+
+    summarizer = CountingSummarizer()
+    service = MonitoringService(manager, summarizer, storage_path=temp_storage, **kwargs)
+    return service, summarizer
+
+
+@pytest.mark.asyncio
+async def test_unmoved_pane_is_not_captured(temp_storage):
+    manager = ChangingInstanceManager()
+    service, summarizer = _gated_service(temp_storage, manager)
+    instance = {"state": "idle"}
+
+    await service._process_instance("a", instance)
+    await service._process_instance("a", instance)
+
+    assert len(summarizer.calls) == 1
+    assert manager.captures == 1
+    assert service.stats()["skipped_unchanged"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pane_with_full_history_is_always_captured(temp_storage):
+    from orchestrator.tmux_instance_manager.helpers import PaneCursor
+
+    manager = ChangingInstanceManager()
+    manager.cursor = PaneCursor(history_size=2000, cursor_y=49, history_limit=2000)
+    service, summarizer = _gated_service(temp_storage, manager, min_new_chars=0)
+    instance = {"state": "idle"}
+
+    await service._process_instance("a", instance)
+    # New lines, but tmux trimmed history so the cursor reads the same
+    manager.output += "\nTests passed"
+    await service._process_instance("a", instance)
+
+    assert manager.captures == 2
+    assert summarizer.calls[-1] == "Tests passed"
+
+
+@pytest.mark.asyncio
+async def test_identical_output_is_not_summarized_without_cursor(temp_storage):
+    manager = ChangingInstanceManager(with_cursor=False)
+    service, summarizer = _gated_service(temp_storage, manager)
+
+    await service._process_instance("a", {"state": "idle"})
+    await service._process_instance("a", {"state": "idle"})
+    manager.output += "\nWriting tests for the parser module"
+    await service._process_instance("a", {"state": "busy"})
+
+    assert len(summarizer.calls) == 2
+    stats = service.stats()
+    assert (stats["summaries_generated"], stats["skipped_unchanged"]) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_small_changes_accumulate_until_threshold(temp_storage):
+    manager = ChangingInstanceManager()
+    service, summarizer = _gated_service(temp_storage, manager, min_new_lines=2, min_new_chars=0)
+
+    await service._process_instance("a", {"state": "busy"})
+    manager.output += "\nStep 1 done"
+    manager.cursor = (0, 3)
+    await service._process_instance("a", {"state": "busy"})
+    assert len(summarizer.calls) == 1
+    assert service.skipped_below_threshold == 1
+
+    # Counted against the last summary, not the last check
+    manager.output += "\nStep 2 done"
+    manager.cursor = (0, 4)
+    await service._process_instance("a", {"state": "busy"})
+    assert len(summarizer.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_redrawn_footer_is_not_new_output(temp_storage):
+    manager = ChangingInstanceManager(with_cursor=False)
+    manager.output = "Working on it\n> \n? for shortcuts"
+    service, summarizer = _gated_service(temp_storage, manager, min_new_chars=0)
+
+    await service._process_instance("a", {"state": "busy"})
+    manager.output = "Working on it\n  \n> \n? for shortcuts"  # blank line only
+    await service._process_instance("a", {"state": "busy"})
+
+    assert len(summarizer.calls) == 1
+    assert service.skipped_unchanged == 1
+
+
+@pytest.mark.asyncio
+async def test_deferred_change_is_summarized_once_stale(temp_storage):
+    manager = ChangingInstanceManager()
+    service, summarizer = _gated_service(temp_storage, manager, min_new_chars=1000)
+
+    await service._process_instance("a", {"state": "busy"})
+    manager.output += "\nok"
+    manager.cursor = (0, 3)
+    await service._process_instance("a", {"state": "busy"})
+    assert len(summarizer.calls) == 1
+
+    service._fingerprints["a"].summarized_at -= service.max_summary_age
+    await service._process_instance("a", {"state": "busy"})  # cursor unmoved since
+    assert len(summarizer.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_only_new_output_is_summarized_with_previous_summary(temp_storage):
+    manager = PaneInstanceManager()
+    service, summarizer = _gated_service(temp_storage, manager, min_new_chars=0)
+
+    await service._process_instance("a", {"state": "busy"})
+    manager.lines += [f"Editing module {i}" for i in range(50)]
+    await service._process_instance("a", {"state": "busy"})
+    manager.lines += ["Running tests", "All tests passed"]
+    await service._process_instance("a", {"state": "busy"})
+
+    assert summarizer.calls[0] == "Booting\nReading files"
+    assert summarizer.calls[2] == "Running tests\nAll tests passed"
+    assert summarizer.contexts == [None, "summary 1", "summary 2"]
+    # The last capture started at the screen shown at the previous summary
+    assert manager.captured[-1].splitlines()[0] == "Editing module 48"
+
+    latest = await service.get_summary("a")
+    assert latest["metadata"]["delta_length"] == len("Running tests\nAll tests passed")
+    assert latest["metadata"]["rolling_context"] is True
+
+
+@pytest.mark.asyncio
+async def test_fallback_summary_is_not_used_as_context(temp_storage):
+    from orchestrator.llm_summarizer import summary_unavailable
+
+    manager = PaneInstanceManager()
+    service, summarizer = _gated_service(temp_storage, manager, min_new_chars=0)
+    await service._process_instance("a", {"state": "busy"})
+    summarize = summarizer.summarize_activity
+
+    async def unavailable(instance_id, activity_text, max_tokens=200, previous_summary=None):
+        summarizer.contexts.append(previous_summary)
+        return summary_unavailable(instance_id, "network error")
+
+    summarizer.summarize_activity = unavailable
+    manager.lines.append("Step one finished")
+    await service._process_instance("a", {"state": "busy"})
+
+    assert service._fingerprints["a"].summary == "summary 1"
+    assert service.summaries_generated == 1
+    assert service._error_counts["a"] == 1
+
+    # The lines the fallback stood in for are summarized on the next poll
+    summarizer.summarize_activity = summarize
+    await service._process_instance("a", {"state": "busy"})
+
+    assert summarizer.calls[-1] == "Step one finished"
+    assert service._fingerprints["a"].summary == "summary 2"
+    assert "a" not in service._error_counts
+
+
+@pytest.mark.asyncio
+async def test_fallback_summary_recaptures_unmoved_pane(temp_storage):
+    from orchestrator.llm_summarizer import summary_unavailable
+
+    manager = ChangingInstanceManager()
+    service, summarizer = _gated_service(temp_storage, manager)
+    summarize = summarizer.summarize_activity
+
+    async def unavailable(instance_id, activity_text, max_tokens=200, previous_summary=None):
+        return summary_unavailable(instance_id, "API error 500")
+
+    summarizer.summarize_activity = unavailable
+    await service._process_instance("a", {"state": "idle"})
+    summarizer.summarize_activity = summarize
+    await service._process_instance("a", {"state": "idle"})
+
+    assert manager.captures == 2
+    assert summarizer.calls == ["Booting\nReading files"]
+    assert service.summaries_generated == 1
+
+
+@pytest.mark.asyncio
+async def test_inactive_instances_are_forgotten(temp_storage):
+    manager = ChangingInstanceManager()
+    service, _ = _gated_service(temp_storage, manager)
+    await service._process_instance("a", {"state": "idle"})
+
+    service._forget_inactive({})
+
+    assert not service._fingerprints and not service._checked_cursors
+
+
+class BatchingSummarizer(MockLLMSummarizer):
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    async def summarize_batch(self, requests, max_tokens=200):
+        self.batches.append([r.instance_id for r in requests])
+        return {r.instance_id: f"batched {r.instance_id}" for r in requests}
+
+
+@pytest.mark.asyncio
+async def test_loop_summarizes_changed_instances_in_one_batch(temp_storage, mock_instance_manager):
+    from orchestrator.monitoring_service import MonitoringService
+
+    summarizer = BatchingSummarizer()
+    service = MonitoringService(
+        mock_instance_manager, summarizer, poll_interval=60, storage_path=temp_storage
+    )
+    await service.start()
+    try:
+        for _ in range(100):
+            if service.summaries_generated == 2:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await service.stop()
+
+    # test-instance-3 is completed, so not monitored
+    assert summarizer.batches == [["test-instance-1", "test-instance-2"]]
+    summary = await service.get_summary("test-instance-2")
+    assert summary["summary"] == "batched test-instance-2"
+
+
+# ============================================================================
+# Adaptive Schedule Tests
+# ============================================================================
+
+
+def test_poll_scheduler_orders_by_due_time_and_drops_stale_entries():
+    from orchestrator.monitoring_service import InstanceCadence, PollScheduler
+
+    scheduler = PollScheduler()
+    cadences = {iid: InstanceCadence(12) for iid in ("a", "b", "c")}
+    scheduler.schedule("a", cadences["a"], 30)
+    scheduler.schedule("b", cadences["b"], 10)
+    scheduler.schedule("c", cadences["c"], 20)
+    scheduler.schedule("b", cadences["b"], 40)  # rescheduled: the entry at 10 is stale
+    scheduler.forget("c")
+
+    assert scheduler.next_due() == 30
+    assert scheduler.pop_due(35) == ["a"]
+    assert scheduler.pop_due(35) == []
+    assert scheduler.pop_due(40) == ["b"]
+
+
+def _scheduled_service(temp_storage, **kwargs):
+    from orchestrator.monitoring_service import MonitoringService
+
+    service = MonitoringService(
+        MockInstanceManager(), MockLLMSummarizer(), storage_path=temp_storage, **kwargs
+    )
+    service._sync_schedule({"a": {"state": "busy"}})
+    return service, service._scheduler.cadences["a"]
+
+
+def test_busy_instance_is_polled_more_often(temp_storage):
+    service, cadence = _scheduled_service(temp_storage, poll_interval=12, min_poll_interval=2)
+
+    for expected in (6, 3, 2, 2):
+        service._reschedule("a", "busy", new_chars=1000)
+        assert cadence.interval == expected
+
+    cadence.last_polled -= 10
+    service._reschedule("a", "busy", new_chars=100)  # 10 chars/s: back to normal
+    assert cadence.interval == 12
+
+
+def test_quiet_instance_backs_off_exponentially(temp_storage):
+    service, cadence = _scheduled_service(temp_storage, poll_interval=12, max_poll_interval=100)
+
+    intervals = []
+    for _ in range(5):
+        service._reschedule("a", "idle", new_chars=None)
+        intervals.append(cadence.interval)
+
+    # The first poll also saw busy -> idle, which polls again soon
+    assert intervals == [3, 24, 48, 96, 100]
+    assert cadence.quiet_polls == 4
+
+
+def test_state_change_brings_next_poll_forward(temp_storage):
+    service, cadence = _scheduled_service(temp_storage, max_poll_interval=300)
+    for _ in range(5):
+        service._reschedule("a", "busy", new_chars=None)
+    assert service._scheduler.pop_due(time.monotonic()) == []
+
+    service._sync_schedule({"a": {"state": "idle"}})
+
+    assert service._scheduler.pop_due(time.monotonic()) == ["a"]
+    service._reschedule("a", "idle", new_chars=None)
+    assert cadence.interval == service.min_poll_interval
+
+
+def test_error_backoff_delays_next_poll(temp_storage):
+    service, cadence = _scheduled_service(temp_storage, poll_interval=1, min_poll_interval=1)
+    for _ in range(5):
+        service._record_error("a")  # 32 s backoff
+
+    service._reschedule("a", "busy", new_chars=1000)
+
+    assert cadence.interval == 1
+    assert cadence.next_due - time.monotonic() > 30
+
+
+@pytest.mark.asyncio
+async def test_all_summaries_include_cadence(temp_storage):
+    service, _ = _scheduled_service(temp_storage)
+    await service._process_instance("a", {"state": "busy"})
+    service._reschedule("a", "busy", new_chars=40)
+
+    summaries = await service.get_all_summaries()
+
+    cadence = summaries["a"]["cadence"]
+    assert cadence["interval"] == 12
+    assert cadence["quiet_polls"] == 0
+    assert 0 < cadence["next_poll_in"] <= 12
+
+
 # ============================================================================
 # MCP Adapter Tests
 # ============================================================================
@@ -0,0 +1,83 @@
+"""Tests for the thread-pooled libtmux adapter."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from orchestrator.tmux_instance_manager.async_tmux import AsyncTmux, LatencyHistogram
+
+
+@pytest.fixture
+def tmux():
+    adapter = AsyncTmux(MagicMock(), max_workers=2)
+    yield adapter
+    adapter.shutdown()
+
+
+class TestLatencyHistogram:
+    def test_observations_land_in_one_bucket_each(self):
+        hist = LatencyHistogram()
+        hist.observe(0.0005)  # 0.5 ms
+        hist.observe(0.004)  # 4 ms
+        hist.observe(10.0)  # beyond the last bound
+
+        data = hist.as_dict()
+        assert data["count"] == 3
+        assert data["buckets"] == {"<=1ms": 1, "<=5ms": 1, ">5000ms": 1}
+        assert data["max_ms"] == 10000.0
+
+    def test_empty_histogram(self):
+        assert LatencyHistogram().as_dict() == {
+            "count": 0,
+            "avg_ms": 0.0,
+            "max_ms": 0.0,
+            "buckets": {},
+        }
+
+
+class TestAsyncTmux:
+    async def test_calls_run_off_the_event_loop_thread(self, tmux):
+        loop_thread = threading.get_ident()
+        seen = []
+
+        def blocking():
+            seen.append(threading.get_ident())
+            return "done"
+
+        assert await tmux.run("list-panes", blocking) == "done"
+        assert seen and seen[0] != loop_thread
+
+    async def test_latency_recorded_per_verb(self, tmux):
+        pane = MagicMock()
+        pane.cmd.return_value = MagicMock(stdout=["out"])
+
+        result = await tmux.pane_cmd(pane, "capture-pane", "-p")
+        await tmux.pane_cmd(pane, "capture-pane", "-p", "-S", "-")
+        await tmux.send_keys(pane, "Enter", literal=False)
+
+        assert result.stdout == ["out"]
+        pane.cmd.assert_called_with("capture-pane", "-p", "-S", "-")
+        pane.send_keys.assert_called_once_with("Enter", literal=False)
+        stats = tmux.stats()
+        assert stats["capture-pane"]["count"] == 2
+        assert stats["send-keys"]["count"] == 1
+
+    async def test_failed_call_is_still_timed(self, tmux):
+        session = MagicMock()
+        session.kill_session.side_effect = RuntimeError("gone")
+
+        with pytest.raises(RuntimeError):
+            await tmux.kill_session(session)
+        assert tmux.stats()["kill-session"]["count"] == 1
+
+    async def test_session_helpers_use_server(self, tmux):
+        await tmux.find_session("madrox-abc")
+        tmux.server.find_where.assert_called_once_with({"session_name": "madrox-abc"})
+
+        await tmux.new_session(session_name="madrox-abc", x=160, y=50)
+        tmux.server.new_session.assert_called_once_with(session_name="madrox-abc", x=160, y=50)
+
+    def test_sync_call_is_timed(self, tmux):
+        assert tmux.call("list-sessions", lambda: 42) == 42
+        assert tmux.stats()["list-sessions"]["count"] == 1
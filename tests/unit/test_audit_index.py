@@ -0,0 +1,117 @@
+"""Tests for the byte-offset audit log index."""
+
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+from orchestrator.audit_index import AuditIndex
+from orchestrator.instance_manager import InstanceManager
+from orchestrator.tmux_instance_manager import TmuxInstanceManager
+
+
+def _write(path, entries, mode="a"):
+    with path.open(mode) as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def _event(second: int, instance_id: str | None = "a", **extra):
+    entry = {"timestamp": f"2026-10-16T12:00:{second:02d}", "event_type": "instance_spawn"}
+    if instance_id is not None:
+        entry["instance_id"] = instance_id
+    entry.update(extra)
+    return entry
+
+
+class TestAuditIndex:
+    def test_since_is_exclusive_by_default(self, tmp_path):
+        _write(tmp_path / "audit_20261016.jsonl", [_event(s) for s in range(5)])
+        index = AuditIndex(tmp_path)
+
+        result = index.query(since="2026-10-16T12:00:02")
+        assert [e["timestamp"][-2:] for e in result.entries] == ["03", "04"]
+        assert result.total == 2
+
+        inclusive = index.query(since="2026-10-16T12:00:02", include_since=True)
+        assert inclusive.total == 3
+
+    def test_limit_takes_oldest_or_newest(self, tmp_path):
+        _write(tmp_path / "audit_20261015.jsonl", [_event(s) for s in range(0, 3)])
+        _write(tmp_path / "audit_20261016.jsonl", [_event(s) for s in range(3, 6)])
+        index = AuditIndex(tmp_path)
+
+        head = index.query(limit=4)
+        assert [e["timestamp"][-2:] for e in head.entries] == ["00", "01", "02", "03"]
+        tail = index.query(limit=4, tail=True)
+        assert [e["timestamp"][-2:] for e in tail.entries] == ["02", "03", "04", "05"]
+        assert head.total == tail.total == 6
+
+    def test_instance_filter_keeps_events_without_instance(self, tmp_path):
+        _write(
+            tmp_path / "audit_20261016.jsonl",
+            [_event(0, "a"), _event(1, "b"), _event(2, None), _event(3, "c"), _event(4, "a")],
+        )
+        result = AuditIndex(tmp_path).query(instance_ids={"a", "c"}, since="2026-10-16T12:00:00")
+        assert [e.get("instance_id") for e in result.entries] == [None, "c", "a"]
+
+    def test_follows_appends_and_partial_lines(self, tmp_path):
+        path = tmp_path / "audit_20261016.jsonl"
+        _write(path, [_event(0)])
+        index = AuditIndex(tmp_path)
+        assert index.query().total == 1
+
+        with path.open("a") as f:
+            f.write(json.dumps(_event(1)) + "\n" + json.dumps(_event(2))[:10])
+        assert index.query().total == 2
+
+        with path.open("a") as f:
+            f.write(json.dumps(_event(2))[10:] + "\n")
+        assert index.query().total == 3
+        assert index.lines_indexed == 3
+
+    def test_rotated_file_is_reindexed(self, tmp_path):
+        path = tmp_path / "audit_20261016.jsonl"
+        _write(path, [_event(s) for s in range(3)])
+        index = AuditIndex(tmp_path)
+        assert index.query().total == 3
+
+        os.rename(path, tmp_path / "audit_20261016.jsonl.2026-10-16")
+        _write(path, [_event(10)], mode="w")
+        result = index.query()
+        assert [e["timestamp"][-2:] for e in result.entries] == ["10"]
+        assert index.rebuilds == 1
+
+    def test_skips_lines_that_are_not_audit_records(self, tmp_path):
+        path = tmp_path / "audit_20261016.jsonl"
+        _write(path, [_event(0)])
+        with path.open("a") as f:
+            f.write("not json\n[1, 2]\n")
+        _write(path, [_event(1)])
+        assert AuditIndex(tmp_path).query().total == 2
+
+    def test_out_of_order_timestamps_are_filtered_exactly(self, tmp_path):
+        _write(tmp_path / "audit_20261016.jsonl", [_event(0), _event(5), _event(3), _event(6)])
+        result = AuditIndex(tmp_path).query(since="2026-10-16T12:00:04")
+        assert [e["timestamp"][-2:] for e in result.entries] == ["05", "06"]
+
+    def test_shared_per_directory(self, tmp_path):
+        assert AuditIndex.for_directory(tmp_path) is AuditIndex.for_directory(str(tmp_path))
+
+
+async def test_managers_return_newest_entries_without_since(tmp_path):
+    audit_dir = tmp_path / "audit"
+    audit_dir.mkdir()
+    _write(audit_dir / "audit_20261001.jsonl", [_event(s) for s in range(0, 3)])
+    _write(audit_dir / "audit_20261016.jsonl", [_event(s) for s in range(3, 6)])
+    with patch("orchestrator.tmux_instance_manager.core.libtmux.Server"):
+        tmux_manager = TmuxInstanceManager({"workspace_base_dir": str(tmp_path)})
+    tmux_manager.logging_manager = MagicMock(audit_dir=audit_dir)
+    instance_manager = InstanceManager.__new__(InstanceManager)
+    instance_manager.logging_manager = tmux_manager.logging_manager
+
+    for manager in (tmux_manager, instance_manager):
+        recent = await manager.get_audit_logs(limit=2)
+        assert [e["timestamp"][-2:] for e in recent] == ["04", "05"]
+
+        polled = await manager.get_audit_logs(since="2026-10-16T12:00:01", limit=2)
+        assert [e["timestamp"][-2:] for e in polled] == ["02", "03"]
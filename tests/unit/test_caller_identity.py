@@ -0,0 +1,74 @@
+"""Tests for per-instance MCP caller tokens."""
+
+import logging
+
+import pytest
+
+from orchestrator.caller_identity import (
+    CallerParamFilter,
+    new_caller_token,
+    public_record,
+    resolve_caller_token,
+)
+
+
+def test_issued_token_resolves_to_its_instance():
+    token = new_caller_token("inst-1")
+    instances = {"inst-1": {"state": "idle", "caller_token": token}}
+    assert token.startswith("inst-1.")
+    assert resolve_caller_token(token, instances) == "inst-1"
+
+
+def test_tokens_are_unique_per_issue():
+    assert new_caller_token("inst-1") != new_caller_token("inst-1")
+
+
+@pytest.mark.parametrize(
+    "token",
+    [None, "", "inst-1", "inst-1.", "inst-1.forged", "inst-2.s3cret"],
+)
+def test_unknown_or_forged_tokens_do_not_resolve(token):
+    instances = {"inst-1": {"state": "idle", "caller_token": "inst-1.s3cret"}}
+    assert resolve_caller_token(token, instances) is None
+
+
+def test_terminated_instance_token_does_not_resolve():
+    instances = {"inst-1": {"state": "terminated", "caller_token": "inst-1.s3cret"}}
+    assert resolve_caller_token("inst-1.s3cret", instances) is None
+
+
+def test_instance_without_token_does_not_resolve():
+    instances = {"inst-1": {"state": "idle"}}
+    assert resolve_caller_token("inst-1.s3cret", instances) is None
+
+
+def test_public_record_drops_the_token_only():
+    record = {"id": "inst-1", "state": "idle", "caller_token": "inst-1.s3cret"}
+    assert public_record(record) == {"id": "inst-1", "state": "idle"}
+    assert record["caller_token"] == "inst-1.s3cret"
+
+
+def test_public_record_masks_copies_of_the_token():
+    record = {
+        "caller_token": "inst-1.s3cret",
+        "mcp_servers": {
+            "madrox": {"url": "http://localhost:8001/mcp?caller=inst-1.s3cret"},
+            "other": {"args": ["--token", "inst-1.s3cret"]},
+        },
+    }
+    assert "s3cret" not in str(public_record(record))
+    assert "s3cret" in record["mcp_servers"]["madrox"]["url"]
+
+
+def test_access_log_filter_masks_the_caller_parameter():
+    record = logging.LogRecord(
+        "uvicorn.access",
+        logging.INFO,
+        __file__,
+        1,
+        '%s - "%s %s HTTP/%s" %d',
+        ("127.0.0.1:5000", "POST", "/mcp?caller=inst-1.s3cret&x=1", "1.1", 200),
+        None,
+    )
+    assert CallerParamFilter().filter(record)
+    assert record.getMessage() == '127.0.0.1:5000 - "POST /mcp?caller=***&x=1 HTTP/1.1" 200'
@@ -0,0 +1,103 @@
+"""Tests for the /ws/monitor instance change feed."""
+
+import asyncio
+
+import pytest
+
+from orchestrator.tmux_instance_manager.change_feed import (
+    InstanceChangeFeed,
+    ResyncRequired,
+)
+
+
+def _instance(state="idle", tokens=0, **extra):
+    record = {
+        "name": "worker",
+        "state": state,
+        "role": "general",
+        "created_at": "2026-10-16T12:00:00",
+        "total_tokens_used": tokens,
+    }
+    record.update(extra)
+    return record
+
+
+class TestInstanceChangeFeed:
+    def test_publishes_only_changed_fields(self):
+        feed = InstanceChangeFeed()
+        first = feed.publish("a", _instance())
+        assert first.op == "upsert" and first.fields["status"] == "idle"
+
+        assert feed.publish("a", _instance()) is None
+        change = feed.publish("a", _instance(state="busy", tokens=12))
+        assert change.seq == 2
+        assert change.fields == {"status": "busy", "totalTokens": 12}
+        assert feed.stats()["unchanged"] == 1
+
+    def test_terminated_instance_is_removed_once(self):
+        feed = InstanceChangeFeed()
+        feed.publish("a", _instance())
+        change = feed.publish("a", _instance(state="terminated"))
+        assert change.as_dict() == {"seq": 2, "id": "a", "op": "remove"}
+        assert feed.publish("a", None) is None
+        assert feed.publish("never-seen", _instance(state="terminated")) is None
+
+    async def test_subscriber_receives_batches_in_order(self):
+        feed = InstanceChangeFeed()
+        feed.publish("a", _instance())
+        sub = feed.subscribe()
+        kind, seq, views = sub.resync()
+        assert (kind, seq, [v["id"] for v in views]) == ("snapshot", 1, ["a"])
+
+        feed.publish("a", _instance(state="busy"))
+        feed.publish("b", _instance())
+        batch = await sub.next_batch(timeout=1)
+        assert [c.seq for c in batch] == [2, 3]
+        assert await sub.next_batch(timeout=0.01) == []
+
+    async def test_publish_wakes_waiting_subscriber(self):
+        feed = InstanceChangeFeed()
+        sub = feed.subscribe()
+        waiter = asyncio.create_task(sub.next_batch(timeout=5))
+        await asyncio.sleep(0)
+        feed.publish("a", _instance())
+        batch = await asyncio.wait_for(waiter, 1)
+        assert [c.instance_id for c in batch] == ["a"]
+
+    async def test_gap_resync_replays_backlog_or_snapshots(self):
+        feed = InstanceChangeFeed(backlog=2)
+        sub = feed.subscribe()
+        for tokens in range(1, 4):
+            feed.publish("a", _instance(tokens=tokens))
+
+        sub.request_resync(1)
+        with pytest.raises(ResyncRequired) as resync:
+            await sub.next_batch(timeout=1)
+        assert resync.value.since == 1
+        kind, seq, changes = sub.resync(1)
+        assert kind == "changes" and [c.seq for c in changes] == [2, 3] and seq == 3
+
+        # Change 1 has left the backlog
+        kind, _, views = sub.resync(0)
+        assert kind == "snapshot" and views[0]["totalTokens"] == 3
+
+    async def test_slow_subscriber_overflows_to_snapshot(self):
+        feed = InstanceChangeFeed(max_pending=2)
+        sub = feed.subscribe()
+        for tokens in range(5):
+            feed.publish("a", _instance(tokens=tokens))
+
+        with pytest.raises(ResyncRequired) as resync:
+            await sub.next_batch(timeout=1)
+        assert resync.value.since is None
+        assert feed.stats()["overflows"] == 1
+        kind, seq, _ = sub.resync()
+        assert kind == "snapshot" and seq == 5
+
+    async def test_closed_subscription_stops_receiving(self):
+        feed = InstanceChangeFeed()
+        sub = feed.subscribe()
+        sub.close()
+        feed.publish("a", _instance())
+        assert feed.stats()["subscribers"] == 0
+        assert await sub.next_batch(timeout=0.01) == []
@@ -257,3 +257,18 @@ class TestTerminalMarkers:
         assert ClaudeHarness.is_trust_prompt("Yes, I trust this folder\nNo, exit")
         assert not ClaudeHarness.is_trust_prompt("Yes, I trust this folder")
         assert CodexHarness.is_trust_prompt("Do you trust the contents?\n1. Yes\n2. No")
+
+
+class TestPasteSensitivity:
+    def test_defaults(self):
+        assert not ClaudeHarness.is_paste_sensitive()
+        assert not CodexHarness.is_paste_sensitive()
+        assert GrokHarness.is_paste_sensitive()
+
+    def test_config_overrides_default(self, monkeypatch, tmp_path):
+        config = tmp_path / "models.yaml"
+        config.write_text("grok:\n  paste_sensitive: false\nclaude:\n  paste_sensitive: true\n")
+        monkeypatch.setenv("MADROX_MODELS_CONFIG", str(config))
+        _load_model_config.cache_clear()
+        assert not GrokHarness.is_paste_sensitive()
+        assert ClaudeHarness.is_paste_sensitive()
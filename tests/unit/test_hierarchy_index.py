@@ -0,0 +1,65 @@
+"""Tests for the parent -> children hierarchy index."""
+
+from orchestrator.tmux_instance_manager.hierarchy_index import HierarchyIndex
+
+
+def _instances(*edges: tuple[str, str | None]) -> dict[str, dict]:
+    return {iid: {"parent_instance_id": parent, "state": "running"} for iid, parent in edges}
+
+
+def test_children_depth_and_root():
+    instances = _instances(("root", None), ("a", "root"), ("b", "root"), ("a1", "a"))
+    index = HierarchyIndex().sync(instances)
+
+    assert index.children("root") == ["a", "b"]
+    assert index.children("a1") == []
+    assert index.parent("a1") == "a"
+    assert [index.depth(i) for i in ("root", "a", "a1")] == [0, 1, 2]
+    assert index.root("a1") == "root"
+    assert list(index.descendants("root")) == ["a", "b", "a1"]
+
+
+def test_sync_indexes_only_new_instances():
+    instances = _instances(("root", None))
+    index = HierarchyIndex().sync(instances)
+
+    instances["child"] = {"parent_instance_id": "root"}
+    instances["grandchild"] = {"parent_instance_id": "child"}
+    index.sync(instances)
+
+    assert index.children("root") == ["child"]
+    assert index.root("grandchild") == "root"
+    assert index.depth("grandchild") == 2
+
+
+def test_replaced_mapping_is_reindexed():
+    index = HierarchyIndex().sync(_instances(("root", None), ("a", "root")))
+    index.sync(_instances(("other", None), ("b", "other")))
+
+    assert index.children("root") == []
+    assert index.children("other") == ["b"]
+
+
+def test_removed_instance_triggers_reindex():
+    instances = _instances(("root", None), ("a", "root"), ("b", "root"))
+    index = HierarchyIndex().sync(instances)
+
+    del instances["b"]
+    instances["c"] = {"parent_instance_id": "root"}
+    index.sync(instances)
+
+    assert index.children("root") == ["a", "c"]
+
+
+def test_child_indexed_before_its_parent_is_reattached():
+    # Shared metadata can list a child ahead of its parent
+    instances = _instances(("child", "parent"), ("grandchild", "child"), ("parent", None))
+    index = HierarchyIndex().sync(instances)
+
+    assert index.root("grandchild") == "parent"
+    assert index.depth("grandchild") == 2
+
+
+def test_parent_cycle_does_not_hang():
+    index = HierarchyIndex().sync(_instances(("a", "b"), ("b", "a")))
+    assert sorted(index.descendants("a")) == ["b"]
@@ -0,0 +1,91 @@
+"""Cold-start import guard for the STDIO proxy.
+
+Every Codex/Grok child imports ``orchestrator.mcp_server``. These tests run
+``python -X importtime`` in a fresh interpreter and fail if the proxy starts
+pulling in the backend again.
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import orchestrator
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+# The backend and its heavy dependencies; the proxy needs none of them.
+# (uvicorn is absent on purpose: fastmcp itself imports it.)
+FORBIDDEN = (
+    "libtmux",
+    "fastapi",
+    "orchestrator.instance_manager",
+    "orchestrator.tmux_instance_manager",
+    "orchestrator.logging_manager",
+    "orchestrator.server",
+)
+
+# Self time in microseconds, excluding stdlib and third-party imports.
+# Generous: the package __init__ and the proxy module take a few ms
+PACKAGE_BUDGET_US = 20_000
+PROXY_OWN_BUDGET_US = 50_000
+
+requires_proxy_deps = pytest.mark.skipif(
+    importlib.util.find_spec("fastmcp") is None or importlib.util.find_spec("httpx") is None,
+    reason="STDIO proxy dependencies not installed",
+)
+
+
+def _importtime(statement: str) -> dict[str, tuple[int, int]]:
+    """``{module: (self_us, cumulative_us)}`` for a fresh ``python -c statement``."""
+    pythonpath = os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")]))
+    env = {**os.environ, "PYTHONPATH": pythonpath}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def _imported(timings: dict, prefix: str) -> list[str]:
+    return [name for name in timings if name == prefix or name.startswith(prefix + ".")]
+
+
+class TestLazyPackage:
+    def test_importing_package_loads_no_submodules(self):
+        timings = _importtime("import orchestrator")
+        assert _imported(timings, "orchestrator") == ["orchestrator"]
+        assert timings["orchestrator"][0] < PACKAGE_BUDGET_US
+
+    def test_exports_resolve_on_access(self):
+        assert orchestrator.InstanceState.RUNNING == "running"
+        assert "InstanceManager" in dir(orchestrator)
+        with pytest.raises(AttributeError):
+            orchestrator.DoesNotExist  # noqa: B018
+
+
+@requires_proxy_deps
+class TestProxyColdStart:
+    def test_proxy_does_not_import_backend(self):
+        timings = _importtime("import orchestrator.mcp_server")
+        for prefix in FORBIDDEN:
+            assert not _imported(timings, prefix), f"STDIO proxy imports {prefix}"
+
+    def test_proxy_own_import_time(self):
+        timings = _importtime("import orchestrator.mcp_server")
+        own = sum(
+            self_us for name, (self_us, _) in timings.items() if name.startswith("orchestrator")
+        )
+        assert own < PROXY_OWN_BUDGET_US
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from orchestrator.instance_manager import InstanceManager
+from orchestrator.tmux_instance_manager.readiness import TeamReadiness
 
 
 @pytest.fixture
@@ -592,6 +593,9 @@ class TestTeamCoordination:
         instance_manager.spawn_instance = AsyncMock(
             side_effect=["supervisor-1", "backend-1", "frontend-1"]
         )
+        instance_manager.tmux_manager.wait_for_descendants = AsyncMock(
+            return_value=TeamReadiness("supervisor-1", 2, ready=["backend-1"], timed_out=True)
+        )
 
         with patch("pathlib.Path.exists", return_value=True):
             with patch("pathlib.Path.read_text", return_value=template_content):
@@ -603,6 +607,7 @@ class TestTeamCoordination:
                 assert (isinstance(result, str) and "Supervisor ID:" in result) or (
                     isinstance(result, dict) and ("supervisor_id" in result or "error" in result)
                 )
+                assert "Status: Initializing (1/2 team members up" in result
 
     @pytest.mark.asyncio
     async def test_coordinate_instances_sequential(self, instance_manager):
@@ -1380,6 +1385,30 @@ class TestStatusManagement:
         assert "instances" in result
         assert "total_instances" in result
 
+    def test_get_instance_status_hides_caller_token(self, instance_manager):
+        """Test that status views never carry an instance's caller token."""
+        # Setup
+        token = "inst-1.s3cret"
+        instance_manager.instances = {
+            "inst-1": {
+                "id": "inst-1",
+                "name": "Instance 1",
+                "state": "running",
+                "role": "worker",
+                "caller_token": token,
+            }
+        }
+
+        # Execute
+        single = instance_manager._get_instance_status_internal(instance_id="inst-1")
+        everything = instance_manager._get_instance_status_internal()
+
+        # Assert
+        assert "caller_token" not in single
+        assert "caller_token" not in everything["instances"]["inst-1"]
+        assert token not in json.dumps(everything, default=str)
+        assert instance_manager.instances["inst-1"]["caller_token"] == token
+
     @pytest.mark.asyncio
     async def test_get_live_instance_status(self, instance_manager):
         """Test getting live status with execution time."""
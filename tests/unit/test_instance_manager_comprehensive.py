@@ -9,6 +9,7 @@ import pytest
 
 from orchestrator.compat import UTC
 from orchestrator.instance_manager import InstanceManager
+from orchestrator.terminated_catalog import TerminatedCatalog
 
 
 @pytest.fixture
@@ -453,6 +454,29 @@ class TestTerminateInstance:
         with pytest.raises(ValueError, match="Unsupported instance type"):
             await instance_manager._terminate_instance_internal("unknown")
 
+    @pytest.mark.asyncio
+    async def test_terminate_multiple_instances_single_teardown(self, instance_manager):
+        """Known instances go to the tmux manager in one call; others fail up front."""
+        instance_manager.instances["a"] = {"id": "a", "instance_type": "claude"}
+        instance_manager.instances["b"] = {"id": "b", "instance_type": "claude"}
+        instance_manager.tmux_manager.instances.update(
+            a={"id": "a", "state": "terminated"}, b={"id": "b", "state": "busy"}
+        )
+        instance_manager.tmux_manager.terminate_instances = AsyncMock(
+            return_value={"a": True, "b": False}
+        )
+
+        result = await instance_manager.terminate_multiple_instances.fn(
+            instance_manager, instance_ids=["a", "b", "missing"], force=False
+        )
+
+        instance_manager.tmux_manager.terminate_instances.assert_awaited_once_with(
+            ["a", "b"], force=False
+        )
+        assert result["terminated"] == ["a"]
+        assert [f["instance_id"] for f in result["failed"]] == ["missing", "b"]
+        assert instance_manager.instances["a"]["state"] == "terminated"
+
 
 class TestInterruptInstance:
     """Test instance interruption."""
@@ -544,6 +568,27 @@ class TestGetChildren:
 
             assert len(children) == 1
 
+    def test_get_children_include_terminated_reads_catalog(self, instance_manager, tmp_path):
+        """Terminated children no longer in memory come from the catalog."""
+        catalog = TerminatedCatalog(tmp_path)
+        catalog.record({"id": "old", "parent_instance_id": "parent", "name": "Old"})
+        catalog.record({"id": "child-1", "parent_instance_id": "parent", "name": "Dup"})
+        instance_manager.tmux_manager.terminated_catalog = catalog
+        instance_manager.instances["parent"] = {"id": "parent"}
+        instance_manager.instances["child-1"] = {
+            "id": "child-1",
+            "parent_instance_id": "parent",
+            "state": "terminated",
+            "name": "Terminated",
+        }
+
+        children = instance_manager._get_children_internal("parent", include_terminated=True)
+
+        assert [c["id"] for c in children] == ["child-1", "old"]
+        assert children[1]["state"] == "terminated"
+        assert children[1]["name"] == "Old"
+        assert instance_manager._get_children_internal("parent") == []
+
 
 class TestGetInstanceTree:
     """Test instance tree building."""
@@ -770,21 +815,19 @@ class TestGetTmuxPaneContent:
         """Test capturing pane content."""
         instance_id = await instance_manager.spawn_instance(name="test", role="general")
 
-        # Mock tmux session
-        mock_pane = MagicMock()
-        mock_pane.cmd.return_value.stdout = ["Line 1", "Line 2", "Line 3"]
-        mock_window = MagicMock()
-        mock_window.panes = [mock_pane]
-        mock_session = MagicMock()
-        mock_session.windows = [mock_window]
-
-        instance_manager.tmux_manager.tmux_sessions[instance_id] = mock_session
+        # Capture runs on the tmux manager's executor
+        instance_manager.tmux_manager.get_tmux_pane_content = AsyncMock(
+            return_value="Line 1\nLine 2\nLine 3"
+        )
 
         result = await instance_manager.get_tmux_pane_content.fn(
             instance_manager, instance_id=instance_id, lines=100
         )
 
-        assert isinstance(result, str)
+        assert result == "Line 1\nLine 2\nLine 3"
+        instance_manager.tmux_manager.get_tmux_pane_content.assert_awaited_once_with(
+            instance_id, 100
+        )
 
     @pytest.mark.asyncio
     async def test_get_tmux_pane_content_not_found(self, instance_manager):
@@ -799,8 +842,9 @@ class TestGetTmuxPaneContent:
         """Test capturing when no tmux session exists."""
         instance_id = await instance_manager.spawn_instance(name="test", role="general")
 
-        # Clear tmux session
-        instance_manager.tmux_manager.tmux_sessions = {}
+        instance_manager.tmux_manager.get_tmux_pane_content = AsyncMock(
+            side_effect=RuntimeError(f"No tmux session found for instance {instance_id}")
+        )
 
         with pytest.raises(RuntimeError, match="No tmux session found"):
             await instance_manager.get_tmux_pane_content.fn(
@@ -1082,6 +1126,25 @@ class TestTemplateOperations:
         assert metadata["supervisor_role"] == "architect"
         assert "hours" in metadata["duration"]
 
+    @pytest.mark.parametrize(
+        ("template_name", "team_size"),
+        [
+            ("data_pipeline_team", 5),
+            ("research_analysis_team", 5),
+            ("security_audit_team", 7),
+            ("software_engineering_team", 6),
+        ],
+    )
+    def test_bundled_templates_parse_header_team_size(
+        self, instance_manager, template_name, team_size
+    ):
+        """Test that the header's team size wins over later variations."""
+        template = Path(__file__).parents[2] / "templates" / f"{template_name}.md"
+
+        metadata = instance_manager._parse_template_metadata(template.read_text())
+
+        assert metadata["team_size"] == team_size
+
     def test_extract_section(self, instance_manager):
         """Test extracting markdown sections."""
         content = """
@@ -0,0 +1,110 @@
+"""Tests for the per-client log stream broadcaster."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock
+
+from orchestrator.log_broadcaster import LogBroadcaster
+
+
+async def _drain():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def _blocked_client():
+    """A client whose sends hang until ``release`` is set."""
+    release = asyncio.Event()
+    websocket = AsyncMock()
+
+    async def send_text(payload):
+        await release.wait()
+
+    websocket.send_text.side_effect = send_text
+    return websocket, release
+
+
+class TestLogBroadcaster:
+    async def test_slow_client_does_not_delay_others(self):
+        broadcaster = LogBroadcaster()
+        slow, _ = _blocked_client()
+        fast = AsyncMock()
+        broadcaster.add_client(slow)
+        broadcaster.add_client(fast)
+
+        for n in range(3):
+            broadcaster.publish(f"m{n}")
+        await _drain()
+
+        assert [c.args[0] for c in fast.send_text.call_args_list] == ["m0", "m1", "m2"]
+        slow_stats = next(c for c in broadcaster.stats()["clients"] if c["sent"] == 0)
+        assert slow_stats["queued"] == 2  # m0 is in flight
+
+    async def test_drop_oldest_keeps_newest(self):
+        broadcaster = LogBroadcaster(max_queue=2)
+        websocket, release = _blocked_client()
+        stream = broadcaster.add_client(websocket)
+        await _drain()
+
+        for n in range(5):
+            broadcaster.publish(f"m{n}")
+        assert stream.dropped == 3
+        assert [payload for _, payload in stream._queue] == ["m3", "m4"]
+
+        release.set()
+        await _drain()
+        assert stream.stats()["queued"] == 0
+
+    async def test_drop_newest_keeps_oldest(self):
+        broadcaster = LogBroadcaster(max_queue=2, policy="drop_newest")
+        websocket, _ = _blocked_client()
+        stream = broadcaster.add_client(websocket)
+        await _drain()
+
+        for n in range(4):
+            broadcaster.publish(f"m{n}")
+        assert stream.dropped == 2
+        assert [payload for _, payload in stream._queue] == ["m0", "m1"]
+
+    async def test_disconnect_policy_closes_lagging_client(self):
+        broadcaster = LogBroadcaster(max_queue=1, policy="disconnect")
+        websocket, _ = _blocked_client()
+        stream = broadcaster.add_client(websocket)
+        await _drain()
+
+        broadcaster.publish("m0")
+        broadcaster.publish("m1")
+        await _drain()
+
+        assert stream.closed
+        assert websocket not in broadcaster.clients
+        websocket.close.assert_awaited_once()
+
+    async def test_failed_send_removes_client(self):
+        broadcaster = LogBroadcaster()
+        websocket = AsyncMock()
+        websocket.send_text.side_effect = RuntimeError("closed")
+        stream = broadcaster.add_client(websocket)
+
+        broadcaster.publish("m0")
+        await _drain()
+        assert stream.closed
+        assert broadcaster.clients == set()
+
+    async def test_publish_from_another_thread(self):
+        broadcaster = LogBroadcaster()
+        websocket = AsyncMock()
+        broadcaster.add_client(websocket)
+
+        thread = threading.Thread(target=broadcaster.publish, args=("m0",))
+        thread.start()
+        thread.join()
+        await _drain()
+        websocket.send_text.assert_awaited_once_with("m0")
+
+    async def test_add_client_is_idempotent(self):
+        broadcaster = LogBroadcaster()
+        websocket = AsyncMock()
+        assert broadcaster.add_client(websocket) is broadcaster.add_client(websocket)
+        broadcaster.remove_client(websocket)
+        assert broadcaster.clients == set()
@@ -1,10 +1,11 @@
 """Comprehensive unit tests for logging_manager module."""
 
+import asyncio
 import json
 import logging
 import tempfile
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -16,154 +17,108 @@ from orchestrator.logging_manager import (
 )
 
 
+def _record(name="test", msg="Test message", **extra):
+    record = logging.LogRecord(
+        name=name,
+        level=logging.INFO,
+        pathname="test.py",
+        lineno=1,
+        msg=msg,
+        args=(),
+        exc_info=None,
+    )
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+async def _drain():
+    # Let the per-client writer tasks run
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
 class TestWebSocketBroadcasting:
     """Test real-time log streaming via WebSocket."""
 
     @pytest.mark.asyncio
     async def test_broadcast_log_to_connected_clients(self):
-        """Test broadcasting log entry to all connected WebSocket clients."""
-        # Setup
+        """Each record is serialised once and sent as the same text to every client."""
         handler = LogStreamHandler(log_type="system_log")
         mock_ws1 = AsyncMock()
         mock_ws2 = AsyncMock()
-        handler.clients.add(mock_ws1)
-        handler.clients.add(mock_ws2)
-
-        log_entry = {
-            "timestamp": "2025-01-01T00:00:00",
-            "level": "INFO",
-            "message": "Test log message",
-        }
+        handler.add_client(mock_ws1)
+        handler.add_client(mock_ws2)
 
-        # Execute
-        await handler._broadcast(log_entry)
+        handler.emit(_record())
+        await _drain()
 
-        # Assert
-        expected_message = {"type": "system_log", "data": log_entry}
-        mock_ws1.send_json.assert_called_once_with(expected_message)
-        mock_ws2.send_json.assert_called_once_with(expected_message)
-        # Coverage: Lines 163-174
+        payload = mock_ws1.send_text.call_args.args[0]
+        mock_ws2.send_text.assert_called_once_with(payload)
+        message = json.loads(payload)
+        assert message["type"] == "system_log"
+        assert message["data"]["message"] == "Test message"
 
     @pytest.mark.asyncio
     async def test_broadcast_removes_disconnected_clients(self):
         """Test removal of disconnected WebSocket clients during broadcast."""
-        # Setup
         handler = LogStreamHandler(log_type="system_log")
         mock_ws_connected = AsyncMock()
         mock_ws_disconnected = AsyncMock()
-        mock_ws_disconnected.send_json.side_effect = Exception("Connection closed")
-
-        handler.clients.add(mock_ws_connected)
-        handler.clients.add(mock_ws_disconnected)
+        mock_ws_disconnected.send_text.side_effect = Exception("Connection closed")
+        handler.add_client(mock_ws_connected)
+        handler.add_client(mock_ws_disconnected)
 
-        log_entry = {"level": "INFO", "message": "test"}
-
-        # Execute
-        await handler._broadcast(log_entry)
+        handler.emit(_record())
+        await _drain()
 
-        # Assert
         assert mock_ws_connected in handler.clients
         assert mock_ws_disconnected not in handler.clients
         assert len(handler.clients) == 1
-        # Coverage: Lines 169-180
 
     @pytest.mark.asyncio
     async def test_broadcast_with_audit_log_type(self):
-        """Test broadcasting with audit_log type."""
-        # Setup
+        """Audit records carry event_type as action and other extras as metadata."""
         handler = LogStreamHandler(log_type="audit_log")
         mock_ws = AsyncMock()
-        handler.clients.add(mock_ws)
-
-        log_entry = {"event": "instance_spawned", "instance_id": "inst-1"}
+        handler.add_client(mock_ws)
 
-        # Execute
-        await handler._broadcast(log_entry)
+        handler.emit(_record("orchestrator.audit", event_type="instance_spawn", instance_id="i1"))
+        await _drain()
 
-        # Assert
-        expected_message = {"type": "audit_log", "data": log_entry}
-        mock_ws.send_json.assert_called_once_with(expected_message)
-        # Coverage: Lines 163-174
+        message = json.loads(mock_ws.send_text.call_args.args[0])
+        assert message["type"] == "audit_log"
+        assert message["data"]["action"] == "instance_spawn"
+        assert message["data"]["metadata"] == {"instance_id": "i1"}
 
-    def test_add_websocket_client(self):
+    @pytest.mark.asyncio
+    async def test_add_websocket_client(self):
         """Test adding WebSocket client to handler."""
-        # Setup
         handler = LogStreamHandler()
-        mock_ws = MagicMock()
+        mock_ws = AsyncMock()
 
-        # Execute
         handler.add_client(mock_ws)
 
-        # Assert
         assert mock_ws in handler.clients
-        # Coverage: Lines 41-43
 
-    def test_remove_websocket_client(self):
+    @pytest.mark.asyncio
+    async def test_remove_websocket_client(self):
         """Test removing WebSocket client from handler."""
-        # Setup
         handler = LogStreamHandler()
-        mock_ws = MagicMock()
+        mock_ws = AsyncMock()
         handler.add_client(mock_ws)
 
-        # Execute
         handler.remove_client(mock_ws)
 
-        # Assert
         assert mock_ws not in handler.clients
-        # Coverage: Lines 45-47
 
-    def test_emit_with_running_event_loop(self):
-        """Test emit creates broadcast task when event loop is running."""
-        # Setup
+    def test_emit_without_clients_does_not_serialise(self):
+        """Records are not formatted at all while nobody is listening."""
         handler = LogStreamHandler()
-        mock_ws = AsyncMock()
-        handler.add_client(mock_ws)
 
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
-
-        # Execute with mocked event loop
-        with patch("asyncio.get_event_loop") as mock_get_loop:
-            mock_loop = Mock()
-            mock_loop.is_running.return_value = True
-            mock_get_loop.return_value = mock_loop
-
-            with patch("asyncio.create_task") as mock_create_task:
-                handler.emit(record)
-                mock_create_task.assert_called_once()
-        # Coverage: Lines 150-157
-
-    def test_emit_without_event_loop(self):
-        """Test emit handles case when no event loop is running."""
-        # Setup
-        handler = LogStreamHandler()
-        mock_ws = AsyncMock()
-        handler.add_client(mock_ws)
-
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
-
-        # Execute with no event loop
-        with patch("asyncio.get_event_loop") as mock_get_loop:
-            mock_get_loop.side_effect = RuntimeError("No event loop")
-
-            # Should not raise exception
-            handler.emit(record)
-        # Coverage: Lines 155-157
+        with patch.object(handler, "_serialise") as mock_serialise:
+            handler.emit(_record())
+            mock_serialise.assert_not_called()
 
     def test_get_log_stream_handler_singleton(self):
         """Test that get_log_stream_handler returns singleton instance."""
@@ -211,14 +166,13 @@ class TestExtraFieldSerialization:
         record.task_id = "task-123"
         record.duration_ms = 1500
 
-        # Execute - emit creates log_entry with extra fields
-        with patch("asyncio.get_event_loop") as mock_get_loop:
-            mock_loop = Mock()
-            mock_loop.is_running.return_value = False
-            mock_get_loop.return_value = mock_loop
+        # Execute
+        data = json.loads(handler._serialise(record))["data"]
 
-            handler.emit(record)
-        # Coverage: Lines 115-146
+        # Assert
+        assert data["instance_id"] == "inst-1"
+        assert data["task_id"] == "task-123"
+        assert data["duration_ms"] == 1500
 
     def test_emit_audit_log_with_metadata(self):
         """Test audit log format includes metadata from extra fields."""
@@ -241,13 +195,11 @@ class TestExtraFieldSerialization:
         record.instance_name = "Test Instance"
 
         # Execute
-        with patch("asyncio.get_event_loop") as mock_get_loop:
-            mock_loop = Mock()
-            mock_loop.is_running.return_value = False
-            mock_get_loop.return_value = mock_loop
+        data = json.loads(handler._serialise(record))["data"]
 
-            handler.emit(record)
-        # Coverage: Lines 53-102
+        # Assert
+        assert data["action"] == "instance_spawned"
+        assert data["metadata"] == {"instance_id": "inst-1", "instance_name": "Test Instance"}
 
     def test_extra_field_non_serializable_converts_to_string(self):
         """Test that non-JSON-serializable extra fields are converted to string."""
@@ -273,13 +225,10 @@ class TestExtraFieldSerialization:
         record.custom_obj = NonSerializable()
 
         # Execute
-        with patch("asyncio.get_event_loop") as mock_get_loop:
-            mock_loop = Mock()
-            mock_loop.is_running.return_value = False
-            mock_get_loop.return_value = mock_loop
+        data = json.loads(handler._serialise(record))["data"]
 
-            handler.emit(record)
-        # Coverage: Lines 142-146, 98-99
+        # Assert
+        assert data["custom_obj"] == "custom_object_repr"
 
     def test_json_extra_filter_in_file_handler(self):
         """Test JsonExtraFilter adds extra fields to log records."""
@@ -18,6 +18,7 @@ from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
 from orchestrator.mcp_adapter import MCPAdapter
+from orchestrator.tmux_instance_manager.readiness import TeamReadiness
 
 # ============================================================================
 # FIXTURES
@@ -415,13 +416,14 @@ class TestBatchOperationsErrorHandling:
     ):
         """Test terminate_multiple_instances with some failures."""
 
-        async def mock_terminate(**kwargs):
-            instance_id = kwargs["instance_id"]
-            if instance_id == "inst-2":
-                return False  # Termination failed
-            return True
-
-        mock_instance_manager._terminate_instance_internal.side_effect = mock_terminate
+        mock_instance_manager._terminate_multiple_instances_internal = AsyncMock(
+            return_value={
+                "terminated": ["inst-1", "inst-3"],
+                "failed": [
+                    {"instance_id": "inst-2", "error": "Termination failed (try with force=true)"}
+                ],
+            }
+        )
 
         request = {
             "jsonrpc": "2.0",
@@ -447,6 +449,9 @@ class TestBatchOperationsErrorHandling:
         assert "Errors:" in text
         assert "inst-2" in text
         assert "force=true" in text.lower()
+        mock_instance_manager._terminate_multiple_instances_internal.assert_awaited_once_with(
+            ["inst-1", "inst-2", "inst-3"], force=False
+        )
 
     @pytest.mark.asyncio
     async def test_interrupt_multiple_instances_with_errors(
@@ -1058,6 +1063,11 @@ Use reply_to_caller for updates
         with patch("pathlib.Path.exists", return_value=True):
             with patch("pathlib.Path.read_text", return_value=template_content):
                 mock_instance_manager.spawn_instance.return_value = "supervisor-123"
+                mock_instance_manager.wait_for_team = AsyncMock(
+                    return_value=TeamReadiness(
+                        "supervisor-123", 4, ready=["a", "b", "c", "d"], elapsed=3.2
+                    )
+                )
 
                 request = {
                     "jsonrpc": "2.0",
@@ -1082,6 +1092,8 @@ Use reply_to_caller for updates
                 assert "supervisor-123" in text
                 assert "5 instances" in text
                 assert "2-4 hours" in text
+                assert "Ready (4/4 team members up in 3.2s)" in text
+                mock_instance_manager.wait_for_team.assert_awaited_once_with("supervisor-123", 5)
 
     @pytest.mark.asyncio
     async def test_spawn_team_from_template_not_found(self, async_client, mock_instance_manager):
@@ -1301,17 +1313,10 @@ class TestTmuxPaneContent:
     @pytest.mark.asyncio
     async def test_get_tmux_pane_content_success(self, async_client, mock_instance_manager):
         """Test get_tmux_pane_content retrieves pane output."""
-        mock_pane = MagicMock()
-        mock_pane.cmd.return_value = MagicMock(stdout=["Line 1", "Line 2", "Line 3"])
-
-        mock_window = MagicMock()
-        mock_window.panes = [mock_pane]
-
-        mock_session = MagicMock()
-        mock_session.windows = [mock_window]
-
         mock_instance_manager.instances["inst-123"] = {"state": "running"}
-        mock_instance_manager.tmux_manager.tmux_sessions = {"inst-123": mock_session}
+        mock_instance_manager.tmux_manager.get_tmux_pane_content = AsyncMock(
+            return_value="Line 1\nLine 2\nLine 3"
+        )
 
         request = {
             "jsonrpc": "2.0",
@@ -1337,17 +1342,10 @@ class TestTmuxPaneContent:
     @pytest.mark.asyncio
     async def test_get_tmux_pane_content_all_lines(self, async_client, mock_instance_manager):
         """Test get_tmux_pane_content with lines=-1 (all lines)."""
-        mock_pane = MagicMock()
-        mock_pane.cmd.return_value = MagicMock(stdout=["Full", "History"])
-
-        mock_window = MagicMock()
-        mock_window.panes = [mock_pane]
-
-        mock_session = MagicMock()
-        mock_session.windows = [mock_window]
-
         mock_instance_manager.instances["inst-123"] = {"state": "running"}
-        mock_instance_manager.tmux_manager.tmux_sessions = {"inst-123": mock_session}
+        mock_instance_manager.tmux_manager.get_tmux_pane_content = AsyncMock(
+            return_value="Full\nHistory"
+        )
 
         request = {
             "jsonrpc": "2.0",
@@ -1365,8 +1363,10 @@ class TestTmuxPaneContent:
         response = await async_client.post("/mcp/", json=request)
         assert response.status_code == 200
 
-        # Verify cmd was called without -S parameter
-        mock_pane.cmd.assert_called_with("capture-pane", "-p")
+        # Capture goes through the tmux manager, which owns the executor
+        mock_instance_manager.tmux_manager.get_tmux_pane_content.assert_awaited_once_with(
+            "inst-123", -1
+        )
 
 
 # ============================================================================
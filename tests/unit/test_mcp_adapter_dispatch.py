@@ -0,0 +1,140 @@
+"""Tests for the MCP adapter's tool registry, caller identity and tool stats."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import Request
+
+from orchestrator.mcp_adapter import MCPAdapter
+from orchestrator.mcp_adapter.dispatch import ToolRegistry, ToolStats, tools
+
+
+@pytest.fixture
+def manager():
+    manager = AsyncMock()
+    manager.instances = {}
+    manager._spawn_harness_instance = AsyncMock(return_value={"instance_id": "inst-123"})
+    manager._get_children_internal = MagicMock(return_value=[])
+    manager.get_and_clear_main_inbox = MagicMock(return_value=[])
+    return manager
+
+
+@pytest.fixture
+def adapter(manager):
+    return MCPAdapter(instance_manager=manager)
+
+
+def _jsonrpc(name: str, arguments: dict, caller_token: str | None = None) -> MagicMock:
+    request = MagicMock(spec=Request)
+    request.headers = {}
+    request.query_params = {"caller": caller_token} if caller_token else {}
+    request.json = AsyncMock(
+        return_value={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": name, "arguments": arguments},
+        }
+    )
+    return request
+
+
+async def _post(adapter: MCPAdapter, request) -> dict:
+    route = next(r for r in adapter.router.routes if r.path == "/mcp/")
+    response = await route.endpoint(request)
+    return json.loads(response.body)
+
+
+class TestRegistry:
+    def test_spawn_tools_are_registered_and_need_caller(self):
+        for name in MCPAdapter.SPAWN_TOOLS:
+            assert tools.get(name).needs_caller
+        assert tools.get("spawn_team_from_template").needs_caller
+
+    def test_read_only_tools_skip_caller_detection(self):
+        for name in ("get_children", "get_instance_status", "get_pending_replies"):
+            assert not tools.get(name).needs_caller
+
+    def test_duplicate_handler_is_rejected(self):
+        registry = ToolRegistry()
+        registry.handler("a")(AsyncMock())
+        with pytest.raises(ValueError, match="Duplicate"):
+            registry.handler("a")(AsyncMock())
+
+
+class TestCallTool:
+    async def test_unknown_tool(self, adapter):
+        result = await adapter.call_tool("no_such_tool", {})
+        assert result["error"]["code"] == -32601
+        assert adapter.tool_stats.snapshot() == {}
+
+    async def test_caller_not_detected_for_tools_without_parent(self, adapter):
+        with patch.object(adapter, "_detect_caller_instance") as detect:
+            await adapter.call_tool("get_children", {"parent_id": "p"})
+        detect.assert_not_called()
+
+    async def test_caller_injected_as_spawn_parent(self, adapter, manager):
+        with patch.object(adapter, "_detect_caller_instance", return_value="caller-1") as detect:
+            await adapter.call_tool("spawn_claude", {"name": "w"})
+        detect.assert_called_once()
+        assert manager._spawn_harness_instance.call_args.kwargs["parent_instance_id"] == "caller-1"
+
+    async def test_explicit_parent_skips_detection(self, adapter, manager):
+        with patch.object(adapter, "_detect_caller_instance") as detect:
+            await adapter.call_tool("spawn_claude", {"name": "w", "parent_instance_id": "p-1"})
+        detect.assert_not_called()
+        assert manager._spawn_harness_instance.call_args.kwargs["parent_instance_id"] == "p-1"
+
+    async def test_caller_resolved_from_token(self, adapter, manager):
+        manager.instances["caller-1"] = {"state": "busy", "caller_token": "caller-1.s3cret"}
+        manager.instances["busier-2"] = {"state": "busy", "last_activity": "9999"}
+
+        await _post(adapter, _jsonrpc("spawn_claude", {"name": "w"}, "caller-1.s3cret"))
+
+        assert manager._spawn_harness_instance.call_args.kwargs["parent_instance_id"] == "caller-1"
+        assert adapter.caller_stats.as_dict() == {"token": 1, "fallback": 0}
+
+    @pytest.mark.parametrize("token", [None, "caller-1.wrong", "unknown.s3cret"])
+    async def test_bad_token_falls_back_to_detection(self, adapter, manager, token):
+        manager.instances["caller-1"] = {"state": "idle", "caller_token": "caller-1.s3cret"}
+        with patch.object(adapter, "_detect_caller_instance", return_value="guess") as detect:
+            await _post(adapter, _jsonrpc("spawn_claude", {"name": "w"}, token))
+
+        detect.assert_called_once()
+        assert manager._spawn_harness_instance.call_args.kwargs["parent_instance_id"] == "guess"
+        assert adapter.caller_stats.as_dict() == {"token": 0, "fallback": 1}
+
+    async def test_jsonrpc_request_is_dispatched(self, adapter):
+        body = await _post(adapter, _jsonrpc("get_children", {"parent_id": "p"}))
+        assert body["result"]["content"][0]["text"].startswith("Found 0 children")
+
+    async def test_handler_exception_becomes_jsonrpc_error(self, adapter, manager):
+        manager._get_children_internal.side_effect = RuntimeError("boom")
+        body = await _post(adapter, _jsonrpc("get_children", {"parent_id": "p"}))
+        assert body["error"]["message"] == "boom"
+        assert adapter.tool_stats.snapshot()["get_children"]["errors"] == 1
+
+
+class TestToolStats:
+    async def test_calls_are_counted_per_tool(self, adapter):
+        await adapter.call_tool("get_children", {"parent_id": "p"})
+        await adapter.call_tool("get_children", {"parent_id": "p"})
+        await adapter.call_tool("get_main_instance_id", {})  # returns isError
+
+        stats = adapter.tool_stats.snapshot()
+        assert stats["get_children"]["count"] == 2
+        assert stats["get_children"]["errors"] == 0
+        assert stats["get_main_instance_id"]["errors"] == 1
+        assert stats["get_children"]["calls_per_minute"] > 0
+
+    def test_snapshot_ranks_tools_by_total_time(self):
+        stats = ToolStats()
+        stats.record("fast", 0.001, ok=True)
+        stats.record("fast", 0.001, ok=True)
+        stats.record("slow", 2.0, ok=False)
+
+        snapshot = stats.snapshot()
+        assert list(snapshot) == ["slow", "fast"]
+        assert snapshot["slow"]["total_seconds"] == 2.0
+        assert snapshot["slow"]["errors"] == 1
@@ -0,0 +1,157 @@
+"""Tests for the STDIO proxy's pooled client and tool schema cache."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from orchestrator.mcp_server import OrchestrationMCPServer, ToolSchemaCache
+
+PARENT = "http://parent.test"
+
+TOOLS = [
+    {
+        "name": "get_instance_status",
+        "description": "Get instance status",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"instance_id": {"type": "string"}},
+            "required": [],
+        },
+    }
+]
+
+
+class FakeParent:
+    """Serves /tools with an ETag and answers /tools/execute."""
+
+    def __init__(self, schema_hash="v1", tools=TOOLS):
+        self.schema_hash = schema_hash
+        self.tools = tools
+        self.requests: list[httpx.Request] = []
+        self.connected = True
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if not self.connected:
+            raise httpx.ConnectError("refused", request=request)
+        if request.url.path == "/tools":
+            etag = f'"{self.schema_hash}"'
+            if request.headers.get("if-none-match") == etag:
+                return httpx.Response(304, headers={"ETag": etag})
+            return httpx.Response(
+                200,
+                json={"tools": self.tools, "schema_hash": self.schema_hash},
+                headers={"ETag": etag},
+            )
+        return httpx.Response(200, json={"echo": request.read().decode()})
+
+
+def _proxy(parent: FakeParent, cache_dir) -> OrchestrationMCPServer:
+    server = OrchestrationMCPServer(parent_url=PARENT, schema_cache_dir=cache_dir)
+    server._client = httpx.AsyncClient(transport=httpx.MockTransport(parent.handler))
+    return server
+
+
+async def _tool_names(server: OrchestrationMCPServer) -> set[str]:
+    return set(await server.mcp.get_tools())
+
+
+class TestToolSchemaCache:
+    async def test_first_start_fetches_and_caches(self, tmp_path):
+        parent = FakeParent()
+        server = _proxy(parent, tmp_path)
+
+        await server._register_proxy_tools()
+
+        assert "get_instance_status" in await _tool_names(server)
+        assert "if-none-match" not in parent.requests[0].headers
+        assert server.schema_cache.load() == {"schema_hash": "v1", "tools": TOOLS}
+
+    async def test_restart_revalidates_cached_schemas(self, tmp_path):
+        parent = FakeParent()
+        await _proxy(parent, tmp_path)._register_proxy_tools()
+
+        server = _proxy(parent, tmp_path)
+        await server._register_proxy_tools()
+
+        assert parent.requests[-1].headers["if-none-match"] == '"v1"'
+        assert "get_instance_status" in await _tool_names(server)
+
+    async def test_changed_schema_hash_refreshes_cache(self, tmp_path):
+        parent = FakeParent()
+        await _proxy(parent, tmp_path)._register_proxy_tools()
+
+        renamed = [{**TOOLS[0], "name": "get_status_v2"}]
+        parent.schema_hash, parent.tools = "v2", renamed
+        server = _proxy(parent, tmp_path)
+        await server._register_proxy_tools()
+
+        assert "get_status_v2" in await _tool_names(server)
+        assert server.schema_cache.load()["schema_hash"] == "v2"
+
+    async def test_unreachable_parent_falls_back_to_cache_without_retrying(self, tmp_path):
+        parent = FakeParent()
+        await _proxy(parent, tmp_path)._register_proxy_tools()
+
+        parent.connected = False
+        parent.requests.clear()
+        server = _proxy(parent, tmp_path)
+        await server._register_proxy_tools()
+
+        assert len(parent.requests) == 1
+        assert "get_instance_status" in await _tool_names(server)
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        cache = ToolSchemaCache(PARENT, tmp_path)
+        cache.path.write_text("{not json")
+        assert cache.load() is None
+
+    def test_cache_is_keyed_by_parent_url(self, tmp_path):
+        assert (
+            ToolSchemaCache(PARENT, tmp_path).path
+            != ToolSchemaCache("http://other.test", tmp_path).path
+        )
+
+
+class TestPooledClient:
+    async def test_calls_share_one_client(self, tmp_path):
+        parent = FakeParent()
+        server = _proxy(parent, tmp_path)
+        client = server._get_client()
+
+        for _ in range(3):
+            result = await server._call_parent("get_instance_status", {"instance_id": "a"})
+            assert "get_instance_status" in result["echo"]
+
+        assert server._get_client() is client
+        await server.aclose()
+        assert server._client is None
+
+    @pytest.mark.parametrize("status", [404, 500])
+    async def test_parent_error_is_returned(self, tmp_path, status):
+        server = OrchestrationMCPServer(parent_url=PARENT, schema_cache_dir=tmp_path)
+        server._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(status, text="nope"))
+        )
+        result = await server._call_parent("get_instance_status", {})
+        assert result == {"error": "nope", "status_code": status}
+
+    async def test_caller_token_sent_with_every_call(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("MADROX_CALLER_TOKEN", "inst-1.s3cret")
+        server = OrchestrationMCPServer(parent_url=PARENT, schema_cache_dir=tmp_path)
+        assert server._get_client().headers["X-Madrox-Caller"] == "inst-1.s3cret"
+        await server.aclose()
+
+    @pytest.mark.parametrize("exists", [True, False])
+    def test_parent_socket_used_only_when_present(self, tmp_path, exists):
+        socket_path = tmp_path / "parent.sock"
+        if exists:
+            socket_path.touch()
+        server = OrchestrationMCPServer(
+            parent_url=PARENT, parent_socket=str(socket_path), schema_cache_dir=tmp_path
+        )
+        with patch("orchestrator.mcp_server.httpx.AsyncHTTPTransport") as transport:
+            server._get_client()
+        expected = str(socket_path) if exists else None
+        assert transport.call_args.kwargs["uds"] == expected
@@ -0,0 +1,171 @@
+"""Tests for the Unix-socket reply bus."""
+
+import asyncio
+import base64
+import os
+import threading
+from queue import Full
+from unittest.mock import patch
+
+import pytest
+
+from orchestrator.reply_bus import (
+    ReplyBusClient,
+    ReplyBusError,
+    ReplyBusServer,
+    ReplyQueue,
+)
+from orchestrator.shared_state_manager import SharedStateManager
+
+AUTHKEY = b"reply-bus-test-key"
+
+
+@pytest.fixture
+def bus():
+    server = ReplyBusServer(AUTHKEY)
+    server.start()
+    yield server
+    server.close()
+
+
+class TestReplyQueue:
+    async def test_get_returns_items_in_order(self):
+        queue = ReplyQueue()
+        queue.put({"n": 1})
+        queue.put({"n": 2})
+        assert await queue.get(timeout=1) == {"n": 1}
+        assert await queue.get(timeout=1) == {"n": 2}
+
+    async def test_get_wakes_on_put(self):
+        queue = ReplyQueue()
+        waiter = asyncio.create_task(queue.get(timeout=5))
+        await asyncio.sleep(0)
+        queue.put("reply")
+        assert await asyncio.wait_for(waiter, 1) == "reply"
+
+    async def test_put_from_another_thread_wakes_waiter(self):
+        queue = ReplyQueue()
+        waiter = asyncio.create_task(queue.get(timeout=5))
+        await asyncio.sleep(0)
+        threading.Thread(target=queue.put, args=("from-thread",)).start()
+        assert await asyncio.wait_for(waiter, 1) == "from-thread"
+
+    async def test_get_times_out(self):
+        queue = ReplyQueue()
+        with pytest.raises(TimeoutError):
+            await queue.get(timeout=0.01)
+        with pytest.raises(TimeoutError):
+            await queue.get(timeout=0)
+
+    async def test_timed_out_waiter_does_not_swallow_items(self):
+        queue = ReplyQueue()
+        with pytest.raises(TimeoutError):
+            await queue.get(timeout=0.01)
+        queue.put("late")
+        assert queue.qsize() == 1
+        assert await queue.get(timeout=0) == "late"
+
+    def test_put_raises_when_full(self):
+        queue = ReplyQueue(maxsize=1)
+        queue.put("a")
+        with pytest.raises(Full):
+            queue.put("b")
+        assert queue.drain() == 1
+        assert queue.empty()
+
+
+class TestReplyBus:
+    async def test_client_put_reaches_owner_queue(self, bus):
+        client = ReplyBusClient(bus.socket_path, AUTHKEY)
+        try:
+            await client.put("coordinator", {"reply_message": "done"})
+            assert await bus.queue("coordinator").get(timeout=1) == {"reply_message": "done"}
+        finally:
+            await client.close()
+        assert bus.stats()["remote_puts"] == 1
+
+    async def test_client_get_waits_for_owner_put(self, bus):
+        client = ReplyBusClient(bus.socket_path, AUTHKEY)
+        try:
+            waiter = asyncio.create_task(client.get("inst-1", timeout=5))
+            await asyncio.sleep(0.05)
+            bus.queue("inst-1").put({"n": 1})
+            assert await asyncio.wait_for(waiter, 2) == {"n": 1}
+
+            with pytest.raises(TimeoutError):
+                await client.get("inst-1", timeout=0.05)
+        finally:
+            await client.close()
+
+    async def test_put_does_not_queue_behind_pending_get(self, bus):
+        client = ReplyBusClient(bus.socket_path, AUTHKEY)
+        try:
+            waiter = asyncio.create_task(client.get("inst-1", timeout=5))
+            await asyncio.sleep(0.05)
+            await asyncio.wait_for(client.put("inst-1", "hello"), 1)
+            assert await asyncio.wait_for(waiter, 1) == "hello"
+        finally:
+            await client.close()
+
+    async def test_full_queue_surfaces_to_client(self, bus):
+        bus.queue("small", maxsize=1).put("x")
+        client = ReplyBusClient(bus.socket_path, AUTHKEY)
+        try:
+            with pytest.raises(Full):
+                await client.put("small", "y")
+        finally:
+            await client.close()
+
+    async def test_wrong_authkey_is_rejected(self, bus):
+        client = ReplyBusClient(bus.socket_path, b"wrong")
+        with pytest.raises(ReplyBusError, match="unauthorized"):
+            await client.put("inst-1", "x")
+        assert bus.stats()["rejected"] == 1
+        assert bus.queue("inst-1").empty()
+
+    async def test_unreachable_socket(self, tmp_path):
+        client = ReplyBusClient(str(tmp_path / "missing.sock"), AUTHKEY)
+        with pytest.raises(ReplyBusError, match="unreachable"):
+            await client.put("inst-1", "x")
+
+    def test_close_removes_socket(self):
+        server = ReplyBusServer(AUTHKEY)
+        server.start()
+        assert os.path.exists(server.socket_path)
+        server.close()
+        assert not server.is_running
+        assert not os.path.exists(server.socket_path)
+
+
+class TestSharedStateReplies:
+    async def test_parent_put_and_get(self):
+        manager = SharedStateManager()
+        try:
+            await manager.put_reply("inst-1", {"reply_message": "hi"})
+            assert manager.get_queue_depth("inst-1") == 1
+            assert await manager.get_reply("inst-1", timeout=1) == {"reply_message": "hi"}
+        finally:
+            manager.shutdown()
+
+    async def test_child_replies_reach_parent_queue(self):
+        parent = SharedStateManager()
+        env = {
+            "MADROX_MANAGER_AUTHKEY": base64.b64encode(parent.manager_authkey).decode(),
+            "MADROX_REPLY_SOCKET": parent.reply_socket,
+        }
+        if isinstance(parent.manager_address, tuple):
+            env["MADROX_MANAGER_HOST"] = parent.manager_address[0]
+            env["MADROX_MANAGER_PORT"] = str(parent.manager_address[1])
+        else:
+            env["MADROX_MANAGER_SOCKET"] = parent.manager_address
+        try:
+            with patch.dict(os.environ, env):
+                child = SharedStateManager()
+            assert child.reply_bus is None
+            await child.put_reply("coordinator", {"reply_message": "from child"})
+            assert await parent.get_reply("coordinator", timeout=1) == {
+                "reply_message": "from child"
+            }
+            child.shutdown()
+        finally:
+            parent.shutdown()
@@ -0,0 +1,94 @@
+"""Tests for the server's TCP and MCP Unix socket listeners."""
+
+import asyncio
+import os
+import shutil
+import socket
+import stat
+import tempfile
+
+import httpx
+import pytest
+import uvicorn
+from fastapi import FastAPI
+
+from orchestrator.server.listeners import (
+    bind_tcp_sockets,
+    bind_unix_socket,
+    mcp_socket_path,
+    remove_unix_socket,
+)
+
+
+@pytest.fixture
+def short_tmp():
+    """A directory short enough for sun_path (pytest's tmp_path may not be)."""
+    path = tempfile.mkdtemp(prefix="mx-")
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+class TestUnixSocket:
+    def test_socket_is_private(self, short_tmp):
+        path = os.path.join(short_tmp, "mcp.sock")
+        sock = bind_unix_socket(path)
+        try:
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        finally:
+            sock.close()
+            remove_unix_socket(path)
+        assert not os.path.exists(path)
+
+    def test_stale_socket_is_replaced(self, short_tmp):
+        path = os.path.join(short_tmp, "mcp.sock")
+        bind_unix_socket(path).close()  # left behind, nobody listening
+        bind_unix_socket(path).close()
+
+    def test_live_socket_is_not_stolen(self, short_tmp):
+        path = os.path.join(short_tmp, "mcp.sock")
+        live = bind_unix_socket(path)
+        live.listen()
+        try:
+            with pytest.raises(OSError, match="Another server"):
+                bind_unix_socket(path)
+        finally:
+            live.close()
+
+    def test_overlong_path_disables_socket(self):
+        assert mcp_socket_path("/tmp/madrox_logs") == "/tmp/madrox_logs/mcp.sock"
+        assert mcp_socket_path("/tmp/" + "x" * 120) is None
+
+
+def test_tcp_sockets_bind_every_address():
+    sockets = bind_tcp_sockets("127.0.0.1", 0)
+    try:
+        assert [s.family for s in sockets] == [socket.AF_INET]
+        assert sockets[0].getsockname()[1] != 0
+    finally:
+        for sock in sockets:
+            sock.close()
+
+
+async def test_one_server_answers_on_tcp_and_unix_socket(short_tmp):
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    path = os.path.join(short_tmp, "mcp.sock")
+    sockets = [*bind_tcp_sockets("127.0.0.1", 0), bind_unix_socket(path)]
+    port = sockets[0].getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="off"))
+    serving = asyncio.create_task(server.serve(sockets=sockets))
+    try:
+        while not server.started:
+            await asyncio.sleep(0.01)
+        async with httpx.AsyncClient() as tcp:
+            assert (await tcp.get(f"http://127.0.0.1:{port}/ping")).json() == {"ok": True}
+        transport = httpx.AsyncHTTPTransport(uds=path)
+        async with httpx.AsyncClient(transport=transport) as uds:
+            assert (await uds.get("http://localhost/ping")).json() == {"ok": True}
+    finally:
+        server.should_exit = True
+        await serving
@@ -58,7 +58,7 @@ class TestInitialization:
         assert hasattr(manager, "response_queues")
         assert hasattr(manager, "message_registry")
         assert hasattr(manager, "instance_metadata")
-        assert hasattr(manager, "queue_locks")
+        assert manager.reply_bus is not None
         assert isinstance(manager.response_queues, dict)
         assert len(manager.response_queues) == 0
 
@@ -125,7 +125,6 @@ class TestResponseQueueManagement:
         queue = manager.create_response_queue(instance_id)
 
         assert instance_id in manager.response_queues
-        assert instance_id in manager.queue_locks
         assert queue is not None
         assert manager.response_queues[instance_id] == queue
 
@@ -309,7 +308,6 @@ class TestInstanceCleanup:
 
         # Verify cleanup
         assert instance_id not in manager.response_queues
-        assert instance_id not in manager.queue_locks
         assert instance_id not in manager.instance_metadata
 
     def test_cleanup_instance_drains_queue(self, manager):
@@ -403,10 +401,10 @@ class TestStats:
         stats = manager.get_stats()
 
         assert stats["active_queues"] == 0
-        assert stats["active_locks"] == 0
         assert stats["registered_messages"] == 0
         assert stats["instance_metadata_count"] == 0
         assert stats["queue_depths"] == {}
+        assert stats["reply_bus"]["running"] is True
 
     def test_get_stats_with_data(self, manager):
         """Test getting stats with active data."""
@@ -429,7 +427,6 @@ class TestStats:
         stats = manager.get_stats()
 
         assert stats["active_queues"] == 2
-        assert stats["active_locks"] == 2
         assert stats["registered_messages"] == 1
         assert stats["instance_metadata_count"] == 1
         assert "inst-1" in stats["queue_depths"]
@@ -547,7 +544,6 @@ class TestShutdown:
 
         # Verify cleanup
         assert len(manager.response_queues) == 0
-        assert len(manager.queue_locks) == 0
 
     def test_shutdown_child_connection(self):
         """Test shutdown behavior for child connections."""
@@ -1168,7 +1164,6 @@ class TestAdditionalEdgeCases:
         stats = manager.get_stats()
 
         assert stats["active_queues"] == 2
-        assert stats["active_locks"] == 2
         assert stats["registered_messages"] == 1
         assert stats["instance_metadata_count"] == 1
         assert stats["queue_depths"]["stats-1"] == 2
@@ -658,6 +658,15 @@ class TestOrchestratorConfig:
         assert config_dict["metrics_port"] == 9090
         assert config_dict["artifacts_dir"] == "/tmp/madrox_logs/artifacts"
         assert config_dict["preserve_artifacts"] is True
+        assert config_dict["warm_pool_size"] == 0
+        assert config_dict["tmux_max_workers"] == 8
+        assert config_dict["teardown_concurrency"] == 8
+        assert config_dict["state_flush_interval_ms"] == 250
+        assert config_dict["summary_min_new_lines"] == 1
+        assert config_dict["summary_max_age_seconds"] == 300.0
+        assert config_dict["summary_max_concurrent"] == 4
+        assert config_dict["summary_batch_size"] == 1
+        assert config_dict["summary_max_poll_interval"] == 300.0
         # Note: log_dir is not in to_dict output based on the source code
 
     def test_to_dict_with_custom_values(self):
@@ -0,0 +1,73 @@
+"""Tests for write-behind instance state persistence."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from orchestrator.tmux_instance_manager.persistence import StatePersister
+
+
+def _persister(instances, interval_ms=20):
+    store = MagicMock()
+    return store, StatePersister(store, lambda: instances, flush_interval_ms=interval_ms)
+
+
+class TestStatePersister:
+    async def test_burst_of_marks_is_one_flush(self):
+        instances = {"a": {"id": "a"}, "b": {"id": "b"}}
+        store, persister = _persister(instances)
+
+        for _ in range(5):
+            persister.mark_dirty("a")
+        persister.mark_dirty("b")
+        store.save_instance.assert_not_called()
+
+        await asyncio.sleep(0.05)
+        assert store.save_instance.call_count == 2
+        stats = persister.stats()
+        assert stats["flushes"] == 1
+        assert stats["marks"] == 6
+        assert stats["coalesced"] == 5
+        assert stats["flush_latency"]["count"] == 1
+        assert not stats["pending"]
+
+    async def test_mark_all_uses_save_all(self):
+        instances = {"a": {"id": "a"}}
+        store, persister = _persister(instances)
+        persister.mark_dirty("a")
+        persister.mark_dirty()
+
+        persister.flush()
+        store.save_all.assert_called_once_with(instances)
+        store.save_instance.assert_not_called()
+
+    async def test_flush_writes_immediately_and_cancels_timer(self):
+        store, persister = _persister({"a": {"id": "a"}}, interval_ms=10_000)
+        persister.mark_dirty("a")
+
+        persister.flush()
+        store.save_instance.assert_called_once()
+        assert persister._timer is None
+
+    async def test_vanished_instance_is_removed(self):
+        store, persister = _persister({})
+        persister.mark_dirty("gone")
+        persister.flush()
+        store.remove_instance.assert_called_once_with("gone")
+
+    def test_writes_inline_without_a_running_loop(self):
+        store, persister = _persister({"a": {"id": "a"}})
+        persister.mark_dirty("a")
+        store.save_instance.assert_called_once()
+
+    async def test_store_errors_are_counted_not_raised(self):
+        store, persister = _persister({"a": {"id": "a"}})
+        store.save_instance.side_effect = OSError("disk full")
+        persister.mark_dirty("a")
+        persister.flush()
+        assert persister.stats()["errors"] == 1
+
+    def test_no_store_is_a_no_op(self):
+        persister = StatePersister(None, dict)
+        persister.mark_dirty("a")
+        persister.flush()
+        assert persister.stats()["marks"] == 0
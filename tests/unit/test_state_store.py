@@ -0,0 +1,140 @@
+"""Tests for the journaled instance StateStore."""
+
+import json
+from datetime import datetime, timedelta
+
+from orchestrator.state_store import StateStore
+
+
+def _instance(iid: str, **fields):
+    record = {
+        "id": iid,
+        "name": f"agent-{iid}",
+        "state": "running",
+        "system_prompt": "You are a helpful agent. " * 200,
+        "_transient": object(),
+    }
+    record.update(fields)
+    return record
+
+
+def _journal(store: StateStore) -> list[dict]:
+    if not store.journal_file.exists():
+        return []
+    return [json.loads(line) for line in store.journal_file.read_text().splitlines()]
+
+
+class TestJournal:
+    def test_round_trip_strips_transient_fields(self, tmp_path):
+        store = StateStore(tmp_path)
+        store.save_all({"a": _instance("a"), "b": _instance("b")})
+
+        loaded = StateStore(tmp_path).load_all()
+        assert set(loaded) == {"a", "b"}
+        assert "_transient" not in loaded["a"]
+        assert loaded["a"]["name"] == "agent-a"
+
+    def test_transition_appends_only_changed_fields(self, tmp_path):
+        store = StateStore(tmp_path)
+        instances = {"a": _instance("a"), "b": _instance("b")}
+        store.save_all(instances)
+        before = len(_journal(store))
+
+        instances["a"]["state"] = "busy"
+        store.save_all(instances)
+
+        entries = _journal(store)
+        assert len(entries) == before + 1
+        assert entries[-1] == {"op": "set", "id": "a", "fields": {"state": "busy"}}
+        assert store.load_all()["a"]["state"] == "busy"
+
+    def test_unchanged_state_writes_nothing(self, tmp_path):
+        store = StateStore(tmp_path)
+        instances = {"a": _instance("a")}
+        store.save_all(instances)
+        size = store.journal_file.stat().st_size
+
+        store.save_all(instances)
+        store.save_instance(instances["a"])
+        assert store.journal_file.stat().st_size == size
+
+    def test_in_place_mutation_of_nested_field_is_detected(self, tmp_path):
+        store = StateStore(tmp_path)
+        instances = {"a": _instance("a", mcp_servers={})}
+        store.save_all(instances)
+
+        instances["a"]["mcp_servers"]["playwright"] = {"transport": "stdio"}
+        store.save_all(instances)
+        assert store.load_all()["a"]["mcp_servers"] == {"playwright": {"transport": "stdio"}}
+
+    def test_removed_fields_and_instances_replay(self, tmp_path):
+        store = StateStore(tmp_path)
+        instances = {"a": _instance("a", error_message="boom"), "b": _instance("b")}
+        store.save_all(instances)
+
+        del instances["a"]["error_message"]
+        del instances["b"]
+        store.save_all(instances)
+
+        loaded = StateStore(tmp_path).load_all()
+        assert set(loaded) == {"a"}
+        assert "error_message" not in loaded["a"]
+
+    def test_remove_instance(self, tmp_path):
+        store = StateStore(tmp_path)
+        store.save_instance(_instance("a"))
+        store.save_instance(_instance("b"))
+        store.remove_instance("a")
+        assert set(StateStore(tmp_path).load_all()) == {"b"}
+
+    def test_torn_final_line_is_skipped(self, tmp_path):
+        store = StateStore(tmp_path)
+        store.save_instance(_instance("a"))
+        with store.journal_file.open("a") as f:
+            f.write('{"op": "set", "id": "a", "fie')
+
+        assert StateStore(tmp_path).load_all()["a"]["state"] == "running"
+
+
+class TestCompaction:
+    def test_compacts_after_threshold(self, tmp_path):
+        store = StateStore(tmp_path, compact_after=5)
+        instance = _instance("a")
+        for n in range(7):
+            instance["retry_count"] = n
+            store.save_instance(instance)
+
+        assert store.compactions == 1
+        assert len(_journal(store)) == 2
+        snapshot = json.loads(store.instances_file.read_text())
+        assert snapshot["a"]["retry_count"] == 4
+        assert StateStore(tmp_path).load_all()["a"]["retry_count"] == 6
+
+    def test_replaying_an_already_compacted_journal_is_harmless(self, tmp_path):
+        store = StateStore(tmp_path)
+        store.save_instance(_instance("a", state="busy"))
+        store.remove_instance("gone")
+        journal = store.journal_file.read_text()
+
+        store.compact()
+        # Crash after the snapshot was written but before the journal was cleared
+        store.journal_file.write_text(journal)
+        assert StateStore(tmp_path).load_all()["a"]["state"] == "busy"
+
+    def test_prune_terminated_rewrites_snapshot(self, tmp_path):
+        store = StateStore(tmp_path)
+        old = (datetime.now() - timedelta(hours=48)).isoformat()
+        store.save_all(
+            {
+                "live": _instance("live"),
+                "dead": _instance("dead", state="terminated", terminated_at=old),
+            }
+        )
+
+        assert store.prune_terminated() == 1
+        assert not store.journal_file.exists()
+        assert set(store.load_all()) == {"live"}
+
+        # The delta cache is rebuilt from disk, so later writes stay correct
+        store.save_instance(_instance("live", state="idle"))
+        assert store.load_all()["live"]["state"] == "idle"
@@ -0,0 +1,132 @@
+"""Tests for the team readiness barrier."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from orchestrator.tmux_instance_manager import TmuxInstanceManager
+from orchestrator.tmux_instance_manager.change_feed import InstanceChangeFeed
+from orchestrator.tmux_instance_manager.readiness import TeamReadiness, team_status, wait_for_team
+
+
+class Team:
+    """Instances under one supervisor, published to a feed like the manager does."""
+
+    def __init__(self, *states: str):
+        self.feed = InstanceChangeFeed()
+        self.instances = {"lead": {"state": "busy"}}
+        for i, state in enumerate(states):
+            self.set(f"m{i}", state)
+
+    def set(self, instance_id: str, state: str) -> None:
+        self.instances.setdefault(instance_id, {"name": instance_id})["state"] = state
+        self.feed.publish(instance_id, self.instances[instance_id])
+
+    def descendants(self):
+        return [(iid, inst["state"]) for iid, inst in self.instances.items() if iid != "lead"]
+
+    def wait(self, expected: int, timeout: float = 5.0, **kwargs):
+        return wait_for_team(self.feed, "lead", self.descendants, expected, timeout, **kwargs)
+
+
+async def test_returns_immediately_when_team_is_up():
+    team = Team("idle", "busy")
+    readiness = await team.wait(2)
+
+    assert readiness.complete and not readiness.timed_out
+    assert readiness.ready == ["m0", "m1"]
+    assert readiness.elapsed < 1
+
+
+async def test_wakes_on_state_change_not_recheck():
+    team = Team("initializing")
+    waiter = asyncio.create_task(team.wait(2, recheck_interval=60))
+    await asyncio.sleep(0)
+
+    team.set("m0", "idle")
+    team.set("m1", "initializing")
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    team.set("m1", "idle")
+
+    readiness = await asyncio.wait_for(waiter, 1)
+    assert readiness.complete
+    assert not team.feed._subscribers  # subscription closed
+
+
+async def test_times_out_with_pending_members():
+    team = Team("idle", "initializing")
+    readiness = await team.wait(3, timeout=0.05, recheck_interval=0.01)
+
+    assert readiness.timed_out and not readiness.complete
+    assert readiness.ready == ["m0"]
+    assert readiness.pending == {"m1": "initializing"}
+    assert team_status(readiness).startswith("Initializing (1/3 team members up")
+
+
+async def test_member_seen_up_stays_counted_until_terminated():
+    team = Team("idle", "initializing", "initializing")
+    waiter = asyncio.create_task(team.wait(2, recheck_interval=60))
+    await asyncio.sleep(0)
+
+    team.set("m0", "error")  # was up already: still counts
+    team.set("m1", "idle")
+    readiness = await asyncio.wait_for(waiter, 1)
+    assert readiness.ready == ["m0", "m1"]
+
+    team.set("m1", "terminated")
+    readiness = await team.wait(2, timeout=0.05, recheck_interval=0.01)
+    assert readiness.timed_out
+    assert readiness.pending == {"m0": "error", "m2": "initializing"}
+
+
+async def test_async_progress_callback_sees_each_member():
+    team = Team("initializing", "initializing")
+    counts = []
+
+    async def progress(readiness: TeamReadiness) -> None:
+        counts.append(len(readiness.ready))
+
+    waiter = asyncio.create_task(team.wait(2, recheck_interval=60, on_progress=progress))
+    await asyncio.sleep(0)
+    team.set("m0", "idle")
+
+    async def reported(n: int) -> None:
+        while len(counts) < n:
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(reported(2), 1)
+    team.set("m1", "busy")
+    await asyncio.wait_for(waiter, 1)
+
+    assert counts == [0, 1, 2]
+
+
+def test_team_status():
+    assert team_status(None) == "Initializing"
+    done = TeamReadiness("lead", 2, ready=["a", "b"], elapsed=3.21)
+    assert team_status(done) == "Ready (2/2 team members up in 3.2s)"
+
+
+async def test_manager_waits_on_supervisor_subtree(tmp_path):
+    with patch("orchestrator.tmux_instance_manager.core.libtmux.Server"):
+        manager = TmuxInstanceManager({"workspace_base_dir": str(tmp_path)})
+    manager.instances = {
+        "lead": {"state": "busy", "parent_instance_id": None},
+        "dev": {"state": "initializing", "parent_instance_id": "lead"},
+        "other": {"state": "idle", "parent_instance_id": None},
+    }
+    waiter = asyncio.create_task(manager.wait_for_descendants("lead", 2, timeout=5))
+    await asyncio.sleep(0)
+
+    manager.instances["dev"]["state"] = "idle"
+    manager._save_state("dev")
+    manager.instances["qa"] = {"state": "idle", "parent_instance_id": "dev"}
+    manager._save_state("qa")
+
+    readiness = await asyncio.wait_for(waiter, 1)
+    assert readiness.ready == ["dev", "qa"]
+
+    with pytest.raises(ValueError, match="not found"):
+        await manager.wait_for_descendants("missing", 1)
@@ -0,0 +1,78 @@
+"""Tests for the append-only terminated-instance catalog."""
+
+import json
+import os
+
+from orchestrator.terminated_catalog import TerminatedCatalog
+
+
+def _instance(iid: str, parent: str | None, **fields) -> dict:
+    return {
+        "id": iid,
+        "parent_instance_id": parent,
+        "name": f"agent-{iid}",
+        "role": "worker",
+        "instance_type": "claude",
+        "state": "terminated",
+        "terminated_at": "2026-01-01T00:00:00+00:00",
+        **fields,
+    }
+
+
+def test_children_are_looked_up_by_parent(tmp_path):
+    catalog = TerminatedCatalog(tmp_path)
+    catalog.record(_instance("a", "root"))
+    catalog.record(_instance("b", "root"))
+    catalog.record(_instance("a1", "a"))
+
+    assert [e["id"] for e in catalog.children("root")] == ["a", "b"]
+    assert [e["id"] for e in catalog.children("a")] == ["a1"]
+    assert catalog.children("missing") == []
+    assert catalog.children("root")[0]["name"] == "agent-a"
+
+
+def test_missing_file_is_empty(tmp_path):
+    catalog = TerminatedCatalog(tmp_path / "state")
+    assert catalog.children("root") == []
+    assert catalog.stats()["entries"] == 0
+
+
+def test_roots_are_not_recorded(tmp_path):
+    catalog = TerminatedCatalog(tmp_path)
+    catalog.record(_instance("root", None))
+    assert not catalog.path.exists()
+
+
+def test_follows_appends_from_other_writers(tmp_path):
+    reader = TerminatedCatalog(tmp_path)
+    assert reader.children("root") == []
+
+    TerminatedCatalog(tmp_path).record(_instance("a", "root"))
+    assert [e["id"] for e in reader.children("root")] == ["a"]
+
+
+def test_reterminated_instance_keeps_latest_entry(tmp_path):
+    catalog = TerminatedCatalog(tmp_path)
+    catalog.record(_instance("a", "root", name="first"))
+    catalog.record(_instance("b", "root"))
+    catalog.record(_instance("a", "root", name="second"))
+
+    children = catalog.children("root")
+    assert [e["id"] for e in children] == ["b", "a"]
+    assert children[-1]["name"] == "second"
+
+
+def test_partial_and_malformed_lines(tmp_path):
+    catalog = TerminatedCatalog(tmp_path)
+    catalog.record(_instance("a", "root"))
+    with open(catalog.path, "a") as f:
+        f.write("not json\n")
+        f.write(json.dumps(_instance("b", "root"))[:20])  # writer mid-line
+
+    assert [e["id"] for e in catalog.children("root")] == ["a"]
+
+    # A file replaced under the reader is indexed again
+    replacement = tmp_path / "new.jsonl"
+    replacement.write_text(json.dumps(_instance("c", "root")) + "\n")
+    os.replace(replacement, catalog.path)
+    assert [e["id"] for e in catalog.children("root")] == ["c"]
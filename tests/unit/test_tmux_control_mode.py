@@ -0,0 +1,262 @@
+"""Tests for the tmux control-mode client and its use by TmuxInstanceManager."""
+
+import asyncio
+import shutil
+import subprocess
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from orchestrator.tmux_instance_manager import TmuxControlClient, TmuxInstanceManager
+from orchestrator.tmux_instance_manager.control_mode import TmuxControlError, decode_output
+
+
+class _FakeStdin:
+    """Collects lines written by the client."""
+
+    def __init__(self):
+        self.lines: list[str] = []
+
+    def write(self, data: bytes) -> None:
+        self.lines.append(data.decode().rstrip("\n"))
+
+    async def drain(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeProcess:
+    def __init__(self):
+        self.stdin = _FakeStdin()
+        self.stdout = asyncio.StreamReader()
+        self.returncode = None
+
+    async def wait(self):
+        self.returncode = 0
+        return 0
+
+    def kill(self):
+        self.returncode = -9
+
+
+def _attach_fake(client: TmuxControlClient) -> _FakeProcess:
+    """Wire a fake tmux process into the client and start its reader."""
+    proc = _FakeProcess()
+    client._process = proc
+    client._reader_task = asyncio.create_task(client._read_loop())
+    return proc
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestDecodeOutput:
+    def test_octal_escapes_are_decoded(self):
+        assert decode_output(b"a\\015\\012b") == b"a\r\nb"
+
+    def test_backslash_escape(self):
+        assert decode_output(b"C:\\134path") == b"C:\\path"
+
+    def test_plain_text_unchanged(self):
+        assert decode_output(b"hello world") == b"hello world"
+
+
+class TestProtocol:
+    async def test_command_reply_resolves_in_order(self):
+        client = TmuxControlClient()
+        proc = _attach_fake(client)
+
+        first = asyncio.create_task(client.command("display-message", "-p", "one"))
+        second = asyncio.create_task(client.command("display-message", "-p", "two"))
+        await _settle()
+        assert proc.stdin.lines == ["display-message -p one", "display-message -p two"]
+
+        proc.stdout.feed_data(b"%begin 1 10 1\none\n%end 1 10 1\n")
+        proc.stdout.feed_data(b"%begin 1 11 1\ntwo\n%end 1 11 1\n")
+        assert await first == ["one"]
+        assert await second == ["two"]
+        assert client.commands_sent == 2
+
+    async def test_unsolicited_block_is_not_a_reply(self):
+        client = TmuxControlClient()
+        proc = _attach_fake(client)
+
+        task = asyncio.create_task(client.command("list-sessions"))
+        await _settle()
+        # Flags 0: produced by the attach, not by our command
+        proc.stdout.feed_data(b"%begin 1 5 0\n%end 1 5 0\n")
+        proc.stdout.feed_data(b"%begin 1 6 1\nhub: 1 windows\n%end 1 6 1\n")
+        assert await task == ["hub: 1 windows"]
+
+    async def test_error_reply_raises(self):
+        client = TmuxControlClient()
+        proc = _attach_fake(client)
+
+        task = asyncio.create_task(client.command("kill-session", "-t", "nope"))
+        await _settle()
+        proc.stdout.feed_data(b"%begin 1 7 1\ncan't find session: nope\n%error 1 7 1\n")
+        with pytest.raises(TmuxControlError, match="can't find session"):
+            await task
+
+    async def test_connection_loss_fails_pending_commands(self):
+        client = TmuxControlClient()
+        proc = _attach_fake(client)
+
+        task = asyncio.create_task(client.command("list-sessions"))
+        await _settle()
+        proc.stdout.feed_eof()
+        with pytest.raises(TmuxControlError):
+            await task
+        assert client.is_alive is False
+
+    async def test_command_refused_when_not_running(self):
+        client = TmuxControlClient()
+        with pytest.raises(TmuxControlError):
+            await client.command("list-sessions")
+
+
+class TestPaneOutput:
+    async def _watched(self, pane_id: str = "%3"):
+        client = TmuxControlClient(buffer_bytes=16)
+        proc = _attach_fake(client)
+        watch = asyncio.create_task(client.watch(pane_id, "@2"))
+        await _settle()
+        proc.stdout.feed_data(b"%begin 1 1 1\n%end 1 1 1\n")
+        await watch
+        return client, proc
+
+    async def test_watch_links_window_into_hub(self):
+        client, proc = await self._watched()
+        assert proc.stdin.lines == ["link-window -d -s @2 -t madrox_control:"]
+        assert client.is_watching("%3")
+
+    async def test_output_wakes_waiter_and_fills_buffer(self):
+        client, proc = await self._watched()
+        seq = client.output_seq("%3")
+
+        waiter = asyncio.create_task(client.wait_for_output("%3", seq, timeout=5))
+        await _settle()
+        assert not waiter.done()
+
+        proc.stdout.feed_data(b"%output %3 hi\\015\\012\n")
+        assert await asyncio.wait_for(waiter, timeout=1) == seq + 1
+        assert client.recent_output("%3") == "hi\r\n"
+        assert client.stats()["output_bytes"] == 4
+
+    async def test_output_for_unwatched_pane_is_ignored(self):
+        client, proc = await self._watched()
+        proc.stdout.feed_data(b"%output %9 other\n")
+        await _settle()
+        assert client.output_seq("%9") == 0
+        assert client.output_events == 0
+
+    async def test_buffer_is_bounded(self):
+        client, proc = await self._watched()
+        proc.stdout.feed_data(b"%output %3 0123456789\n%output %3 abcdefghij\n")
+        await _settle()
+        assert client.recent_output("%3") == "456789abcdefghij"
+        assert client.output_seq("%3") == 2
+
+    async def test_wait_times_out_without_output(self):
+        client, _ = await self._watched()
+        assert await client.wait_for_output("%3", 0, timeout=0.01) == 0
+
+    async def test_wait_returns_immediately_when_already_behind(self):
+        client, proc = await self._watched()
+        proc.stdout.feed_data(b"%output %3 x\n")
+        await _settle()
+        assert await client.wait_for_output("%3", 0, timeout=5) == 1
+
+
+class TestManagerFallback:
+    @pytest.fixture
+    def manager(self, tmp_path):
+        with patch("orchestrator.tmux_instance_manager.core.libtmux.Server"):
+            yield TmuxInstanceManager({"workspace_base_dir": str(tmp_path)})
+
+    def test_control_mode_off_by_default(self, manager):
+        assert manager._tmux_control_mode is False
+        assert manager.control_client is None
+
+    async def test_watch_is_noop_without_control_mode(self, manager):
+        pane = MagicMock(pane_id="%1", window_id="@1")
+        await manager._watch_pane("inst", pane)
+        assert manager._watched_panes == {}
+
+    async def test_capture_falls_back_to_capture_pane(self, manager):
+        pane = MagicMock()
+        pane.cmd.return_value = MagicMock(stdout=["line 1", "line 2"])
+        assert await manager._capture_pane(pane, "-S", "-") == "line 1\nline 2"
+        pane.cmd.assert_called_with("capture-pane", "-p", "-S", "-")
+
+    async def test_failed_start_disables_control_mode(self, tmp_path):
+        with patch("orchestrator.tmux_instance_manager.core.libtmux.Server"):
+            manager = TmuxInstanceManager(
+                {"workspace_base_dir": str(tmp_path), "tmux_control_mode": True}
+            )
+        with patch.object(TmuxControlClient, "start", side_effect=OSError("no tmux")):
+            await manager._watch_pane("inst", MagicMock(pane_id="%1", window_id="@1"))
+        assert manager._tmux_control_mode is False
+        assert manager.control_client is None
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(shutil.which("tmux") is None, reason="tmux not installed")
+class TestRealTmux:
+    @pytest.fixture
+    def socket_name(self):
+        name = f"madrox-test-{uuid.uuid4().hex[:8]}"
+        subprocess.run(
+            ["tmux", "-L", name, "new-session", "-d", "-s", "madrox-t", "-x", "160", "-y", "50"],
+            check=True,
+        )
+        yield name
+        subprocess.run(["tmux", "-L", name, "kill-server"], check=False)
+
+    def _ids(self, socket_name: str) -> list[str]:
+        return subprocess.run(
+            [
+                "tmux",
+                "-L",
+                socket_name,
+                "display-message",
+                "-p",
+                "-t",
+                "madrox-t",
+                "#{pane_id} #{window_id}",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+
+    async def test_output_notification_and_capture(self, socket_name):
+        pane_id, window_id = self._ids(socket_name)
+        client = TmuxControlClient(socket_name=socket_name)
+        await client.start()
+        try:
+            await client.watch(pane_id, window_id)
+            seq = client.output_seq(pane_id)
+            subprocess.run(
+                ["tmux", "-L", socket_name, "send-keys", "-t", pane_id, "echo marker", "Enter"],
+                check=True,
+            )
+            assert await client.wait_for_output(pane_id, seq, timeout=5) > seq
+            lines = await client.capture_pane(pane_id)
+            assert any("echo marker" in line for line in lines)
+            await client.unwatch(pane_id)
+        finally:
+            await client.close()
+
+        # Closing the hub must leave the instance session alive
+        sessions = subprocess.run(
+            ["tmux", "-L", socket_name, "list-sessions", "-F", "#{session_name}"],
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        assert sessions == ["madrox-t"]
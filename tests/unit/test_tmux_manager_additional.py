@@ -22,7 +22,9 @@ from unittest.mock import MagicMock, patch
 import pytest  # type: ignore[import-untyped]
 
 from orchestrator.compat import UTC
+from orchestrator.harnesses import ClaudeHarness, CodexHarness, GrokHarness
 from orchestrator.tmux_instance_manager import TmuxInstanceManager
+from orchestrator.tmux_instance_manager.helpers import PaneCursor
 
 
 @pytest.fixture
@@ -304,6 +306,155 @@ class TestMessageSending:
                 assert pane.send_keys.call_count >= 4
 
 
+class TestMessageDelivery:
+    """Test bracketed-paste delivery and the keystroke fallback."""
+
+    @pytest.fixture
+    def paste_mocks(self) -> dict[str, Any]:
+        mocks = create_mock_libtmux()
+        mocks["server"].cmd = MagicMock(return_value=MagicMock(stderr=[]))
+        mocks["pane"].cmd = MagicMock(return_value=MagicMock(stdout=["❯"], stderr=[]))
+        return mocks
+
+    def _manager(self, mock_config: dict[str, Any], mocks: dict[str, Any]) -> TmuxInstanceManager:
+        with patch(
+            "orchestrator.tmux_instance_manager.core.libtmux.Server", return_value=mocks["server"]
+        ):
+            return TmuxInstanceManager(mock_config)
+
+    @pytest.mark.asyncio
+    async def test_paste_capable_harness_uses_tmux_buffer(
+        self, mock_config: dict[str, Any], paste_mocks: dict[str, Any]
+    ) -> None:
+        """A 300-line message is delivered with two tmux commands plus Enter."""
+        manager = self._manager(mock_config, paste_mocks)
+        pane = paste_mocks["pane"]
+        message = "\n".join(f"line {i}" for i in range(300))
+
+        await manager._send_multiline_message_to_pane(pane, message, ClaudeHarness)
+
+        load_args = paste_mocks["server"].cmd.call_args.args
+        assert load_args[:2] == ("load-buffer", "-b")
+        buffer_name, staged_path = load_args[2], load_args[3]
+        assert not Path(staged_path).exists()  # staging file removed
+        pane.cmd.assert_called_with("paste-buffer", "-p", "-d", "-b", buffer_name)
+        pane.send_keys.assert_called_once_with("Enter", literal=False)
+
+        stats = manager.delivery_stats.snapshot()
+        assert stats["claude"]["paste"]["messages"] == 1
+        assert stats["claude"]["paste"]["lines"] == 300
+        assert stats["claude"]["paste"]["bytes"] == len(message)
+
+    @pytest.mark.asyncio
+    async def test_paste_sensitive_harness_types_message(
+        self, mock_config: dict[str, Any], paste_mocks: dict[str, Any]
+    ) -> None:
+        manager = self._manager(mock_config, paste_mocks)
+        pane = paste_mocks["pane"]
+
+        await manager._send_multiline_message_to_pane(pane, "Line 1\nLine 2", GrokHarness)
+
+        paste_mocks["server"].cmd.assert_not_called()
+        # 2 lines + 1 C-j + Enter
+        assert pane.send_keys.call_count == 4
+        assert "keystrokes" in manager.delivery_stats.snapshot()["grok"]
+
+    @pytest.mark.asyncio
+    async def test_failed_paste_falls_back_to_keystrokes(
+        self, mock_config: dict[str, Any], paste_mocks: dict[str, Any]
+    ) -> None:
+        paste_mocks["server"].cmd.return_value = MagicMock(stderr=["no server running"])
+        manager = self._manager(mock_config, paste_mocks)
+        pane = paste_mocks["pane"]
+
+        await manager._send_multiline_message_to_pane(pane, "Line 1\nLine 2", CodexHarness)
+
+        assert pane.send_keys.call_count == 4
+        stats = manager.delivery_stats.snapshot()["codex"]
+        assert "paste" not in stats
+        assert stats["keystrokes"]["messages"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_paste_is_not_typed_again(
+        self, mock_config: dict[str, Any], paste_mocks: dict[str, Any]
+    ) -> None:
+        """Once paste-buffer has run, the text may be in the pane: never resend it."""
+        manager = self._manager(mock_config, paste_mocks)
+        pane = paste_mocks["pane"]
+        pane.cmd = MagicMock(
+            side_effect=lambda *args: MagicMock(
+                stdout=["❯"], stderr=["timed out"] if args[0] == "paste-buffer" else []
+            )
+        )
+
+        with pytest.raises(RuntimeError, match="timed out"):
+            await manager._send_multiline_message_to_pane(pane, "Line 1\nLine 2", CodexHarness)
+
+        pane.send_keys.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_enter_after_paste_is_retried_alone(
+        self, mock_config: dict[str, Any], paste_mocks: dict[str, Any]
+    ) -> None:
+        manager = self._manager(mock_config, paste_mocks)
+        pane = paste_mocks["pane"]
+        pane.send_keys.side_effect = [RuntimeError("tmux busy"), None]
+
+        await manager._send_multiline_message_to_pane(pane, "Line 1\nLine 2", CodexHarness)
+
+        assert [c.args for c in pane.send_keys.call_args_list] == [("Enter",), ("Enter",)]
+        assert paste_mocks["server"].cmd.call_count == 1  # loaded once
+        assert "keystrokes" not in manager.delivery_stats.snapshot()["codex"]
+
+
+class TestPaneCursor:
+    """Test incremental capture since a pane cursor."""
+
+    def test_capture_start_tracks_scrolled_lines(self) -> None:
+        before = PaneCursor(history_size=100, cursor_y=40, history_limit=2000)
+        after = PaneCursor(history_size=130, cursor_y=49, history_limit=2000)
+        assert before.capture_start(after) == -30
+
+    def test_capture_start_untrusted_after_clear_or_full_history(self) -> None:
+        before = PaneCursor(history_size=100, cursor_y=0, history_limit=2000)
+        assert before.capture_start(PaneCursor(5, 0, 2000)) is None
+        assert before.capture_start(PaneCursor(2000, 0, 2000)) is None
+
+    @pytest.mark.asyncio
+    async def test_capture_since_requests_only_new_lines(self, mock_config: dict[str, Any]) -> None:
+        mocks = create_mock_libtmux()
+        with patch(
+            "orchestrator.tmux_instance_manager.core.libtmux.Server", return_value=mocks["server"]
+        ):
+            manager = TmuxInstanceManager(mock_config)
+
+        pane = mocks["pane"]
+        pane.cmd = MagicMock(
+            side_effect=[
+                MagicMock(stdout=["130 49 2000"]),
+                MagicMock(stdout=["reply line"]),
+            ]
+        )
+        cursor = PaneCursor(history_size=100, cursor_y=40, history_limit=2000)
+
+        assert await manager._capture_since(pane, cursor) == "reply line"
+        pane.cmd.assert_called_with("capture-pane", "-p", "-S", "-30")
+
+    @pytest.mark.asyncio
+    async def test_capture_since_falls_back_to_bounded_window(
+        self, mock_config: dict[str, Any]
+    ) -> None:
+        mocks = create_mock_libtmux()
+        with patch(
+            "orchestrator.tmux_instance_manager.core.libtmux.Server", return_value=mocks["server"]
+        ):
+            manager = TmuxInstanceManager(mock_config)
+
+        pane = mocks["pane"]
+        await manager._capture_since(pane, None)
+        pane.cmd.assert_called_with("capture-pane", "-p", "-S", "-2000")
+
+
 # ============================================================================
 # Output Capture Tests
 # ============================================================================
@@ -13,16 +13,17 @@ Current: 28% (230/813 statements)
 """
 
 import asyncio
-import threading
+import json
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from queue import Queue
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from orchestrator.compat import UTC
+from orchestrator.reply_bus import ReplyQueue
+from orchestrator.terminated_catalog import TerminatedCatalog
 from orchestrator.tmux_instance_manager import TmuxInstanceManager
 
 
@@ -123,6 +124,30 @@ class TestSessionManagement:
         assert instance_id in tmux_manager.tmux_sessions
         assert tmux_manager._mock_server.new_session.called
 
+    @pytest.mark.asyncio
+    async def test_session_window_keeps_long_history(self, tmux_manager):
+        """Test that instance panes are created under a raised history-limit."""
+        from orchestrator.tmux_instance_manager.core import PANE_HISTORY_LIMIT
+
+        tmux_manager.instances["test-123"] = {
+            "id": "test-123",
+            "workspace_dir": "/tmp/test_workspace",
+            "instance_type": "claude",
+            "mcp_servers": {},
+        }
+
+        await tmux_manager._launch_cli(tmux_manager.instances["test-123"], resume=False)
+
+        args = next(
+            c.args
+            for c in tmux_manager._mock_server.cmd.call_args_list
+            if "history-limit" in c.args
+        )
+        # Set first, then the window is recreated so the new limit applies
+        assert args[args.index("history-limit") + 1] == str(PANE_HISTORY_LIMIT)
+        assert args.index("history-limit") < args.index("new-window")
+        assert "madrox-test-123:^" in args
+
     @pytest.mark.asyncio
     async def test_create_tmux_session_already_exists(self, tmux_manager):
         """Test creating session when one already exists (should kill old session)."""
@@ -520,27 +545,16 @@ class TestMessageCommunication:
         assert msg3["msg"] == "third"
 
     @pytest.mark.asyncio
-    async def test_put_with_lock(self, tmux_manager):
-        """Test thread-safe queue put operation with lock."""
-        # This is a simplified test since put_with_lock is used internally
-        # It's actually part of _put_to_shared_queue which requires shared_state
-
-        # Setup shared_state mock
+    async def test_put_to_shared_queue_uses_reply_bus(self, tmux_manager):
+        """Test shared queue puts go through SharedStateManager.put_reply."""
         mock_shared_state = MagicMock()
-        mock_queue = MagicMock()
-        mock_lock = MagicMock()
-
-        mock_shared_state.get_response_queue = MagicMock(return_value=mock_queue)
-        mock_shared_state.queue_locks = {"inst-123": mock_lock}
+        mock_shared_state.put_reply = AsyncMock()
 
         tmux_manager.shared_state = mock_shared_state
 
-        # Execute
         await tmux_manager._put_to_shared_queue("inst-123", {"test": "message"})
 
-        # Assert - lock context manager was used
-        mock_lock.__enter__.assert_called()
-        mock_lock.__exit__.assert_called()
+        mock_shared_state.put_reply.assert_awaited_once_with("inst-123", {"test": "message"})
 
     @pytest.mark.asyncio
     async def test_concurrent_message_sending(self, tmux_manager):
@@ -873,6 +887,80 @@ class TestMCPServerConfiguration:
         # Assert
         assert "madrox" in instance["mcp_servers"]
 
+    @pytest.mark.parametrize("socket_path", [None, "/tmp/madrox_logs/mcp.sock"])
+    def test_stdio_madrox_proxy_prefers_server_socket(self, tmux_manager, socket_path):
+        """Test that STDIO proxies are pointed at the server's Unix socket once bound."""
+        from orchestrator.harnesses import get_harness
+
+        tmux_manager.mcp_socket_path = socket_path
+        mcp_servers: dict = {}
+        tmux_manager._add_madrox_mcp_server(mcp_servers, get_harness("codex"), "codex-1")
+
+        env = mcp_servers["madrox"]["env"]
+        assert env["MADROX_PARENT_URL"] == f"http://localhost:{tmux_manager.server_port}"
+        assert env.get("MADROX_PARENT_SOCKET") == socket_path
+
+    @pytest.mark.parametrize("harness_name", ["claude", "codex", "grok"])
+    def test_madrox_config_carries_caller_token(self, tmux_manager, harness_name):
+        """Test that each instance's madrox server identifies it to the parent."""
+        from orchestrator.caller_identity import resolve_caller_token
+        from orchestrator.harnesses import get_harness
+
+        token = "inst-1.s3cret"
+        tmux_manager.instances["inst-1"] = {"state": "running", "caller_token": token}
+        mcp_servers: dict = {}
+        tmux_manager._add_madrox_mcp_server(mcp_servers, get_harness(harness_name), "inst-1")
+
+        madrox = mcp_servers["madrox"]
+        if harness_name == "codex":
+            # Codex registers globally; the token goes on the launch command
+            assert "MADROX_CALLER_TOKEN" not in madrox["env"]
+        elif harness_name == "claude":
+            # Sent as a header, so it stays out of URLs and access logs
+            assert madrox["url"].endswith("/mcp")
+            assert madrox["headers"] == {"X-Madrox-Caller": token}
+        else:
+            assert madrox["url"].endswith(f"/mcp?caller={token}")
+        assert resolve_caller_token(token, tmux_manager.instances) == "inst-1"
+
+    def test_claude_config_file_sends_caller_header(self, tmux_manager):
+        """Test that the caller header reaches the JSON config Claude reads."""
+        from orchestrator.harnesses import get_harness
+
+        harness = get_harness("claude")
+        instance = {"id": "inst-1", "workspace_dir": "/tmp/ws", "caller_token": "inst-1.s3"}
+        mcp_servers: dict = {}
+        tmux_manager._add_madrox_mcp_server(
+            mcp_servers, harness, "inst-1", caller_token=instance["caller_token"]
+        )
+        with patch("pathlib.Path.write_text") as write_text:
+            tmux_manager._write_mcp_config_file(instance, harness, mcp_servers)
+
+        config = json.loads(write_text.call_args.args[0])
+        madrox = config["mcpServers"]["madrox"]
+        assert madrox["headers"] == {"X-Madrox-Caller": "inst-1.s3"}
+        assert "inst-1.s3" not in madrox["url"]
+
+    @pytest.mark.asyncio
+    async def test_codex_instances_launch_with_their_own_caller_tokens(self, tmux_manager):
+        """Test that two Codex spawns cannot pick up each other's caller token."""
+        tmux_manager._mock_pane.cmd.return_value = MagicMock(stdout=["OpenAI Codex", "›"])
+        first = await tmux_manager.spawn_instance(name="codex-a", instance_type="codex")
+        second = await tmux_manager.spawn_instance(name="codex-b", instance_type="codex")
+
+        typed = [c.args[0] for c in tmux_manager._mock_pane.send_keys.call_args_list if c.args]
+        registrations = [cmd for cmd in typed if " mcp add madrox " in cmd]
+        launches = [cmd for cmd in typed if "mcp_servers.madrox.env.MADROX_CALLER_TOKEN" in cmd]
+        tokens = [tmux_manager.instances[iid]["caller_token"] for iid in (first, second)]
+
+        assert tokens[0] != tokens[1]
+        # The shared ~/.codex/config.toml entry carries no token at all
+        assert registrations and not any("MADROX_CALLER_TOKEN" in cmd for cmd in registrations)
+        assert len(launches) == 2
+        for launch, token, other in zip(launches, tokens, reversed(tokens), strict=True):
+            assert token in launch
+            assert other not in launch
+
     @pytest.mark.asyncio
     async def test_mcp_server_startup(self, tmux_manager):
         """Test MCP server configuration during instance startup."""
@@ -1096,10 +1184,7 @@ class TestErrorHandling:
         """Test IPC queue communication errors."""
         # Setup shared_state with failing queue
         mock_shared_state = MagicMock()
-        mock_queue = MagicMock()
-        mock_queue.get.side_effect = Exception("Queue error")
-
-        mock_shared_state.get_response_queue = MagicMock(return_value=mock_queue)
+        mock_shared_state.get_reply = AsyncMock(side_effect=Exception("Queue error"))
         tmux_manager.shared_state = mock_shared_state
 
         # Execute & Assert
@@ -1213,6 +1298,36 @@ class TestErrorHandling:
         assert tmux_manager.instances[child1_id]["state"] == "terminated"
         assert tmux_manager.instances[child2_id]["state"] == "terminated"
 
+    @pytest.mark.asyncio
+    async def test_cascade_termination_records_catalog(self, tmp_path, tmux_manager):
+        """Terminated children are appended to the terminated catalog."""
+        tmux_manager.terminated_catalog = TerminatedCatalog(tmp_path)
+        parent_id = await tmux_manager.spawn_instance(name="parent")
+        child_id = await tmux_manager.spawn_instance(name="child", parent_instance_id=parent_id)
+
+        await tmux_manager.terminate_instance(parent_id, force=True)
+
+        entries = tmux_manager.terminated_catalog.children(parent_id)
+        assert [e["id"] for e in entries] == [child_id]
+        assert entries[0]["name"] == "child"
+        assert entries[0]["terminated_at"]
+
+    @pytest.mark.asyncio
+    async def test_cascaded_children_are_audited_as_forced(self, tmux_manager):
+        """Descendants are force-terminated whatever force the caller passed."""
+        parent_id = await tmux_manager.spawn_instance(name="parent")
+        child_id = await tmux_manager.spawn_instance(name="child", parent_instance_id=parent_id)
+        tmux_manager.instances[parent_id]["state"] = "idle"
+        tmux_manager.logging_manager = MagicMock()
+
+        assert await tmux_manager.terminate_instance(parent_id, force=False)
+
+        audited = {
+            c.kwargs["instance_id"]: c.kwargs["details"]["force"]
+            for c in tmux_manager.logging_manager.log_audit_event.call_args_list
+        }
+        assert audited == {parent_id: False, child_id: True}
+
     @pytest.mark.asyncio
     async def test_concurrent_termination(self, tmux_manager):
         """Test terminating multiple instances concurrently."""
@@ -1232,6 +1347,69 @@ class TestErrorHandling:
             tmux_manager.instances[inst_id]["state"] == "terminated" for inst_id in instances
         )
 
+    @staticmethod
+    def _team(tmux_manager, fanout: int = 3, depth: int = 3) -> list[str]:
+        """Register a tree of idle instances with sessions; returns ids, root first."""
+        ids, level = ["root"], ["root"]
+        for _ in range(depth - 1):
+            level = [f"{parent}.{i}" for parent in level for i in range(fanout)]
+            ids.extend(level)
+        for iid in ids:
+            parent = iid.rpartition(".")[0] or None
+            tmux_manager.instances[iid] = {
+                "id": iid,
+                "name": iid,
+                "state": "idle",
+                "parent_instance_id": parent,
+                "created_at": datetime.now(UTC).isoformat(),
+            }
+            tmux_manager.tmux_sessions[iid] = MagicMock()
+        return ids
+
+    @pytest.mark.asyncio
+    async def test_bulk_teardown_is_parallel_and_bounded(self, tmux_manager):
+        """Sessions are killed concurrently under the cap, state is flushed once."""
+        ids = self._team(tmux_manager)
+        running, peak = 0, 0
+
+        async def kill_session(session):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        tmux_manager.tmux = MagicMock(kill_session=kill_session)
+        tmux_manager._teardown_concurrency = 4
+        tmux_manager._flush_state = MagicMock()
+
+        results = await tmux_manager.terminate_instances(["root"], force=True)
+
+        assert results == {"root": True}
+        assert all(tmux_manager.instances[iid]["state"] == "terminated" for iid in ids)
+        assert not tmux_manager.tmux_sessions
+        assert peak == 4
+        tmux_manager._flush_state.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_bulk_teardown_skips_busy_without_force(self, tmux_manager):
+        """A busy instance keeps its subtree; the other requested ones go."""
+        self._team(tmux_manager, fanout=2, depth=2)
+        tmux_manager.instances["root.0"]["state"] = "busy"
+        tmux_manager.tmux = MagicMock(kill_session=AsyncMock())
+
+        results = await tmux_manager.terminate_instances(["root.0", "root.1"])
+
+        assert results == {"root.0": False, "root.1": True}
+        assert tmux_manager.instances["root.0"]["state"] == "busy"
+        assert tmux_manager.instances["root.1"]["state"] == "terminated"
+        assert tmux_manager.instances["root"]["state"] == "idle"
+
+    @pytest.mark.asyncio
+    async def test_bulk_teardown_rejects_unknown_ids(self, tmux_manager):
+        with pytest.raises(ValueError, match="missing"):
+            await tmux_manager.terminate_instances(["missing"])
+
 
 # ============================================================================
 # Additional Critical Function Tests
@@ -1244,13 +1422,14 @@ class TestCriticalFunctions:
     @pytest.mark.asyncio
     async def test_put_with_lock_concurrent(self, tmux_manager):
         """Test concurrent put operations are thread-safe (critical 0% coverage function)."""
-        # Setup shared_state with queue and lock
+        # Setup shared_state backed by a real reply queue
         mock_shared_state = MagicMock()
-        mock_queue = Queue()
-        mock_lock = threading.Lock()
+        mock_queue = ReplyQueue()
+
+        async def put_reply(instance_id, message):
+            mock_queue.put(message)
 
-        mock_shared_state.get_response_queue = MagicMock(return_value=mock_queue)
-        mock_shared_state.queue_locks = {"inst-123": mock_lock}
+        mock_shared_state.put_reply = put_reply
 
         tmux_manager.shared_state = mock_shared_state
 
@@ -1,7 +1,7 @@
 """Test TmuxInstanceManager monitoring service and health checks."""
 
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -143,15 +143,9 @@ class TestSharedStateQueueOperations:
         with patch("orchestrator.tmux_instance_manager.core.libtmux.Server"):
             manager = TmuxInstanceManager(mock_config)
 
-            # Mock shared state with queue that times out
+            # Mock shared state whose reply wait times out
             mock_shared_state = MagicMock()
-            mock_queue = MagicMock()
-
-            # Simulate queue.Empty exception
-            import queue
-
-            mock_queue.get.side_effect = queue.Empty()
-            mock_shared_state.get_response_queue.return_value = mock_queue
+            mock_shared_state.get_reply = AsyncMock(side_effect=TimeoutError())
             manager.shared_state = mock_shared_state
 
             with pytest.raises(TimeoutError, match="No message received"):
@@ -163,17 +157,16 @@ class TestSharedStateQueueOperations:
         with patch("orchestrator.tmux_instance_manager.core.libtmux.Server"):
             manager = TmuxInstanceManager(mock_config)
 
-            # Mock shared state with queue that returns message
+            # Mock shared state that returns a reply
             mock_shared_state = MagicMock()
-            mock_queue = MagicMock()
             test_message = {"content": "test message"}
-            mock_queue.get.return_value = test_message
-            mock_shared_state.get_response_queue.return_value = mock_queue
+            mock_shared_state.get_reply = AsyncMock(return_value=test_message)
             manager.shared_state = mock_shared_state
 
             result = await manager._get_from_shared_queue("inst-123", timeout=1)
 
             assert result == test_message
+            mock_shared_state.get_reply.assert_awaited_once_with("inst-123", 1)
 
 
 class TestServerPortConfiguration:
@@ -351,3 +344,33 @@ class TestTmuxServerConnection:
             # Should have created server
             mock_server_class.assert_called_once()
             assert manager.tmux_server is mock_server
+
+
+class TestOutputSince:
+    """Delta capture for the monitoring service."""
+
+    @pytest.mark.asyncio
+    async def test_captures_from_previous_cursor(self, mock_config):
+        from orchestrator.tmux_instance_manager.helpers import PaneCursor
+
+        with patch("orchestrator.tmux_instance_manager.core.libtmux.Server"):
+            manager = TmuxInstanceManager(mock_config)
+        manager.instances["a"] = {"state": "busy"}
+        manager.tmux_sessions["a"] = MagicMock()
+        manager.tmux = MagicMock(first_pane=AsyncMock(return_value=MagicMock()))
+        now = PaneCursor(history_size=130, cursor_y=5, history_limit=2000)
+        manager._pane_cursor = AsyncMock(return_value=now)
+        manager._capture_pane = AsyncMock(return_value="new output")
+
+        before = PaneCursor(history_size=100, cursor_y=20, history_limit=2000)
+        result = await manager.get_output_since("a", before)
+
+        assert result == {"output": "new output", "cursor": now}
+        manager._capture_pane.assert_awaited_once_with(
+            manager.tmux.first_pane.return_value, "-S", "-30"
+        )
+
+        # No cursor yet, or history cleared: the last `limit` lines
+        await manager.get_output_since("a", None, limit=500)
+        assert manager._capture_pane.await_args.args[1:] == ("-S", "-500")
+        assert await manager.get_output_since("missing", None) == {"output": "", "cursor": None}
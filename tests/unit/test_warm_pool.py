@@ -0,0 +1,168 @@
+"""Tests for the warm session pool and how spawn_instance claims from it."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from orchestrator.tmux_instance_manager import TmuxInstanceManager
+from orchestrator.tmux_instance_manager.warm_pool import WarmPool, WarmSession, pool_key
+
+READY = 'Try "edit <filepath> to..."'
+
+
+def _warm(instance_id: str) -> WarmSession:
+    return WarmSession(
+        instance_id=instance_id,
+        workspace_dir=f"/tmp/{instance_id}",
+        caller_token=f"{instance_id}.token",
+        session=MagicMock(),
+        pane=MagicMock(),
+        mcp_servers={},
+    )
+
+
+class TestWarmPool:
+    def test_disabled_by_default(self):
+        assert WarmPool().enabled is False
+        assert WarmPool(2).enabled is True
+
+    def test_claim_is_fifo_per_key(self):
+        pool = WarmPool(2)
+        key = pool_key("claude", "m1", mcp_servers={})
+        pool.put(key, _warm("a"))
+        pool.put(key, _warm("b"))
+
+        assert pool.claim(pool_key("claude", "m2", mcp_servers={})) is None
+        assert pool.claim(key).instance_id == "a"
+        assert pool.claim(key).instance_id == "b"
+        assert pool.claim(key) is None
+
+    def test_deficit_counts_idle_and_booting(self):
+        pool = WarmPool(3)
+        key = pool_key("codex", None)
+        pool.put(key, _warm("a"))
+        pool.begin_boot(key)
+        assert pool.deficit(key) == 1
+        pool.end_boot(key)
+        assert pool.deficit(key) == 2
+
+    def test_fingerprint_covers_launch_config(self):
+        base = pool_key("claude", "m1", bypass_isolation=True, mcp_servers={})
+        assert base == pool_key("claude", "m1", mcp_servers={}, bypass_isolation=True)
+        assert base != pool_key("claude", "m1", bypass_isolation=False, mcp_servers={})
+        assert base != pool_key("claude", "m1", bypass_isolation=True, mcp_servers={"x": {}})
+
+    def test_stats(self):
+        pool = WarmPool(1)
+        pool.put(pool_key("claude", None), _warm("a"))
+        pool.record_claim(hit=True)
+        pool.record_claim(hit=False)
+        pool.claim_latency.observe(0.05)
+
+        stats = pool.stats()
+        assert stats["idle"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["claim_latency"]["count"] == 1
+        assert list(stats["keys"].values()) == [1]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    with patch("orchestrator.tmux_instance_manager.core.libtmux.Server"):
+        manager = TmuxInstanceManager({"workspace_base_dir": str(tmp_path), "warm_pool_size": 1})
+
+    launched = []
+
+    async def launch_cli(record, *, resume):
+        manager.tmux_sessions[record["id"]] = MagicMock()
+        record["_mcp_config_path"] = f"{record['workspace_dir']}/.claude_mcp_config.json"
+        launched.append(record)
+        return MagicMock(), True
+
+    manager._launch_cli = launch_cli
+    manager._capture_pane = AsyncMock(return_value=READY)
+    manager._initialize_tmux_session = AsyncMock()
+    manager._bootstrap_instance = AsyncMock()
+    manager._send_multiline_message_to_pane = AsyncMock()
+    manager.tmux = MagicMock(kill_session=AsyncMock())
+    manager.launched = launched
+    yield manager
+
+
+async def _booted(manager) -> None:
+    await asyncio.gather(*manager._warm_boot_tasks)
+
+
+async def test_spawn_claims_a_warm_session(manager):
+    await manager.spawn_instance(name="first", model="m1")  # miss, warms the pool
+    await _booted(manager)
+    warm = manager.launched[0]
+    assert (Path(warm["workspace_dir"]) / ".madrox_instance_id").read_text() == warm["id"]
+
+    instance_id = await manager.spawn_instance(name="second", model="m1", initial_prompt="hi")
+
+    instance = manager.instances[instance_id]
+    assert instance_id == warm["id"]
+    assert instance["state"] == "idle"
+    assert instance["caller_token"] == warm["caller_token"]
+    assert instance["_mcp_config_path"] == warm["_mcp_config_path"]
+    assert instance["mcp_servers"] is warm["mcp_servers"]  # as the warm CLI was configured
+    manager._initialize_tmux_session.assert_awaited_once()  # only the cold spawn
+    manager._bootstrap_instance.assert_awaited_once()
+    # Claude takes the first prompt as an argument; a warm CLI gets it typed in
+    manager._send_multiline_message_to_pane.assert_awaited_once()
+
+    stats = manager.warm_pool.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["claim_latency"]["count"] == 1
+
+
+async def test_other_configuration_misses(manager):
+    await manager.prewarm("claude", "m1")
+    await _booted(manager)
+
+    await manager.spawn_instance(name="other", model="m2")
+
+    manager._initialize_tmux_session.assert_awaited_once()
+    assert manager.warm_pool.misses == 1
+
+
+async def test_dead_warm_session_is_discarded(manager):
+    await manager.prewarm("claude", "m1")
+    await _booted(manager)
+    manager._capture_pane.return_value = "$ "  # CLI exited back to the shell
+
+    await manager.spawn_instance(name="cold", model="m1")
+
+    manager._initialize_tmux_session.assert_awaited_once()
+    assert manager.warm_pool.discarded == 1
+    assert not Path(manager.launched[0]["workspace_dir"]).exists()
+
+
+async def test_worktree_spawns_bypass_the_pool(manager):
+    warm = await manager._claim_warm_session(
+        "claude", "m1", True, None, None, {"use_worktree": True}
+    )
+
+    assert warm is None
+    assert not manager._warm_boot_tasks
+    assert manager.warm_pool.misses == 0
+
+
+async def test_mcp_servers_as_json_match_dict(manager):
+    as_dict, _ = manager._warm_launch("claude", "m1", True, None, None, {"x": {"url": "u"}})
+    as_json, _ = manager._warm_launch("claude", "m1", True, None, None, '{"x": {"url": "u"}}')
+    assert as_dict == as_json
+
+
+async def test_shutdown_drains_the_pool(manager):
+    await manager.prewarm("claude", "m1")
+    await _booted(manager)
+
+    await manager._drain_warm_pool()
+
+    assert manager.warm_pool.stats()["idle"] == 0
+    assert not manager.tmux_sessions
+    manager.tmux.kill_session.assert_awaited_once()